@@ -0,0 +1,118 @@
+"""Microbenchmark of the send path's own overhead, with no I/O.
+
+Every request goes through an in-memory session that returns a canned
+response, so what's timed is the client-side dispatch alone: the tool
+preparing a call and handing it to its `ZenrowsClient`, the client's
+retry / key pool / limiter layers, and tracing::
+
+    python -m benchmarks.dispatch
+    python -m benchmarks.dispatch --calls 100000
+
+Paths:
+
+- ``tool``       - `ZenrowsFetch.fetch_result` minus input validation: a
+  full tool call.
+- ``tool+layers`` - the same with a `RetryPolicy`, a `ZenrowsKeyPool`,
+  an `InMemoryCache` (bypassed) and instrumentation configured.
+- ``tool+middleware`` - the tool call with three pass-through
+  `ZenrowsMiddleware` in its chain.
+- ``client``     - `ZenrowsClient.send` with prepared params.
+- ``session``    - the canned session alone (the floor).
+"""
+
+import argparse
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from langchain_zenrows import (
+    InMemoryCache,
+    RetryPolicy,
+    ZenrowsClient,
+    ZenrowsFetch,
+    ZenrowsInstrumentation,
+    ZenrowsKeyPool,
+    ZenrowsMiddleware,
+    ZenrowsRateLimiter,
+)
+from langchain_zenrows.zenrows_result import RequestTrace
+
+URL = "https://example.com/products/12345"
+
+
+class CannedSession(requests.Session):
+    """Answers every GET with the same 200 response, without any I/O."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.canned = requests.Response()
+        self.canned.status_code = 200
+        self.canned._content = b"<html><body>ok</body></html>"
+        self.canned.headers["Content-Type"] = "text/html; charset=utf-8"
+        # As the HTTP adapter would set it, so `.text` doesn't guess.
+        self.canned.encoding = "utf-8"
+        self.canned.headers["X-Request-Cost"] = "1"
+
+    def get(self, url, **kwargs):  # type: ignore[override]
+        return self.canned
+
+
+def _per_call(fn: Callable[[], object], calls: int, repeat: int) -> float:
+    """Best-of-``repeat`` microseconds per call."""
+    return min(timeit.repeat(fn, number=calls, repeat=repeat)) / calls * 1e6
+
+
+def measure(calls: int, repeat: int = 5) -> Dict[str, float]:
+    """Microseconds per call for each layer of the send path."""
+    session = CannedSession()
+    tool = ZenrowsFetch(
+        zenrows_api_key="bench", session=session, limiter=ZenrowsRateLimiter()
+    )
+    layered = ZenrowsFetch(
+        session=session,
+        retry_policy=RetryPolicy(),
+        key_pool=ZenrowsKeyPool(["bench-a", "bench-b"]),
+        cache=InMemoryCache(),
+        instrumentation=ZenrowsInstrumentation(),
+    )
+    chained = ZenrowsFetch(
+        zenrows_api_key="bench",
+        session=session,
+        limiter=ZenrowsRateLimiter(),
+        middleware=[ZenrowsMiddleware() for _ in range(3)],
+    )
+    client = ZenrowsClient(session=session, limiter=ZenrowsRateLimiter())
+    kwargs = {"url": URL}
+    bypass = {"url": URL, "cache_bypass": True}
+    params = {"url": URL, "apikey": "bench"}
+
+    return {
+        "tool": _per_call(lambda: tool._run_result(kwargs), calls, repeat),
+        "tool+layers": _per_call(lambda: layered._run_result(bypass), calls, repeat),
+        "tool+middleware": _per_call(
+            lambda: chained._run_result(kwargs), calls, repeat
+        ),
+        "client": _per_call(
+            lambda: client.send(params, None, RequestTrace()), calls, repeat
+        ),
+        "session": _per_call(lambda: session.get(URL, params=params), calls, repeat),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'path':<16} {'us/call':>8}")
+    print("-" * 25)
+    for path, micros in measure(args.calls, args.repeat).items():
+        print(f"{path:<16} {micros:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
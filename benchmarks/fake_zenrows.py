@@ -0,0 +1,308 @@
+"""A local stand-in for ``https://api.zenrows.com/v1/``.
+
+Speaks just enough of the Zenrows API for the client's hot path to be
+exercised offline: the ``apikey`` check, Extract's ``AUTH010`` domain gate,
+plan concurrency headers, per-request cost, screenshots / PDFs, and
+injected 429s and 5xx. Latency and payload size are configurable, so the
+benchmarks measure the client rather than the network.
+
+Usage::
+
+    with FakeZenrowsServer(latency=0.05, error_rate=0.05) as server:
+        tool = ZenrowsFetch(zenrows_api_key="bench", base_url=server.base_url)
+        tool.invoke({"url": "https://example.com"})
+
+`FakeZenrowsServer` runs in a background thread, which is handy in tests;
+`FakeZenrowsProcess` runs it in a child process so the server's own work
+doesn't compete for the GIL with the client being measured.
+"""
+
+import json
+import multiprocessing
+import random
+import socket
+import threading
+import time
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# Credits per configuration, as billed by Zenrows.
+_COSTS = {(False, False): 1, (True, False): 5, (False, True): 10, (True, True): 25}
+
+_PNG_HEADER = b"\x89PNG\r\n\x1a\n"
+_PDF_HEADER = b"%PDF-1.7\n"
+
+
+def _flag(params: Dict[str, str], name: str) -> bool:
+    # `requests` sends True as "True", `httpx` as "true".
+    return params.get(name, "").lower() == "true"
+
+
+@dataclass
+class FakeZenrowsConfig:
+    """Behavior of a `FakeZenrowsServer`.
+
+    Attributes:
+        latency: Base seconds each request takes (Zenrows' render time).
+        latency_jitter: Extra uniform random delay, up to this many seconds.
+        tail_rate: Fraction of requests that are slow outliers.
+        tail_latency: Extra seconds a slow outlier takes.
+        payload_size: Bytes in each HTML / binary body.
+        error_rate: Fraction of requests failing with a 5xx.
+        rate_limit_rate: Fraction of requests answered with a 429.
+        concurrency_limit: Plan concurrency; requests beyond it get a 429.
+        auth010_domains: Hosts not enabled for Extract - ``extract``
+            requests for them get a 402 ``AUTH010``.
+        api_key: Expected ``apikey``; anything else gets a 401.
+        seed: Seed for error injection and jitter, for repeatable runs.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    tail_rate: float = 0.0
+    tail_latency: float = 0.0
+    payload_size: int = 16 * 1024
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    concurrency_limit: int = 100
+    auth010_domains: FrozenSet[str] = frozenset()
+    api_key: str = "bench"
+    seed: Optional[int] = 0
+
+
+@dataclass
+class FakeZenrowsStats:
+    """What the server has seen - to check e.g. how many calls a cache saved."""
+
+    requests: int = 0
+    by_status: Dict[int, int] = field(default_factory=dict)
+    max_in_flight: int = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real API
+    server: "_Server"
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out in separate writes; without this, Nagle
+        # plus delayed ACKs adds ~40 ms to every keep-alive response.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):  # noqa: A002 - stdlib signature
+        pass
+
+    def do_GET(self):  # noqa: N802 - stdlib naming
+        if urlsplit(self.path).path.endswith("/__stats"):
+            status, headers = 200, {"Content-Type": "application/json"}
+            body = json.dumps(asdict(self.server.fake.stats)).encode()
+        else:
+            status, headers, body = self.server.fake.handle(self.path, self.headers)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+    fake: "FakeZenrowsServer"
+
+
+class FakeZenrowsServer:
+    """Threaded HTTP server mimicking the Zenrows API on localhost.
+
+    Args:
+        config: Server behavior; keyword arguments override its fields.
+    """
+
+    def __init__(self, config: Optional[FakeZenrowsConfig] = None, **overrides):
+        self.config = config or FakeZenrowsConfig()
+        for name, value in overrides.items():
+            setattr(self.config, name, value)
+        self.stats = FakeZenrowsStats()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._random = random.Random(self.config.seed)
+        self._html = self._make_html(self.config.payload_size)
+        self._httpd: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _make_html(size: int) -> bytes:
+        row = b"<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit.</p>\n"
+        head, tail = b"<html><body>\n", b"</body></html>\n"
+        body = row * max(0, (size - len(head) - len(tail)) // len(row) + 1)
+        return (head + body)[: max(0, size - len(tail))] + tail
+
+    @property
+    def base_url(self) -> str:
+        assert self._httpd is not None, "server not started"
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1/"
+
+    def start(self) -> "FakeZenrowsServer":
+        self._httpd = _Server(("127.0.0.1", 0), _Handler)
+        self._httpd.fake = self
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FakeZenrowsServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = FakeZenrowsStats()
+
+    # -- request handling -------------------------------------------------
+
+    def handle(self, path: str, request_headers) -> Tuple[int, Dict[str, str], bytes]:
+        with self._lock:
+            self._in_flight += 1
+            in_flight = self._in_flight
+            self.stats.max_in_flight = max(self.stats.max_in_flight, in_flight)
+            roll = self._random.random()
+            delay = self._delay()
+        try:
+            status, headers, body = self._respond(path, roll, delay, in_flight)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                remaining = self.config.concurrency_limit - self._in_flight
+        headers["Concurrency-Limit"] = str(self.config.concurrency_limit)
+        headers["Concurrency-Remaining"] = str(max(0, remaining))
+        with self._lock:
+            self.stats.requests += 1
+            self.stats.by_status[status] = self.stats.by_status.get(status, 0) + 1
+        return status, headers, body
+
+    def _delay(self) -> float:
+        config = self.config
+        delay = config.latency + self._random.uniform(0, config.latency_jitter)
+        if config.tail_rate and self._random.random() < config.tail_rate:
+            delay += config.tail_latency
+        return delay
+
+    @staticmethod
+    def _error(status: int, code: str, detail: str, **headers: str):
+        body = json.dumps({"code": code, "detail": detail, "status": status})
+        return status, {"Content-Type": "application/json", **headers}, body.encode()
+
+    def _respond(self, path: str, roll: float, delay: float, in_flight: int):
+        config = self.config
+        params = dict(parse_qsl(urlsplit(path).query))
+
+        if params.get("apikey") != config.api_key:
+            return self._error(401, "AUTH001", "API key is invalid")
+        if in_flight > config.concurrency_limit:
+            return self._error(
+                429, "AUTH006", "Concurrency limit exceeded", **{"Retry-After": "0"}
+            )
+        if roll < config.rate_limit_rate:
+            return self._error(429, "AUTH006", "Too many requests", **{"Retry-After": "0"})
+        if roll < config.rate_limit_rate + config.error_rate:
+            return self._error(503, "RESP001", "Could not get content")
+
+        target = params.get("url", "")
+        if "extract" in params and urlsplit(target).hostname in config.auth010_domains:
+            return self._error(402, "AUTH010", "Domain not enabled for Extract")
+
+        if delay:
+            time.sleep(delay)
+
+        js = _flag(params, "js_render") or "screenshot" in params
+        premium = _flag(params, "premium_proxy")
+        if params.get("mode") == "auto":
+            # Adaptive Stealth: pretend one request in four needs escalation.
+            js = premium = roll > 0.75
+        headers = {
+            "X-Request-Cost": str(_COSTS[(js, premium)]),
+            "X-Request-Id": f"fake-{self.stats.requests}",
+            "Zr-Final-Url": target,
+        }
+
+        if "screenshot" in params:
+            fmt = "jpeg" if params.get("screenshot_format") == "jpeg" else "png"
+            headers["Content-Type"] = f"image/{fmt}"
+            return 200, headers, _PNG_HEADER + bytes(config.payload_size)
+        if params.get("response_type") == "pdf":
+            headers["Content-Type"] = "application/pdf"
+            return 200, headers, _PDF_HEADER + bytes(config.payload_size)
+        if "extract" in params or _flag(params, "autoparse"):
+            headers["Content-Type"] = "application/json"
+            parsed = {"title": "Fake page", "url": target}
+            if "extract" in params:
+                document = {"parsed": parsed, "html": self._html.decode()}
+            else:
+                document = parsed
+            return 200, headers, json.dumps(document).encode()
+
+        headers["Content-Type"] = "text/html; charset=utf-8"
+        return 200, headers, self._html
+
+
+def _serve(config: FakeZenrowsConfig, conn) -> None:
+    with FakeZenrowsServer(config) as server:
+        conn.send(server.base_url)
+        conn.recv()  # any message (or the parent going away) stops the server
+
+
+class FakeZenrowsProcess:
+    """`FakeZenrowsServer` in a child process.
+
+    Args:
+        config: Server behavior; keyword arguments override its fields.
+    """
+
+    def __init__(self, config: Optional[FakeZenrowsConfig] = None, **overrides):
+        self.config = config or FakeZenrowsConfig()
+        for name, value in overrides.items():
+            setattr(self.config, name, value)
+        self.base_url = ""
+        self._process = None
+        self._conn = None
+
+    def start(self) -> "FakeZenrowsProcess":
+        context = multiprocessing.get_context("spawn")
+        self._conn, child = context.Pipe()
+        self._process = context.Process(target=_serve, args=(self.config, child), daemon=True)
+        self._process.start()
+        self.base_url = self._conn.recv()
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._conn.send(None)
+            self._process.join(timeout=5)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+
+    def __enter__(self) -> "FakeZenrowsProcess":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    @property
+    def stats(self) -> FakeZenrowsStats:
+        with urllib.request.urlopen(self.base_url + "__stats") as response:
+            data = json.load(response)
+        data["by_status"] = {int(k): v for k, v in data["by_status"].items()}
+        return FakeZenrowsStats(**data)
@@ -0,0 +1,96 @@
+"""Microbenchmark of per-call request preparation, with no I/O.
+
+Compares what ``invoke``-style calls do per request (validate the input
+against `ZenrowsFetchInput`, prepare the params, then have the session
+prepare the request, encoding them into its URL) with binding a URL to a
+`FetchTemplate`, whose query string is prepared and encoded once::
+
+    python -m benchmarks.prepare
+    python -m benchmarks.prepare --calls 200000
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from langchain_zenrows import ZenrowsFetch
+from langchain_zenrows.zenrows_http import prepare_encoded
+
+# A typical high-volume profile: rendered, geo-targeted markdown with a
+# custom header and a few JS instructions.
+PROFILE = {
+    "wait_for": ".content",
+    "proxy_country": "us",
+    "response_type": "markdown",
+    "custom_headers": {"Referer": "https://www.google.com/"},
+    "js_instructions": json.dumps(
+        [
+            {"click": "#accept-cookies"},
+            {"wait_for": ".product-list"},
+            {"scroll_y": 1500},
+            {"wait": 500},
+            {"fill": ["#search", "wireless headphones"]},
+            {"click": "button[type=submit]"},
+        ],
+        indent=2,
+    ),
+}
+
+URL = "https://example.com/products/12345"
+
+
+def _per_call(fn: Callable[[], object], calls: int, repeat: int) -> float:
+    """Best-of-``repeat`` microseconds per call."""
+    return min(timeit.repeat(fn, number=calls, repeat=repeat)) / calls * 1e6
+
+
+def measure(calls: int, repeat: int = 5) -> Dict[str, float]:
+    """Microseconds per call for each way of preparing a request."""
+    tool = ZenrowsFetch(zenrows_api_key="bench")
+    template = tool.template(**PROFILE)
+    tool_input = {**PROFILE, "url": URL}
+
+    session = requests.Session()
+
+    def per_call_validation() -> object:
+        params, headers = tool._prepare_request_params(tool._validate_input(tool_input))
+        request = requests.Request("GET", tool.base_url, params=params, headers=headers)
+        return session.prepare_request(request)
+
+    def prepare_only() -> object:
+        params, headers = tool._prepare_request_params(tool_input)
+        request = requests.Request("GET", tool.base_url, params=params, headers=headers)
+        return session.prepare_request(request)
+
+    def from_template() -> object:
+        prepared = template.prepare(URL)
+        return prepare_encoded(session, prepared.request_url, prepared.request_headers)
+
+    return {
+        "validate + prepare": _per_call(per_call_validation, calls, repeat),
+        "prepare": _per_call(prepare_only, calls, repeat),
+        "template": _per_call(from_template, calls, repeat),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = measure(args.calls, args.repeat)
+    baseline = results["validate + prepare"]
+    print(f"{'path':<20} {'us/call':>8} {'speedup':>8}")
+    print("-" * 38)
+    for path, micros in results.items():
+        print(f"{path:<20} {micros:>8.2f} {baseline / micros:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,343 @@
+"""Offline benchmarks for the Zenrows tools' client-side hot path.
+
+Runs each scenario against its own local fake Zenrows API and reports
+throughput, p50 / p99 latency and memory, so regressions are caught without
+network access or API credits::
+
+    python -m benchmarks.run
+    python -m benchmarks.run --scenarios async batch --requests 2000 --latency 0.02
+    python -m benchmarks.run --json results.json
+    python -m benchmarks.run --baseline results.json   # exit 1 on regression
+
+Scenarios:
+
+- ``sync``    - sequential ``invoke`` calls (per-call overhead).
+- ``template`` - the same calls through a `FetchTemplate` (no per-call
+  validation, preparation or ``invoke`` overhead).
+- ``client``  - prepared params sent straight through a `ZenrowsClient`,
+  the transport the tools delegate to (the floor under ``sync``).
+- ``async``   - ``ainvoke`` calls, ``--concurrency`` in flight on one loop.
+- ``batch``   - ``batch_fetch`` with ``--concurrency`` threads.
+- ``cache``   - ``invoke`` over a small URL set with an `InMemoryCache`.
+- ``retry``   - ``invoke`` with injected 429 / 5xx and a `RetryPolicy`.
+- ``extract`` - `ZenrowsExtract`, half the calls taking the ``AUTH010`` ->
+  Autoparse fallback.
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from langchain_zenrows import (
+    InMemoryCache,
+    RetryPolicy,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsClient,
+    ZenrowsInstrumentation,
+    ZenrowsRateLimiter,
+)
+
+from benchmarks.fake_zenrows import (
+    FakeZenrowsConfig,
+    FakeZenrowsProcess,
+    FakeZenrowsServer,
+)
+
+API_KEY = "bench"
+
+
+class LatencyRecorder(ZenrowsInstrumentation):
+    """Collects per-call latency through the tools' own instrumentation
+    hooks, so batch and async calls are timed the same way as sync ones."""
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.errors = 0
+
+    def on_call_start(self, tool, url):
+        return time.perf_counter()
+
+    def on_call_end(self, token, result, error):
+        self.latencies.append(time.perf_counter() - token)
+        if error is not None:
+            self.errors += 1
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    requests: int
+    errors: int
+    upstream_requests: int
+    seconds: float
+    throughput: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_kib: Optional[float]
+
+
+def _percentile(values: List[float], pct: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def _inputs(n: int, distinct: Optional[int] = None) -> List[Dict[str, str]]:
+    return [
+        {"url": f"https://example.com/page/{i % (distinct or n)}"} for i in range(n)
+    ]
+
+
+def _fetch_tool(base_url: str, recorder: LatencyRecorder, **kwargs) -> ZenrowsFetch:
+    # A fresh limiter per scenario, so one scenario's adaptation (e.g. to
+    # injected 429s) doesn't carry over into the next.
+    return ZenrowsFetch(
+        zenrows_api_key=API_KEY,
+        base_url=base_url,
+        limiter=ZenrowsRateLimiter(),
+        instrumentation=recorder,
+        **kwargs,
+    )
+
+
+def _invoke_all(tool, inputs: List[Dict[str, str]]) -> None:
+    for item in inputs:
+        try:
+            tool.invoke(item)
+        except ValueError:
+            pass  # counted by the recorder
+
+
+def scenario_sync(base_url: str, recorder: LatencyRecorder, args) -> None:
+    _invoke_all(_fetch_tool(base_url, recorder), _inputs(args.requests))
+
+
+def scenario_template(base_url: str, recorder: LatencyRecorder, args) -> None:
+    template = _fetch_tool(base_url, recorder).template()
+    for item in _inputs(args.requests):
+        try:
+            template.fetch(item["url"])
+        except ValueError:
+            pass
+
+
+def scenario_client(base_url: str, recorder: LatencyRecorder, args) -> None:
+    client = ZenrowsClient(
+        base_url, limiter=ZenrowsRateLimiter(), instrumentation=recorder
+    )
+    for item in _inputs(args.requests):
+        params = {"url": item["url"], "apikey": API_KEY}
+        trace = client.trace("zenrows_client", item["url"])
+        try:
+            with trace.span():
+                response = client.send(params, None, trace)
+            trace.finish(trace.result(response.text, params))
+        except Exception:
+            pass
+
+
+def scenario_async(base_url: str, recorder: LatencyRecorder, args) -> None:
+    tool = _fetch_tool(base_url, recorder)
+
+    async def main() -> None:
+        semaphore = asyncio.Semaphore(args.concurrency)
+
+        async def one(item: Dict[str, str]) -> None:
+            async with semaphore:
+                try:
+                    await tool.ainvoke(item)
+                except ValueError:
+                    pass
+
+        await asyncio.gather(*(one(item) for item in _inputs(args.requests)))
+
+    asyncio.run(main())
+
+
+def scenario_batch(base_url: str, recorder: LatencyRecorder, args) -> None:
+    tool = _fetch_tool(base_url, recorder)
+    tool.batch_fetch(_inputs(args.requests), concurrency=args.concurrency)
+
+
+def scenario_cache(base_url: str, recorder: LatencyRecorder, args) -> None:
+    tool = _fetch_tool(base_url, recorder, cache=InMemoryCache())
+    _invoke_all(tool, _inputs(args.requests, distinct=max(1, args.requests // 10)))
+
+
+def scenario_retry(base_url: str, recorder: LatencyRecorder, args) -> None:
+    policy = RetryPolicy(max_attempts=5, backoff_base=0.001, backoff_cap=0.01)
+    tool = _fetch_tool(base_url, recorder, retry_policy=policy)
+    _invoke_all(tool, _inputs(args.requests))
+
+
+def scenario_extract(base_url: str, recorder: LatencyRecorder, args) -> None:
+    tool = ZenrowsExtract(
+        zenrows_api_key=API_KEY,
+        base_url=base_url,
+        limiter=ZenrowsRateLimiter(),
+        instrumentation=recorder,
+    )
+    host = ("www", "blocked")
+    inputs = [
+        {"url": f"https://{host[i % 2]}.example.com/item/{i}"}
+        for i in range(args.requests)
+    ]
+    _invoke_all(tool, inputs)
+
+
+SCENARIOS: Dict[str, Callable[[str, LatencyRecorder, Any], None]] = {
+    "sync": scenario_sync,
+    "template": scenario_template,
+    "client": scenario_client,
+    "async": scenario_async,
+    "batch": scenario_batch,
+    "cache": scenario_cache,
+    "retry": scenario_retry,
+    "extract": scenario_extract,
+}
+
+# Server behavior a scenario needs on top of the command-line settings.
+SCENARIO_SERVER_CONFIG: Dict[str, Dict[str, Any]] = {
+    "retry": {"rate_limit_rate": 0.05, "error_rate": 0.05},
+    "extract": {"auth010_domains": frozenset({"blocked.example.com"})},
+}
+
+
+def run_scenario(name: str, args) -> ScenarioResult:
+    """Run one scenario against a fresh fake server and summarize it."""
+    config = FakeZenrowsConfig(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        payload_size=args.payload_size,
+        api_key=API_KEY,
+        **SCENARIO_SERVER_CONFIG.get(name, {}),
+    )
+    server_cls = FakeZenrowsServer if args.in_process else FakeZenrowsProcess
+    recorder = LatencyRecorder()
+    peak = None
+    with server_cls(config) as server:
+        if args.trace_memory:
+            tracemalloc.start()
+        started = time.perf_counter()
+        SCENARIOS[name](server.base_url, recorder, args)
+        seconds = time.perf_counter() - started
+        if args.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1] / 1024
+            tracemalloc.stop()
+        upstream_requests = server.stats.requests
+    return ScenarioResult(
+        scenario=name,
+        requests=len(recorder.latencies),
+        errors=recorder.errors,
+        upstream_requests=upstream_requests,
+        seconds=seconds,
+        throughput=len(recorder.latencies) / seconds if seconds else 0.0,
+        p50_ms=_percentile(recorder.latencies, 50) * 1000,
+        p99_ms=_percentile(recorder.latencies, 99) * 1000,
+        peak_memory_kib=peak,
+    )
+
+
+def _print_table(results: List[ScenarioResult]) -> None:
+    header = (
+        f"{'scenario':<10} {'calls':>6} {'errors':>6} {'upstream':>8} "
+        f"{'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'peak KiB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        peak = "-" if r.peak_memory_kib is None else f"{r.peak_memory_kib:.0f}"
+        print(
+            f"{r.scenario:<10} {r.requests:>6} {r.errors:>6} {r.upstream_requests:>8} "
+            f"{r.throughput:>9.1f} {r.p50_ms:>8.2f} {r.p99_ms:>8.2f} {peak:>9}"
+        )
+    # ru_maxrss is in KiB on Linux, bytes on macOS.
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    maxrss_mib = maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    print(f"\nclient process max RSS: {maxrss_mib:.0f} MiB")
+
+
+def compare(
+    results: List[ScenarioResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float,
+) -> List[str]:
+    """Regressions against a ``--json`` baseline: throughput down, or p99 up,
+    by more than ``tolerance`` (a fraction)."""
+    regressions = []
+    for r in results:
+        base = baseline.get(r.scenario)
+        if base is None:
+            continue
+        if r.throughput < base["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{r.scenario}: throughput {r.throughput:.1f} req/s, "
+                f"baseline {base['throughput']:.1f}"
+            )
+        if r.p99_ms > base["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{r.scenario}: p99 {r.p99_ms:.2f} ms, baseline {base['p99_ms']:.2f}"
+            )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument("--requests", type=int, default=500, help="calls per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="async / batch")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="server seconds per request"
+    )
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=16 * 1024, help="bytes")
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="report the tracemalloc peak per scenario (slows the run)",
+    )
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run the fake server in a thread instead of a child process",
+    )
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare against a previous --json file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed regression fraction"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = [run_scenario(name, args) for name in args.scenarios]
+
+    _print_table(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({r.scenario: asdict(r) for r in results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
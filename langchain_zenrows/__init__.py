@@ -6,8 +6,43 @@ extraction with anti-bot bypass, JavaScript rendering, and geo-targeting
 features.
 """
 
+from langchain_zenrows.zenrows_batch import BatchResult
+from langchain_zenrows.zenrows_binary import BinaryContent
+from langchain_zenrows.zenrows_cache import (
+    InMemoryCache,
+    RedisCache,
+    SQLiteCache,
+    ZenrowsCache,
+)
+from langchain_zenrows.zenrows_cancel import CancelToken, RequestCancelled
+from langchain_zenrows.zenrows_capabilities import DomainCapabilityCache
+from langchain_zenrows.zenrows_client import ZenrowsClient
+from langchain_zenrows.zenrows_crawler import BloomFilter, CrawlPage, ZenrowsCrawler
+from langchain_zenrows.zenrows_deadline import DeadlineExceeded, ZenrowsTimeouts
 from langchain_zenrows.zenrows_extract import ZenrowsExtract, ZenrowsExtractInput
 from langchain_zenrows.zenrows_fetch import ZenrowsFetch, ZenrowsFetchInput
+from langchain_zenrows.zenrows_html import HtmlDocument, HtmlElement
+from langchain_zenrows.zenrows_instrumentation import (
+    OpenTelemetryInstrumentation,
+    ZenrowsInstrumentation,
+)
+from langchain_zenrows.zenrows_jobs import (
+    JobSummary,
+    JournalRecord,
+    JSONLJournal,
+    SQLiteJournal,
+    ZenrowsJob,
+    ZenrowsJournal,
+)
+from langchain_zenrows.zenrows_keypool import ZenrowsKeyPool
+from langchain_zenrows.zenrows_limiter import ZenrowsRateLimiter
+from langchain_zenrows.zenrows_loader import ZenrowsLoader
+from langchain_zenrows.zenrows_middleware import ZenrowsMiddleware, ZenrowsRequest
+from langchain_zenrows.zenrows_result import ZenrowsResult
+from langchain_zenrows.zenrows_retry import RetryPolicy, RetryStats
+from langchain_zenrows.zenrows_singleflight import SingleFlight
+from langchain_zenrows.zenrows_stealth import StealthLearner
+from langchain_zenrows.zenrows_template import FetchTemplate
 
 # Deprecated - kept for backward compatibility, redirect to the classes above.
 from langchain_zenrows.zenrows_universal_scraper import (
@@ -21,8 +56,44 @@ __version__ = "0.2.0"
 __all__ = [
     "ZenrowsFetch",
     "ZenrowsFetchInput",
+    "FetchTemplate",
     "ZenrowsExtract",
     "ZenrowsExtractInput",
+    "ZenrowsLoader",
+    "ZenrowsClient",
+    "ZenrowsMiddleware",
+    "ZenrowsRequest",
+    "ZenrowsTimeouts",
+    "DeadlineExceeded",
+    "CancelToken",
+    "RequestCancelled",
+    "BatchResult",
+    "BinaryContent",
+    "ZenrowsRateLimiter",
+    "ZenrowsKeyPool",
+    "ZenrowsResult",
+    "HtmlDocument",
+    "HtmlElement",
+    "RetryPolicy",
+    "RetryStats",
+    "ZenrowsCache",
+    "InMemoryCache",
+    "SQLiteCache",
+    "RedisCache",
+    "SingleFlight",
+    "DomainCapabilityCache",
+    "StealthLearner",
+    "ZenrowsInstrumentation",
+    "OpenTelemetryInstrumentation",
+    "ZenrowsCrawler",
+    "CrawlPage",
+    "BloomFilter",
+    "ZenrowsJob",
+    "JobSummary",
+    "ZenrowsJournal",
+    "JournalRecord",
+    "JSONLJournal",
+    "SQLiteJournal",
     # Deprecated aliases - use the names above instead.
     "ZenRowsUniversalScraper",
     "ZenRowsUniversalScraperAPIWrapper",
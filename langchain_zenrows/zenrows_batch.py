@@ -0,0 +1,194 @@
+"""Bounded-concurrency batch runner for the Zenrows tools.
+
+Runs one tool call per input with at most ``concurrency`` in flight - in a
+thread pool for the sync API, as asyncio tasks for the async one - and
+reports every input as a `BatchResult`, so one bad URL (a `ValueError`
+from the tool, or an input that fails validation) doesn't abort the rest of
+the batch.
+
+Inputs are pulled from the iterable lazily, so a generator of tens of
+thousands of URLs never has to be materialized up front.
+"""
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+)
+
+# Matches the concurrency of Zenrows' smallest paid plan, so a batch run
+# with defaults doesn't immediately trip 429s.
+DEFAULT_BATCH_CONCURRENCY = 5
+
+# In ordered mode, how many finished-but-not-yet-yielded results (as a
+# multiple of `concurrency`) may pile up behind one slow item before new
+# work stops being submitted. Bounds memory on huge batches.
+ORDERED_BUFFER_FACTOR = 4
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one input in a batch.
+
+    Attributes:
+        index: Position of the input in the original iterable.
+        input: The input as given (URL string or dict).
+        output: The tool's result, or None if the call failed.
+        error: The exception the call raised, or None on success.
+    """
+
+    index: int
+    input: Any
+    output: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the call succeeded."""
+        return self.error is None
+
+
+def _call(func: Callable[[Any], Any], index: int, item: Any) -> BatchResult:
+    try:
+        return BatchResult(index=index, input=item, output=func(item))
+    except Exception as e:
+        return BatchResult(index=index, input=item, error=e)
+
+
+async def _acall(
+    func: Callable[[Any], Awaitable[Any]], index: int, item: Any
+) -> BatchResult:
+    try:
+        return BatchResult(index=index, input=item, output=await func(item))
+    except Exception as e:
+        return BatchResult(index=index, input=item, error=e)
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+
+class _Reorderer:
+    """Buffers out-of-order results and releases them in input order."""
+
+    def __init__(self) -> None:
+        self._buffer: Dict[int, BatchResult] = {}
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def push(self, result: BatchResult) -> Iterator[BatchResult]:
+        self._buffer[result.index] = result
+        while self._next in self._buffer:
+            yield self._buffer.pop(self._next)
+            self._next += 1
+
+
+def iter_batch(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = False,
+) -> Iterator[BatchResult]:
+    """Call ``func`` on every item from a thread pool, yielding `BatchResult`s.
+
+    With ``ordered=False`` results are yielded as soon as they complete;
+    with ``ordered=True`` they're yielded in input order.
+    """
+    _check_concurrency(concurrency)
+    source = enumerate(items)
+    reorderer = _Reorderer()
+    max_buffered = concurrency * ORDERED_BUFFER_FACTOR
+    pending: Set[Future] = set()
+
+    pool = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+
+        def fill() -> None:
+            while len(pending) < concurrency and len(reorderer) < max_buffered:
+                try:
+                    index, item = next(source)
+                except StopIteration:
+                    return
+                pending.add(pool.submit(_call, func, index, item))
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.remove(future)
+                result = future.result()
+                if ordered:
+                    yield from reorderer.push(result)
+                else:
+                    yield result
+            fill()
+    finally:
+        # Runs on normal exhaustion and when the caller stops iterating
+        # early - either way, don't start anything that hasn't started.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_batch(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ordered: bool = False,
+) -> AsyncIterator[BatchResult]:
+    """Async counterpart of `iter_batch`, running ``func`` as asyncio tasks."""
+    _check_concurrency(concurrency)
+    source = enumerate(items)
+    reorderer = _Reorderer()
+    max_buffered = concurrency * ORDERED_BUFFER_FACTOR
+    pending: Set["asyncio.Task[BatchResult]"] = set()
+
+    def fill() -> None:
+        while len(pending) < concurrency and len(reorderer) < max_buffered:
+            try:
+                index, item = next(source)
+            except StopIteration:
+                return
+            pending.add(asyncio.ensure_future(_acall(func, index, item)))
+
+    try:
+        fill()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.remove(task)
+                result = task.result()
+                if ordered:
+                    for ready in reorderer.push(result):
+                        yield ready
+                else:
+                    yield result
+            fill()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def normalize_batch_input(item: Any) -> Dict[str, Any]:
+    """Turn a batch input into a tool-input dict.
+
+    Accepts a bare URL string, a dict of tool arguments, or an instance of
+    the tool's pydantic input schema.
+    """
+    if isinstance(item, str):
+        return {"url": item}
+    if hasattr(item, "model_dump"):
+        return item.model_dump(exclude_none=True)
+    return dict(item)
@@ -0,0 +1,95 @@
+"""Typed, zero-copy container for binary Zenrows results.
+
+Screenshots and PDFs come back from Zenrows as raw bytes. `BinaryContent`
+wraps those bytes without copying them: `data` is a read-only `memoryview`
+over the original buffer, and base64 / data-URI encodings are only
+computed - once - if asked for. `ZenrowsFetch(binary_output=True)` returns
+one for every screenshot and PDF request.
+"""
+
+import base64
+import os
+from typing import Any, Mapping, Optional, Union
+
+DEFAULT_SCREENSHOT_MIME_TYPE = "image/png"
+
+
+def guess_mime_type(
+    params: Mapping[str, Any], content_type: Optional[str] = None
+) -> str:
+    """MIME type of a binary result - the response's ``Content-Type`` when
+    it has one, otherwise inferred from the request parameters."""
+    if isinstance(content_type, str) and content_type.strip():
+        return content_type.split(";", 1)[0].strip()
+    if params.get("response_type") == "pdf":
+        return "application/pdf"
+    if params.get("screenshot_format") == "jpeg":
+        return "image/jpeg"
+    return DEFAULT_SCREENSHOT_MIME_TYPE
+
+
+class BinaryContent:
+    """Binary payload plus its MIME type, without defensive copies.
+
+    Args:
+        data: The raw bytes, as received. Kept as-is, never copied.
+        mime_type: e.g. ``"image/png"`` or ``"application/pdf"``.
+    """
+
+    __slots__ = ("_data", "mime_type", "_base64")
+
+    def __init__(self, data: bytes, mime_type: str):
+        self._data = data
+        self.mime_type = mime_type
+        self._base64: Optional[str] = None
+
+    @property
+    def data(self) -> memoryview:
+        """Read-only view of the payload - slicing it doesn't copy."""
+        return memoryview(self._data)
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __bytes__(self) -> bytes:
+        # `bytes` is immutable, so handing out the original is safe.
+        return self._data
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BinaryContent):
+            return self.mime_type == other.mime_type and self._data == other._data
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self._data == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.mime_type, self._data))
+
+    def __repr__(self) -> str:
+        # Also what an agent sees if the result ends up in a message -
+        # far better than megabytes of escaped binary.
+        return f"<BinaryContent {self.mime_type}, {self.nbytes} bytes>"
+
+    __str__ = __repr__
+
+    def to_base64(self) -> str:
+        """Base64 encoding of the payload, computed once on first use."""
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self._data).decode("ascii")
+        return self._base64
+
+    def to_data_uri(self) -> str:
+        """``data:`` URI, e.g. for multimodal LLM messages."""
+        return f"data:{self.mime_type};base64,{self.to_base64()}"
+
+    def save_to(self, path: Union[str, "os.PathLike[str]"]) -> str:
+        """Write the payload to ``path`` straight from the buffer; returns
+        the path written."""
+        path = os.fspath(path)
+        with open(path, "wb") as f:
+            f.write(self.data)
+        return path
@@ -0,0 +1,298 @@
+"""Response cache for the Zenrows tools.
+
+Every Zenrows call is billed and can take seconds, so repeat scrapes of the
+same page with the same parameters can be answered from a cache instead.
+Give a tool a ``cache`` to enable it; entries are keyed on
+`request_fingerprint()` - a canonical hash of the prepared request
+parameters (minus ``apikey``) and custom headers.
+
+Backends:
+
+- `InMemoryCache` - per-process LRU with a TTL.
+- `SQLiteCache` - on-disk, survives restarts, shareable between processes
+  on one machine.
+- `RedisCache` - wraps any Redis-compatible client (``redis.Redis``,
+  ``fakeredis``, ...), for caches shared across machines.
+
+Per call, ``cache_bypass=True`` skips the lookup (the fresh result still
+refreshes the cache) and ``cache_max_age=<seconds>`` rejects entries older
+than that.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple, Union
+
+CacheValue = Union[str, bytes]
+
+# Never part of a cache key: the same request made with two keys (or a
+# rotated key) returns the same page.
+_UNKEYED_PARAMS = frozenset({"apikey"})
+
+
+def request_fingerprint(
+    params: Dict[str, Any], request_headers: Optional[Dict[str, str]] = None
+) -> str:
+    """Canonical hash of a prepared Zenrows request.
+
+    Parameter order doesn't matter and ``apikey`` is excluded. Custom
+    headers are included - they're forwarded to the target and can change
+    the page it returns.
+    """
+    canonical = json.dumps(
+        {
+            "params": {k: v for k, v in params.items() if k not in _UNKEYED_PARAMS},
+            "headers": request_headers or {},
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    """A cached tool result and when it was stored (Unix time)."""
+
+    value: CacheValue
+    stored_at: float
+
+    @property
+    def age(self) -> float:
+        """Seconds since the entry was stored."""
+        return time.time() - self.stored_at
+
+
+class ZenrowsCache(ABC):
+    """Base class for cache backends.
+
+    Subclasses implement `get` / `set` / `delete` / `clear`. The async
+    methods default to running the sync ones in a worker thread, so a slow
+    backend (disk, network) never blocks the event loop.
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: CacheValue) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _expired(self, entry: CacheEntry) -> bool:
+        return self.ttl is not None and entry.age > self.ttl
+
+    def lookup(self, key: str, max_age: Optional[float] = None) -> Optional[CacheValue]:
+        """Return the cached value for ``key``, unless it's missing or older
+        than ``max_age`` seconds."""
+        entry = self.get(key)
+        if entry is None or (max_age is not None and entry.age > max_age):
+            return None
+        return entry.value
+
+    async def aget(self, key: str) -> Optional[CacheEntry]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: CacheValue) -> None:
+        await asyncio.to_thread(self.set, key, value)
+
+    async def alookup(
+        self, key: str, max_age: Optional[float] = None
+    ) -> Optional[CacheValue]:
+        """Async counterpart of `lookup`."""
+        entry = await self.aget(key)
+        if entry is None or (max_age is not None and entry.age > max_age):
+            return None
+        return entry.value
+
+
+class InMemoryCache(ZenrowsCache):
+    """Thread-safe in-process LRU cache with a TTL.
+
+    Args:
+        maxsize: Max entries kept; the least recently used is evicted first.
+        ttl: Seconds an entry stays valid. None keeps entries until evicted.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 3600.0):
+        super().__init__(ttl=ttl)
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, value: CacheValue) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(value=value, stored_at=time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    # Pure in-memory work - no point paying for a thread hop.
+    async def aget(self, key: str) -> Optional[CacheEntry]:
+        return self.get(key)
+
+    async def aset(self, key: str, value: CacheValue) -> None:
+        self.set(key, value)
+
+
+class SQLiteCache(ZenrowsCache):
+    """On-disk cache in a single SQLite file.
+
+    Args:
+        path: Database file; created if missing. ``":memory:"`` works too.
+        ttl: Seconds an entry stays valid. None keeps entries forever.
+    """
+
+    def __init__(self, path: str = "zenrows_cache.sqlite3", ttl: Optional[float] = 86400.0):
+        super().__init__(ttl=ttl)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS zenrows_cache ("
+                " key TEXT PRIMARY KEY,"
+                " stored_at REAL NOT NULL,"
+                " is_bytes INTEGER NOT NULL,"
+                " value BLOB NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT stored_at, is_bytes, value FROM zenrows_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        stored_at, is_bytes, value = row
+        entry = CacheEntry(
+            value=bytes(value) if is_bytes else bytes(value).decode("utf-8"),
+            stored_at=stored_at,
+        )
+        if self._expired(entry):
+            self.delete(key)
+            return None
+        return entry
+
+    def set(self, key: str, value: CacheValue) -> None:
+        is_bytes = isinstance(value, bytes)
+        blob = value if is_bytes else value.encode("utf-8")
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO zenrows_cache VALUES (?, ?, ?, ?)",
+                (key, time.time(), int(is_bytes), sqlite3.Binary(blob)),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM zenrows_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM zenrows_cache")
+
+    def purge_expired(self) -> int:
+        """Delete every expired entry now; returns how many were removed."""
+        if self.ttl is None:
+            return 0
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM zenrows_cache WHERE stored_at < ?",
+                (time.time() - self.ttl,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RedisCache(ZenrowsCache):
+    """Cache on a Redis-compatible server.
+
+    Args:
+        client: Any client exposing ``get(key)``, ``set(key, value, ex=...)``
+            and ``delete(key)`` on bytes - e.g. ``redis.Redis()``. Expiry is
+            delegated to the server via ``ex``.
+        ttl: Seconds an entry stays valid. None keeps entries forever.
+        prefix: Namespace for this cache's keys.
+    """
+
+    def __init__(self, client: Any, ttl: Optional[float] = 3600.0, prefix: str = "zenrows:"):
+        super().__init__(ttl=ttl)
+        self.client = client
+        self.prefix = prefix
+
+    @staticmethod
+    def _encode(value: CacheValue, stored_at: float) -> bytes:
+        kind, blob = (b"b", value) if isinstance(value, bytes) else (b"s", value.encode("utf-8"))
+        return kind + repr(stored_at).encode("ascii") + b"\n" + blob
+
+    @staticmethod
+    def _decode(raw: bytes) -> Tuple[CacheValue, float]:
+        header, _, blob = raw.partition(b"\n")
+        stored_at = float(header[1:])
+        return (blob if header[:1] == b"b" else blob.decode("utf-8")), stored_at
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            return None
+        value, stored_at = self._decode(raw)
+        entry = CacheEntry(value=value, stored_at=stored_at)
+        return None if self._expired(entry) else entry
+
+    def set(self, key: str, value: CacheValue) -> None:
+        ex = max(1, math.ceil(self.ttl)) if self.ttl is not None else None
+        self.client.set(self.prefix + key, self._encode(value, time.time()), ex=ex)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.prefix + key)
+
+    def clear(self) -> None:
+        """Delete this cache's keys. Needs a client with ``scan_iter``."""
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
@@ -0,0 +1,293 @@
+"""Cooperative cancellation of in-flight Zenrows requests.
+
+A scrape that nobody is waiting for any more - the LangGraph run was
+cancelled, the user left the chat - shouldn't keep holding a socket and a
+slot of the plan's concurrency. So abandoned calls are torn down where they
+are, and the limiter slot goes back to the next caller:
+
+- **async**: cancel the task running ``_arun`` / ``ainvoke``. The request is
+  cancelled wherever it is - queued at the limiter, in flight (httpx closes
+  the connection) or backing off between retries.
+- **sync**: pass a `CancelToken` in the run config and call `cancel()` from
+  any thread::
+
+      token = CancelToken()
+      config = {"configurable": {"zenrows_cancel": token}}
+      threading.Thread(target=scraper.invoke, args=({"url": url}, config)).start()
+      ...
+      token.cancel()  # the blocked call fails with "Request cancelled"
+
+  A thread waiting for a limiter slot or backing off wakes up at once; one
+  waiting on Zenrows has its connection shut down under it. Shutting the
+  socket down needs the connection classes `CancellableAdapter` mounts,
+  which sessions from `create_session()` (and so the default one) have; on
+  a session without it, the call stops before its next attempt instead.
+  The same token works on the async path too, and on streamed fetches
+  (``iter_content`` and friends) until the body has been read.
+
+A cancelled call is never retried, and fails with a "Request cancelled"
+`ValueError` (sync, or async through a token) or `asyncio.CancelledError`
+(a cancelled task).
+"""
+
+import asyncio
+import socket
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, List, Mapping, Optional, TypeVar
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+T = TypeVar("T")
+
+# `configurable` key read from the LangChain run config.
+CONFIG_CANCEL_KEY = "zenrows_cancel"
+
+
+class RequestCancelled(Exception):
+    """The call was cancelled through its `CancelToken`. Never retried."""
+
+
+class CancelToken:
+    """Cancels the calls it's passed to, from any thread.
+
+    Once cancelled it stays cancelled: calls started with it afterwards fail
+    straight away. Use a fresh token per run.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    def __repr__(self) -> str:
+        return f"CancelToken(cancelled={self.cancelled})"
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether `cancel` has been called."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel every call using this token. Idempotent."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def raise_if_cancelled(self) -> None:
+        """Raises:
+        RequestCancelled: If the token has been cancelled."""
+        if self._event.is_set():
+            raise RequestCancelled("the call was cancelled")
+
+    def sleep(self, seconds: float) -> None:
+        """`time.sleep` that wakes up early, raising `RequestCancelled`,
+        when the token is cancelled."""
+        if self._event.wait(seconds):
+            self.raise_if_cancelled()
+
+    @contextmanager
+    def on_cancel(self, callback: Callable[[], None]) -> Iterator[None]:
+        """Run ``callback`` (in the cancelling thread) if the token is
+        cancelled during the block - or right away if it already is."""
+        with self._lock:
+            registered = not self._event.is_set()
+            if registered:
+                self._callbacks.append(callback)
+        if not registered:
+            callback()
+        try:
+            yield
+        finally:
+            if registered:
+                with self._lock:
+                    if callback in self._callbacks:
+                        self._callbacks.remove(callback)
+
+
+def call_cancel_token(configurable: Mapping[str, Any]) -> Optional[CancelToken]:
+    """The `CancelToken` set in the run config's ``configurable``, if any."""
+    token = configurable.get(CONFIG_CANCEL_KEY)
+    if token is not None and not isinstance(token, CancelToken):
+        raise ValueError(f"{CONFIG_CANCEL_KEY} must be a CancelToken")
+    return token
+
+
+async def cancelled_by(token: CancelToken, fn: Callable[[], Awaitable[T]]) -> T:
+    """Await ``fn()``, cancelling it if ``token`` is cancelled first - from
+    any thread.
+
+    Raises:
+        RequestCancelled: If the token was cancelled.
+    """
+    token.raise_if_cancelled()
+    loop = asyncio.get_running_loop()
+    task = asyncio.ensure_future(fn())
+    with token.on_cancel(lambda: loop.call_soon_threadsafe(task.cancel)):
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            # Only our own cancel becomes RequestCancelled; the caller's
+            # task being cancelled propagates as usual (3.11+ can tell).
+            if token.cancelled and not getattr(current, "cancelling", int)():
+                raise RequestCancelled("the call was cancelled") from None
+            raise
+
+
+# -- aborting a blocked `requests` call --------------------------------------
+
+
+class _Abort:
+    """Shuts down the socket of the connection the current attempt uses."""
+
+    __slots__ = ("token", "connection", "sock")
+
+    def __init__(self, token: CancelToken) -> None:
+        self.token = token
+        self.connection: Optional[HTTPConnection] = None
+        # Kept once the response starts: a connection that won't be reused
+        # (``Connection: close``) drops its socket to the response's body.
+        self.sock: Optional[socket.socket] = None
+
+    def bind(self, connection: HTTPConnection) -> None:
+        self.connection = connection
+        self.token.raise_if_cancelled()
+
+    def __call__(self) -> None:
+        sock = self.sock or getattr(self.connection, "sock", None)
+        if sock is not None:
+            try:
+                # Unblocks the thread reading from it; urllib3 then discards
+                # the connection rather than returning it to the pool.
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+_active_abort: ContextVar[Optional[_Abort]] = ContextVar(
+    "zenrows_active_abort", default=None
+)
+
+
+@contextmanager
+def _cancelled_as(token: CancelToken) -> Iterator[None]:
+    """Re-raise whatever the block raises once ``token`` is cancelled - the
+    aborted connection's error - as `RequestCancelled`."""
+    try:
+        yield
+    except RequestCancelled:
+        raise
+    except Exception as e:
+        if token.cancelled:
+            raise RequestCancelled("the call was cancelled") from e
+        raise
+
+
+@contextmanager
+def cancellable(token: CancelToken) -> Iterator[None]:
+    """Let ``token`` abort the `requests` call made in the block.
+
+    Raises:
+        RequestCancelled: If the token is cancelled before or during it.
+    """
+    token.raise_if_cancelled()
+    abort = _Abort(token)
+    reset = _active_abort.set(abort)
+    try:
+        with token.on_cancel(abort), _cancelled_as(token):
+            yield
+    finally:
+        _active_abort.reset(reset)
+
+
+@contextmanager
+def cancellable_stream(
+    token: CancelToken, open_stream: Callable[[], Response]
+) -> Iterator[Response]:
+    """`cancellable` for a streamed `requests` response: ``open_stream()``
+    sends the request, and ``token`` can abort it - or the body being read
+    in the block. The response is closed on exit.
+
+    Only opening the response binds the connection, so other requests made
+    while the block reads the body aren't aborted along with it.
+
+    Raises:
+        RequestCancelled: If the token is cancelled before or during it.
+    """
+    token.raise_if_cancelled()
+    abort = _Abort(token)
+    with token.on_cancel(abort), _cancelled_as(token):
+        reset = _active_abort.set(abort)
+        try:
+            response = open_stream()
+        finally:
+            _active_abort.reset(reset)
+        with response:
+            yield response
+
+
+class _CancellableMixin:
+    """Registers the connection with the running attempt's `_Abort`, so a
+    `CancelToken` can shut it down."""
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        abort = _active_abort.get()
+        if abort is not None:
+            abort.bind(self)  # type: ignore[arg-type]
+        return super().request(*args, **kwargs)  # type: ignore[misc]
+
+    def getresponse(self, *args: Any, **kwargs: Any) -> Any:
+        abort = _active_abort.get()
+        if abort is not None:
+            # The socket exists by now, so a later cancel() can shut it down.
+            abort.sock = getattr(self, "sock", None)
+            abort.token.raise_if_cancelled()
+        return super().getresponse(*args, **kwargs)  # type: ignore[misc]
+
+
+class _CancellableHTTPConnection(_CancellableMixin, HTTPConnection):
+    pass
+
+
+class _CancellableHTTPSConnection(_CancellableMixin, HTTPSConnection):
+    pass
+
+
+class _CancellableHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CancellableHTTPConnection
+
+
+class _CancellableHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CancellableHTTPSConnection
+
+
+_POOL_CLASSES = {
+    "http": _CancellableHTTPConnectionPool,
+    "https": _CancellableHTTPSConnectionPool,
+}
+
+
+class CancellableAdapter(HTTPAdapter):
+    """`HTTPAdapter` whose connections a `CancelToken` can shut down
+    mid-request. Mount it on your own session to get the same behavior as
+    `create_session()`'s."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _POOL_CLASSES
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs: Any) -> Any:
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        # SOCKS proxies bring their own connection classes.
+        if not proxy.lower().startswith("socks"):
+            manager.pool_classes_by_scheme = _POOL_CLASSES
+        return manager
@@ -0,0 +1,80 @@
+"""Per-domain memory of which sites Extract can't handle.
+
+While Extract is in beta, Zenrows answers ``402 AUTH010`` for domains not
+enabled for it, and `ZenrowsExtract` then retries with Autoparse - paying for
+a failing request first, on every call. Give the tool a
+`DomainCapabilityCache` and it remembers domains that answered ``AUTH010``,
+sending later calls for them straight to Autoparse.
+
+Entries expire after ``ttl`` seconds, so a domain enabled for Extract later
+gets tried again.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# Domains are enabled for the Extract beta on request, which takes a while;
+# re-probing once a day is frequent enough to notice.
+DEFAULT_CAPABILITY_TTL = 86400.0
+
+
+def domain_of(url: Optional[str]) -> Optional[str]:
+    """Lowercased host of ``url``, or None if it has none."""
+    if not url:
+        return None
+    try:
+        return urlsplit(url).hostname
+    except ValueError:
+        return None
+
+
+class DomainCapabilityCache:
+    """Thread-safe set of domains known to answer ``AUTH010``, with a TTL.
+
+    One instance can be shared by several tools (of the same account).
+
+    Args:
+        ttl: Seconds a domain stays marked. None keeps it until `forget`.
+    """
+
+    def __init__(self, ttl: Optional[float] = DEFAULT_CAPABILITY_TTL):
+        self.ttl = ttl
+        self._marked: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._marked)
+
+    def mark_unsupported(self, url: Optional[str]) -> None:
+        """Record that Extract isn't enabled for ``url``'s domain."""
+        domain = domain_of(url)
+        if domain is not None:
+            with self._lock:
+                self._marked[domain] = time.monotonic()
+
+    def is_unsupported(self, url: Optional[str]) -> bool:
+        """True if ``url``'s domain answered ``AUTH010`` within the TTL."""
+        domain = domain_of(url)
+        if domain is None:
+            return False
+        with self._lock:
+            marked_at = self._marked.get(domain)
+            if marked_at is None:
+                return False
+            if self.ttl is not None and time.monotonic() - marked_at > self.ttl:
+                del self._marked[domain]
+                return False
+            return True
+
+    def forget(self, url: str) -> None:
+        """Un-mark ``url``'s domain (a URL or bare host), e.g. once it's been
+        enabled for Extract."""
+        domain = domain_of(url if "//" in url else f"//{url}")
+        with self._lock:
+            self._marked.pop(domain, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._marked.clear()
@@ -0,0 +1,771 @@
+"""The transport engine both Zenrows tools send through.
+
+`ZenrowsFetch` and `ZenrowsExtract` differ in how they build a request and
+read the answer, but not in how the request reaches Zenrows. That part lives
+here, in `ZenrowsClient`, as a fixed stack of optional layers - each one a
+slot that's skipped when empty::
+
+    serve:  cache -> single_flight -> compute (the tool's own logic)
+    send:   middleware -> retry_policy -> key_pool -> limiter -> HTTP
+    stream: middleware (on_request) -> key_pool -> limiter -> HTTP
+
+with ``instrumentation`` (metrics) observing the call and every attempt
+through the call's `RequestTrace`. The tools build a client from their own
+fields per call, so configuring a tool is unchanged; a client can also be
+used directly to send already-prepared params::
+
+    client = ZenrowsClient(retry_policy=RetryPolicy())
+    trace = client.trace("my_scraper", url)
+    response = client.send({"url": url, "apikey": key}, None, trace)
+
+Errors are left as the HTTP library raised them; `mapped_errors` turns them
+into the tools' `ValueError`s. A failing cache backend is logged and skipped
+instead: the cache only saves calls, it mustn't fail them.
+"""
+
+import logging
+import time
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from dataclasses import replace
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    NoReturn,
+    Optional,
+    Sequence,
+    Union,
+)
+
+import httpx
+import requests
+from langchain_core.runnables.config import ensure_config
+
+from langchain_zenrows.zenrows_cache import (
+    CacheValue,
+    ZenrowsCache,
+    request_fingerprint,
+)
+from langchain_zenrows.zenrows_cancel import (
+    CancelToken,
+    RequestCancelled,
+    call_cancel_token,
+    cancellable,
+    cancellable_stream,
+    cancelled_by,
+)
+from langchain_zenrows.zenrows_deadline import (
+    DeadlineExceeded,
+    ZenrowsTimeouts,
+    call_deadline,
+    httpx_timeout,
+    remaining,
+    requests_timeout,
+    within,
+)
+from langchain_zenrows.zenrows_http import (
+    get_default_async_client,
+    get_default_session,
+    get_encoded,
+)
+from langchain_zenrows.zenrows_instrumentation import ZenrowsInstrumentation
+from langchain_zenrows.zenrows_keypool import KeyLease, ZenrowsKeyPool
+from langchain_zenrows.zenrows_limiter import ZenrowsRateLimiter, get_default_limiter
+from langchain_zenrows.zenrows_middleware import (
+    ZenrowsMiddleware,
+    ZenrowsRequest,
+    arun_middleware,
+    run_middleware,
+    run_on_request,
+)
+from langchain_zenrows.zenrows_result import RequestTrace, ZenrowsResult
+from langchain_zenrows.zenrows_retry import RetryPolicy
+from langchain_zenrows.zenrows_singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.zenrows.com/v1/"
+
+HTTPError = Union[requests.exceptions.HTTPError, httpx.HTTPStatusError]
+
+
+def raise_for_http_error(e: HTTPError) -> NoReturn:
+    """Map a non-2xx Zenrows response onto a `ValueError`. Works for both the
+    sync (`requests`) and async (`httpx`) errors - both carry `.response`."""
+    if e.response.status_code == 401:
+        raise ValueError("Invalid Zenrows API key")
+    elif e.response.status_code == 429:
+        raise ValueError("Rate limit exceeded. Check your Zenrows plan limits.")
+    elif e.response.status_code == 413:
+        raise ValueError(
+            "Response size too large. Consider using CSS selectors to reduce content."
+        )
+    else:
+        raise ValueError(
+            f"HTTP error occurred: {e.response.status_code} - {e.response.text}"
+        )
+
+
+class mapped_errors:
+    """Context manager re-raising anything its block raises as the tools'
+    `ValueError`s - HTTP errors via ``on_http_error``. Covers the sync and
+    async transports. A class rather than a generator, as it wraps every
+    call."""
+
+    __slots__ = ("on_http_error",)
+
+    def __init__(
+        self, on_http_error: Callable[[HTTPError], None] = raise_for_http_error
+    ):
+        self.on_http_error = on_http_error
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type: Any, e: Any, tb: Any) -> bool:
+        if e is None or not isinstance(e, Exception):
+            return False
+        if isinstance(e, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+            self.on_http_error(e)
+            return False
+        if isinstance(e, RequestCancelled):
+            raise ValueError(f"Request cancelled: {str(e)}.")
+        if isinstance(e, DeadlineExceeded):
+            raise ValueError(f"Request timed out: {str(e)}.")
+        if isinstance(e, (requests.exceptions.Timeout, httpx.TimeoutException)):
+            raise ValueError(
+                "Request timed out. The website might be slow or unresponsive."
+            )
+        if isinstance(e, (requests.exceptions.RequestException, httpx.RequestError)):
+            raise ValueError(f"Request failed: {str(e)}")
+        raise ValueError(f"Unexpected error: {str(e)}")
+
+
+def start_trace(
+    tool: str,
+    url: Optional[str],
+    instrumentation: Optional[ZenrowsInstrumentation] = None,
+    timeouts: Optional[ZenrowsTimeouts] = None,
+) -> RequestTrace:
+    """Start a call's trace, with the deadline and `CancelToken` the current
+    LangChain run config (and ``timeouts``) give it."""
+    configurable = ensure_config().get("configurable") or {}
+    return RequestTrace(
+        tool,
+        url,
+        instrumentation,
+        call_deadline(timeouts, configurable),
+        call_cancel_token(configurable),
+    )
+
+
+class ZenrowsClient:
+    """Sends prepared Zenrows requests through the configured layers.
+
+    Every argument but ``base_url`` is an optional layer; None skips it
+    (``session`` / ``async_client`` / ``limiter`` fall back to the
+    process-wide shared ones instead).
+
+    Args:
+        base_url: The Zenrows API endpoint.
+        session: Sync connection pool.
+        async_client: Async connection pool.
+        limiter: Concurrency / rate limiter. Unused with a ``key_pool``,
+            whose keys have their own.
+        retry_policy: Retries for transient failures.
+        key_pool: API keys to spread attempts over, with failover.
+        cache: Response cache consulted by `serve`.
+        single_flight: Request coalescing for `serve`.
+        instrumentation: Hooks for the traces this client starts.
+        middleware: Your own request / response hooks, outermost first.
+        timeouts: Connect / read timeouts per attempt, and the default
+            budget for calls whose trace this client starts.
+    """
+
+    __slots__ = (
+        "base_url",
+        "session",
+        "async_client",
+        "limiter",
+        "retry_policy",
+        "key_pool",
+        "cache",
+        "single_flight",
+        "instrumentation",
+        "middleware",
+        "timeouts",
+    )
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_BASE_URL,
+        *,
+        session: Optional[requests.Session] = None,
+        async_client: Optional[httpx.AsyncClient] = None,
+        limiter: Optional[ZenrowsRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        key_pool: Optional[ZenrowsKeyPool] = None,
+        cache: Optional[ZenrowsCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        instrumentation: Optional[ZenrowsInstrumentation] = None,
+        middleware: Sequence[ZenrowsMiddleware] = (),
+        timeouts: Optional[ZenrowsTimeouts] = None,
+    ):
+        self.base_url = base_url
+        self.session = session
+        self.async_client = async_client
+        self.limiter = limiter
+        self.retry_policy = retry_policy
+        self.key_pool = key_pool
+        self.cache = cache
+        self.single_flight = single_flight
+        self.instrumentation = instrumentation
+        self.middleware = middleware
+        self.timeouts = timeouts
+
+    def get_session(self) -> requests.Session:
+        """Return the pooled sync session requests go through."""
+        return self.session or get_default_session()
+
+    def get_async_client(self) -> httpx.AsyncClient:
+        """Return the pooled async client requests go through."""
+        return self.async_client or get_default_async_client()
+
+    def get_limiter(self) -> ZenrowsRateLimiter:
+        """Return the rate limiter requests go through without a key pool."""
+        return self.limiter or get_default_limiter()
+
+    def trace(self, tool: str, url: Optional[str]) -> RequestTrace:
+        """Start a call's trace, reporting to this client's instrumentation;
+        see `start_trace`."""
+        return start_trace(tool, url, self.instrumentation, self.timeouts)
+
+    # -- serve: cache and coalescing around a whole call --------------------
+
+    def serve(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        compute: Callable[[RequestTrace], ZenrowsResult],
+        *,
+        cache_bypass: bool = False,
+        cache_max_age: Optional[float] = None,
+        from_cache: Optional[Callable[[CacheValue], Any]] = None,
+        to_cache: Optional[Callable[[Any], CacheValue]] = None,
+    ) -> ZenrowsResult:
+        """Serve one call - from the cache, a coalesced in-flight call, or
+        ``compute``. Errors propagate unmapped.
+
+        Args:
+            params: The prepared params; with ``request_headers``, the key
+                the call is cached and coalesced under.
+            request_headers: Custom headers forwarded to the target.
+            trace: The call's trace.
+            compute: Produces the result on a miss, typically via `send`,
+                filling in the trace it's given: the call's own, or - for
+                a coalesced call, which may outlive the caller that
+                started it - one of its own, uninstrumented.
+            cache_bypass: Skip the lookup (the result is still stored).
+            cache_max_age: Ignore cached entries older than this, in seconds.
+            from_cache: Rebuilds the content from a cached value.
+            to_cache: Turns the content into what's cached.
+        """
+        request_key = None
+        if self.cache is not None or self.single_flight is not None:
+            request_key = request_fingerprint(params, request_headers)
+
+        if self.cache is not None and not cache_bypass:
+            cached = self._lookup(request_key, cache_max_age)
+            if cached is not None:
+                return self._cached_result(params, trace, cached, from_cache)
+
+        if self.single_flight is not None:
+            # Identical concurrent calls share one upstream request. A
+            # caller's token and deadline end only its own wait; the request
+            # is cancelled once every caller waiting on it has given up.
+            upstream = CancelToken()
+            result, shared = self.single_flight.do(
+                request_key,
+                lambda: compute(RequestTrace(trace.tool, cancel_token=upstream)),
+                trace.cancel_token,
+                trace.deadline,
+                upstream.cancel,
+            )
+        else:
+            result, shared = compute(trace), False
+
+        if self.cache is not None:
+            content = result.content
+            self._store(request_key, to_cache(content) if to_cache else content)
+        return replace(
+            result,
+            coalesced=shared,
+            total_seconds=time.perf_counter() - trace.started,
+        )
+
+    async def aserve(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        compute: Callable[[RequestTrace], Awaitable[ZenrowsResult]],
+        *,
+        cache_bypass: bool = False,
+        cache_max_age: Optional[float] = None,
+        from_cache: Optional[Callable[[CacheValue], Any]] = None,
+        to_cache: Optional[Callable[[Any], CacheValue]] = None,
+    ) -> ZenrowsResult:
+        """Async counterpart of `serve`."""
+        request_key = None
+        if self.cache is not None or self.single_flight is not None:
+            request_key = request_fingerprint(params, request_headers)
+
+        if self.cache is not None and not cache_bypass:
+            cached = await self._alookup(request_key, cache_max_age)
+            if cached is not None:
+                return self._cached_result(params, trace, cached, from_cache)
+
+        if self.single_flight is not None:
+            # `ado` cancels the request once every caller has given up.
+            result, shared = await self.single_flight.ado(
+                request_key,
+                lambda: compute(RequestTrace(trace.tool)),
+                trace.cancel_token,
+                trace.deadline,
+            )
+        else:
+            result, shared = await compute(trace), False
+
+        if self.cache is not None:
+            content = result.content
+            await self._astore(request_key, to_cache(content) if to_cache else content)
+        return replace(
+            result,
+            coalesced=shared,
+            total_seconds=time.perf_counter() - trace.started,
+        )
+
+    # A backend error (Redis down, SQLite locked, ...) is a miss on lookup
+    # and skipped on store.
+
+    def _lookup(self, key: str, max_age: Optional[float]) -> Optional[CacheValue]:
+        try:
+            return self.cache.lookup(key, max_age=max_age)
+        except Exception:
+            logger.warning("Zenrows cache lookup failed", exc_info=True)
+            return None
+
+    async def _alookup(
+        self, key: str, max_age: Optional[float]
+    ) -> Optional[CacheValue]:
+        try:
+            return await self.cache.alookup(key, max_age=max_age)
+        except Exception:
+            logger.warning("Zenrows cache lookup failed", exc_info=True)
+            return None
+
+    def _store(self, key: str, value: CacheValue) -> None:
+        try:
+            self.cache.set(key, value)
+        except Exception:
+            logger.warning("Zenrows cache store failed", exc_info=True)
+
+    async def _astore(self, key: str, value: CacheValue) -> None:
+        try:
+            await self.cache.aset(key, value)
+        except Exception:
+            logger.warning("Zenrows cache store failed", exc_info=True)
+
+    @staticmethod
+    def _cached_result(
+        params: Dict[str, Any],
+        trace: RequestTrace,
+        cached: CacheValue,
+        from_cache: Optional[Callable[[CacheValue], Any]],
+    ) -> ZenrowsResult:
+        return ZenrowsResult(
+            content=from_cache(cached) if from_cache else cached,
+            url=params.get("url"),
+            cache_hit=True,
+            total_seconds=time.perf_counter() - trace.started,
+        )
+
+    # -- send: one Zenrows request, retried, keyed and rate limited --------
+
+    def send(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str] = None,
+    ) -> requests.Response:
+        """Send one Zenrows request through the middleware, retried per
+        `retry_policy` if set, within ``trace.deadline`` and until
+        ``trace.cancel_token`` is cancelled.
+
+        ``request_url`` (from a `FetchTemplate`) already has ``params``
+        encoded into its query string, so it's sent as is instead. Raises
+        `requests.exceptions.HTTPError` (with the response attached) on
+        non-2xx, same as `Response.raise_for_status()`.
+        """
+        if not self.middleware:
+            return self._send_retried(params, request_headers, trace, request_url)
+
+        def send(request: ZenrowsRequest) -> requests.Response:
+            return self._send_retried(
+                request.params,
+                request.headers,
+                trace,
+                request.request_url if request.params == params else None,
+            )
+
+        request = ZenrowsRequest(
+            trace.tool, dict(params), dict(request_headers or {}), request_url
+        )
+        response = run_middleware(self.middleware, request, send)
+        trace.response = response
+        response.raise_for_status()
+        return response
+
+    async def asend(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str] = None,
+    ) -> httpx.Response:
+        """Async counterpart of `send`. Raises `httpx.HTTPStatusError` (with
+        the response attached) on non-2xx. Past ``trace.deadline``, or once
+        ``trace.cancel_token`` is cancelled, the request is cancelled wherever
+        it is - queued, in flight or backing off."""
+        if trace.deadline is None and trace.cancel_token is None:
+            return await self._asend_chain(
+                params, request_headers, trace, request_url
+            )
+
+        def send() -> Awaitable[httpx.Response]:
+            return self._asend_chain(params, request_headers, trace, request_url)
+
+        token = trace.cancel_token
+        if token is None:
+            return await within(trace.deadline, send)
+        if trace.deadline is None:
+            return await cancelled_by(token, send)
+        return await within(trace.deadline, lambda: cancelled_by(token, send))
+
+    async def _asend_chain(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+    ) -> httpx.Response:
+        """`asend` without the deadline."""
+        if not self.middleware:
+            return await self._asend_retried(
+                params, request_headers, trace, request_url
+            )
+
+        async def send(request: ZenrowsRequest) -> httpx.Response:
+            return await self._asend_retried(
+                request.params,
+                request.headers,
+                trace,
+                request.request_url if request.params == params else None,
+            )
+
+        request = ZenrowsRequest(
+            trace.tool,
+            dict(params),
+            dict(request_headers or {}),
+            request_url,
+            is_async=True,
+        )
+        response = await arun_middleware(self.middleware, request, send)
+        trace.response = response
+        response.raise_for_status()
+        return response
+
+    def _send_retried(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+    ) -> requests.Response:
+        """Send one request, retried per `retry_policy` if set."""
+        if self.retry_policy is None:
+            return self._send_once(params, request_headers, trace, request_url)
+        return self.retry_policy.call(
+            lambda: self._send_once(params, request_headers, trace, request_url),
+            trace.deadline,
+            trace.cancel_token,
+        )
+
+    async def _asend_retried(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+    ) -> httpx.Response:
+        """Async counterpart of `_send_retried`."""
+        if self.retry_policy is None:
+            return await self._asend_once(params, request_headers, trace, request_url)
+        return await self.retry_policy.acall(
+            lambda: self._asend_once(params, request_headers, trace, request_url),
+            trace.deadline,
+        )
+
+    def _send_once(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+    ) -> requests.Response:
+        """Send one request - with a `key_pool` key if set, failing over to
+        another key if Zenrows rejects this one (but not on `AUTH010`)."""
+        if self.key_pool is None:
+            return self._send_attempt(
+                params, request_headers, trace, request_url, self.get_limiter()
+            )
+
+        def attempt(lease: KeyLease) -> requests.Response:
+            keyed_params, keyed_url = lease.apply(params, request_url)
+            return self._send_attempt(
+                keyed_params, request_headers, trace, keyed_url, lease.limiter
+            )
+
+        return self.key_pool.call(attempt)
+
+    async def _asend_once(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+    ) -> httpx.Response:
+        """Async counterpart of `_send_once`."""
+        if self.key_pool is None:
+            return await self._asend_attempt(
+                params, request_headers, trace, request_url, self.get_limiter()
+            )
+
+        async def attempt(lease: KeyLease) -> httpx.Response:
+            keyed_params, keyed_url = lease.apply(params, request_url)
+            return await self._asend_attempt(
+                keyed_params, request_headers, trace, keyed_url, lease.limiter
+            )
+
+        return await self.key_pool.acall(attempt)
+
+    def _send_attempt(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+        limiter: ZenrowsRateLimiter,
+    ) -> requests.Response:
+        """Issue the request under the rate limiter, with this attempt's
+        timeouts. A cancelled ``trace.cancel_token`` wakes it from the
+        limiter wait, or aborts the request in flight."""
+        token = trace.cancel_token
+        wait = remaining(trace.deadline)
+        with limiter.slot(token, wait) as waited, trace.attempt(waited):
+            timeout = requests_timeout(self.timeouts, trace.deadline)
+            if token is None:
+                response = self._get(params, request_headers, request_url, timeout)
+            else:
+                with cancellable(token):
+                    response = self._get(
+                        params, request_headers, request_url, timeout
+                    )
+            trace.response = response
+            limiter.observe(response.status_code, response.headers)
+        response.raise_for_status()
+        return response
+
+    def _get(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        request_url: Optional[str],
+        timeout: Any,
+    ) -> requests.Response:
+        if request_url is None:
+            return self.get_session().get(
+                self.base_url,
+                params=params,
+                headers=request_headers,  # Pass custom headers if provided
+                timeout=timeout,
+            )
+        return get_encoded(self.get_session(), request_url, request_headers, timeout)
+
+    async def _asend_attempt(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str],
+        limiter: ZenrowsRateLimiter,
+    ) -> httpx.Response:
+        """Async counterpart of `_send_attempt`, on the loop's shared `httpx`
+        pool."""
+        async with limiter.aslot() as waited:
+            with trace.attempt(waited):
+                response = await self.get_async_client().get(
+                    request_url or self.base_url,
+                    params=None if request_url else params,
+                    headers=request_headers,
+                    timeout=httpx_timeout(self.timeouts, trace.deadline),
+                    extensions={"trace": trace.on_httpx_event},
+                )
+                trace.response = response
+                limiter.observe(response.status_code, response.headers)
+        response.raise_for_status()
+        return response
+
+    # -- stream: one request whose body is read as it arrives ---------------
+
+    def _stream_lease(self) -> ContextManager[Optional[KeyLease]]:
+        """Borrow a `key_pool` key for a streamed request - which can't fail
+        over once its body is being read - or nothing without a pool."""
+        if self.key_pool is None:
+            return nullcontext()
+        return self.key_pool.lease()
+
+    @contextmanager
+    def stream(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> Iterator[requests.Response]:
+        """Open one Zenrows request with its body left unread, for the block
+        to stream (``response.iter_content()``). Its key and rate-limiter
+        slot are held until the block exits, and ``trace.cancel_token``
+        can cancel it until then - queued, opening or mid-body.
+
+        Streams skip the cache, coalescing and retries, which all need the
+        complete body, and run only the middleware's `on_request` hooks - a
+        response one answers with is streamed instead. ``trace.deadline``
+        caps the connect and read timeouts the request gets. Raises
+        `requests.exceptions.HTTPError` on non-2xx, before the block runs.
+        """
+        if self.middleware:
+            request = ZenrowsRequest(
+                trace.tool, dict(params), dict(request_headers or {})
+            )
+            answered = run_on_request(self.middleware, request)
+            if answered is not None:
+                answered.raise_for_status()
+                yield answered
+                return
+            params, request_headers = request.params, request.headers
+        with self._stream_lease() as lease:
+            limiter = self.get_limiter()
+            if lease is not None:
+                params, _ = lease.apply(params)
+                limiter = lease.limiter
+            token, wait = trace.cancel_token, remaining(trace.deadline)
+            with limiter.slot(token, wait) as waited:
+                with trace.attempt(waited, streamed=True), self._open_stream(
+                    params, request_headers, trace
+                ) as response:
+                    trace.response = response
+                    if lease is not None:
+                        lease.response = response
+                    limiter.observe(response.status_code, response.headers)
+                    response.raise_for_status()
+                    yield response
+
+    @asynccontextmanager
+    async def astream(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> AsyncIterator[httpx.Response]:
+        """Async counterpart of `stream`, for ``response.aiter_bytes()``.
+        Raises `httpx.HTTPStatusError` on non-2xx. ``trace.cancel_token``
+        cancels the wait and the request; await reads of the body through
+        `cancelled_by` for it to cancel those too."""
+        if self.middleware:
+            request = ZenrowsRequest(
+                trace.tool,
+                dict(params),
+                dict(request_headers or {}),
+                is_async=True,
+            )
+            answered = run_on_request(self.middleware, request)
+            if answered is not None:
+                answered.raise_for_status()
+                yield answered
+                return
+            params, request_headers = request.params, request.headers
+        with self._stream_lease() as lease:
+            limiter = self.get_limiter()
+            if lease is not None:
+                params, _ = lease.apply(params)
+                limiter = lease.limiter
+            token, wait = trace.cancel_token, remaining(trace.deadline)
+            async with limiter.aslot(token, wait) as waited:
+                with trace.attempt(waited, streamed=True):
+                    client = self.get_async_client()
+                    request = client.build_request(
+                        "GET",
+                        self.base_url,
+                        params=params,
+                        headers=request_headers,
+                        timeout=httpx_timeout(self.timeouts, trace.deadline),
+                        extensions={"trace": trace.on_httpx_event},
+                    )
+                    if token is None:
+                        response = await client.send(request, stream=True)
+                    else:
+                        response = await cancelled_by(
+                            token, lambda: client.send(request, stream=True)
+                        )
+                    try:
+                        trace.response = response
+                        if lease is not None:
+                            lease.response = response
+                        limiter.observe(response.status_code, response.headers)
+                        if response.is_error:
+                            # Error bodies are small; read it so the mapped
+                            # error can include it.
+                            await response.aread()
+                        response.raise_for_status()
+                        yield response
+                    finally:
+                        await response.aclose()
+
+    def _open_stream(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> ContextManager[requests.Response]:
+        """Send a streamed request; ``trace.cancel_token`` can abort it, and
+        the read of its body, until the returned context exits."""
+        timeout = requests_timeout(self.timeouts, trace.deadline)
+
+        def open_stream() -> requests.Response:
+            return self.get_session().get(
+                self.base_url,
+                params=params,
+                headers=request_headers,
+                stream=True,
+                timeout=timeout,
+            )
+
+        if trace.cancel_token is None:
+            return open_stream()
+        return cancellable_stream(trace.cancel_token, open_stream)
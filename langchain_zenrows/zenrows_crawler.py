@@ -0,0 +1,672 @@
+"""Crawler built on `ZenrowsFetch` and Zenrows' ``outputs=links``.
+
+`ZenrowsCrawler` starts from seed URLs and follows links breadth-first (or
+in any order a ``priority`` function picks). Pages are fetched with
+``outputs=links`` added to the request, so Zenrows returns each page's links
+as JSON and no HTML is parsed locally.
+
+- Frontier: a priority queue with a sub-queue per host. A host is skipped,
+  without rescanning its queued URLs, while it is at ``max_per_host``
+  in-flight requests or still inside its ``host_delay``.
+- Dedup: URLs are canonicalized (`canonicalize_url`) and checked against a
+  seen-set - an exact `set` by default, or a `BloomFilter` to bound memory
+  on crawls of millions of URLs.
+- Limits: ``max_depth``, ``max_pages``, ``max_pages_per_host`` and the
+  domains links may be followed to.
+
+Every fetch goes through the tool as usual - its limiter, retries, cache and
+instrumentation included.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import json
+import math
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit, urlunsplit
+
+from langchain_zenrows.zenrows_fetch import ZenrowsFetch
+from langchain_zenrows.zenrows_result import ZenrowsResult
+
+# Query parameters that only track where a click came from; dropped during
+# canonicalization so they don't make one page look like many.
+DEFAULT_IGNORED_QUERY_PARAMS = frozenset(
+    {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "gclid",
+        "fbclid",
+        "mc_cid",
+        "mc_eid",
+    }
+)
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_PERCENT_ESCAPE = re.compile(r"%[0-9A-Fa-f]{2}")
+_UNRESERVED = frozenset(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~"
+)
+# Characters left as-is when re-quoting a path: RFC 3986 pchar plus "/" and
+# existing "%" escapes.
+_PATH_SAFE = "/:@!$&'()*+,;=-._~%"
+
+
+def _normalize_escape(match: "re.Match[str]") -> str:
+    char = chr(int(match.group(0)[1:], 16))
+    return char if char in _UNRESERVED else match.group(0).upper()
+
+
+def _remove_dot_segments(path: str) -> str:
+    output: List[str] = []
+    for segment in path.split("/")[1:]:
+        if segment == "..":
+            if output:
+                output.pop()
+        elif segment != ".":
+            output.append(segment)
+    if path.rsplit("/", 1)[-1] in (".", ".."):
+        output.append("")  # "/a/b/.." -> "/a/", like a browser
+    return "/" + "/".join(output)
+
+
+def canonicalize_url(
+    url: str,
+    *,
+    ignored_query_params: FrozenSet[str] = DEFAULT_IGNORED_QUERY_PARAMS,
+) -> Optional[str]:
+    """Normalize a URL so equivalent spellings compare equal.
+
+    Lowercases the scheme and host, drops default ports, credentials and
+    the fragment, resolves ``.`` / ``..`` path segments, normalizes percent
+    escapes, and sorts the query string minus ``ignored_query_params``.
+
+    Returns:
+        The canonical URL, or None if it isn't an absolute http(s) URL.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = parts.hostname
+    if scheme not in _DEFAULT_PORTS or not host:
+        return None
+    netloc = f"[{host}]" if ":" in host else host
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+
+    path = _PERCENT_ESCAPE.sub(_normalize_escape, parts.path)
+    path = quote(_remove_dot_segments(path or "/"), safe=_PATH_SAFE)
+
+    query = urlencode(
+        sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k not in ignored_query_params
+        )
+    )
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class BloomFilter:
+    """Fixed-memory probabilistic set of strings.
+
+    Never forgets an added item; ``error_rate`` is the chance that an item
+    never added is reported as seen (for a crawler: a page skipped). Memory
+    is about 1.2 bytes per expected item at the default 1% error rate,
+    versus ~100+ for a URL held in a `set`.
+
+    Args:
+        capacity: Expected number of items. Beyond it the error rate climbs.
+        error_rate: Target false-positive rate at ``capacity``.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.01):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Kirsch-Mitzenmacher: k indexes from two independent 64-bit hashes.
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> bool:
+        """Add ``item``. Returns True if it was (probably) not present."""
+        added = False
+        for pos in self._positions(item):
+            byte, bit = divmod(pos, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        self._count += added
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item)
+        )
+
+    def __len__(self) -> int:
+        """Items added (approximate: false positives aren't counted)."""
+        return self._count
+
+
+class _SeenSet:
+    """Exact seen-set with the same ``add`` contract as `BloomFilter`."""
+
+    def __init__(self) -> None:
+        self._items: Set[str] = set()
+
+    def add(self, item: str) -> bool:
+        if item in self._items:
+            return False
+        self._items.add(item)
+        return True
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class _Entry(NamedTuple):
+    priority: float
+    seq: int
+    url: str
+    host: str
+    depth: int
+    parent: Optional[str]
+
+
+class _Frontier:
+    """Priority queue of URLs with per-host concurrency and pacing.
+
+    Each host keeps its own heap; ``_ready`` holds the head of every host
+    that may start a request now, so `pop` never walks URLs of a busy host.
+    ``_ready`` entries are invalidated lazily: one is only used if it still
+    names the head of an available host.
+    """
+
+    def __init__(self, max_per_host: Optional[int], host_delay: float) -> None:
+        self.max_per_host = max_per_host
+        self.host_delay = host_delay
+        self._hosts: Dict[str, List[_Entry]] = {}
+        self._ready: List[Tuple[float, int, str]] = []
+        self._waking: List[Tuple[float, str]] = []
+        self._in_flight: Dict[str, int] = {}
+        self._next_start: Dict[str, float] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _available(self, host: str, now: float) -> bool:
+        if self.max_per_host is not None:
+            if self._in_flight.get(host, 0) >= self.max_per_host:
+                return False
+        return self._next_start.get(host, 0.0) <= now
+
+    def _offer(self, host: str, now: float) -> None:
+        # (Re-)advertise the host's head in `_ready`, or wake it later.
+        queue = self._hosts.get(host)
+        if not queue:
+            return
+        if self._available(host, now):
+            head = queue[0]
+            heapq.heappush(self._ready, (head.priority, head.seq, host))
+        elif self._next_start.get(host, 0.0) > now:
+            heapq.heappush(self._waking, (self._next_start[host], host))
+
+    def push(self, entry: _Entry, now: float) -> None:
+        queue = self._hosts.setdefault(entry.host, [])
+        heapq.heappush(queue, entry)
+        self._size += 1
+        if queue[0] is entry:
+            self._offer(entry.host, now)
+
+    def pop(self, now: float) -> Optional[_Entry]:
+        """The best URL whose host may start a request now, if any."""
+        while self._waking and self._waking[0][0] <= now:
+            self._offer(heapq.heappop(self._waking)[1], now)
+        while self._ready:
+            priority, seq, host = heapq.heappop(self._ready)
+            queue = self._hosts.get(host)
+            if not queue or queue[0].seq != seq or not self._available(host, now):
+                continue  # stale
+            entry = heapq.heappop(queue)
+            if not queue:
+                del self._hosts[host]
+            self._size -= 1
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            if self.host_delay:
+                self._next_start[host] = now + self.host_delay
+            self._offer(host, now)
+            return entry
+        return None
+
+    def release(self, host: str, now: float) -> None:
+        """A request to ``host`` finished."""
+        self._in_flight[host] -= 1
+        if not self._in_flight[host]:
+            del self._in_flight[host]
+        self._offer(host, now)
+
+    def next_wake(self, now: float) -> Optional[float]:
+        """Seconds until a paced host may start again, if any is waiting."""
+        if not self._waking:
+            return None
+        return max(0.0, self._waking[0][0] - now)
+
+
+@dataclass
+class CrawlPage:
+    """One crawled page.
+
+    Attributes:
+        url: Canonical URL that was fetched.
+        depth: Link hops from the nearest seed (seeds are 0).
+        parent: Page the URL was discovered on; None for seeds.
+        links: Links Zenrows reported on the page, resolved against its
+            final URL but not yet canonicalized or filtered.
+        data: The page's full ``outputs`` JSON - e.g. ``headings`` or
+            ``emails`` too, if ``fetch_params`` asked for them.
+        result: The fetch's `ZenrowsResult` (timings, credits, ...).
+        error: The exception the fetch raised, or None on success.
+    """
+
+    url: str
+    depth: int
+    parent: Optional[str] = None
+    links: List[str] = field(default_factory=list)
+    data: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[ZenrowsResult] = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        """True if the page was fetched and parsed."""
+        return self.error is None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _result(task: "asyncio.Future[CrawlPage]") -> CrawlPage:
+    return await task
+
+
+def _host_matches(host: str, domains: Iterable[str]) -> bool:
+    return any(host == d or host.endswith("." + d) for d in domains)
+
+
+def _merge_outputs(outputs: Optional[str]) -> str:
+    requested = [o.strip() for o in (outputs or "").split(",") if o.strip()]
+    return ",".join(requested if "links" in requested else requested + ["links"])
+
+
+def _extract_links(data: Any, base_url: str) -> List[str]:
+    raw = data.get("links") if isinstance(data, dict) else None
+    links = []
+    for link in raw or ():
+        if isinstance(link, dict):
+            link = link.get("href") or link.get("url")
+        if isinstance(link, str) and link:
+            links.append(urljoin(base_url, link))
+    return links
+
+
+class ZenrowsCrawler:
+    """Crawls a site (or several) through a `ZenrowsFetch` tool.
+
+    Args:
+        fetch: Tool used for every request.
+        max_depth: Link hops to follow from the seeds; 0 fetches only the
+            seeds.
+        max_pages: Max pages fetched in total. None -> unlimited.
+        max_pages_per_host: Max pages queued per host. None -> unlimited.
+        concurrency: Max requests in flight overall (threads in `crawl`,
+            tasks in `acrawl`). The tool's limiter still applies on top.
+        max_per_host: Max requests in flight per host.
+        host_delay: Min seconds between request starts to the same host.
+        allowed_domains: Domains (subdomains included) links may be
+            followed to. None -> the seeds' domains, minus a leading
+            ``www.``. Seeds themselves are always fetched.
+        follow_external: Follow links to any domain.
+        priority: ``(url, depth) -> float``; lower is fetched first.
+            Defaults to the depth (breadth-first).
+        seen: Seen-set - anything with ``add(url) -> bool`` (True if new),
+            e.g. a `BloomFilter`. Defaults to an exact in-memory set.
+        fetch_params: Extra Fetch parameters for every page (``js_render``,
+            ``premium_proxy``, ...). ``links`` is always added to
+            ``outputs``.
+        ignored_query_params: Query parameters dropped when canonicalizing.
+    """
+
+    def __init__(
+        self,
+        fetch: ZenrowsFetch,
+        *,
+        max_depth: int = 2,
+        max_pages: Optional[int] = 1000,
+        max_pages_per_host: Optional[int] = None,
+        concurrency: int = 5,
+        max_per_host: Optional[int] = 2,
+        host_delay: float = 0.0,
+        allowed_domains: Optional[Iterable[str]] = None,
+        follow_external: bool = False,
+        priority: Optional[Callable[[str, int], float]] = None,
+        seen: Optional[Any] = None,
+        fetch_params: Optional[Dict[str, Any]] = None,
+        ignored_query_params: FrozenSet[str] = DEFAULT_IGNORED_QUERY_PARAMS,
+    ):
+        if max_depth < 0:
+            raise ValueError("max_depth must be at least 0")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if max_per_host is not None and max_per_host < 1:
+            raise ValueError("max_per_host must be at least 1")
+        if host_delay < 0:
+            raise ValueError("host_delay must not be negative")
+        self.fetch = fetch
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_pages_per_host = max_pages_per_host
+        self.concurrency = concurrency
+        self.max_per_host = max_per_host
+        self.host_delay = host_delay
+        self.allowed_domains = (
+            None if allowed_domains is None else {d.lower() for d in allowed_domains}
+        )
+        self.follow_external = follow_external
+        self.priority = priority or (lambda url, depth: float(depth))
+        self.seen = seen if seen is not None else _SeenSet()
+        self.fetch_params = dict(fetch_params or {})
+        self.ignored_query_params = ignored_query_params
+        self._seed_domains: Set[str] = set()
+        self._frontier = _Frontier(max_per_host, host_delay)
+        self._seq = 0
+        self._host_pages: Dict[str, int] = {}
+        self._scheduled = 0
+        # Fetches already dispatched when a crawl was stopped early - worker
+        # threads of `crawl`, tasks of `acrawl`; the next `crawl` or `acrawl`,
+        # either one, collects them instead of fetching them again.
+        self._carried: Dict[Future, _Entry] = {}
+        self._acarried: Dict["asyncio.Future[CrawlPage]", _Entry] = {}
+
+    # -- frontier ---------------------------------------------------------
+
+    def add_seeds(self, seeds: Iterable[str]) -> None:
+        """Queue seed URLs at depth 0.
+
+        Raises:
+            ValueError: If a seed isn't an absolute http(s) URL.
+        """
+        for url in seeds:
+            canonical = canonicalize_url(
+                url, ignored_query_params=self.ignored_query_params
+            )
+            if canonical is None:
+                raise ValueError(f"Not an absolute http(s) URL: {url!r}")
+            host = urlsplit(canonical).hostname or ""
+            self._seed_domains.add(host[4:] if host.startswith("www.") else host)
+            self._enqueue(canonical, 0, None)
+
+    def _allowed(self, host: str) -> bool:
+        if self.follow_external:
+            return True
+        domains = self.allowed_domains
+        return _host_matches(host, self._seed_domains if domains is None else domains)
+
+    def _enqueue(self, url: str, depth: int, parent: Optional[str]) -> bool:
+        canonical = canonicalize_url(url, ignored_query_params=self.ignored_query_params)
+        if canonical is None:
+            return False
+        host = urlsplit(canonical).hostname or ""
+        # Seeds are always crawled, whatever the allowed domains.
+        if parent is not None and not self._allowed(host):
+            return False
+        if (
+            self.max_pages_per_host is not None
+            and self._host_pages.get(host, 0) >= self.max_pages_per_host
+        ):
+            return False
+        if not self.seen.add(canonical):
+            return False
+        self._host_pages[host] = self._host_pages.get(host, 0) + 1
+        self._seq += 1
+        priority = self.priority(canonical, depth)
+        self._frontier.push(
+            _Entry(priority, self._seq, canonical, host, depth, parent),
+            time.monotonic(),
+        )
+        return True
+
+    def _next(self) -> Optional[_Entry]:
+        if self.max_pages is not None and self._scheduled >= self.max_pages:
+            return None
+        entry = self._frontier.pop(time.monotonic())
+        if entry is not None:
+            self._scheduled += 1
+        return entry
+
+    def _done(self, entry: _Entry, page: CrawlPage) -> None:
+        self._frontier.release(entry.host, time.monotonic())
+        if page.ok and entry.depth < self.max_depth:
+            for link in page.links:
+                self._enqueue(link, entry.depth + 1, entry.url)
+
+    def _requeue(self, entry: _Entry) -> None:
+        # A page stopping the crawl early kept from ever being fetched goes
+        # back on the frontier, so a later `crawl` call fetches it.
+        now = time.monotonic()
+        self._frontier.release(entry.host, now)
+        self._frontier.push(entry, now)
+        self._scheduled -= 1
+
+    def _wake_timeout(self, in_flight: int) -> Optional[float]:
+        # With a free slot, wake up when a paced host becomes available.
+        if in_flight >= self.concurrency:
+            return None
+        return self._frontier.next_wake(time.monotonic())
+
+    def _idle_wait(self) -> Optional[float]:
+        """With nothing in flight: seconds to wait for a paced host, or None
+        if the crawl is over."""
+        if self.max_pages is not None and self._scheduled >= self.max_pages:
+            return None
+        return self._frontier.next_wake(time.monotonic())
+
+    # -- fetching ---------------------------------------------------------
+
+    def _params(self, entry: _Entry) -> Dict[str, Any]:
+        params = dict(self.fetch_params)
+        params["url"] = entry.url
+        params["outputs"] = _merge_outputs(params.get("outputs"))
+        return params
+
+    @staticmethod
+    def _page(entry: _Entry, result: ZenrowsResult) -> CrawlPage:
+        try:
+            data = json.loads(result.text)
+        except ValueError as e:
+            raise ValueError(f"Expected JSON outputs for {entry.url}: {e}") from e
+        return CrawlPage(
+            url=entry.url,
+            depth=entry.depth,
+            parent=entry.parent,
+            links=_extract_links(data, result.final_url or entry.url),
+            data=data if isinstance(data, dict) else {},
+            result=result,
+        )
+
+    def _crawl_one(self, entry: _Entry) -> CrawlPage:
+        try:
+            return self._page(entry, self.fetch.fetch_result(self._params(entry)))
+        except Exception as e:
+            return CrawlPage(url=entry.url, depth=entry.depth, parent=entry.parent, error=e)
+
+    async def _acrawl_one(self, entry: _Entry) -> CrawlPage:
+        try:
+            result = await self.fetch.afetch_result(self._params(entry))
+            return self._page(entry, result)
+        except Exception as e:
+            return CrawlPage(url=entry.url, depth=entry.depth, parent=entry.parent, error=e)
+
+    def crawl(self, seeds: Iterable[str] = ()) -> Iterator[CrawlPage]:
+        """Crawl from ``seeds`` (plus any added with `add_seeds`), yielding
+        each page as it completes. A failed page carries its error instead
+        of stopping the crawl.
+
+        Stopping iteration early stops the crawl; queued URLs are kept, so
+        calling `crawl` (or `acrawl`) again resumes it. Fetches already
+        under way finish in the background, and the next call yields their
+        pages.
+        """
+        self.add_seeds(seeds)
+        pending, self._carried = self._carried, {}
+        tasks, self._acarried = self._acarried, {}
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        try:
+            # Tasks left by a stopped `acrawl`: collect them if they're done,
+            # or through their loop if it runs on another thread. One whose
+            # loop is stopped would never finish, and is fetched again.
+            for task, entry in list(tasks.items()):
+                del tasks[task]
+                loop = task.get_loop()
+                if task.done() and not task.cancelled():
+                    page = task.result()
+                    self._done(entry, page)
+                    yield page
+                elif (
+                    not task.done()
+                    and loop.is_running()
+                    and loop is not _running_loop()
+                ):
+                    future = asyncio.run_coroutine_threadsafe(_result(task), loop)
+                    pending[future] = entry
+                else:
+                    if not loop.is_closed():
+                        task.cancel()
+                    self._requeue(entry)
+            while True:
+                while len(pending) < self.concurrency:
+                    entry = self._next()
+                    if entry is None:
+                        break
+                    pending[pool.submit(self._crawl_one, entry)] = entry
+                if not pending:
+                    delay = self._idle_wait()
+                    if delay is None:
+                        return
+                    time.sleep(delay)
+                    continue
+                done, _ = wait(
+                    pending,
+                    timeout=self._wake_timeout(len(pending)),
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    entry = pending.pop(future)
+                    page = future.result()
+                    self._done(entry, page)
+                    yield page
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            for future, entry in pending.items():
+                if future.cancelled():
+                    self._requeue(entry)
+                else:
+                    self._carried[future] = entry
+            self._acarried.update(tasks)
+
+    async def acrawl(self, seeds: Iterable[str] = ()) -> AsyncIterator[CrawlPage]:
+        """Async counterpart of `crawl`, running fetches as asyncio tasks."""
+        self.add_seeds(seeds)
+        pending, self._acarried = self._acarried, {}
+        # Fetches left running by a stopped `crawl`, awaited on this loop.
+        threaded: Dict["asyncio.Future[CrawlPage]", Future] = {}
+        for future, entry in self._carried.items():
+            wrapped = asyncio.wrap_future(future)
+            threaded[wrapped] = future
+            pending[wrapped] = entry
+        self._carried = {}
+        loop = asyncio.get_running_loop()
+        try:
+            for task, entry in list(pending.items()):
+                if task.get_loop() is loop and not task.cancelled():
+                    continue
+                # Cancelled, or carried from an event loop that has since
+                # stopped - which cancels the tasks it didn't finish.
+                del pending[task]
+                if task.done() and not task.cancelled():
+                    page = task.result()
+                    self._done(entry, page)
+                    yield page
+                else:
+                    self._requeue(entry)
+            while True:
+                while len(pending) < self.concurrency:
+                    entry = self._next()
+                    if entry is None:
+                        break
+                    pending[asyncio.ensure_future(self._acrawl_one(entry))] = entry
+                if not pending:
+                    delay = self._idle_wait()
+                    if delay is None:
+                        return
+                    await asyncio.sleep(delay)
+                    continue
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self._wake_timeout(len(pending)),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    entry = pending.pop(task)
+                    page = task.result()
+                    self._done(entry, page)
+                    yield page
+        finally:
+            for future, entry in pending.items():
+                if future in threaded:
+                    self._carried[threaded[future]] = entry
+                else:
+                    self._acarried[future] = entry
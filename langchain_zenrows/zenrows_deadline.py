@@ -0,0 +1,162 @@
+"""Timeouts and per-call deadline budgets for the Zenrows tools.
+
+By default a request to Zenrows waits as long as it takes - JS-rendered
+pages routinely need 5-30s, and there's no one right cut-off. Give a tool
+`ZenrowsTimeouts` to bound it:
+
+- ``connect`` / ``read`` - per HTTP attempt: seconds to open the connection
+  and to wait for response data.
+- ``total`` - a budget for the whole call: every retry, backoff and rate
+  limiter wait, and Extract's ``AUTH010`` -> Autoparse second request, all
+  come out of it. Once it's spent, the call fails with `DeadlineExceeded`
+  (mapped to a "Request timed out" `ValueError`) instead of starting or
+  retrying another attempt, and an attempt in flight gets only what's left.
+
+A budget can also come from the LangChain run config, so an agent step
+bounds every Zenrows call made within it::
+
+    scraper.invoke(
+        {"url": url},
+        config={"configurable": {"zenrows_timeout": 20}},
+    )
+
+``zenrows_timeout`` is a budget in seconds per call; ``zenrows_deadline`` an
+absolute `time.time()` by which calls must finish, which propagates
+unchanged to every step of a run. The tightest of the tool's ``total`` and
+the two config keys applies.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, Optional, Tuple, TypeVar
+
+import httpx
+import requests
+from langchain_core.runnables.config import ensure_config
+
+T = TypeVar("T")
+
+# `configurable` keys read from the LangChain run config.
+CONFIG_TIMEOUT_KEY = "zenrows_timeout"
+CONFIG_DEADLINE_KEY = "zenrows_deadline"
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """A call's deadline passed before it could finish. Never retried."""
+
+
+@dataclass(frozen=True)
+class ZenrowsTimeouts:
+    """Connect / read timeouts per attempt, and a budget per call.
+
+    Attributes:
+        connect: Seconds to wait for a connection to Zenrows. None -> no
+            limit.
+        read: Seconds to wait for response data - for a rendered page,
+            roughly the time Zenrows takes to answer. None -> no limit.
+        total: Seconds for the whole call, retries and fallbacks included.
+            None -> no limit (unless the run config sets one).
+    """
+
+    connect: Optional[float] = None
+    read: Optional[float] = None
+    total: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        for name in ("connect", "read", "total"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} timeout must be positive")
+
+
+def _config_deadline(configurable: Mapping[str, Any], now: float) -> Optional[float]:
+    """The tightest deadline set in the run config's ``configurable``, on
+    the `time.monotonic` clock."""
+    deadlines = []
+    budget = configurable.get(CONFIG_TIMEOUT_KEY)
+    if budget is not None:
+        deadlines.append(now + float(budget))
+    wall_deadline = configurable.get(CONFIG_DEADLINE_KEY)
+    if wall_deadline is not None:
+        deadlines.append(now + float(wall_deadline) - time.time())
+    return min(deadlines, default=None)
+
+
+def call_deadline(
+    timeouts: Optional[ZenrowsTimeouts],
+    configurable: Optional[Mapping[str, Any]] = None,
+) -> Optional[float]:
+    """The `time.monotonic` time a call starting now must finish by, from
+    ``timeouts.total`` and the run config's ``configurable`` (by default,
+    the current LangChain run config's); None if neither sets one."""
+    if configurable is None:
+        configurable = ensure_config().get("configurable") or {}
+    now = time.monotonic()
+    deadline = _config_deadline(configurable, now)
+    if timeouts is not None and timeouts.total is not None:
+        total = now + timeouts.total
+        deadline = total if deadline is None else min(deadline, total)
+    return deadline
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left before ``deadline`` (None -> no deadline).
+
+    Raises:
+        DeadlineExceeded: If none are left.
+    """
+    if deadline is None:
+        return None
+    left = deadline - time.monotonic()
+    if left <= 0:
+        raise DeadlineExceeded("the call's deadline was exceeded")
+    return left
+
+
+def _cap(value: Optional[float], limit: Optional[float]) -> Optional[float]:
+    if limit is None:
+        return value
+    return limit if value is None else min(value, limit)
+
+
+def requests_timeout(
+    timeouts: Optional[ZenrowsTimeouts], deadline: Optional[float]
+) -> Optional[Tuple[Optional[float], Optional[float]]]:
+    """The ``timeout=`` for one `requests` attempt: ``(connect, read)``,
+    each capped at what's left of the deadline; None -> no limits."""
+    left = remaining(deadline)
+    if timeouts is None and left is None:
+        return None
+    connect = timeouts.connect if timeouts is not None else None
+    read = timeouts.read if timeouts is not None else None
+    return _cap(connect, left), _cap(read, left)
+
+
+def httpx_timeout(
+    timeouts: Optional[ZenrowsTimeouts], deadline: Optional[float]
+) -> Any:
+    """The ``timeout=`` for one `httpx` attempt, as `requests_timeout`;
+    `httpx.USE_CLIENT_DEFAULT` when nothing is set."""
+    timeout = requests_timeout(timeouts, deadline)
+    if timeout is None:
+        return httpx.USE_CLIENT_DEFAULT
+    connect, read = timeout
+    return httpx.Timeout(None, connect=connect, read=read)
+
+
+async def within(
+    deadline: Optional[float], fn: Callable[[], Awaitable[T]]
+) -> T:
+    """Await ``fn()``, cancelling it if ``deadline`` passes first.
+
+    Raises:
+        DeadlineExceeded: If the deadline passed.
+    """
+    if deadline is None:
+        return await fn()
+    left = remaining(deadline)
+    try:
+        return await asyncio.wait_for(fn(), left)
+    except asyncio.TimeoutError:
+        raise DeadlineExceeded("the call's deadline was exceeded") from None
@@ -11,12 +11,49 @@ See https://docs.zenrows.com/extract/setup for the current contract.
 
 import json
 import os
-from typing import Any, Dict, Literal, Optional, Type, Union
-
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+)
+
+import httpx
 import requests
 from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field, field_validator
 
+from langchain_zenrows.zenrows_batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchResult,
+    aiter_batch,
+    iter_batch,
+    normalize_batch_input,
+)
+from langchain_zenrows.zenrows_capabilities import DomainCapabilityCache
+from langchain_zenrows.zenrows_cache import ZenrowsCache
+from langchain_zenrows.zenrows_client import (
+    ZenrowsClient,
+    mapped_errors,
+    start_trace,
+)
+from langchain_zenrows.zenrows_deadline import ZenrowsTimeouts
+from langchain_zenrows.zenrows_http import error_code
+from langchain_zenrows.zenrows_instrumentation import ZenrowsInstrumentation
+from langchain_zenrows.zenrows_keypool import ZenrowsKeyPool
+from langchain_zenrows.zenrows_limiter import ZenrowsRateLimiter
+from langchain_zenrows.zenrows_middleware import ZenrowsMiddleware
+from langchain_zenrows.zenrows_result import RequestTrace, ZenrowsResult
+from langchain_zenrows.zenrows_retry import RetryPolicy
+from langchain_zenrows.zenrows_singleflight import SingleFlight
+
 
 class ZenrowsExtractInput(BaseModel):
     """Input schema for Zenrows Extract."""
@@ -73,6 +110,14 @@ class ZenrowsExtractInput(BaseModel):
         default=True,
         description="Enable Adaptive Stealth Mode (sent as mode='auto' to Zenrows) so a target needing js_render/premium_proxy escalates automatically instead of failing with REQS002. Set False to disable and set js_render/premium_proxy yourself.",
     )
+    cache_bypass: bool = Field(
+        default=False,
+        description="Skip the tool's response cache (if one is configured) and extract a fresh copy. The fresh result still refreshes the cache.",
+    )
+    cache_max_age: Optional[int] = Field(
+        default=None,
+        description="Only accept a cached response (if a cache is configured) stored at most this many seconds ago; otherwise extract a fresh copy.",
+    )
 
     @field_validator("proxy_country")
     @classmethod
@@ -109,16 +154,51 @@ class ZenrowsExtract(BaseTool):
 
     zenrows_api_key: Optional[str] = None
     base_url: str = "https://api.zenrows.com/v1/"
+    # Connection pools. None -> the process-wide shared ones from
+    # `zenrows_http`; pass your own (e.g. `create_session(pool_maxsize=...)`)
+    # to size or isolate them.
+    session: Optional[requests.Session] = None
+    async_client: Optional[httpx.AsyncClient] = None
+    # Concurrency / rate limiter. None -> the process-wide one shared by all
+    # Fetch and Extract instances, which tracks the plan's concurrency cap.
+    limiter: Optional[ZenrowsRateLimiter] = None
+    # Retries for transient failures (429/5xx/timeouts). None -> no retries.
+    retry_policy: Optional[RetryPolicy] = None
+    # Response cache (`InMemoryCache`, `SQLiteCache`, `RedisCache`, ...).
+    # None -> every call goes to Zenrows.
+    cache: Optional[ZenrowsCache] = None
+    # Request coalescing. None -> identical concurrent calls each go upstream.
+    single_flight: Optional[SingleFlight] = None
+    # Runtime instrumentation (`OpenTelemetryInstrumentation`, or your own
+    # `ZenrowsInstrumentation`). None -> no hooks run.
+    instrumentation: Optional[ZenrowsInstrumentation] = None
+    # Domains known to answer AUTH010, routed straight to Autoparse. None ->
+    # every call tries Extract first (batch calls share a per-batch one).
+    domain_capabilities: Optional[DomainCapabilityCache] = None
+    # Several API keys to spread requests over, each with its own limiter
+    # (the `limiter` field is then unused). None -> `zenrows_api_key` only.
+    key_pool: Optional[ZenrowsKeyPool] = None
+    # Your own request / response hooks (`ZenrowsMiddleware`), run in order
+    # around every request below the cache. None -> no chain at all.
+    middleware: Optional[List[ZenrowsMiddleware]] = None
+    # Connect / read timeouts per attempt and a budget per call
+    # (`ZenrowsTimeouts`). None -> requests wait as long as they take,
+    # unless the run config sets a budget.
+    timeouts: Optional[ZenrowsTimeouts] = None
 
     def __init__(self, zenrows_api_key: Optional[str] = None, **kwargs):
         """Initialize the Zenrows Extract tool.
 
         Args:
             zenrows_api_key: Your Zenrows API key. If not provided, will look for
-                           ZENROWS_API_KEY environment variable.
+                           ZENROWS_API_KEY environment variable. Not needed
+                           with a ``key_pool``.
             **kwargs: Additional arguments passed to BaseTool.
         """
         super().__init__(**kwargs)
+        if self.key_pool is not None:
+            # Keys come from the pool, per request attempt.
+            return
         self.zenrows_api_key = zenrows_api_key or os.environ.get("ZENROWS_API_KEY")
 
         if not self.zenrows_api_key:
@@ -146,6 +226,8 @@ class ZenrowsExtract(BaseTool):
 
         # Local control flags, never sent on the wire.
         params.pop("fallback_to_autoparse", None)
+        params.pop("cache_bypass", None)
+        params.pop("cache_max_age", None)
         adaptive_stealth = params.pop("adaptive_stealth", True)
 
         if autoparse_fallback:
@@ -180,48 +262,55 @@ class ZenrowsExtract(BaseTool):
 
         return params, request_headers
 
-    @staticmethod
-    def _error_code(body: str) -> Optional[str]:
-        """Pull the Zenrows JSON error envelope's `code` field, if any -
-        mirrors the CLI's `zrErrorCode` helper. Returns None on non-JSON or
-        missing/non-string `code`."""
-        try:
-            parsed = json.loads(body)
-        except (ValueError, TypeError):
-            return None
-        code = parsed.get("code") if isinstance(parsed, dict) else None
-        return code.upper() if isinstance(code, str) else None
-
-    def _send(self, params: Dict[str, Any], request_headers: Optional[Dict[str, str]]):
-        """Issue the request. Raises `requests.exceptions.HTTPError` (with the
-        response attached) on non-2xx, same as `Response.raise_for_status()`."""
-        response = requests.get(self.base_url, params=params, headers=request_headers)
-        response.raise_for_status()
-        return response
-
-    def _raise_for_http_error(self, e: requests.exceptions.HTTPError) -> None:
-        if e.response.status_code == 401:
-            raise ValueError("Invalid Zenrows API key")
-        elif e.response.status_code == 429:
-            raise ValueError("Rate limit exceeded. Check your Zenrows plan limits.")
-        elif e.response.status_code == 413:
-            raise ValueError(
-                "Response size too large. Consider using CSS selectors to reduce content."
-            )
-        else:
-            raise ValueError(
-                f"HTTP error occurred: {e.response.status_code} - {e.response.text}"
-            )
+    def _get_client(self) -> ZenrowsClient:
+        """The transport this tool's calls go through, from its fields."""
+        return ZenrowsClient(
+            self.base_url,
+            session=self.session,
+            async_client=self.async_client,
+            limiter=self.limiter,
+            retry_policy=self.retry_policy,
+            key_pool=self.key_pool,
+            cache=self.cache,
+            single_flight=self.single_flight,
+            instrumentation=self.instrumentation,
+            middleware=self.middleware or (),
+            timeouts=self.timeouts,
+        )
 
-    def _run_autoparse_fallback(self, kwargs: Dict[str, Any]) -> str:
+    def _send(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> requests.Response:
+        """Send one Zenrows request; see `ZenrowsClient.send`. A key pool
+        doesn't fail over on `AUTH010`, which is about the domain."""
+        return self._get_client().send(params, request_headers, trace)
+
+    async def _asend(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> httpx.Response:
+        """Async counterpart of `_send`."""
+        return await self._get_client().asend(params, request_headers, trace)
+
+    def _run_autoparse_fallback(
+        self, kwargs: Dict[str, Any], trace: RequestTrace
+    ) -> str:
         """Retry with Autoparse and re-wrap the result into Extract's
         ``{"parsed", "html"}`` envelope, so callers can rely on `data["parsed"]`
         either way. Adds `extract_fallback: "autoparse"` so callers/agents can
         tell a fallback happened rather than a real Extract response."""
+        trace.fallback()
+        if self.retry_policy is not None:
+            self.retry_policy.stats.record_autoparse_fallback()
         params, request_headers = self._prepare_request_params(
             kwargs, autoparse_fallback=True
         )
-        response = self._send(params, request_headers)
+        response = self._send(params, request_headers, trace)
 
         try:
             parsed_data: Any = response.json()
@@ -232,6 +321,137 @@ class ZenrowsExtract(BaseTool):
             {"parsed": parsed_data, "html": None, "extract_fallback": "autoparse"}
         )
 
+    async def _arun_autoparse_fallback(
+        self, kwargs: Dict[str, Any], trace: RequestTrace
+    ) -> str:
+        """Async counterpart of `_run_autoparse_fallback`."""
+        trace.fallback()
+        if self.retry_policy is not None:
+            self.retry_policy.stats.record_autoparse_fallback()
+        params, request_headers = self._prepare_request_params(
+            kwargs, autoparse_fallback=True
+        )
+        response = await self._asend(params, request_headers, trace)
+
+        try:
+            parsed_data: Any = response.json()
+        except ValueError:
+            parsed_data = response.text
+
+        return json.dumps(
+            {"parsed": parsed_data, "html": None, "extract_fallback": "autoparse"}
+        )
+
+    @staticmethod
+    def _fallback_allowed(kwargs: Dict[str, Any]) -> bool:
+        """True if the call may be served by Autoparse instead of Extract."""
+        return (kwargs.get("extract") or "auto") == "auto" and kwargs.get(
+            "fallback_to_autoparse", True
+        )
+
+    def _known_unsupported(self, kwargs: Dict[str, Any]) -> bool:
+        """True if the domain is known to answer `AUTH010` and the call may
+        skip straight to Autoparse."""
+        return (
+            self.domain_capabilities is not None
+            and self._fallback_allowed(kwargs)
+            and self.domain_capabilities.is_unsupported(kwargs.get("url"))
+        )
+
+    def _should_fall_back(
+        self,
+        e: Union[requests.exceptions.HTTPError, httpx.HTTPStatusError],
+        kwargs: Dict[str, Any],
+    ) -> bool:
+        """True if ``e`` is the Extract-beta domain gate (`AUTH010`) and the
+        call allows retrying it with Autoparse. Remembers the domain either
+        way, if the tool has a `domain_capabilities` cache."""
+        if e.response.status_code != 402:
+            return False
+        if error_code(e.response.text) != "AUTH010":
+            return False
+        if self.domain_capabilities is not None:
+            self.domain_capabilities.mark_unsupported(kwargs.get("url"))
+        return self._fallback_allowed(kwargs)
+
+    def _extract(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> ZenrowsResult:
+        """Send the prepared Extract request, falling back to Autoparse on
+        `AUTH010` - or going straight to Autoparse for a domain already known
+        to answer it. HTTP errors propagate for `_run` to map."""
+        if not self._known_unsupported(kwargs):
+            try:
+                text = self._send(params, request_headers, trace).text
+                return trace.result(text, params)
+            except requests.exceptions.HTTPError as e:
+                if not self._should_fall_back(e, kwargs):
+                    raise
+        text = self._run_autoparse_fallback(kwargs, trace)
+        return trace.result(text, params, autoparse_fallback=True)
+
+    async def _aextract(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+    ) -> ZenrowsResult:
+        """Async counterpart of `_extract`."""
+        if not self._known_unsupported(kwargs):
+            try:
+                text = (await self._asend(params, request_headers, trace)).text
+                return trace.result(text, params)
+            except httpx.HTTPStatusError as e:
+                if not self._should_fall_back(e, kwargs):
+                    raise
+        text = await self._arun_autoparse_fallback(kwargs, trace)
+        return trace.result(text, params, autoparse_fallback=True)
+
+    def _call(self, kwargs: Dict[str, Any], trace: RequestTrace) -> ZenrowsResult:
+        """Serve one call - from the cache, a coalesced in-flight call, or
+        Zenrows. Errors propagate unmapped."""
+        started = time.perf_counter()
+        params, request_headers = self._prepare_request_params(kwargs)
+        trace.prepared(params, time.perf_counter() - started)
+
+        return self._get_client().serve(
+            params,
+            request_headers,
+            trace,
+            lambda t: self._extract(kwargs, params, request_headers, t),
+            cache_bypass=bool(kwargs.get("cache_bypass")),
+            cache_max_age=kwargs.get("cache_max_age"),
+        )
+
+    async def _acall(
+        self, kwargs: Dict[str, Any], trace: RequestTrace
+    ) -> ZenrowsResult:
+        """Async counterpart of `_call`."""
+        started = time.perf_counter()
+        params, request_headers = self._prepare_request_params(kwargs)
+        trace.prepared(params, time.perf_counter() - started)
+
+        return await self._get_client().aserve(
+            params,
+            request_headers,
+            trace,
+            lambda t: self._aextract(kwargs, params, request_headers, t),
+            cache_bypass=bool(kwargs.get("cache_bypass")),
+            cache_max_age=kwargs.get("cache_max_age"),
+        )
+
+    def _to_tool_output(self, result: ZenrowsResult) -> Any:
+        """What `_run` returns: the JSON text, or ``(text, result)`` for
+        ``response_format="content_and_artifact"``."""
+        if self.response_format == "content_and_artifact":
+            return result.text, result
+        return result.content
+
     def _run(self, **kwargs) -> str:
         """Execute the Zenrows Extract request.
 
@@ -246,40 +466,146 @@ class ZenrowsExtract(BaseTool):
             a dict with `parsed` and `html` fields; on an Autoparse fallback
             it's re-wrapped into that same shape, plus
             `extract_fallback: "autoparse"` so callers can tell which path
-            was taken. Use `json.loads()` on the result either way.
+            was taken. Use `json.loads()` on the result either way. With
+            ``response_format="content_and_artifact"``, a ``(text,
+            ZenrowsResult)`` pair instead.
+
+        With a ``cache`` configured, the final result - fallback included -
+        is cached under the Extract request's fingerprint.
         """
-        fallback_enabled = kwargs.get("fallback_to_autoparse", True)
-        mode = kwargs.get("extract") or "auto"
+        return self._to_tool_output(self._run_result(kwargs))
 
-        try:
-            params, request_headers = self._prepare_request_params(kwargs)
-            response = self._send(params, request_headers)
-            return response.text
-
-        except requests.exceptions.HTTPError as e:
-            if (
-                e.response.status_code == 402
-                and mode == "auto"
-                and fallback_enabled
-                and self._error_code(e.response.text) == "AUTH010"
-            ):
-                try:
-                    return self._run_autoparse_fallback(kwargs)
-                except requests.exceptions.HTTPError as fallback_error:
-                    self._raise_for_http_error(fallback_error)
-            self._raise_for_http_error(e)
-
-        except requests.exceptions.Timeout:
-            raise ValueError(
-                "Request timed out. The website might be slow or unresponsive."
-            )
+    async def _arun(self, **kwargs) -> str:
+        """Async version of _run method.
 
-        except requests.exceptions.RequestException as e:
-            raise ValueError(f"Request failed: {str(e)}")
+        Same behavior as `_run`, including the `AUTH010` -> Autoparse
+        fallback, but on the event loop's shared `httpx` pool so the loop
+        isn't blocked while Zenrows renders the page.
+        """
+        return self._to_tool_output(await self._arun_result(kwargs))
 
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {str(e)}")
+    def _run_result(self, kwargs: Dict[str, Any]) -> ZenrowsResult:
+        """`_call`, with errors mapped to `ValueError`s."""
+        trace = start_trace(
+            self.name, kwargs.get("url"), self.instrumentation, self.timeouts
+        )
+        with trace.span(), mapped_errors():
+            result = self._call(kwargs, trace)
+        return trace.finish(result)
+
+    async def _arun_result(self, kwargs: Dict[str, Any]) -> ZenrowsResult:
+        """Async counterpart of `_run_result`."""
+        trace = start_trace(
+            self.name, kwargs.get("url"), self.instrumentation, self.timeouts
+        )
+        with trace.span(), mapped_errors():
+            result = await self._acall(kwargs, trace)
+        return trace.finish(result)
 
-    async def _arun(self, **kwargs) -> str:
-        """Async version of _run method."""
-        return self._run(**kwargs)
+    def _validate_input(
+        self, tool_input: Union[str, Dict[str, Any], ZenrowsExtractInput]
+    ) -> Dict[str, Any]:
+        """Validate a tool input outside `invoke`, keeping only the fields
+        the caller actually set (same as `invoke` passes to `_run`)."""
+        validated = ZenrowsExtractInput.model_validate(normalize_batch_input(tool_input))
+        return validated.model_dump(exclude_unset=True)
+
+    def extract_result(
+        self, tool_input: Union[str, Dict[str, Any], ZenrowsExtractInput]
+    ) -> ZenrowsResult:
+        """Extract a page and return the JSON text with timing and cost
+        metadata.
+
+        Args:
+            tool_input: A URL, tool-input dict, or `ZenrowsExtractInput`.
+
+        Raises:
+            ValueError: Same errors as `_run`.
+        """
+        return self._run_result(self._validate_input(tool_input))
+
+    async def aextract_result(
+        self, tool_input: Union[str, Dict[str, Any], ZenrowsExtractInput]
+    ) -> ZenrowsResult:
+        """Async counterpart of `extract_result`."""
+        return await self._arun_result(self._validate_input(tool_input))
+
+    def _for_batch(self) -> "ZenrowsExtract":
+        """This tool, or - without a `domain_capabilities` cache - a copy with
+        one for the batch, so a domain's first `AUTH010` routes the rest of
+        its inputs straight to Autoparse."""
+        if self.domain_capabilities is not None:
+            return self
+        return self.model_copy(update={"domain_capabilities": DomainCapabilityCache()})
+
+    def iter_batch_extract(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsExtractInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Extract many pages with bounded concurrency, streaming the results.
+
+        Once a domain answers `AUTH010`, its remaining inputs go straight to
+        Autoparse (requests already in flight still make the round-trip).
+
+        Args:
+            inputs: URLs, tool-input dicts, or `ZenrowsExtractInput`
+                instances. Consumed lazily.
+            concurrency: Max requests in flight at once (threads).
+            ordered: Yield results in input order instead of as they finish.
+
+        Yields:
+            A `BatchResult` per input; failures carry their error.
+        """
+        tool = self._for_batch()
+        return iter_batch(
+            lambda item: tool.invoke(normalize_batch_input(item)),
+            inputs,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def batch_extract(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsExtractInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Same as `iter_batch_extract`, but returns every result as a list
+        in input order."""
+        return list(
+            self.iter_batch_extract(inputs, concurrency=concurrency, ordered=True)
+        )
+
+    def aiter_batch_extract(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsExtractInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """Async counterpart of `iter_batch_extract`, running on the event
+        loop (via `ainvoke`) instead of threads."""
+        tool = self._for_batch()
+        return aiter_batch(
+            lambda item: tool.ainvoke(normalize_batch_input(item)),
+            inputs,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def abatch_extract(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsExtractInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Async counterpart of `batch_extract`."""
+        return [
+            result
+            async for result in self.aiter_batch_extract(
+                inputs, concurrency=concurrency, ordered=True
+            )
+        ]
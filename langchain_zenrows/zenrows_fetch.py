@@ -2,11 +2,56 @@
 
 import json
 import os
-from typing import Any, Dict, Literal, Optional, Type, Union
-
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Type,
+    Union,
+)
+
+import httpx
 import requests
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from langchain_zenrows.zenrows_batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchResult,
+    aiter_batch,
+    iter_batch,
+    normalize_batch_input,
+)
+from langchain_zenrows.zenrows_binary import BinaryContent, guess_mime_type
+from langchain_zenrows.zenrows_cache import CacheValue, ZenrowsCache
+from langchain_zenrows.zenrows_cancel import CancelToken, cancelled_by
+from langchain_zenrows.zenrows_client import (
+    ZenrowsClient,
+    mapped_errors,
+    start_trace,
+)
+from langchain_zenrows.zenrows_deadline import ZenrowsTimeouts
+from langchain_zenrows.zenrows_instrumentation import ZenrowsInstrumentation
+from langchain_zenrows.zenrows_keypool import ZenrowsKeyPool
+from langchain_zenrows.zenrows_limiter import ZenrowsRateLimiter
+from langchain_zenrows.zenrows_middleware import ZenrowsMiddleware
+from langchain_zenrows.zenrows_result import RequestTrace, ZenrowsResult
+from langchain_zenrows.zenrows_retry import RetryPolicy
+from langchain_zenrows.zenrows_singleflight import SingleFlight
+from langchain_zenrows.zenrows_stealth import StealthLearner, wrong_config
+from langchain_zenrows.zenrows_stream import (
+    DEFAULT_CHUNK_SIZE,
+    Sink,
+    awrite_chunks,
+    write_chunks,
+)
+from langchain_zenrows.zenrows_template import FetchTemplate, PreparedRequest
 
 
 class ZenrowsFetchInput(BaseModel):
@@ -103,6 +148,14 @@ class ZenrowsFetchInput(BaseModel):
         default=None,
         description="Specify which data types to extract from the scraped HTML. Accepted values: emails, phone_numbers, headings, images, audios, videos, links, menus, hashtags, metadata, tables, favicon.",
     )
+    cache_bypass: Optional[bool] = Field(
+        default=None,
+        description="Skip the tool's response cache (if one is configured) and fetch a fresh copy. The fresh result still refreshes the cache.",
+    )
+    cache_max_age: Optional[int] = Field(
+        default=None,
+        description="Only accept a cached response (if a cache is configured) stored at most this many seconds ago; otherwise fetch a fresh copy.",
+    )
 
     @field_validator("css_extractor")
     @classmethod
@@ -147,16 +200,55 @@ class ZenrowsFetch(BaseTool):
 
     zenrows_api_key: Optional[str] = None
     base_url: str = "https://api.zenrows.com/v1/"
+    # Connection pools. None -> the process-wide shared ones from
+    # `zenrows_http`; pass your own (e.g. `create_session(pool_maxsize=...)`)
+    # to size or isolate them.
+    session: Optional[requests.Session] = None
+    async_client: Optional[httpx.AsyncClient] = None
+    # Concurrency / rate limiter. None -> the process-wide one shared by all
+    # Fetch and Extract instances, which tracks the plan's concurrency cap.
+    limiter: Optional[ZenrowsRateLimiter] = None
+    # Retries for transient failures (429/5xx/timeouts). None -> no retries.
+    retry_policy: Optional[RetryPolicy] = None
+    # Response cache (`InMemoryCache`, `SQLiteCache`, `RedisCache`, ...).
+    # None -> every call goes to Zenrows.
+    cache: Optional[ZenrowsCache] = None
+    # Request coalescing. None -> identical concurrent calls each go upstream.
+    single_flight: Optional[SingleFlight] = None
+    # Runtime instrumentation (`OpenTelemetryInstrumentation`, or your own
+    # `ZenrowsInstrumentation`). None -> no hooks run.
+    instrumentation: Optional[ZenrowsInstrumentation] = None
+    # Return screenshots and PDFs as `BinaryContent` (zero-copy view + MIME
+    # type) instead of raw `bytes` / decoded text.
+    binary_output: bool = False
+    # Per-domain Adaptive Stealth learning: mode="auto" requests for domains
+    # known to need js_render / premium_proxy get them set directly. None ->
+    # mode="auto" is always left to Zenrows.
+    stealth_learner: Optional[StealthLearner] = None
+    # Several API keys to spread requests over, each with its own limiter
+    # (the `limiter` field is then unused). None -> `zenrows_api_key` only.
+    key_pool: Optional[ZenrowsKeyPool] = None
+    # Your own request / response hooks (`ZenrowsMiddleware`), run in order
+    # around every request below the cache. None -> no chain at all.
+    middleware: Optional[List[ZenrowsMiddleware]] = None
+    # Connect / read timeouts per attempt and a budget per call
+    # (`ZenrowsTimeouts`). None -> requests wait as long as they take,
+    # unless the run config sets a budget.
+    timeouts: Optional[ZenrowsTimeouts] = None
 
     def __init__(self, zenrows_api_key: Optional[str] = None, **kwargs):
         """Initialize the Zenrows Fetch tool.
 
         Args:
             zenrows_api_key: Your Zenrows API key. If not provided, will look for
-                           ZENROWS_API_KEY environment variable.
+                           ZENROWS_API_KEY environment variable. Not needed
+                           with a ``key_pool``.
             **kwargs: Additional arguments passed to BaseTool.
         """
         super().__init__(**kwargs)
+        if self.key_pool is not None:
+            # Keys come from the pool, per request attempt.
+            return
         self.zenrows_api_key = zenrows_api_key or os.environ.get("ZENROWS_API_KEY")
 
         if not self.zenrows_api_key:
@@ -189,6 +281,15 @@ class ZenrowsFetch(BaseTool):
         else:
             params = tool_input.copy()
 
+        # Local control flags, never sent on the wire.
+        params.pop("cache_bypass", None)
+        params.pop("cache_max_age", None)
+
+        # Skip the escalation ladder for domains already learned to need
+        # js_render / premium_proxy.
+        if self.stealth_learner is not None:
+            params = self.stealth_learner.apply(params)
+
         # In Adaptive Stealth Mode (mode=auto), Zenrows manages js_render and
         # premium_proxy automatically, so skip auto-enabling them.
         adaptive_stealth = params.get("mode") == "auto"
@@ -228,64 +329,494 @@ class ZenrowsFetch(BaseTool):
 
         return params, request_headers
 
+    @staticmethod
+    def _is_screenshot_request(params: Dict[str, Any]) -> bool:
+        """Return True if the request asks for a screenshot (binary body)."""
+        screenshot_params = [
+            "screenshot",
+            "screenshot_fullpage",
+            "screenshot_selector",
+        ]
+        return any(params.get(param) for param in screenshot_params)
+
+    def _wants_binary(self, kwargs: Dict[str, Any]) -> bool:
+        """Return True if this call should produce a `BinaryContent`."""
+        return self.binary_output and (
+            self._is_screenshot_request(kwargs) or kwargs.get("response_type") == "pdf"
+        )
+
+    def _decode_response(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        response: Union[requests.Response, httpx.Response],
+    ) -> Union[str, bytes, BinaryContent]:
+        """Turn a successful response into the tool's result."""
+        if self._wants_binary(kwargs):
+            # Wraps the body as received - no decode, no copy.
+            return BinaryContent(
+                response.content,
+                guess_mime_type(params, response.headers.get("Content-Type")),
+            )
+        if self._is_screenshot_request(kwargs):
+            return response.content
+        return response.text
+
+    def _from_cache(
+        self, kwargs: Dict[str, Any], params: Dict[str, Any], cached: CacheValue
+    ) -> Union[str, bytes, BinaryContent]:
+        """Rewrap a cached binary body when this call wants `BinaryContent`."""
+        if isinstance(cached, bytes) and self._wants_binary(kwargs):
+            return BinaryContent(cached, guess_mime_type(params))
+        return cached
+
+    @staticmethod
+    def _to_cache(result: Union[str, bytes, BinaryContent]) -> CacheValue:
+        return bytes(result) if isinstance(result, BinaryContent) else result
+
+    def _get_client(self) -> ZenrowsClient:
+        """The transport this tool's calls go through, from its fields."""
+        return ZenrowsClient(
+            self.base_url,
+            session=self.session,
+            async_client=self.async_client,
+            limiter=self.limiter,
+            retry_policy=self.retry_policy,
+            key_pool=self.key_pool,
+            cache=self.cache,
+            single_flight=self.single_flight,
+            instrumentation=self.instrumentation,
+            middleware=self.middleware or (),
+            timeouts=self.timeouts,
+        )
+
+    def _send(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str] = None,
+    ) -> requests.Response:
+        """Send one Zenrows request; see `ZenrowsClient.send`."""
+        return self._get_client().send(params, request_headers, trace, request_url)
+
+    async def _asend(
+        self,
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str] = None,
+    ) -> httpx.Response:
+        """Async counterpart of `_send`."""
+        return await self._get_client().asend(
+            params, request_headers, trace, request_url
+        )
+
+    def _fetch(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str] = None,
+    ) -> ZenrowsResult:
+        """Send the prepared request and decode the body. HTTP errors
+        propagate for `_run` to map."""
+        # Note: Zenrows automatically handles User-Agent and other headers
+        try:
+            response = self._send(params, request_headers, trace, request_url)
+        except requests.exceptions.HTTPError as e:
+            self._learn_stealth(kwargs, params, None, e)
+            raise
+        result = trace.result(self._decode_response(kwargs, params, response), params)
+        self._learn_stealth(kwargs, params, result)
+        return result
+
+    async def _afetch(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        request_headers: Optional[Dict[str, str]],
+        trace: RequestTrace,
+        request_url: Optional[str] = None,
+    ) -> ZenrowsResult:
+        """Async counterpart of `_fetch`."""
+        try:
+            response = await self._asend(
+                params, request_headers, trace, request_url
+            )
+        except httpx.HTTPStatusError as e:
+            self._learn_stealth(kwargs, params, None, e)
+            raise
+        result = trace.result(self._decode_response(kwargs, params, response), params)
+        self._learn_stealth(kwargs, params, result)
+        return result
+
+    def _learn_stealth(
+        self,
+        kwargs: Dict[str, Any],
+        params: Dict[str, Any],
+        result: Optional[ZenrowsResult],
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Feed a ``mode="auto"`` call's outcome to the stealth learner.
+        ``result`` is None if the request failed with the HTTP ``error``."""
+        if self.stealth_learner is None or kwargs.get("mode") != "auto":
+            return
+        if result is not None:
+            self.stealth_learner.observe(result.url, result.credits)
+        elif (
+            params.get("mode") != "auto" and error is not None and wrong_config(error)
+        ):
+            # The learner's pre-selected config didn't work.
+            self.stealth_learner.record_failure(params.get("url"))
+
+    def _call(
+        self,
+        kwargs: Dict[str, Any],
+        trace: RequestTrace,
+        prepared: Optional[PreparedRequest] = None,
+    ) -> ZenrowsResult:
+        """Serve one call - from the cache, a coalesced in-flight call, or
+        Zenrows. ``prepared`` (from a `FetchTemplate`) skips preparing the
+        params and encoding the request URL. Errors propagate unmapped."""
+        started = time.perf_counter()
+        if prepared is None:
+            prepared = PreparedRequest(*self._prepare_request_params(kwargs))
+        params, request_headers, request_url = prepared
+        trace.prepared(params, time.perf_counter() - started)
+
+        return self._get_client().serve(
+            params,
+            request_headers,
+            trace,
+            lambda t: self._fetch(kwargs, params, request_headers, t, request_url),
+            cache_bypass=bool(kwargs.get("cache_bypass")),
+            cache_max_age=kwargs.get("cache_max_age"),
+            from_cache=lambda cached: self._from_cache(kwargs, params, cached),
+            to_cache=self._to_cache,
+        )
+
+    async def _acall(
+        self,
+        kwargs: Dict[str, Any],
+        trace: RequestTrace,
+        prepared: Optional[PreparedRequest] = None,
+    ) -> ZenrowsResult:
+        """Async counterpart of `_call`."""
+        started = time.perf_counter()
+        if prepared is None:
+            prepared = PreparedRequest(*self._prepare_request_params(kwargs))
+        params, request_headers, request_url = prepared
+        trace.prepared(params, time.perf_counter() - started)
+
+        return await self._get_client().aserve(
+            params,
+            request_headers,
+            trace,
+            lambda t: self._afetch(kwargs, params, request_headers, t, request_url),
+            cache_bypass=bool(kwargs.get("cache_bypass")),
+            cache_max_age=kwargs.get("cache_max_age"),
+            from_cache=lambda cached: self._from_cache(kwargs, params, cached),
+            to_cache=self._to_cache,
+        )
+
+    def _to_tool_output(self, result: ZenrowsResult) -> Any:
+        """What `_run` returns: the bare content, or ``(text, result)`` for
+        ``response_format="content_and_artifact"``."""
+        if self.response_format == "content_and_artifact":
+            return result.text, result
+        return result.content
+
     def _run(self, **kwargs) -> str:
         """Execute the Zenrows Fetch request.
 
         Returns:
             The scraped content as a string, format depends on response_type parameter.
+            Screenshots come back as `bytes` - or, like PDFs, as
+            `BinaryContent` when `binary_output` is set. With
+            ``response_format="content_and_artifact"``, a ``(text,
+            ZenrowsResult)`` pair instead.
         """
-        try:
-            params, request_headers = self._prepare_request_params(kwargs)
-
-            # Make the API request
-            # Note: Zenrows automatically handles User-Agent and other headers
-            response = requests.get(
-                self.base_url,
-                params=params,
-                headers=request_headers,  # Pass custom headers if provided
-            )
+        return self._to_tool_output(self._run_result(kwargs))
 
-            # Check for successful response
-            response.raise_for_status()
+    async def _arun(self, **kwargs) -> str:
+        """Async version of _run method.
 
-            # Handle different response types
-            screenshot_params = [
-                "screenshot",
-                "screenshot_fullpage",
-                "screenshot_selector",
-            ]
-            if any(param in kwargs and kwargs[param] for param in screenshot_params):
-                # For screenshots, return base64 encoded content with metadata
-                return response.content
+        Uses the event loop's shared, pooled `httpx.AsyncClient` instead of
+        the blocking `requests` call, so many scrapes can be in flight on
+        one loop without stalling it. Errors map to the same `ValueError`s
+        as `_run`.
+        """
+        return self._to_tool_output(await self._arun_result(kwargs))
+
+    def _run_result(
+        self, kwargs: Dict[str, Any], prepared: Optional[PreparedRequest] = None
+    ) -> ZenrowsResult:
+        """`_call`, with errors mapped to `ValueError`s."""
+        trace = start_trace(
+            self.name, kwargs.get("url"), self.instrumentation, self.timeouts
+        )
+        with trace.span(), mapped_errors():
+            result = self._call(kwargs, trace, prepared)
+        return trace.finish(result)
+
+    async def _arun_result(
+        self, kwargs: Dict[str, Any], prepared: Optional[PreparedRequest] = None
+    ) -> ZenrowsResult:
+        """Async counterpart of `_run_result`."""
+        trace = start_trace(
+            self.name, kwargs.get("url"), self.instrumentation, self.timeouts
+        )
+        with trace.span(), mapped_errors():
+            result = await self._acall(kwargs, trace, prepared)
+        return trace.finish(result)
+
+    def fetch_result(
+        self, tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput]
+    ) -> ZenrowsResult:
+        """Fetch a page and return it with timing and cost metadata.
 
-            # For text content, return the response text
-            return response.text
+        Args:
+            tool_input: A URL, tool-input dict, or `ZenrowsFetchInput`.
 
-        except requests.exceptions.HTTPError as e:
-            if e.response.status_code == 401:
-                raise ValueError("Invalid Zenrows API key")
-            elif e.response.status_code == 429:
-                raise ValueError("Rate limit exceeded. Check your Zenrows plan limits.")
-            elif e.response.status_code == 413:
-                raise ValueError(
-                    "Response size too large. Consider using CSS selectors to reduce content."
-                )
-            else:
-                raise ValueError(
-                    f"HTTP error occurred: {e.response.status_code} - {e.response.text}"
-                )
-
-        except requests.exceptions.Timeout:
-            raise ValueError(
-                "Request timed out. The website might be slow or unresponsive."
-            )
+        Raises:
+            ValueError: Same errors as `_run`.
+        """
+        return self._run_result(self._validate_input(tool_input))
 
-        except requests.exceptions.RequestException as e:
-            raise ValueError(f"Request failed: {str(e)}")
+    async def afetch_result(
+        self, tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput]
+    ) -> ZenrowsResult:
+        """Async counterpart of `fetch_result`."""
+        return await self._arun_result(self._validate_input(tool_input))
 
-        except Exception as e:
-            raise ValueError(f"Unexpected error: {str(e)}")
+    def template(self, **defaults: Any) -> FetchTemplate:
+        """Validate and prepare a parameter profile once, to bind many URLs
+        to.
 
-    async def _arun(self, **kwargs) -> str:
-        """Async version of _run method."""
-        return self._run(**kwargs)
+        For high-QPS callers sending the same parameters for many pages:
+        per call, only the URL is bound - no input validation or parameter
+        preparation, and no LangChain ``invoke`` overhead.
+
+        Args:
+            **defaults: Tool-input fields for every call, except ``url``.
+
+        Raises:
+            ValueError: If ``defaults`` contains ``url`` or fails validation.
+        """
+        try:
+            return FetchTemplate(self, defaults)
+        except ValidationError as e:
+            raise ValueError(f"Invalid template parameters: {e}") from e
+
+    def _validate_input(
+        self, tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput]
+    ) -> Dict[str, Any]:
+        """Validate a tool input outside `invoke`, keeping only the fields
+        the caller actually set (same as `invoke` passes to `_run`)."""
+        validated = ZenrowsFetchInput.model_validate(normalize_batch_input(tool_input))
+        return validated.model_dump(exclude_unset=True)
+
+    def iter_content(
+        self,
+        tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> Iterator[bytes]:
+        """Stream the response body in chunks instead of buffering it.
+
+        Meant for large payloads - full-page screenshots, PDFs, huge pages.
+        The request goes through `ZenrowsClient.stream`, holding its key and
+        rate-limiter slot until the stream is exhausted or closed. Streams
+        bypass the cache, request coalescing and retries, which all need
+        the complete body, and run only the middleware's `on_request`
+        hooks. ``timeouts`` (and a run-config budget) cap the connect and
+        read timeouts, but don't end a body still arriving. The call is
+        reported to ``instrumentation`` once the stream ends, with the
+        bytes streamed.
+
+        Args:
+            tool_input: A URL, tool-input dict, or `ZenrowsFetchInput`.
+            chunk_size: Max bytes per yielded chunk.
+            cancel_token: Cancels the stream from any thread - queued,
+                opening or mid-body. Defaults to the run config's
+                ``zenrows_cancel``.
+
+        Raises:
+            ValueError: Same errors as `_run`, raised on first iteration.
+        """
+        params, request_headers = self._prepare_request_params(
+            self._validate_input(tool_input)
+        )
+        trace = start_trace(
+            self.name, params.get("url"), self.instrumentation, self.timeouts
+        )
+        if cancel_token is not None:
+            trace.cancel_token = cancel_token
+        token = trace.cancel_token
+        received = 0
+        with trace.span(), mapped_errors(), self._get_client().stream(
+            params, request_headers, trace
+        ) as response:
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if token is not None:
+                        token.raise_if_cancelled()
+                    received += len(chunk)
+                    yield chunk
+            except GeneratorExit:
+                pass  # The caller stopped reading; the call still ends.
+            result = trace.result(b"", params, bytes_received=received)
+        trace.finish(result)
+
+    async def aiter_content(
+        self,
+        tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> AsyncIterator[bytes]:
+        """Async counterpart of `iter_content`."""
+        params, request_headers = self._prepare_request_params(
+            self._validate_input(tool_input)
+        )
+        trace = start_trace(
+            self.name, params.get("url"), self.instrumentation, self.timeouts
+        )
+        if cancel_token is not None:
+            trace.cancel_token = cancel_token
+        token = trace.cancel_token
+        received = 0
+        with trace.span(), mapped_errors():
+            async with self._get_client().astream(
+                params, request_headers, trace
+            ) as response:
+                chunks = response.aiter_bytes(chunk_size)
+                try:
+                    while True:
+                        try:
+                            if token is None:
+                                chunk = await chunks.__anext__()
+                            else:
+                                chunk = await cancelled_by(token, chunks.__anext__)
+                        except StopAsyncIteration:
+                            break
+                        received += len(chunk)
+                        yield chunk
+                except GeneratorExit:
+                    pass  # The caller stopped reading; the call still ends.
+                result = trace.result(b"", params, bytes_received=received)
+        trace.finish(result)
+
+    def fetch_to(
+        self,
+        tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput],
+        sink: Sink,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> int:
+        """Stream the response body straight into ``sink``.
+
+        Args:
+            tool_input: A URL, tool-input dict, or `ZenrowsFetchInput`.
+            sink: A file path (written atomically via ``<path>.part``) or a
+                binary file-like object.
+            chunk_size: Max bytes held in memory at a time.
+            cancel_token: Cancels the download; see `iter_content`.
+
+        Returns:
+            The number of bytes written.
+        """
+        chunks = self.iter_content(
+            tool_input, chunk_size=chunk_size, cancel_token=cancel_token
+        )
+        return write_chunks(chunks, sink)
+
+    async def afetch_to(
+        self,
+        tool_input: Union[str, Dict[str, Any], ZenrowsFetchInput],
+        sink: Sink,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> int:
+        """Async counterpart of `fetch_to`."""
+        chunks = self.aiter_content(
+            tool_input, chunk_size=chunk_size, cancel_token=cancel_token
+        )
+        return await awrite_chunks(chunks, sink)
+
+    def iter_batch_fetch(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsFetchInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult]:
+        """Fetch many pages with bounded concurrency, streaming the results.
+
+        Args:
+            inputs: URLs, tool-input dicts, or `ZenrowsFetchInput` instances.
+                Consumed lazily, so a generator works for very large jobs.
+            concurrency: Max requests in flight at once (threads).
+            ordered: Yield results in input order instead of as they finish.
+
+        Yields:
+            A `BatchResult` per input. A failed input (bad params, HTTP
+            error, ...) carries its exception in `error` instead of
+            aborting the batch.
+        """
+        return iter_batch(
+            lambda item: self.invoke(normalize_batch_input(item)),
+            inputs,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    def batch_fetch(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsFetchInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Fetch many pages with bounded concurrency.
+
+        Same as `iter_batch_fetch`, but waits for the whole batch and returns
+        the results as a list in input order.
+        """
+        return list(
+            self.iter_batch_fetch(inputs, concurrency=concurrency, ordered=True)
+        )
+
+    def aiter_batch_fetch(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsFetchInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult]:
+        """Async counterpart of `iter_batch_fetch`, running on the event loop
+        (via `ainvoke`) instead of threads."""
+        return aiter_batch(
+            lambda item: self.ainvoke(normalize_batch_input(item)),
+            inputs,
+            concurrency=concurrency,
+            ordered=ordered,
+        )
+
+    async def abatch_fetch(
+        self,
+        inputs: Iterable[Union[str, Dict[str, Any], ZenrowsFetchInput]],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> List[BatchResult]:
+        """Async counterpart of `batch_fetch`."""
+        return [
+            result
+            async for result in self.aiter_batch_fetch(
+                inputs, concurrency=concurrency, ordered=True
+            )
+        ]
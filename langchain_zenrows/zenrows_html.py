@@ -0,0 +1,769 @@
+"""Local post-processing of fetched HTML.
+
+Asking Zenrows for markdown *and* links, or tables *and* text, takes one
+paid request per format. `HtmlDocument` derives them all locally from the
+raw HTML of a single fetch instead::
+
+    result = scraper.fetch_result("https://example.com/products")
+    page = result.document()
+    page.markdown            # the page as Markdown
+    page.text                # as plain text
+    page.links               # absolute link URLs, in page order
+    page.tables              # each <table> as rows of cell texts
+    page.extract({"title": "h1", "images": "img @src"})  # css_extractor rules
+
+The HTML is parsed once, with the standard library's `html.parser`, into a
+small element tree; each view is computed on first use and then kept on the
+document, and the document is kept on the result - so every view after the
+first is free. `select` supports a CSS subset: type, ``#id``, ``.class``,
+``*`` and attribute selectors (``[a]``, ``[a=v]``, ``~=``, ``^=``, ``$=``,
+``*=``, ``|=``), descendant / ``>`` / ``+`` / ``~`` combinators, and
+comma-separated groups.
+
+The views approximate Zenrows' own ``response_type`` / ``outputs``
+conversions rather than reproduce them byte for byte.
+"""
+
+import json
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urljoin
+
+# Elements that never have content or a closing tag.
+_VOID = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "keygen",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+
+_BLOCK = frozenset(
+    {
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "body",
+        "dd",
+        "details",
+        "dialog",
+        "div",
+        "dl",
+        "dt",
+        "fieldset",
+        "figcaption",
+        "figure",
+        "footer",
+        "form",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "header",
+        "hr",
+        "html",
+        "li",
+        "main",
+        "nav",
+        "ol",
+        "p",
+        "pre",
+        "section",
+        "summary",
+        "table",
+        "tbody",
+        "td",
+        "tfoot",
+        "th",
+        "thead",
+        "tr",
+        "ul",
+    }
+)
+
+# Never rendered as text.
+_HIDDEN = frozenset({"head", "script", "style", "noscript", "template", "svg"})
+
+_HEADINGS = {f"h{level}": level for level in range(1, 7)}
+
+# Tags a start tag implicitly closes while they're the innermost open one,
+# as browsers do for unclosed <p>, <li>, <td>...
+_CLOSES_P = frozenset({"p"})
+_IMPLICIT_CLOSE: Dict[str, frozenset] = {
+    **{tag: _CLOSES_P for tag in _BLOCK - {"td", "th", "tr", "li", "dd", "dt"}},
+    "li": frozenset({"li", "p"}),
+    "dt": frozenset({"dt", "dd", "p"}),
+    "dd": frozenset({"dt", "dd", "p"}),
+    "tr": frozenset({"tr", "td", "th", "p"}),
+    "td": frozenset({"td", "th", "p"}),
+    "th": frozenset({"td", "th", "p"}),
+    "option": frozenset({"option"}),
+}
+
+# Elements nested deeper are attached at this depth instead - as browsers
+# and libxml2 cap it too - so walking the tree can't exhaust the stack.
+_MAX_DEPTH = 256
+
+# Stands in for <br> until whitespace has been collapsed.
+_BREAK = "\u2028"
+_WHITESPACE = re.compile(r"[ \t\n\r\f\v]+")
+
+
+def _collapse(text: str) -> str:
+    """Collapse whitespace runs to single spaces, then turn `_BREAK`s into
+    newlines."""
+    text = _WHITESPACE.sub(" ", text)
+    if _BREAK in text:
+        text = "\n".join(line.strip() for line in text.split(_BREAK))
+    return text.strip()
+
+
+class HtmlElement:
+    """An element of a parsed `HtmlDocument`.
+
+    Attributes:
+        tag: Lowercase tag name.
+        attrs: Attributes, names lowercased; valueless ones map to ``""``.
+        children: Child elements and text nodes (`str`), in order.
+        parent: The enclosing element; None for the document root.
+    """
+
+    __slots__ = ("tag", "attrs", "children", "parent")
+
+    def __init__(
+        self,
+        tag: str,
+        attrs: Dict[str, str],
+        parent: Optional["HtmlElement"] = None,
+    ):
+        self.tag = tag
+        self.attrs = attrs
+        self.children: List[Union["HtmlElement", str]] = []
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        return f"<HtmlElement {self.tag} {self.attrs!r}>"
+
+    def get(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """An attribute's value."""
+        return self.attrs.get(name, default)
+
+    @property
+    def text(self) -> str:
+        """The element's text, whitespace collapsed."""
+        return _collapse("".join(self._text_parts()))
+
+    def _text_parts(self) -> Iterator[str]:
+        stack: List[Union[HtmlElement, str]] = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, str):
+                yield child
+            elif child.tag == "br":
+                yield _BREAK
+            elif child.tag not in _HIDDEN:
+                if child.tag in _BLOCK:
+                    yield " "
+                    stack.append(" ")
+                stack.extend(reversed(child.children))
+
+    def iter(self) -> Iterator["HtmlElement"]:
+        """This element's descendants, in document order."""
+        stack = list(reversed(self.children))
+        while stack:
+            child = stack.pop()
+            if isinstance(child, HtmlElement):
+                yield child
+                stack.extend(reversed(child.children))
+
+    def select(self, selector: str) -> List["HtmlElement"]:
+        """Descendants matching a CSS ``selector``, in document order."""
+        groups = _compile(selector)
+        return [el for el in self.iter() if any(_matches(el, g) for g in groups)]
+
+    def _element_siblings_before(self) -> Iterator["HtmlElement"]:
+        """Preceding sibling elements, nearest first."""
+        if self.parent is None:
+            return
+        siblings = self.parent.children
+        for sibling in reversed(siblings[: _index(siblings, self)]):
+            if isinstance(sibling, HtmlElement):
+                yield sibling
+
+
+def _index(children: List[Union[HtmlElement, str]], element: HtmlElement) -> int:
+    for i, child in enumerate(children):
+        if child is element:
+            return i
+    raise ValueError("element is not a child of its parent")
+
+
+class _TreeBuilder(HTMLParser):
+    """Builds an `HtmlElement` tree, forgiving unclosed and stray tags."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.root = HtmlElement("#document", {})
+        self._open = [self.root]
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        closes = _IMPLICIT_CLOSE.get(tag)
+        if closes:
+            while len(self._open) > 1 and self._open[-1].tag in closes:
+                self._open.pop()
+        parent = self._parent()
+        element = HtmlElement(tag, {k: v or "" for k, v in attrs}, parent)
+        parent.children.append(element)
+        if tag not in _VOID:
+            self._open.append(element)
+
+    def handle_startendtag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]]
+    ) -> None:
+        parent = self._parent()
+        parent.children.append(
+            HtmlElement(tag, {k: v or "" for k, v in attrs}, parent)
+        )
+
+    def handle_endtag(self, tag: str) -> None:
+        for i in range(len(self._open) - 1, 0, -1):
+            if self._open[i].tag == tag:
+                del self._open[i:]
+                return
+        # A stray end tag - ignored, as browsers do.
+
+    def handle_data(self, data: str) -> None:
+        self._open[-1].children.append(data)
+
+    def _parent(self) -> HtmlElement:
+        """Where a new element goes: the innermost open one, or the one at
+        `_MAX_DEPTH` below it."""
+        return self._open[min(len(self._open), _MAX_DEPTH) - 1]
+
+
+class HtmlDocument:
+    """A parsed HTML page, with derived views computed once each.
+
+    Args:
+        html: The page's HTML.
+        base_url: URL the page was fetched from; relative links resolve
+            against it (or the page's ``<base href>``).
+    """
+
+    __slots__ = (
+        "root",
+        "base_url",
+        "_markdown",
+        "_text",
+        "_links",
+        "_tables",
+        "_selections",
+        "_extractions",
+    )
+
+    def __init__(self, html: str, base_url: Optional[str] = None):
+        builder = _TreeBuilder()
+        builder.feed(html)
+        builder.close()
+        self.root = builder.root
+        base = next((el.get("href") for el in self.root.select("base[href]")), None)
+        self.base_url = urljoin(base_url or "", base) if base else base_url
+        self._markdown: Optional[str] = None
+        self._text: Optional[str] = None
+        self._links: Optional[List[str]] = None
+        self._tables: Optional[List[List[List[str]]]] = None
+        self._selections: Dict[str, List[HtmlElement]] = {}
+        self._extractions: Dict[str, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<HtmlDocument {self.base_url or ''}>"
+
+    @property
+    def title(self) -> Optional[str]:
+        """The ``<title>``, if any."""
+        titles = self.select("title")
+        return titles[0].text if titles else None
+
+    @property
+    def text(self) -> str:
+        """The page as plain text: one line per block, scripts, styles and
+        ``<head>`` left out."""
+        if self._text is None:
+            lines: List[str] = []
+            _render_text(self.root, lines)
+            self._text = "\n".join(lines)
+        return self._text
+
+    @property
+    def markdown(self) -> str:
+        """The page as Markdown - headings, paragraphs, lists, links,
+        images, emphasis, code, quotes and tables."""
+        if self._markdown is None:
+            renderer = _MarkdownRenderer(self.base_url)
+            self._markdown = "\n\n".join(renderer.blocks(self.root))
+        return self._markdown
+
+    @property
+    def links(self) -> List[str]:
+        """Absolute URLs of the page's ``<a href>`` links, deduplicated, in
+        page order. ``javascript:`` and same-page ``#`` links are skipped."""
+        if self._links is None:
+            seen: Dict[str, None] = {}
+            for anchor in self.select("a[href]"):
+                href = anchor.attrs["href"].strip()
+                if _is_link(href):
+                    seen.setdefault(self._resolve(href))
+            self._links = list(seen)
+        return self._links
+
+    @property
+    def tables(self) -> List[List[List[str]]]:
+        """Every ``<table>``, outer before nested, as rows of cell texts."""
+        if self._tables is None:
+            self._tables = [_table_rows(table) for table in self.select("table")]
+        return self._tables
+
+    def select(self, selector: str) -> List[HtmlElement]:
+        """Elements matching a CSS ``selector``, in document order.
+
+        Raises:
+            ValueError: If the selector uses syntax outside the supported
+                subset.
+        """
+        selected = self._selections.get(selector)
+        if selected is None:
+            selected = self._selections[selector] = self.root.select(selector)
+        return selected
+
+    def extract(self, rules: Union[str, Mapping[str, str]]) -> Dict[str, Any]:
+        """Apply ``css_extractor``-style rules locally.
+
+        Args:
+            rules: ``{"name": "selector"}``, as a mapping or JSON. End a
+                selector with ``@attr`` (``"img @src"``) to take that
+                attribute instead of the text; URL attributes (``href``,
+                ``src``) come back absolute.
+
+        Returns:
+            Per name: the value for a single match, a list for several, an
+            empty list for none.
+        """
+        key = rules if isinstance(rules, str) else json.dumps(rules, sort_keys=True)
+        extracted = self._extractions.get(key)
+        if extracted is None:
+            parsed = json.loads(rules) if isinstance(rules, str) else rules
+            extracted = {
+                name: self._extract_one(selector) for name, selector in parsed.items()
+            }
+            self._extractions[key] = extracted
+        return extracted
+
+    def _extract_one(self, rule: str) -> Union[str, List[str]]:
+        selector, attr = rule, ""
+        match = _ATTR_SUFFIX.search(rule)
+        if match:
+            selector, attr = rule[: match.start()], match.group(1).lower()
+        values = []
+        for element in self.select(selector.strip()):
+            if not attr:
+                values.append(element.text)
+            elif attr in element.attrs:
+                value = element.attrs[attr]
+                if attr in ("href", "src"):
+                    value = self._resolve(value)
+                values.append(value)
+        return values[0] if len(values) == 1 else values
+
+    def _resolve(self, url: str) -> str:
+        return urljoin(self.base_url, url) if self.base_url else url
+
+
+def _is_link(href: Optional[str]) -> bool:
+    """Whether ``href`` leads somewhere else - not a same-page ``#`` anchor
+    or a ``javascript:`` URL."""
+    if not href or href.startswith("#"):
+        return False
+    return not href.lower().startswith("javascript:")
+
+
+def _table_rows(table: HtmlElement) -> List[List[str]]:
+    """A table's rows - its own, not those of tables nested in it."""
+    rows = []
+    for tr in table.select("tr"):
+        owner = tr.parent
+        while owner is not None and owner.tag != "table":
+            owner = owner.parent
+        if owner is table:
+            rows.append(
+                [
+                    cell.text
+                    for cell in tr.children
+                    if isinstance(cell, HtmlElement) and cell.tag in ("td", "th")
+                ]
+            )
+    return rows
+
+
+def _render_text(element: HtmlElement, lines: List[str]) -> None:
+    """Append ``element``'s text to ``lines``, a line per block."""
+    parts: List[str] = []
+
+    def flush() -> None:
+        text = _collapse("".join(parts))
+        if text:
+            lines.extend(text.split("\n"))
+        parts.clear()
+
+    for child in element.children:
+        if isinstance(child, str):
+            parts.append(child)
+        elif child.tag == "br":
+            parts.append(_BREAK)
+        elif child.tag in _HIDDEN:
+            continue
+        elif child.tag in ("td", "th"):
+            parts.append(f" {child.text} ")
+        elif child.tag == "pre":
+            flush()
+            lines.extend("".join(_raw_text(child)).strip("\n").split("\n"))
+        elif child.tag in _BLOCK or _has_block(child):
+            flush()
+            _render_text(child, lines)
+        else:
+            parts.append(child.text)
+    flush()
+
+
+def _has_block(element: HtmlElement) -> bool:
+    return any(el.tag in _BLOCK for el in element.iter())
+
+
+class _MarkdownRenderer:
+    """Renders an element tree to Markdown blocks."""
+
+    def __init__(self, base_url: Optional[str]):
+        self.base_url = base_url
+
+    def _url(self, url: str) -> str:
+        return urljoin(self.base_url, url) if self.base_url else url
+
+    # -- blocks -------------------------------------------------------------
+
+    def blocks(self, element: HtmlElement) -> List[str]:
+        """``element``'s content as Markdown blocks."""
+        out: List[str] = []
+        inline: List[str] = []
+
+        def flush() -> None:
+            text = _collapse("".join(inline))
+            if text:
+                out.append(text)
+            inline.clear()
+
+        for child in element.children:
+            if isinstance(child, str):
+                inline.append(child)
+            elif child.tag in _HIDDEN:
+                continue
+            elif child.tag in _BLOCK or _has_block(child):
+                flush()
+                out.extend(self.block(child))
+            else:
+                inline.append(self.inline(child))
+        flush()
+        return out
+
+    def block(self, element: HtmlElement) -> List[str]:
+        tag = element.tag
+        if tag in _HEADINGS:
+            text = _collapse(self.inline_children(element)).replace("\n", " ")
+            return [f"{'#' * _HEADINGS[tag]} {text}"] if text else []
+        if tag == "hr":
+            return ["---"]
+        if tag == "pre":
+            code = "".join(_raw_text(element)).strip("\n")
+            return [f"```\n{code}\n```"]
+        if tag in ("ul", "ol"):
+            return [self.bullets(element)] if element.children else []
+        if tag == "blockquote":
+            inner = "\n\n".join(self.blocks(element))
+            return ["\n".join(f"> {line}".rstrip() for line in inner.split("\n"))]
+        if tag == "table":
+            table = self.table(element)
+            return [table] if table else []
+        return self.blocks(element)
+
+    def bullets(self, element: HtmlElement) -> str:
+        items = []
+        try:
+            number = int(element.get("start") or 1)
+        except ValueError:
+            number = 1
+        for child in element.children:
+            if not isinstance(child, HtmlElement) or child.tag != "li":
+                continue
+            marker = f"{number}. " if element.tag == "ol" else "- "
+            number += 1
+            lines = "\n".join(self.blocks(child)).split("\n")
+            indent = " " * len(marker)
+            items.append(
+                "\n".join(
+                    [marker + lines[0]]
+                    + [indent + line if line else "" for line in lines[1:]]
+                )
+            )
+        return "\n".join(items)
+
+    def table(self, element: HtmlElement) -> str:
+        rows = [
+            [cell.replace("|", "\\|").replace("\n", " ") for cell in row]
+            for row in _table_rows(element)
+            if row
+        ]
+        if not rows:
+            return ""
+        width = max(len(row) for row in rows)
+        rows = [row + [""] * (width - len(row)) for row in rows]
+        lines = [
+            "| " + " | ".join(rows[0]) + " |",
+            "| " + " | ".join(["---"] * width) + " |",
+        ]
+        lines.extend("| " + " | ".join(row) + " |" for row in rows[1:])
+        return "\n".join(lines)
+
+    # -- inline -------------------------------------------------------------
+
+    def inline_children(self, element: HtmlElement) -> str:
+        parts = []
+        for child in element.children:
+            parts.append(child if isinstance(child, str) else self.inline(child))
+        return "".join(parts)
+
+    def inline(self, element: HtmlElement) -> str:
+        tag = element.tag
+        if tag in _HIDDEN:
+            return ""
+        if tag == "br":
+            return _BREAK
+        if tag == "img":
+            src = element.get("src")
+            if not src:
+                return ""
+            return f"![{element.get('alt', '')}]({self._url(src)})"
+        content = self.inline_children(element)
+        if tag == "a":
+            href = element.get("href")
+            text = _collapse(content)
+            if not text or not _is_link(href):
+                return content
+            return f"[{text}]({self._url(href)})"
+        if tag in ("strong", "b"):
+            return _wrap(content, "**")
+        if tag in ("em", "i"):
+            return _wrap(content, "*")
+        if tag == "code":
+            return _wrap(content, "`")
+        return content
+
+
+def _wrap(content: str, marker: str) -> str:
+    """Wrap ``content`` in ``marker``, keeping surrounding whitespace
+    outside it (``** bold**`` isn't bold)."""
+    stripped = content.strip()
+    if not stripped:
+        return content
+    lead = content[: len(content) - len(content.lstrip())]
+    trail = content[len(content.rstrip()) :]
+    return f"{lead}{marker}{stripped}{marker}{trail}"
+
+
+def _raw_text(element: HtmlElement) -> Iterator[str]:
+    """Text with whitespace preserved, for ``<pre>``."""
+    stack: List[Union[HtmlElement, str]] = list(reversed(element.children))
+    while stack:
+        child = stack.pop()
+        if isinstance(child, str):
+            yield child
+        elif child.tag == "br":
+            yield "\n"
+        else:
+            stack.extend(reversed(child.children))
+
+
+# -- CSS selectors ------------------------------------------------------------
+
+_TOKEN = re.compile(
+    r"""
+    \s*(?P<combinator>[>+~])\s*
+    | (?P<space>\s+)
+    | (?P<tag>\*|[A-Za-z][\w-]*)
+    | \#(?P<id>[\w-]+)
+    | \.(?P<cls>[\w-]+)
+    | \[\s*(?P<attr>[\w:-]+)\s*
+      (?:(?P<op>[~^$*|]?=)\s*(?P<value>"[^"]*"|'[^']*'|[^\]\s]*)\s*)?\]
+    """,
+    re.VERBOSE,
+)
+
+# The ``@attr`` suffix of an ``extract`` rule: only at the very end, after
+# whitespace, so an ``@`` inside an attribute value stays part of it.
+_ATTR_SUFFIX = re.compile(r"\s@([\w-]+)\s*$")
+
+_Compound = Tuple[
+    Optional[str],  # tag
+    Optional[str],  # id
+    Tuple[str, ...],  # classes
+    Tuple[Tuple[str, Optional[str], Optional[str]], ...],  # attribute tests
+]
+# A compound selector, and the combinator joining it to the previous one.
+_Chain = Tuple[Tuple[Optional[str], _Compound], ...]
+
+
+@lru_cache(maxsize=256)
+def _compile(selector: str) -> Tuple[_Chain, ...]:
+    """Parse ``selector`` into one chain per comma-separated group - commas
+    inside ``[...]`` attribute tests don't separate groups."""
+    groups, start, quote, depth = [], 0, "", 0
+    for pos, char in enumerate(selector):
+        if quote:
+            quote = "" if char == quote else quote
+        elif char in "'\"" and depth:
+            quote = char
+        elif char in "[]":
+            depth += 1 if char == "[" else -1
+        elif char == "," and not depth:
+            groups.append(_compile_group(selector[start:pos].strip(), selector))
+            start = pos + 1
+    groups.append(_compile_group(selector[start:].strip(), selector))
+    return tuple(groups)
+
+
+def _compile_group(group: str, selector: str) -> _Chain:
+    if not group:
+        raise ValueError(f"Unsupported CSS selector: {selector!r}")
+    chain: List[Tuple[Optional[str], _Compound]] = []
+    combinator: Optional[str] = None
+    tag: Optional[str] = None
+    id_: Optional[str] = None
+    classes: List[str] = []
+    attrs: List[Tuple[str, Optional[str], Optional[str]]] = []
+    started = False
+
+    def close() -> None:
+        nonlocal tag, id_, classes, attrs, started
+        chain.append((combinator, (tag, id_, tuple(classes), tuple(attrs))))
+        tag, id_, classes, attrs, started = None, None, [], [], False
+
+    pos = 0
+    while pos < len(group):
+        match = _TOKEN.match(group, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Unsupported CSS selector: {selector!r}")
+        pos = match.end()
+        if match.group("combinator") or match.group("space"):
+            if not started:
+                raise ValueError(f"Unsupported CSS selector: {selector!r}")
+            close()
+            combinator = match.group("combinator") or " "
+            continue
+        if match.group("tag"):
+            if started:
+                raise ValueError(f"Unsupported CSS selector: {selector!r}")
+            tag = None if match.group("tag") == "*" else match.group("tag").lower()
+        elif match.group("id"):
+            id_ = match.group("id")
+        elif match.group("cls"):
+            classes.append(match.group("cls"))
+        else:
+            value = match.group("value")
+            if value and value[0] in "'\"":
+                value = value[1:-1]
+            attrs.append((match.group("attr").lower(), match.group("op"), value))
+        started = True
+    if not started:
+        raise ValueError(f"Unsupported CSS selector: {selector!r}")
+    close()
+    return tuple(chain)
+
+
+def _attr_matches(actual: str, op: Optional[str], expected: Optional[str]) -> bool:
+    if op is None:
+        return True
+    expected = expected or ""
+    if op == "=":
+        return actual == expected
+    if op == "~=":
+        return expected in actual.split()
+    if op == "^=":
+        return bool(expected) and actual.startswith(expected)
+    if op == "$=":
+        return bool(expected) and actual.endswith(expected)
+    if op == "*=":
+        return bool(expected) and expected in actual
+    # |=
+    return actual == expected or actual.startswith(expected + "-")
+
+
+def _compound_matches(element: HtmlElement, compound: _Compound) -> bool:
+    tag, id_, classes, attrs = compound
+    if tag is not None and element.tag != tag:
+        return False
+    if id_ is not None and element.attrs.get("id") != id_:
+        return False
+    if classes:
+        have = element.attrs.get("class", "").split()
+        if any(cls not in have for cls in classes):
+            return False
+    for name, op, value in attrs:
+        actual = element.attrs.get(name)
+        if actual is None or not _attr_matches(actual, op, value):
+            return False
+    return True
+
+
+def _matches(element: HtmlElement, chain: _Chain, index: int = -1) -> bool:
+    """Whether ``element`` matches ``chain`` up to compound ``index``,
+    checked right to left."""
+    if element.parent is None:
+        return False  # the document root isn't an element
+    if index < 0:
+        index += len(chain)
+    combinator, compound = chain[index]
+    if not _compound_matches(element, compound):
+        return False
+    if index == 0:
+        return True
+    if combinator == ">":
+        parent = element.parent
+        return parent is not None and _matches(parent, chain, index - 1)
+    if combinator == "+":
+        previous = next(element._element_siblings_before(), None)
+        return previous is not None and _matches(previous, chain, index - 1)
+    if combinator == "~":
+        return any(
+            _matches(sibling, chain, index - 1)
+            for sibling in element._element_siblings_before()
+        )
+    ancestor = element.parent
+    while ancestor is not None:
+        if _matches(ancestor, chain, index - 1):
+            return True
+        ancestor = ancestor.parent
+    return False
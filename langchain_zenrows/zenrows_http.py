@@ -0,0 +1,230 @@
+"""HTTP transport shared by the Zenrows tools.
+
+`ZenrowsFetch` and `ZenrowsExtract` both talk to the same endpoint, so the
+connection pools live here rather than on either tool: by default every
+tool instance in the process reuses one pooled `requests.Session`, and every
+tool instance running on a given event loop reuses one `httpx.AsyncClient` -
+and with them the open keep-alive connections to api.zenrows.com, instead of
+paying a fresh TCP + TLS handshake per request.
+
+Either can be swapped for your own via the tools' ``session`` /
+``async_client`` fields, e.g. a `create_session()` with a bigger pool.
+"""
+
+import asyncio
+import email.utils
+import http.cookiejar
+import json
+import threading
+import time
+import weakref
+from typing import Any, Dict, Mapping, Optional, Union
+
+import httpx
+import requests
+from urllib3.util.retry import Retry
+
+from langchain_zenrows.zenrows_cancel import CancellableAdapter
+
+# JS-rendered pages routinely take 5-30s, so there's deliberately no
+# timeout here - same as the sync `requests` path, which sets none either.
+DEFAULT_ASYNC_TIMEOUT = httpx.Timeout(None)
+
+# Sized for hundreds of concurrent tool calls on one loop. Zenrows plans cap
+# concurrency server-side anyway; this only bounds local sockets.
+DEFAULT_MAX_CONNECTIONS = 500
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 100
+
+# Sync pool sizing. urllib3 keeps one pool per host, and every request goes
+# to the same host, so `pool_maxsize` is effectively the number of
+# keep-alive connections to Zenrows that threads can use at once.
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 100
+
+# Adapter-level retries only cover failing to *connect* - nothing has
+# reached Zenrows yet, so retrying can't double-bill. Status/read retries are
+# left off here on purpose.
+DEFAULT_ADAPTER_RETRIES = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+
+_default_session: Optional[requests.Session] = None
+_default_session_lock = threading.Lock()
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_async_clients_lock = threading.Lock()
+
+
+def create_session(
+    *,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    max_retries: Union[Retry, int] = DEFAULT_ADAPTER_RETRIES,
+) -> requests.Session:
+    """Build a pooled, keep-alive `requests.Session` for the Zenrows API.
+
+    Args:
+        pool_connections: Number of per-host pools to cache.
+        pool_maxsize: Max connections kept open per host - i.e. to Zenrows.
+        pool_block: If True, threads wait for a free connection once
+            `pool_maxsize` are in use, instead of opening (and then
+            discarding) an extra one.
+        max_retries: urllib3 `Retry` (or retry count) for the HTTP adapter.
+
+    The session rejects cookies, so it holds no per-request state and is
+    safe to share between threads and tool instances. Its connections can be
+    shut down mid-request by a `CancelToken`.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    adapter = CancellableAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=max_retries,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_default_session() -> requests.Session:
+    """Return the process-wide session shared by all tool instances."""
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = create_session()
+        return _default_session
+
+
+def create_async_client(
+    *,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    timeout: httpx.Timeout = DEFAULT_ASYNC_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Build a pooled `httpx.AsyncClient` configured for the Zenrows API."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+        timeout=timeout,
+    )
+
+
+def get_default_async_client() -> httpx.AsyncClient:
+    """Return the shared async client for the running event loop.
+
+    An `httpx.AsyncClient`'s connections are bound to the loop that opened
+    them, so the pool is kept per loop - e.g. successive `asyncio.run()`
+    calls each get a fresh one instead of reusing dead sockets. Must be
+    called from inside a running loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _async_clients_lock:
+        client = _async_clients.get(loop)
+        if client is None or client.is_closed:
+            client = create_async_client()
+            _async_clients[loop] = client
+        return client
+
+
+def prepare_encoded(
+    session: requests.Session,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> requests.PreparedRequest:
+    """Prepare a GET for a URL whose query string is already fully
+    percent-encoded (e.g. by a `FetchTemplate`).
+
+    `requests` re-parses and re-quotes every URL in pure Python, which for
+    long query strings costs more than the rest of preparing the request.
+    Here the request is prepared against the URL without its query - same
+    session headers, cookies and auth - and the encoded URL is swapped in.
+    """
+    base_url, _, _ = url.partition("?")
+    request = requests.Request("GET", base_url, headers=headers)
+    prepared = session.prepare_request(request)
+    prepared.url = url
+    return prepared
+
+
+def get_encoded(
+    session: requests.Session,
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: Any = None,
+) -> requests.Response:
+    """``session.get(url, headers=headers, timeout=timeout)`` for an
+    already-encoded URL; see `prepare_encoded`."""
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    return session.send(
+        prepare_encoded(session, url, headers),
+        allow_redirects=True,
+        timeout=timeout,
+        **settings,
+    )
+
+
+# -- reading Zenrows responses ------------------------------------------------
+
+
+def error_code(body: Any) -> Optional[str]:
+    """Zenrows JSON error-envelope ``code``, upper-cased - mirrors the
+    CLI's ``zrErrorCode`` helper. None on non-JSON or a missing/non-string
+    ``code``."""
+    try:
+        parsed = json.loads(body)
+    except (ValueError, TypeError):
+        return None
+    code = parsed.get("code") if isinstance(parsed, dict) else None
+    return code.upper() if isinstance(code, str) else None
+
+
+def parse_retry_after(value: Any) -> Optional[float]:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date)."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+def header_str(headers: Mapping[str, Any], name: str) -> Optional[str]:
+    """Read a string header, or None if it's absent."""
+    value = headers.get(name)
+    return value if isinstance(value, str) else None
+
+
+def header_float(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """Read a numeric header, or None if it's absent or malformed."""
+    value = header_str(headers, name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def header_int(headers: Mapping[str, Any], name: str) -> Optional[int]:
+    """Read an integer header, or None if it's absent or malformed."""
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    if not isinstance(value, str):
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
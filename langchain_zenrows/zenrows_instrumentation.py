@@ -0,0 +1,243 @@
+"""Runtime instrumentation hooks for the Zenrows tools.
+
+Give a tool an ``instrumentation`` to see what it does at runtime - call
+latency, per-attempt status codes and timings, payload sizes, retries, 429s,
+Extract ``AUTH010`` -> Autoparse fallbacks and error mapping.
+
+- `ZenrowsInstrumentation` - zero-dependency callback protocol. Subclass it
+  and override the hooks you need; they all default to no-ops.
+- `OpenTelemetryInstrumentation` - emits one span per call (with an event
+  per HTTP attempt) plus latency / payload-size histograms and counters
+  through OpenTelemetry. Needs ``pip install langchain-zenrows[otel]``.
+- `MultiInstrumentation` - fans events out to several of the above.
+
+Hooks run inline on the request path, so keep them cheap. An exception
+raised by a hook propagates to the caller.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+
+if TYPE_CHECKING:
+    from langchain_zenrows.zenrows_result import ZenrowsResult
+
+
+@dataclass
+class AttemptEvent:
+    """One HTTP attempt within a call.
+
+    Attributes:
+        attempt: 1-based attempt number within the call.
+        retry: Whether this attempt retries a failed one. The Extract
+            Autoparse fallback is a new request, not a retry.
+        status_code: HTTP status, or None if no response arrived.
+        seconds: Time from send to response headers (or to the error).
+        queue_seconds: Time spent waiting on the rate limiter first.
+        bytes_received: Response body size, if a response arrived.
+        error: The transport error (timeout, dropped connection, ...), if
+            any. Non-2xx responses are not errors here - see `status_code`.
+    """
+
+    attempt: int
+    retry: bool
+    status_code: Optional[int]
+    seconds: float
+    queue_seconds: float
+    bytes_received: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+class ZenrowsInstrumentation:
+    """Callback protocol for tool instrumentation; every hook is a no-op.
+
+    ``on_call_start`` returns an opaque token (e.g. a span) that is handed
+    back to every other hook for the same call.
+    """
+
+    def on_call_start(self, tool: str, url: Optional[str]) -> Any:
+        """A tool call started."""
+        return None
+
+    def on_prepared(self, token: Any, params: Dict[str, Any], seconds: float) -> None:
+        """Request parameters were prepared (``apikey`` already removed)."""
+
+    def on_attempt(self, token: Any, event: AttemptEvent) -> None:
+        """An HTTP attempt finished - successfully or not."""
+
+    def on_autoparse_fallback(self, token: Any) -> None:
+        """Extract hit ``AUTH010`` and is falling back to Autoparse."""
+
+    def on_call_end(
+        self,
+        token: Any,
+        result: Optional["ZenrowsResult"],
+        error: Optional[BaseException],
+    ) -> None:
+        """The call finished. ``error`` is the `ValueError` raised to the
+        caller; the underlying exception is its ``__context__``."""
+
+
+class MultiInstrumentation(ZenrowsInstrumentation):
+    """Forwards every event to several instrumentations, in order."""
+
+    def __init__(self, instrumentations: Sequence[ZenrowsInstrumentation]):
+        self.instrumentations = list(instrumentations)
+
+    def on_call_start(self, tool: str, url: Optional[str]) -> Any:
+        return [i.on_call_start(tool, url) for i in self.instrumentations]
+
+    def on_prepared(self, token: Any, params: Dict[str, Any], seconds: float) -> None:
+        for i, t in zip(self.instrumentations, token):
+            i.on_prepared(t, params, seconds)
+
+    def on_attempt(self, token: Any, event: AttemptEvent) -> None:
+        for i, t in zip(self.instrumentations, token):
+            i.on_attempt(t, event)
+
+    def on_autoparse_fallback(self, token: Any) -> None:
+        for i, t in zip(self.instrumentations, token):
+            i.on_autoparse_fallback(t)
+
+    def on_call_end(
+        self,
+        token: Any,
+        result: Optional["ZenrowsResult"],
+        error: Optional[BaseException],
+    ) -> None:
+        for i, t in zip(self.instrumentations, token):
+            i.on_call_end(t, result, error)
+
+
+class OpenTelemetryInstrumentation(ZenrowsInstrumentation):
+    """Spans and metrics through OpenTelemetry.
+
+    Per call: a ``zenrows.<tool>`` span with the target URL, final status,
+    attempts, credits and cache / coalescing flags as attributes, and a
+    ``zenrows.attempt`` event per HTTP attempt. The span is current while
+    the call runs, so spans started inside it are its children.
+
+    Metrics: ``zenrows.client.duration`` (call latency, s),
+    ``zenrows.client.attempt.duration`` (per attempt, s, by status),
+    ``zenrows.client.response.size`` (bytes), and the counters
+    ``zenrows.client.attempts``, ``zenrows.client.retries``,
+    ``zenrows.client.rate_limited`` (429s),
+    ``zenrows.client.autoparse_fallbacks`` and ``zenrows.client.errors``.
+
+    Args:
+        tracer_provider: Defaults to the global provider.
+        meter_provider: Defaults to the global provider.
+    """
+
+    def __init__(self, tracer_provider: Any = None, meter_provider: Any = None):
+        try:
+            from opentelemetry import context, metrics, trace
+        except ImportError as e:
+            raise ImportError(
+                "OpenTelemetryInstrumentation requires opentelemetry-api. "
+                "Install it with `pip install langchain-zenrows[otel]`."
+            ) from e
+
+        self._context = context
+        self._trace = trace
+        self._tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+        meter = metrics.get_meter(__name__, meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "zenrows.client.duration", unit="s", description="Tool call latency"
+        )
+        self._attempt_duration = meter.create_histogram(
+            "zenrows.client.attempt.duration",
+            unit="s",
+            description="Latency of a single HTTP attempt",
+        )
+        self._size = meter.create_histogram(
+            "zenrows.client.response.size", unit="By", description="Response body size"
+        )
+        self._attempts = meter.create_counter("zenrows.client.attempts")
+        self._retries = meter.create_counter("zenrows.client.retries")
+        self._rate_limited = meter.create_counter("zenrows.client.rate_limited")
+        self._fallbacks = meter.create_counter("zenrows.client.autoparse_fallbacks")
+        self._errors = meter.create_counter("zenrows.client.errors")
+
+    def on_call_start(self, tool: str, url: Optional[str]) -> Any:
+        span = self._tracer.start_span(
+            f"zenrows.{tool}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes={"zenrows.tool": tool, "url.full": url or ""},
+        )
+        # Current until the call ends - what `trace.use_span` does, split
+        # across the two hooks - so spans started inside the call (HTTP
+        # client instrumentation, say) are its children.
+        attached = self._context.attach(self._trace.set_span_in_context(span))
+        return (span, tool, time.perf_counter(), attached)
+
+    def on_prepared(self, token: Any, params: Dict[str, Any], seconds: float) -> None:
+        span, _, _, _ = token
+        for key in ("mode", "js_render", "premium_proxy", "response_type", "extract"):
+            if key in params:
+                span.set_attribute(f"zenrows.param.{key}", str(params[key]))
+
+    def on_attempt(self, token: Any, event: AttemptEvent) -> None:
+        span, tool, _, _ = token
+        attributes: Dict[str, Any] = {"zenrows.tool": tool}
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+        self._attempts.add(1, attributes)
+        self._attempt_duration.record(event.seconds, attributes)
+        if event.retry:
+            self._retries.add(1, {"zenrows.tool": tool})
+        if event.status_code == 429:
+            self._rate_limited.add(1, {"zenrows.tool": tool})
+        if event.bytes_received is not None:
+            self._size.record(event.bytes_received, attributes)
+        span.add_event(
+            "zenrows.attempt",
+            {
+                **attributes,
+                "zenrows.attempt": event.attempt,
+                "zenrows.attempt.seconds": event.seconds,
+                "zenrows.queue.seconds": event.queue_seconds,
+            },
+        )
+
+    def on_autoparse_fallback(self, token: Any) -> None:
+        span, tool, _, _ = token
+        self._fallbacks.add(1, {"zenrows.tool": tool})
+        span.add_event("zenrows.autoparse_fallback")
+
+    def on_call_end(
+        self,
+        token: Any,
+        result: Optional["ZenrowsResult"],
+        error: Optional[BaseException],
+    ) -> None:
+        span, tool, started, attached = token
+        self._context.detach(attached)
+        attributes: Dict[str, Any] = {"zenrows.tool": tool}
+        if result is not None:
+            if result.status_code is not None:
+                attributes["http.response.status_code"] = result.status_code
+            span.set_attributes(
+                {
+                    **attributes,
+                    "zenrows.attempts": result.attempts,
+                    "zenrows.cache_hit": result.cache_hit,
+                    "zenrows.coalesced": result.coalesced,
+                    "zenrows.autoparse_fallback": result.autoparse_fallback,
+                    "zenrows.queue.seconds": result.queue_seconds,
+                }
+            )
+            if result.credits is not None:
+                span.set_attribute("zenrows.credits", result.credits)
+            if result.stealth_escalated is not None:
+                span.set_attribute("zenrows.stealth_escalated", result.stealth_escalated)
+        if error is not None:
+            cause = error.__cause__ or error.__context__ or error
+            attributes["error.type"] = type(cause).__name__
+            self._errors.add(1, attributes)
+            span.record_exception(error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+        self._duration.record(time.perf_counter() - started, attributes)
+        span.end()
@@ -0,0 +1,534 @@
+"""Resumable batch jobs with an on-disk journal.
+
+`ZenrowsJob` runs a tool (`ZenrowsFetch`, `ZenrowsExtract`, ...) over many
+inputs like ``batch_fetch`` does, but records every finished input - output
+or error - in an append-only journal as it completes. Run the same job again
+after a crash and inputs already in the journal are skipped, so no page is
+paid for twice.
+
+Journals:
+
+- `JSONLJournal` - one JSON line per finished input; trivially inspectable.
+  A line torn by a crash is ignored on the next run.
+- `SQLiteJournal` - a single SQLite file (WAL mode), cheap to query.
+
+Inputs are matched across runs by `job_item_key` - a hash of the tool
+input, the same across runs whatever the input's position. Journal writes
+happen on the caller's thread as results come in, never from worker
+threads.
+
+`ZenrowsJournal.compact` turns a journal into JSONL or Parquet shards of
+the final results, in input order. Parquet needs ``pyarrow``
+(``pip install langchain-zenrows[parquet]``).
+"""
+
+import base64
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from langchain_zenrows.zenrows_batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchResult,
+    aiter_batch,
+    iter_batch,
+    normalize_batch_input,
+)
+from langchain_zenrows.zenrows_binary import BinaryContent
+from langchain_zenrows.zenrows_cache import request_fingerprint
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+_STATUS_RUNNING = "running"
+
+# Results per shard written by `ZenrowsJournal.compact`.
+DEFAULT_SHARD_SIZE = 10_000
+
+
+def job_item_key(item: Any) -> str:
+    """Stable identity of a job input: a hash of its normalized tool input,
+    so a URL string and ``{"url": ...}`` are the same item."""
+    return request_fingerprint(normalize_batch_input(item))
+
+
+@dataclass
+class JournalRecord:
+    """One finished job input.
+
+    Attributes:
+        key: `job_item_key` of the input.
+        index: Position of the input in the job's inputs.
+        input: The normalized tool input.
+        status: ``"ok"`` or ``"error"``.
+        output: The tool's output (str, bytes, or JSON-compatible), or None.
+        error: ``"<ExceptionType>: <message>"`` for failed inputs.
+        finished_at: Unix time the input finished.
+    """
+
+    key: str
+    index: int
+    input: Dict[str, Any]
+    status: str
+    output: Any = None
+    error: Optional[str] = None
+    finished_at: float = field(default_factory=time.time)
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-compatible form; bytes outputs are base64-encoded."""
+        data = {
+            "key": self.key,
+            "index": self.index,
+            "input": self.input,
+            "status": self.status,
+            "output": self.output,
+            "error": self.error,
+            "finished_at": self.finished_at,
+        }
+        if isinstance(self.output, bytes):
+            data["output"] = base64.b64encode(self.output).decode("ascii")
+            data["output_encoding"] = "base64"
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "JournalRecord":
+        output = data.get("output")
+        if data.get("output_encoding") == "base64":
+            output = base64.b64decode(output)
+        return cls(
+            key=data["key"],
+            index=data["index"],
+            input=data["input"],
+            status=data["status"],
+            output=output,
+            error=data.get("error"),
+            finished_at=data["finished_at"],
+        )
+
+
+def _to_record(key: str, index: int, item: Dict[str, Any], result: BatchResult):
+    if result.error is not None:
+        error = f"{type(result.error).__name__}: {result.error}"
+        return JournalRecord(key, index, item, STATUS_ERROR, error=error)
+    output = result.output
+    if isinstance(output, BinaryContent):
+        output = bytes(output)
+    return JournalRecord(key, index, item, STATUS_OK, output=output)
+
+
+class ZenrowsJournal(ABC):
+    """Base class for job journals.
+
+    Subclasses implement `append`, `statuses` and `iter_records`, and
+    `close` if they hold resources.
+    Later records for a key supersede earlier ones (e.g. a failed input
+    that succeeded on a rerun).
+    """
+
+    @abstractmethod
+    def append(self, record: JournalRecord) -> None:
+        """Durably record a finished input."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def statuses(self) -> Dict[str, str]:
+        """Latest status per key. Outputs aren't loaded."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_records(self, include_failed: bool = False) -> Iterator[JournalRecord]:
+        """Latest record per key, in input order."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ZenrowsJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def compact(
+        self,
+        directory: str,
+        *,
+        format: Literal["jsonl", "parquet"] = "jsonl",  # noqa: A002
+        shard_size: int = DEFAULT_SHARD_SIZE,
+        include_failed: bool = False,
+    ) -> List[str]:
+        """Write the final results as shards ``part-00000.<format>``, ... in
+        ``directory``, in input order.
+
+        Parquet shards have the columns ``key``, ``index``, ``input`` (JSON),
+        ``status``, ``output`` (text), ``output_bytes`` (binary outputs),
+        ``error`` and ``finished_at``.
+
+        Returns:
+            Paths of the shards written.
+        """
+        if format not in ("jsonl", "parquet"):
+            raise ValueError(f"Unknown shard format: {format!r}")
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        write = _write_parquet_shard if format == "parquet" else _write_jsonl_shard
+        if format == "parquet":
+            _import_pyarrow()
+        os.makedirs(directory, exist_ok=True)
+
+        paths: List[str] = []
+        shard: List[JournalRecord] = []
+
+        def flush() -> None:
+            path = os.path.join(directory, f"part-{len(paths):05d}.{format}")
+            write(path, shard)
+            paths.append(path)
+            shard.clear()
+
+        for record in self.iter_records(include_failed=include_failed):
+            shard.append(record)
+            if len(shard) >= shard_size:
+                flush()
+        if shard:
+            flush()
+        return paths
+
+
+def _write_jsonl_shard(path: str, records: List[JournalRecord]) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record.to_dict(), separators=(",", ":")) + "\n")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet shards require pyarrow. "
+            "Install it with `pip install langchain-zenrows[parquet]`."
+        ) from e
+    return pyarrow
+
+
+def _write_parquet_shard(path: str, records: List[JournalRecord]) -> None:
+    pa = _import_pyarrow()
+    rows = []
+    for record in records:
+        output = record.output
+        is_bytes = isinstance(output, bytes)
+        if not is_bytes and output is not None and not isinstance(output, str):
+            output = json.dumps(output)
+        rows.append(
+            {
+                "key": record.key,
+                "index": record.index,
+                "input": json.dumps(record.input, sort_keys=True),
+                "status": record.status,
+                "output": None if is_bytes else output,
+                "output_bytes": output if is_bytes else None,
+                "error": record.error,
+                "finished_at": record.finished_at,
+            }
+        )
+    schema = pa.schema(
+        [
+            ("key", pa.string()),
+            ("index", pa.int64()),
+            ("input", pa.string()),
+            ("status", pa.string()),
+            ("output", pa.large_string()),
+            ("output_bytes", pa.large_binary()),
+            ("error", pa.string()),
+            ("finished_at", pa.float64()),
+        ]
+    )
+    pa.parquet.write_table(pa.Table.from_pylist(rows, schema=schema), path)
+
+
+class JSONLJournal(ZenrowsJournal):
+    """Journal as a JSON-lines file.
+
+    Args:
+        path: Journal file; created if missing, appended to otherwise.
+        fsync: ``fsync`` after every record. Off, a record survives the
+            process dying but not the machine losing power.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = open(path, "a+b")
+        # A crash mid-write can leave a torn last line; start on a fresh one
+        # so the next record isn't glued to it.
+        self._file.seek(0, os.SEEK_END)
+        if self._file.tell():
+            self._file.seek(-1, os.SEEK_END)
+            if self._file.read(1) != b"\n":
+                self._file.write(b"\n")
+                self._file.flush()
+
+    def append(self, record: JournalRecord) -> None:
+        line = json.dumps(record.to_dict(), separators=(",", ":")).encode() + b"\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+
+    def _scan(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """``(offset, record dict)`` per intact line."""
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    data = json.loads(line)
+                except ValueError:
+                    data = None  # torn by a crash
+                if isinstance(data, dict) and "key" in data:
+                    yield offset, data
+                offset += len(line)
+
+    def statuses(self) -> Dict[str, str]:
+        return {data["key"]: data["status"] for _, data in self._scan()}
+
+    def iter_records(self, include_failed: bool = False) -> Iterator[JournalRecord]:
+        # Index the latest line per key, then read just those back in input
+        # order - memory stays O(keys), not O(outputs).
+        latest: Dict[str, Tuple[int, int, str]] = {}
+        for offset, data in self._scan():
+            latest[data["key"]] = (data["index"], offset, data["status"])
+        with open(self.path, "rb") as f:
+            for _, offset, status in sorted(latest.values()):
+                if status == STATUS_OK or include_failed:
+                    f.seek(offset)
+                    yield JournalRecord.from_dict(json.loads(f.readline()))
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class SQLiteJournal(ZenrowsJournal):
+    """Journal in a single SQLite file.
+
+    Args:
+        path: Database file; created if missing.
+        fsync: Sync to disk on every record (``synchronous=FULL``) rather
+            than at WAL checkpoints.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS zenrows_journal ("
+                " key TEXT PRIMARY KEY,"
+                " idx INTEGER NOT NULL,"
+                " input TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " output_kind TEXT,"
+                " output BLOB,"
+                " error TEXT,"
+                " finished_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def _encode_output(output: Any) -> Tuple[Optional[str], Any]:
+        if output is None:
+            return None, None
+        if isinstance(output, bytes):
+            return "bytes", sqlite3.Binary(output)
+        if isinstance(output, str):
+            return "str", output
+        return "json", json.dumps(output)
+
+    @staticmethod
+    def _decode_output(kind: Optional[str], value: Any) -> Any:
+        if kind == "bytes":
+            return bytes(value)
+        if kind == "json":
+            return json.loads(value)
+        return value
+
+    def append(self, record: JournalRecord) -> None:
+        kind, output = self._encode_output(record.output)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO zenrows_journal VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    record.key,
+                    record.index,
+                    json.dumps(record.input),
+                    record.status,
+                    kind,
+                    output,
+                    record.error,
+                    record.finished_at,
+                ),
+            )
+
+    def statuses(self) -> Dict[str, str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT key, status FROM zenrows_journal")
+            return dict(rows.fetchall())
+
+    def iter_records(self, include_failed: bool = False) -> Iterator[JournalRecord]:
+        query = "SELECT * FROM zenrows_journal"
+        if not include_failed:
+            query += f" WHERE status = '{STATUS_OK}'"
+        # A separate cursor per iteration; rows are streamed, not loaded.
+        cursor = self._conn.cursor()
+        for row in cursor.execute(query + " ORDER BY idx"):
+            key, index, item, status, kind, output, error, finished_at = row
+            yield JournalRecord(
+                key=key,
+                index=index,
+                input=json.loads(item),
+                status=status,
+                output=self._decode_output(kind, output),
+                error=error,
+                finished_at=finished_at,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class JobSummary:
+    """Counts for one `ZenrowsJob.run`.
+
+    Attributes:
+        total: Inputs given.
+        skipped: Inputs already finished in the journal.
+        succeeded: Inputs run successfully this time.
+        failed: Inputs that failed this time.
+    """
+
+    total: int = 0
+    skipped: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+
+class ZenrowsJob:
+    """Runs a tool over many inputs, journaling each result.
+
+    Args:
+        tool: Any Zenrows tool (called through ``invoke`` / ``ainvoke``).
+        journal: Where finished inputs are recorded.
+        concurrency: Max calls in flight at once.
+        retry_failed: On a rerun, run inputs that failed last time again.
+            Off, only inputs missing from the journal run.
+        key: Input -> identity across runs. Defaults to `job_item_key`.
+    """
+
+    def __init__(
+        self,
+        tool: Any,
+        journal: ZenrowsJournal,
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        retry_failed: bool = True,
+        key: Callable[[Any], str] = job_item_key,
+    ):
+        self.tool = tool
+        self.journal = journal
+        self.concurrency = concurrency
+        self.retry_failed = retry_failed
+        self.key = key
+        self.summary = JobSummary()
+
+    def _pending(
+        self, inputs: Iterable[Any]
+    ) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+        """``(index, key, tool input)`` for every input still to run, counting
+        the rest as skipped. Lazy, so huge input generators stay lazy."""
+        done = self.journal.statuses()
+        for index, item in enumerate(inputs):
+            self.summary.total += 1
+            key = self.key(item)
+            status = done.get(key)
+            if status == STATUS_ERROR and self.retry_failed:
+                status = None
+            if status is not None:
+                self.summary.skipped += 1
+                continue
+            done[key] = _STATUS_RUNNING  # a repeated input runs once
+            yield index, key, normalize_batch_input(item)
+
+    def _record(self, result: BatchResult) -> BatchResult:
+        index, key, item = result.input
+        self.journal.append(_to_record(key, index, item, result))
+        if result.ok:
+            self.summary.succeeded += 1
+        else:
+            self.summary.failed += 1
+        return BatchResult(
+            index=index, input=item, output=result.output, error=result.error
+        )
+
+    def iter_run(self, inputs: Iterable[Any]) -> Iterator[BatchResult]:
+        """Run every input not yet finished, yielding a `BatchResult` (with
+        the input's original index) as each completes and is journaled.
+
+        Stopping iteration early is safe: finished inputs are journaled,
+        the rest run next time. `summary` counts this run.
+        """
+        self.summary = JobSummary()
+        for result in iter_batch(
+            lambda pending: self.tool.invoke(pending[2]),
+            self._pending(inputs),
+            concurrency=self.concurrency,
+        ):
+            yield self._record(result)
+
+    def run(self, inputs: Iterable[Any]) -> JobSummary:
+        """Run the job to completion (see `iter_run`)."""
+        for _ in self.iter_run(inputs):
+            pass
+        return self.summary
+
+    async def aiter_run(self, inputs: Iterable[Any]) -> AsyncIterator[BatchResult]:
+        """Async counterpart of `iter_run`, calling ``ainvoke`` on the event
+        loop. Journal writes are small appends made inline."""
+        self.summary = JobSummary()
+        async for result in aiter_batch(
+            lambda pending: self.tool.ainvoke(pending[2]),
+            self._pending(inputs),
+            concurrency=self.concurrency,
+        ):
+            yield self._record(result)
+
+    async def arun(self, inputs: Iterable[Any]) -> JobSummary:
+        """Async counterpart of `run`."""
+        async for _ in self.aiter_run(inputs):
+            pass
+        return self.summary
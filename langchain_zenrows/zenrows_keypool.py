@@ -0,0 +1,325 @@
+"""Spreading requests across several Zenrows API keys.
+
+Each Zenrows account has its own concurrency cap, so running several
+accounts multiplies the requests that can be in flight - if a single tool
+can use all of them. Give `ZenrowsFetch` / `ZenrowsExtract` a
+`ZenrowsKeyPool` instead of a ``zenrows_api_key`` and every request attempt
+borrows a key from the pool:
+
+- Each key has its own `ZenrowsRateLimiter`, which learns that account's
+  concurrency cap from the response headers.
+- A request goes to the key with the most free capacity relative to its
+  weight - the learned cap (scaled by weight) minus what's in flight on it.
+- A key that answers 401 (invalid), 402 (out of credits - but not
+  ``AUTH010``, which is about the target domain) or 429 (over its limits)
+  is evicted for a cooldown, and the request is retried straight away on
+  another key. None of those responses are billed.
+- Per-key usage (requests, failures, evictions, credits) is tracked.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import quote_plus
+
+from langchain_zenrows.zenrows_http import error_code, header_float, parse_retry_after
+from langchain_zenrows.zenrows_limiter import ZenrowsRateLimiter
+from langchain_zenrows.zenrows_result import REQUEST_COST_HEADER
+
+T = TypeVar("T")
+
+# 401 and 402 rarely clear up by themselves (a revoked key, an exhausted
+# plan), so those keys sit out longer than rate-limited ones.
+DEFAULT_KEY_COOLDOWN = 300.0
+DEFAULT_RATE_LIMIT_COOLDOWN = 5.0
+
+# 402 codes that aren't about the account: AUTH010 means the *target
+# domain* isn't enabled for the Extract beta.
+NON_EVICTING_ERROR_CODES = frozenset({"AUTH010"})
+
+
+def _mask(key: str) -> str:
+    """A key as shown in stats: enough to tell keys apart, not to use one."""
+    return f"...{key[-4:]}" if len(key) > 8 else "..."
+
+
+@dataclass
+class _PooledKey:
+    key: str
+    weight: float
+    limiter: ZenrowsRateLimiter
+    in_flight: int = 0
+    cooling_until: float = 0.0
+    # Usage: attempts sent, 2xx/3xx answers, error statuses or no response,
+    # times evicted, credits billed (X-Request-Cost), errors per status.
+    requests: int = 0
+    successes: int = 0
+    failures: int = 0
+    evictions: int = 0
+    credits: float = 0.0
+    status_codes: Dict[str, int] = field(default_factory=dict)
+
+
+class KeyLease:
+    """One request attempt's hold on a pool key."""
+
+    def __init__(self, entry: _PooledKey):
+        self._entry = entry
+        self.key = entry.key
+        self.limiter = entry.limiter
+        # The response, once there is one - set by callers of
+        # `ZenrowsKeyPool.lease` so the outcome can be recorded.
+        self.response: Any = None
+
+    def __repr__(self) -> str:
+        return f"KeyLease({_mask(self.key)})"
+
+    def apply(
+        self, params: Dict[str, Any], request_url: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """``params`` and pre-encoded ``request_url`` with this key set."""
+        params = {**params, "apikey": self.key}
+        if request_url is not None:
+            request_url = f"{request_url}&apikey={quote_plus(self.key)}"
+        return params, request_url
+
+
+class ZenrowsKeyPool:
+    """Load-balances requests over several Zenrows API keys, with failover.
+
+    Thread-safe; one pool can be shared by several tools.
+
+    Args:
+        keys: API keys, or a mapping of key -> weight. A key with weight 2
+            gets twice the share of a weight-1 key whose cap is the same.
+        cooldown: Seconds a key sits out after a 401 or 402.
+        rate_limit_cooldown: Seconds a key sits out after a 429, unless the
+            response sends ``Retry-After``.
+        limiter_factory: Builds each key's rate limiter.
+    """
+
+    def __init__(
+        self,
+        keys: Union[Sequence[str], Mapping[str, float]],
+        *,
+        cooldown: float = DEFAULT_KEY_COOLDOWN,
+        rate_limit_cooldown: float = DEFAULT_RATE_LIMIT_COOLDOWN,
+        limiter_factory: Callable[[], ZenrowsRateLimiter] = ZenrowsRateLimiter,
+    ):
+        if isinstance(keys, str):
+            keys = [keys]
+        weights = dict(keys) if isinstance(keys, Mapping) else dict.fromkeys(keys, 1.0)
+        if not weights:
+            raise ValueError("A key pool needs at least one API key")
+        if any(not key for key in weights):
+            raise ValueError("API keys must be non-empty strings")
+        if any(weight <= 0 for weight in weights.values()):
+            raise ValueError("Key weights must be positive")
+        self.cooldown = cooldown
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self._keys = [
+            _PooledKey(key, float(weight), limiter_factory())
+            for key, weight in weights.items()
+        ]
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    # -- choosing keys ------------------------------------------------------
+
+    def _load(self, entry: _PooledKey, default_limit: int) -> float:
+        """How busy ``entry`` would be with one more request, relative to
+        its (weighted) capacity. Lower is better."""
+        limit = entry.limiter.concurrency_limit or default_limit
+        return (entry.in_flight + 1) / (limit * entry.weight)
+
+    def _acquire(self, exclude: Collection[str] = ()) -> KeyLease:
+        with self._lock:
+            now = time.monotonic()
+            candidates = [
+                e
+                for e in self._keys
+                if e.key not in exclude and e.cooling_until <= now
+            ]
+            if not candidates:
+                # Everything is cooling down: use the key that's back first
+                # rather than fail - Zenrows will answer for itself.
+                untried = [e for e in self._keys if e.key not in exclude]
+                candidates = [
+                    min(untried or self._keys, key=lambda e: e.cooling_until)
+                ]
+            # Keys whose cap isn't learned yet count as the biggest known
+            # one, so they get traffic (and learn it) early.
+            known = [e.limiter.concurrency_limit for e in self._keys]
+            default_limit = max((limit for limit in known if limit), default=1)
+            # Start the scan at a rotating offset so ties spread round-robin.
+            start = self._next % len(candidates)
+            self._next += 1
+            rotated = candidates[start:] + candidates[:start]
+            entry = min(rotated, key=lambda e: self._load(e, default_limit))
+            entry.in_flight += 1
+            return KeyLease(entry)
+
+    def _release(self, lease: KeyLease, response: Any) -> bool:
+        """Record an attempt's outcome; returns True if the key was evicted.
+        ``response`` is None if the attempt got no response."""
+        entry = lease._entry
+        status = getattr(response, "status_code", None)
+        cooldown = self._cooldown_for(response) if status is not None else None
+        with self._lock:
+            entry.in_flight -= 1
+            entry.requests += 1
+            if status is not None and status < 400:
+                entry.successes += 1
+                credits = header_float(response.headers, REQUEST_COST_HEADER)
+                entry.credits += credits or 0.0
+                return False
+            entry.failures += 1
+            if status is not None:
+                code = str(status)
+                entry.status_codes[code] = entry.status_codes.get(code, 0) + 1
+            if cooldown is None:
+                return False
+            entry.evictions += 1
+            entry.cooling_until = time.monotonic() + cooldown
+            return True
+
+    def _cooldown_for(self, response: Any) -> Optional[float]:
+        """Seconds to evict the key that got ``response`` for, or None."""
+        status = response.status_code
+        if status == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            return self.rate_limit_cooldown if retry_after is None else retry_after
+        if status == 401:
+            return self.cooldown
+        if status == 402:
+            if error_code(response.text) in NON_EVICTING_ERROR_CODES:
+                return None
+            return self.cooldown
+        return None
+
+    def _can_fail_over(self, tried: Collection[str]) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            return any(
+                e.key not in tried and e.cooling_until <= now for e in self._keys
+            )
+
+    # -- running requests ---------------------------------------------------
+
+    @contextmanager
+    def lease(self) -> Iterator[KeyLease]:
+        """Borrow a key for one attempt, without failover. Set the lease's
+        ``response`` inside the block so the outcome is recorded."""
+        lease = self._acquire()
+        try:
+            yield lease
+        except BaseException as e:
+            self._release(lease, getattr(e, "response", None) or lease.response)
+            raise
+        self._release(lease, lease.response)
+
+    def call(self, fn: Callable[[KeyLease], T]) -> T:
+        """Run one request attempt, ``fn(lease)``, failing over to another
+        key if the response evicts this one.
+
+        ``fn`` returns the response, or raises with it attached as
+        ``.response`` (as ``raise_for_status()`` does).
+        """
+        tried: List[str] = []
+        while True:
+            lease = self._acquire(tried)
+            try:
+                response = fn(lease)
+            except Exception as e:
+                evicted = self._release(lease, getattr(e, "response", None))
+                tried.append(lease.key)
+                if evicted and self._can_fail_over(tried):
+                    continue
+                raise
+            except BaseException:
+                self._release(lease, None)
+                raise
+            self._release(lease, response)
+            return response
+
+    async def acall(self, fn: Callable[[KeyLease], Awaitable[T]]) -> T:
+        """Async counterpart of `call`."""
+        tried: List[str] = []
+        while True:
+            lease = self._acquire(tried)
+            try:
+                response = await fn(lease)
+            except Exception as e:
+                evicted = self._release(lease, getattr(e, "response", None))
+                tried.append(lease.key)
+                if evicted and self._can_fail_over(tried):
+                    continue
+                raise
+            except BaseException:
+                self._release(lease, None)
+                raise
+            self._release(lease, response)
+            return response
+
+    # -- inspection ---------------------------------------------------------
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Per-key state and usage, with keys masked, as plain dicts."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "key": _mask(e.key),
+                    "weight": e.weight,
+                    "concurrency_limit": e.limiter.concurrency_limit,
+                    "in_flight": e.in_flight,
+                    "cooling_down_seconds": max(0.0, e.cooling_until - now),
+                    "requests": e.requests,
+                    "successes": e.successes,
+                    "failures": e.failures,
+                    "evictions": e.evictions,
+                    "credits": e.credits,
+                    "status_codes": dict(e.status_codes),
+                }
+                for e in self._keys
+            ]
+
+    def evict(self, key: str, seconds: Optional[float] = None) -> None:
+        """Take ``key`` out of rotation for ``seconds`` (default: `cooldown`)."""
+        entry = self._entry(key)
+        with self._lock:
+            entry.evictions += 1
+            entry.cooling_until = time.monotonic() + (
+                self.cooldown if seconds is None else seconds
+            )
+
+    def restore(self, key: str) -> None:
+        """Put an evicted ``key`` straight back into rotation."""
+        entry = self._entry(key)
+        with self._lock:
+            entry.cooling_until = 0.0
+
+    def _entry(self, key: str) -> _PooledKey:
+        for entry in self._keys:
+            if entry.key == key:
+                return entry
+        raise ValueError(f"Key {_mask(key)} isn't in this pool")
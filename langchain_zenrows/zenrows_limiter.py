@@ -0,0 +1,308 @@
+"""Client-side concurrency and rate limiting for Zenrows requests.
+
+Zenrows plans cap how many requests may be in flight at once, and going
+over the cap just earns a 429. `ZenrowsRateLimiter` keeps requests under it
+on the client side instead:
+
+- a concurrency limit (a semaphore), learned from the ``Concurrency-Limit``
+  / ``Concurrency-Remaining`` headers Zenrows sends on every response, and
+  halved when a 429 gets through anyway;
+- an optional requests-per-second token bucket.
+
+By default every `ZenrowsFetch` / `ZenrowsExtract` in the process shares one
+limiter (`get_default_limiter()`), so they jointly run right at the plan's
+ceiling. The same limiter works from threads and from asyncio tasks.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Iterator, List, Mapping, Optional, Tuple
+
+from langchain_zenrows.zenrows_cancel import CancelToken, cancelled_by
+from langchain_zenrows.zenrows_deadline import DeadlineExceeded, remaining
+from langchain_zenrows.zenrows_http import header_int
+
+CONCURRENCY_LIMIT_HEADER = "Concurrency-Limit"
+CONCURRENCY_REMAINING_HEADER = "Concurrency-Remaining"
+
+_default_limiter: Optional["ZenrowsRateLimiter"] = None
+_default_limiter_lock = threading.Lock()
+
+
+def _wake(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ZenrowsRateLimiter:
+    """Concurrency semaphore plus token bucket, shared by threads and tasks.
+
+    Args:
+        max_concurrency: Hard cap on requests in flight. None means no cap
+            until one is learned from response headers.
+        requests_per_second: Sustained request rate. None disables the
+            token bucket.
+        burst: Bucket size - how many requests may go out back-to-back
+            before `requests_per_second` pacing kicks in. Defaults to
+            ``max(1, requests_per_second)``.
+        adaptive: Track the plan's concurrency from response headers (never
+            above `max_concurrency`) and back off on 429s.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None,
+        adaptive: bool = True,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.burst = burst or max(1, int(requests_per_second or 1))
+        self.adaptive = adaptive
+
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._async_waiters: List[
+            Tuple[asyncio.AbstractEventLoop, "asyncio.Future[None]"]
+        ] = []
+
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+
+    @property
+    def concurrency_limit(self) -> Optional[int]:
+        """Current effective concurrency limit (None = unbounded)."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    # -- token bucket -----------------------------------------------------
+
+    def _reserve_token(self) -> float:
+        """Take a token, returning how long to wait before it's valid.
+
+        Tokens are reserved rather than polled for - the bucket may go
+        negative, and each caller sleeps off its own debt - so waiters are
+        served in arrival order without spinning.
+        """
+        if self.requests_per_second is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._refilled_at) * self.requests_per_second,
+            )
+            self._refilled_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.requests_per_second
+
+    # -- concurrency ------------------------------------------------------
+
+    def _has_capacity(self) -> bool:
+        return self._limit is None or self._in_flight < self._limit
+
+    def _notify(self) -> None:
+        """Wake every waiter to re-check capacity. Caller holds `_lock`."""
+        self._cond.notify_all()
+        for loop, future in self._async_waiters:
+            loop.call_soon_threadsafe(_wake, future)
+        self._async_waiters.clear()
+
+    def acquire(
+        self,
+        cancel_token: Optional[CancelToken] = None,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Block until a request may be sent; returns seconds spent waiting.
+
+        Raises:
+            RequestCancelled: If ``cancel_token`` is cancelled while waiting.
+            DeadlineExceeded: If no slot comes free within ``timeout``
+                seconds (None -> wait as long as it takes).
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        delay = self._reserve_token()
+        if delay:
+            self._check_delay(delay, deadline)
+            if cancel_token is None:
+                time.sleep(delay)
+            else:
+                cancel_token.sleep(delay)
+        if cancel_token is None:
+            with self._cond:
+                while not self._has_capacity():
+                    self._cond.wait(remaining(deadline))
+                self._in_flight += 1
+            return time.monotonic() - started
+
+        with cancel_token.on_cancel(self._wake_all), self._cond:
+            while not self._has_capacity():
+                cancel_token.raise_if_cancelled()
+                self._cond.wait(remaining(deadline))
+            cancel_token.raise_if_cancelled()
+            self._in_flight += 1
+        return time.monotonic() - started
+
+    @staticmethod
+    def _check_delay(delay: float, deadline: Optional[float]) -> None:
+        """Fail now rather than sleep off a token bucket ``delay`` that
+        runs past ``deadline``."""
+        left = remaining(deadline)
+        if left is not None and delay >= left:
+            raise DeadlineExceeded("the call's deadline was exceeded")
+
+    def _wake_all(self) -> None:
+        with self._cond:
+            self._cond.notify_all()
+
+    async def aacquire(
+        self,
+        cancel_token: Optional[CancelToken] = None,
+        timeout: Optional[float] = None,
+    ) -> float:
+        """Async counterpart of `acquire` - waits without blocking the loop.
+
+        Raises:
+            RequestCancelled: If ``cancel_token`` is cancelled while waiting.
+            DeadlineExceeded: If no slot comes free within ``timeout``
+                seconds.
+        """
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        delay = self._reserve_token()
+        if delay:
+            self._check_delay(delay, deadline)
+            if cancel_token is None:
+                await asyncio.sleep(delay)
+            else:
+                await cancelled_by(cancel_token, lambda: asyncio.sleep(delay))
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if cancel_token is not None:
+                    cancel_token.raise_if_cancelled()
+                if self._has_capacity():
+                    self._in_flight += 1
+                    return time.monotonic() - started
+                left = remaining(deadline)
+                future = loop.create_future()
+                self._async_waiters.append((loop, future))
+            try:
+                if cancel_token is None:
+                    await asyncio.wait_for(future, left)
+                else:
+                    with cancel_token.on_cancel(
+                        lambda: loop.call_soon_threadsafe(_wake, future)
+                    ):
+                        await asyncio.wait_for(future, left)
+            except asyncio.TimeoutError:
+                self._forget_waiter(loop, future)
+                raise DeadlineExceeded("the call's deadline was exceeded") from None
+            except asyncio.CancelledError:
+                self._forget_waiter(loop, future)
+                raise
+            if cancel_token is not None and cancel_token.cancelled:
+                self._forget_waiter(loop, future)
+
+    def _forget_waiter(
+        self, loop: asyncio.AbstractEventLoop, future: "asyncio.Future[None]"
+    ) -> None:
+        with self._lock:
+            if (loop, future) in self._async_waiters:
+                self._async_waiters.remove((loop, future))
+
+    def release(self) -> None:
+        """Give back a slot taken by `acquire` / `aacquire`."""
+        with self._lock:
+            self._in_flight -= 1
+            self._notify()
+
+    @contextmanager
+    def slot(
+        self,
+        cancel_token: Optional[CancelToken] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[float]:
+        """Hold a request slot for the duration of the block. Binds the
+        seconds spent waiting for it (``with limiter.slot() as waited:``);
+        ``cancel_token`` and ``timeout`` bound that wait, as in `acquire`."""
+        waited = self.acquire(cancel_token, timeout)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def aslot(
+        self,
+        cancel_token: Optional[CancelToken] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[float]:
+        """Async counterpart of `slot`."""
+        waited = await self.aacquire(cancel_token, timeout)
+        try:
+            yield waited
+        finally:
+            self.release()
+
+    # -- adaptation -------------------------------------------------------
+
+    def observe(self, status_code: Any, headers: Mapping[str, Any]) -> None:
+        """Adapt to a Zenrows response. Call while its slot is still held.
+
+        ``Concurrency-Remaining`` counts free slots on the whole plan, which
+        may be shared with other processes, so this process's share is
+        what's free plus what it already has in flight.
+        """
+        if not self.adaptive:
+            return
+        if status_code == 429:
+            self.on_rate_limited()
+            return
+
+        limit = header_int(headers, CONCURRENCY_LIMIT_HEADER)
+        if limit is None:
+            return
+        remaining = header_int(headers, CONCURRENCY_REMAINING_HEADER)
+
+        with self._lock:
+            capacity = limit
+            if remaining is not None:
+                capacity = min(limit, remaining + self._in_flight)
+            if self.max_concurrency is not None:
+                capacity = min(capacity, self.max_concurrency)
+            self._limit = max(1, capacity)
+            self._notify()
+
+    def on_rate_limited(self) -> None:
+        """Halve the concurrency limit after a 429 slipped through. The next
+        response carrying concurrency headers restores the real figure."""
+        with self._lock:
+            current = self._limit if self._limit is not None else self._in_flight
+            self._limit = max(1, current // 2)
+
+
+def get_default_limiter() -> ZenrowsRateLimiter:
+    """Return the process-wide limiter shared by all tool instances."""
+    global _default_limiter
+    with _default_limiter_lock:
+        if _default_limiter is None:
+            _default_limiter = ZenrowsRateLimiter()
+        return _default_limiter
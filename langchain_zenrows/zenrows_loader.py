@@ -0,0 +1,109 @@
+"""LangChain document loader backed by `ZenrowsFetch`.
+
+`ZenrowsLoader` fetches pages concurrently - as Markdown by default - and
+yields each one as a `Document` the moment it arrives, so an indexing
+pipeline can start splitting and embedding while the rest are still in
+flight. Each document's metadata carries the source URL, HTTP status and
+the fetch's timing and cost (see `ZenrowsResult`).
+"""
+
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Union
+
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+
+from langchain_zenrows.zenrows_batch import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchResult,
+    aiter_batch,
+    iter_batch,
+    normalize_batch_input,
+)
+from langchain_zenrows.zenrows_fetch import ZenrowsFetch, ZenrowsFetchInput
+from langchain_zenrows.zenrows_result import ZenrowsResult
+
+DEFAULT_LOADER_PARAMS: Dict[str, Any] = {"response_type": "markdown"}
+
+
+def _document(result: ZenrowsResult) -> Document:
+    metadata = {"source": result.url}
+    metadata.update(
+        (k, v) for k, v in result.metadata().items() if k != "url" and v is not None
+    )
+    return Document(page_content=result.text, metadata=metadata)
+
+
+class ZenrowsLoader(BaseLoader):
+    """Load web pages as `Document`s through Zenrows.
+
+    Args:
+        urls: URLs, per-page tool-input dicts, or `ZenrowsFetchInput`s.
+            Consumed lazily, so a generator works for large crawls.
+        fetch: Tool to fetch with (its cache, retries, limiter, ... apply).
+            Defaults to a new `ZenrowsFetch`.
+        zenrows_api_key: API key for the default tool; falls back to
+            ``ZENROWS_API_KEY``.
+        params: Fetch parameters for every page; per-page dicts override
+            them. Defaults to ``{"response_type": "markdown"}``.
+        concurrency: Max pages fetched at once.
+        continue_on_failure: Skip pages that fail (they're kept in
+            `failures`) instead of raising the first error.
+
+    Metadata: ``source`` (the URL), plus every non-None `ZenrowsResult`
+    field - ``status_code``, ``final_url``, ``content_type``, ``credits``,
+    ``total_seconds``, ``server_seconds``, ``queue_seconds``, ``cache_hit``,
+    and so on.
+    """
+
+    def __init__(
+        self,
+        urls: Union[str, Iterable[Union[str, Dict[str, Any], ZenrowsFetchInput]]],
+        *,
+        fetch: Optional[ZenrowsFetch] = None,
+        zenrows_api_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        continue_on_failure: bool = True,
+    ):
+        self.urls = [urls] if isinstance(urls, str) else urls
+        self.fetch = fetch or ZenrowsFetch(zenrows_api_key=zenrows_api_key)
+        self.params = dict(DEFAULT_LOADER_PARAMS if params is None else params)
+        self.concurrency = concurrency
+        self.continue_on_failure = continue_on_failure
+        # Pages that failed during the last load.
+        self.failures: List[BatchResult] = []
+
+    def _input(self, item: Any) -> Dict[str, Any]:
+        return {**self.params, **normalize_batch_input(item)}
+
+    def _handle(self, result: BatchResult) -> Optional[Document]:
+        if result.ok:
+            return _document(result.output)
+        self.failures.append(result)
+        if not self.continue_on_failure:
+            raise result.error
+        return None
+
+    def lazy_load(self) -> Iterator[Document]:
+        """Yield a `Document` per page, in completion order."""
+        self.failures = []
+        for result in iter_batch(
+            lambda item: self.fetch.fetch_result(self._input(item)),
+            self.urls,
+            concurrency=self.concurrency,
+        ):
+            document = self._handle(result)
+            if document is not None:
+                yield document
+
+    async def alazy_load(self) -> AsyncIterator[Document]:
+        """Async counterpart of `lazy_load`, fetching on the event loop."""
+        self.failures = []
+        async for result in aiter_batch(
+            lambda item: self.fetch.afetch_result(self._input(item)),
+            self.urls,
+            concurrency=self.concurrency,
+        ):
+            document = self._handle(result)
+            if document is not None:
+                yield document
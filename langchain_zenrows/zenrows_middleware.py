@@ -0,0 +1,192 @@
+"""Request / response middleware for the Zenrows tools.
+
+Give a tool a ``middleware`` list to run your own code around every request
+it sends to Zenrows - injecting tenant headers, auditing URLs, refusing
+blocked domains, rewriting responses::
+
+    class TenantHeader(ZenrowsMiddleware):
+        def on_request(self, request):
+            request.headers["X-Tenant"] = "acme"
+
+    class BlockDomains(ZenrowsMiddleware):
+        def on_request(self, request):
+            if urlsplit(request.url).hostname in BLOCKED:
+                return request.respond(403, "blocked by policy")
+
+    scraper = ZenrowsFetch(middleware=[TenantHeader(), BlockDomains()])
+
+The chain sits inside the tool's `ZenrowsClient`: below the cache and
+request coalescing (a cache hit never reaches it), above retries, the key
+pool and the rate limiter (one pass per request, however many attempts it
+takes). The first middleware in the list is the outermost - it sees the
+request first and the response last. With no middleware, the chain isn't
+built at all.
+
+Middleware runs on both the sync and async paths. Override `on_request` /
+`on_response` for work that doesn't need to wrap the call; override
+`handle` and `ahandle` to wrap it (timing, catching errors, calling it more
+than once). Streamed responses (``iter_content`` and friends) run only
+each middleware's `on_request` - edits and short-circuits apply - as there's
+no complete response for `on_response` or `handle` to wrap.
+"""
+
+import http.client
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Union
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+
+Response = Union[requests.Response, httpx.Response]
+
+
+class ZenrowsRequest:
+    """A request on its way to Zenrows, as middleware sees it.
+
+    Attributes:
+        tool: Name of the tool sending it.
+        params: The Zenrows query params. Editing them drops a template's
+            pre-encoded ``request_url``, so the edited params are sent.
+        headers: HTTP headers for the request to Zenrows. Zenrows forwards
+            them to the target only with the ``custom_headers`` param set.
+        request_url: A `FetchTemplate`'s pre-encoded URL, if any.
+        is_async: Whether it's on the async path - `respond` builds an
+            `httpx.Response` then, a `requests.Response` otherwise.
+    """
+
+    __slots__ = ("tool", "params", "headers", "request_url", "is_async")
+
+    def __init__(
+        self,
+        tool: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+        request_url: Optional[str] = None,
+        is_async: bool = False,
+    ):
+        self.tool = tool
+        self.params = params
+        self.headers: Dict[str, str] = headers if headers is not None else {}
+        self.request_url = request_url
+        self.is_async = is_async
+
+    def __repr__(self) -> str:
+        return f"ZenrowsRequest({self.tool!r}, url={self.url!r})"
+
+    @property
+    def url(self) -> Optional[str]:
+        """The target page's URL."""
+        return self.params.get("url")
+
+    def respond(
+        self,
+        status_code: int = 200,
+        body: Union[str, bytes] = b"",
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Response:
+        """A response answering this request without sending it, for
+        middleware to return instead of calling the next handler. A non-2xx
+        one raises like a Zenrows error response would."""
+        content = body.encode("utf-8") if isinstance(body, str) else body
+        url = self.url or ""
+        if self.is_async:
+            return httpx.Response(
+                status_code,
+                content=content,
+                headers=headers,
+                request=httpx.Request("GET", url),
+            )
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = http.client.responses.get(status_code, "")
+        response.headers = CaseInsensitiveDict(headers or {})
+        response._content = content
+        # Already read, so it can be streamed too.
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = url
+        return response
+
+
+class ZenrowsMiddleware:
+    """Base class for middleware; by default it passes everything through.
+
+    `handle` / `ahandle` run `on_request`, then - unless it returned a
+    response - the rest of the chain, then `on_response`.
+    """
+
+    def on_request(self, request: ZenrowsRequest) -> Optional[Response]:
+        """Inspect or edit ``request`` before it's sent. Return a response
+        (see `ZenrowsRequest.respond`) to answer it without sending it."""
+        return None
+
+    def on_response(self, request: ZenrowsRequest, response: Response) -> Response:
+        """Inspect or replace the response. Not called when the request
+        raised, e.g. with a non-2xx response."""
+        return response
+
+    def handle(
+        self,
+        request: ZenrowsRequest,
+        call_next: Callable[[ZenrowsRequest], Response],
+    ) -> Response:
+        """Run the request through this middleware on the sync path."""
+        response = self.on_request(request)
+        if response is None:
+            response = call_next(request)
+        return self.on_response(request, response)
+
+    async def ahandle(
+        self,
+        request: ZenrowsRequest,
+        call_next: Callable[[ZenrowsRequest], Awaitable[Response]],
+    ) -> Response:
+        """Async counterpart of `handle`."""
+        response = self.on_request(request)
+        if response is None:
+            response = await call_next(request)
+        return self.on_response(request, response)
+
+
+def run_middleware(
+    middleware: Sequence[ZenrowsMiddleware],
+    request: ZenrowsRequest,
+    send: Callable[[ZenrowsRequest], Response],
+) -> Response:
+    """Pass ``request`` through ``middleware`` in order, then to ``send``."""
+
+    def call(index: int, request: ZenrowsRequest) -> Response:
+        if index == len(middleware):
+            return send(request)
+        return middleware[index].handle(request, lambda r: call(index + 1, r))
+
+    return call(0, request)
+
+
+async def arun_middleware(
+    middleware: Sequence[ZenrowsMiddleware],
+    request: ZenrowsRequest,
+    send: Callable[[ZenrowsRequest], Awaitable[Response]],
+) -> Response:
+    """Async counterpart of `run_middleware`."""
+
+    async def call(index: int, request: ZenrowsRequest) -> Response:
+        if index == len(middleware):
+            return await send(request)
+        return await middleware[index].ahandle(
+            request, lambda r: call(index + 1, r)
+        )
+
+    return await call(0, request)
+
+
+def run_on_request(
+    middleware: Sequence[ZenrowsMiddleware], request: ZenrowsRequest
+) -> Optional[Response]:
+    """Pass ``request`` through each middleware's `on_request` in order, for
+    a streamed request. Returns the first response one answers it with."""
+    for layer in middleware:
+        response = layer.on_request(request)
+        if response is not None:
+            return response
+    return None
@@ -0,0 +1,300 @@
+"""Structured results with timing and cost metadata.
+
+By default the tools return just the body. `ZenrowsResult` carries that
+body plus what capacity planning needs: a latency breakdown, bytes
+received, credits billed, whether Adaptive Stealth Mode escalated, and
+whether the answer came from the cache or a coalesced call. Get one with
+`ZenrowsFetch.fetch_result` / `ZenrowsExtract.extract_result`, or as the
+tool-message artifact by constructing a tool with
+``response_format="content_and_artifact"``.
+"""
+
+import datetime
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, Mapping, Optional, Union
+
+from langchain_zenrows.zenrows_binary import BinaryContent
+from langchain_zenrows.zenrows_cancel import CancelToken
+from langchain_zenrows.zenrows_html import HtmlDocument
+from langchain_zenrows.zenrows_http import header_float, header_str
+from langchain_zenrows.zenrows_instrumentation import (
+    AttemptEvent,
+    ZenrowsInstrumentation,
+)
+
+# Zenrows response headers.
+REQUEST_COST_HEADER = "X-Request-Cost"
+REQUEST_ID_HEADER = "X-Request-Id"
+FINAL_URL_HEADER = "Zr-Final-Url"
+
+# httpcore trace steps that open a new connection.
+_CONNECT_STEPS = frozenset(
+    {"connection.connect_tcp", "connection.connect_unix_socket", "connection.start_tls"}
+)
+
+# Cost of a plain request (no JS rendering, no premium proxies), in the
+# units of `X-Request-Cost`. In Adaptive Stealth Mode a request billed
+# above this was escalated to a pricier configuration.
+BASIC_REQUEST_COST = 1.0
+
+
+class RequestTrace:
+    """Per-call scratchpad the send path fills in while a request runs.
+
+    One trace spans every attempt of a call - retries and the Extract
+    Autoparse fallback included - and ends up as a `ZenrowsResult`. It
+    also relays the call's events to the tool's instrumentation, if any.
+    """
+
+    __slots__ = (
+        "tool",
+        "started",
+        "deadline",
+        "cancel_token",
+        "attempts",
+        "queue_seconds",
+        "connect_seconds",
+        "response",
+        "instrumentation",
+        "token",
+        "_connect_started",
+        "_first_attempt",
+    )
+
+    def __init__(
+        self,
+        tool: str = "",
+        url: Optional[str] = None,
+        instrumentation: Optional[ZenrowsInstrumentation] = None,
+        deadline: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> None:
+        self.tool = tool
+        self.started = time.perf_counter()
+        # `time.monotonic` time the call must finish by, if it has a budget.
+        self.deadline = deadline
+        self.cancel_token = cancel_token
+        self.attempts = 0
+        self.queue_seconds = 0.0
+        self.connect_seconds: Optional[float] = None
+        self.response: Any = None
+        self.instrumentation = instrumentation
+        self.token = (
+            instrumentation.on_call_start(tool, url) if instrumentation else None
+        )
+        self._connect_started = 0.0
+        # Attempt number of the current request's first try; the Extract
+        # Autoparse fallback starts a new request, which isn't a retry.
+        self._first_attempt = 1
+
+    @contextmanager
+    def span(self) -> Iterator[None]:
+        """Report the call's outcome to instrumentation if the block raises;
+        a successful call reports via `finish`."""
+        try:
+            yield
+        except BaseException as e:
+            if self.instrumentation is not None:
+                self.instrumentation.on_call_end(self.token, None, e)
+            raise
+
+    def finish(self, result: "ZenrowsResult") -> "ZenrowsResult":
+        if self.instrumentation is not None:
+            self.instrumentation.on_call_end(self.token, result, None)
+        return result
+
+    def prepared(self, params: Dict[str, Any], seconds: float) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.on_prepared(
+                self.token,
+                {k: v for k, v in params.items() if k != "apikey"},
+                seconds,
+            )
+
+    def fallback(self) -> None:
+        self._first_attempt = self.attempts + 1
+        if self.instrumentation is not None:
+            self.instrumentation.on_autoparse_fallback(self.token)
+
+    @contextmanager
+    def attempt(self, queue_seconds: float, streamed: bool = False) -> Iterator[None]:
+        """Time one HTTP attempt; set `response` inside the block. A
+        ``streamed`` response's body is left unread."""
+        self.attempts += 1
+        self.queue_seconds += queue_seconds
+        self.response = None
+        started = time.perf_counter()
+        error: Optional[BaseException] = None
+        try:
+            yield
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            if self.instrumentation is not None:
+                raw = None if streamed else getattr(self.response, "content", None)
+                self.instrumentation.on_attempt(
+                    self.token,
+                    AttemptEvent(
+                        attempt=self.attempts,
+                        retry=self.attempts > self._first_attempt,
+                        status_code=getattr(self.response, "status_code", None),
+                        seconds=time.perf_counter() - started,
+                        queue_seconds=queue_seconds,
+                        bytes_received=(
+                            len(raw) if isinstance(raw, (bytes, bytearray)) else None
+                        ),
+                        error=error,
+                    ),
+                )
+
+    async def on_httpx_event(self, name: str, info: Dict[str, Any]) -> None:
+        """`httpx` ``trace`` extension hook - times new TCP/TLS handshakes.
+        Stays None when the request reused a pooled connection."""
+        step, _, event = name.rpartition(".")
+        if step in _CONNECT_STEPS and event in ("started", "complete"):
+            now = time.perf_counter()
+            if event == "started":
+                self._connect_started = now
+            else:
+                self.connect_seconds = (
+                    (self.connect_seconds or 0.0) + now - self._connect_started
+                )
+
+    def result(
+        self,
+        content: Union[str, bytes, BinaryContent],
+        params: Dict[str, Any],
+        *,
+        autoparse_fallback: bool = False,
+        bytes_received: Optional[int] = None,
+    ) -> "ZenrowsResult":
+        """Build the `ZenrowsResult` for a completed call. A streamed call
+        passes the ``bytes_received`` its response no longer holds."""
+        response = self.response
+        headers: Mapping[str, Any] = getattr(response, "headers", None) or {}
+        try:
+            elapsed = getattr(response, "elapsed", None)
+        except RuntimeError:
+            # httpx only sets it once the body stream has been closed.
+            elapsed = None
+        if not isinstance(elapsed, datetime.timedelta):
+            elapsed = None
+        if bytes_received is None:
+            raw = getattr(response, "content", None)
+            if isinstance(raw, (bytes, bytearray)):
+                bytes_received = len(raw)
+        credits = header_float(headers, REQUEST_COST_HEADER)
+        return ZenrowsResult(
+            content=content,
+            url=params.get("url"),
+            status_code=getattr(response, "status_code", None),
+            final_url=header_str(headers, FINAL_URL_HEADER),
+            content_type=header_str(headers, "Content-Type"),
+            request_id=header_str(headers, REQUEST_ID_HEADER),
+            bytes_received=bytes_received,
+            credits=credits,
+            stealth_escalated=(
+                credits > BASIC_REQUEST_COST
+                if params.get("mode") == "auto" and credits is not None
+                else None
+            ),
+            attempts=self.attempts,
+            autoparse_fallback=autoparse_fallback,
+            queue_seconds=self.queue_seconds,
+            connect_seconds=self.connect_seconds,
+            server_seconds=elapsed.total_seconds() if elapsed is not None else None,
+            total_seconds=time.perf_counter() - self.started,
+        )
+
+
+@dataclass
+class ZenrowsResult:
+    """A tool result plus metadata about how it was obtained.
+
+    Attributes:
+        content: The body, exactly as the tool would have returned it.
+        url: Target URL requested.
+        status_code: HTTP status of the final Zenrows response.
+        final_url: URL after redirects, from ``Zr-Final-Url``.
+        content_type: Response ``Content-Type``.
+        request_id: Zenrows request id (``X-Request-Id``), for support.
+        bytes_received: Size of the response body.
+        credits: Cost billed for the request (``X-Request-Cost``).
+        stealth_escalated: In Adaptive Stealth Mode, whether Zenrows had to
+            escalate past a basic request (billed above
+            `BASIC_REQUEST_COST`). None outside that mode or without a cost
+            header.
+        cache_hit: Served from the tool's cache; no request was made, so
+            the response fields are None.
+        coalesced: Shared from another caller's identical in-flight call.
+        attempts: HTTP requests made, retries and fallback included.
+        autoparse_fallback: Extract fell back to Autoparse on ``AUTH010``.
+        queue_seconds: Time spent waiting on the rate limiter.
+        connect_seconds: Time spent opening new connections (async only;
+            None when a pooled connection was reused).
+        server_seconds: Send-to-response time of the final attempt - mostly
+            Zenrows' own scraping time.
+        total_seconds: Wall time of the whole call.
+    """
+
+    content: Union[str, bytes, BinaryContent]
+    url: Optional[str] = None
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    content_type: Optional[str] = None
+    request_id: Optional[str] = None
+    bytes_received: Optional[int] = None
+    credits: Optional[float] = None
+    stealth_escalated: Optional[bool] = None
+    cache_hit: bool = False
+    coalesced: bool = False
+    attempts: int = 0
+    autoparse_fallback: bool = False
+    queue_seconds: float = 0.0
+    connect_seconds: Optional[float] = None
+    server_seconds: Optional[float] = None
+    total_seconds: float = 0.0
+    _document: Optional[HtmlDocument] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def text(self) -> str:
+        """The content as a string, for tool messages - binary bodies are
+        summarized rather than decoded."""
+        if isinstance(self.content, bytes):
+            return f"<{len(self.content)} bytes>"
+        return str(self.content)
+
+    def metadata(self) -> Dict[str, Any]:
+        """Every field but `content`, as a plain dict (e.g. for logging)."""
+        return {
+            k: v
+            for k, v in self.__dict__.items()
+            if k not in ("content", "_document")
+        }
+
+    def document(self) -> HtmlDocument:
+        """The content parsed as HTML, for deriving Markdown, text, links,
+        tables and CSS extractions locally - see `HtmlDocument`. Parsed on
+        the first call; later calls, and the views, reuse the parse.
+
+        Raises:
+            ValueError: If the content isn't HTML - binary, or a converted
+                (``response_type``) or JSON (``css_extractor``,
+                ``autoparse``, ``outputs``) response.
+        """
+        if self._document is None:
+            content_type = (self.content_type or "").lower()
+            if not isinstance(self.content, str) or (
+                content_type and "html" not in content_type
+            ):
+                raise ValueError(
+                    "Content isn't HTML; fetch the page without response_type, "
+                    "css_extractor, autoparse or outputs to process it locally."
+                )
+            self._document = HtmlDocument(self.content, self.final_url or self.url)
+        return self._document
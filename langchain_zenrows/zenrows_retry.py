@@ -0,0 +1,235 @@
+"""Retry policy for transient Zenrows failures.
+
+A `RetryPolicy` retries a single Zenrows request on transient failures -
+429s, 5xx, timeouts, dropped connections - with capped exponential backoff
+and full jitter, honoring the server's ``Retry-After`` when it sends one.
+Every tool accepts one via its ``retry_policy`` field; without it, failures
+raise straight away, as before.
+
+Each request is retried on its own: in `ZenrowsExtract`, the primary
+Extract request and its ``AUTH010`` -> Autoparse fallback request are
+retried independently, and ``AUTH010`` itself is never retried - it's a
+routing answer, not a transient failure.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Optional, TypeVar
+
+import httpx
+import requests
+
+from langchain_zenrows.zenrows_cancel import CancelToken
+from langchain_zenrows.zenrows_deadline import DeadlineExceeded
+from langchain_zenrows.zenrows_http import error_code, parse_retry_after
+
+T = TypeVar("T")
+
+DEFAULT_RETRYABLE_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+# Zenrows error-envelope codes that must never be retried, whatever the
+# HTTP status. AUTH010 ("domain not enabled for Extract") has its own
+# fallback path in `ZenrowsExtract`.
+NON_RETRYABLE_ERROR_CODES: FrozenSet[str] = frozenset({"AUTH010"})
+
+
+@dataclass
+class RetryStats:
+    """Thread-safe counters describing what a `RetryPolicy` has done.
+
+    Attributes:
+        calls: Requests run under the policy.
+        attempts: HTTP attempts made, first tries included.
+        retries: Attempts that were retries.
+        successes: Calls that eventually succeeded.
+        failures: Calls that raised after their last attempt.
+        retries_by_reason: Retry count per reason - an HTTP status code as a
+            string (e.g. ``"429"``), ``"timeout"``, or ``"connection"``.
+        backoff_seconds: Total time spent sleeping between attempts.
+        autoparse_fallbacks: Extract ``AUTH010`` -> Autoparse fallbacks,
+            counted separately since they aren't retries.
+    """
+
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries_by_reason: Dict[str, int] = field(default_factory=dict)
+    backoff_seconds: float = 0.0
+    autoparse_fallbacks: int = 0
+    _lock: Any = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def record_attempt(self, attempt: int) -> None:
+        with self._lock:
+            self.attempts += 1
+            if attempt == 1:
+                self.calls += 1
+
+    def record_retry(self, reason: str, delay: float) -> None:
+        with self._lock:
+            self.retries += 1
+            self.retries_by_reason[reason] = self.retries_by_reason.get(reason, 0) + 1
+            self.backoff_seconds += delay
+
+    def record_outcome(self, success: bool) -> None:
+        with self._lock:
+            if success:
+                self.successes += 1
+            else:
+                self.failures += 1
+
+    def record_autoparse_fallback(self) -> None:
+        with self._lock:
+            self.autoparse_fallbacks += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a consistent copy of the counters as a plain dict."""
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "successes": self.successes,
+                "failures": self.failures,
+                "retries_by_reason": dict(self.retries_by_reason),
+                "backoff_seconds": self.backoff_seconds,
+                "autoparse_fallbacks": self.autoparse_fallbacks,
+            }
+
+
+@dataclass
+class RetryPolicy:
+    """How to retry a failed Zenrows request.
+
+    Attributes:
+        max_attempts: Total attempts per request, the first one included.
+        backoff_base: Backoff before the first retry, in seconds; doubles
+            on each further retry.
+        backoff_cap: Upper bound for a single backoff, in seconds.
+        jitter: Use "full jitter" - sleep a random amount between 0 and the
+            exponential backoff - so clients that failed together don't
+            retry together.
+        respect_retry_after: Sleep for the server's ``Retry-After`` (capped
+            at `max_retry_after`) instead of the computed backoff.
+        max_retry_after: Upper bound for an honored ``Retry-After``.
+        retryable_statuses: HTTP statuses worth retrying.
+        retry_on_timeout: Retry timed-out requests.
+        retry_on_connection_error: Retry dropped / refused connections.
+        stats: Counters updated by every request run under this policy.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_cap: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    max_retry_after: float = 60.0
+    retryable_statuses: FrozenSet[int] = DEFAULT_RETRYABLE_STATUSES
+    retry_on_timeout: bool = True
+    retry_on_connection_error: bool = True
+    stats: RetryStats = field(default_factory=RetryStats)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+    def retry_reason(self, error: BaseException) -> Optional[str]:
+        """Return why ``error`` is worth retrying, or None if it isn't."""
+        if isinstance(error, DeadlineExceeded):
+            return None
+        response = getattr(error, "response", None)
+        if isinstance(error, (requests.exceptions.HTTPError, httpx.HTTPStatusError)):
+            status = getattr(response, "status_code", None)
+            if status not in self.retryable_statuses:
+                return None
+            if error_code(getattr(response, "text", None)) in NON_RETRYABLE_ERROR_CODES:
+                return None
+            return str(status)
+        if isinstance(error, (requests.exceptions.Timeout, httpx.TimeoutException)):
+            return "timeout" if self.retry_on_timeout else None
+        if isinstance(
+            error, (requests.exceptions.ConnectionError, httpx.TransportError)
+        ):
+            return "connection" if self.retry_on_connection_error else None
+        return None
+
+    def backoff(self, retry_number: int, error: BaseException) -> float:
+        """Seconds to wait before retry number ``retry_number`` (1-based)."""
+        if self.respect_retry_after:
+            headers = getattr(getattr(error, "response", None), "headers", None)
+            retry_after = parse_retry_after(
+                headers.get("Retry-After") if hasattr(headers, "get") else None
+            )
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (retry_number - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def call(
+        self,
+        fn: Callable[[], T],
+        deadline: Optional[float] = None,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> T:
+        """Run ``fn``, retrying it per this policy; re-raises the last error.
+        No retry starts, or is slept towards, past ``deadline`` (a
+        `time.monotonic` time); cancelling ``cancel_token`` cuts a backoff
+        short with `RequestCancelled`."""
+        attempt = 1
+        while True:
+            self.stats.record_attempt(attempt)
+            try:
+                result = fn()
+            except Exception as e:
+                delay = self._next_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                if cancel_token is None:
+                    time.sleep(delay)
+                else:
+                    cancel_token.sleep(delay)
+                attempt += 1
+                continue
+            self.stats.record_outcome(success=True)
+            return result
+
+    async def acall(
+        self, fn: Callable[[], Awaitable[T]], deadline: Optional[float] = None
+    ) -> T:
+        """Async counterpart of `call`; backs off without blocking the loop."""
+        attempt = 1
+        while True:
+            self.stats.record_attempt(attempt)
+            try:
+                result = await fn()
+            except Exception as e:
+                delay = self._next_delay(attempt, e, deadline)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.stats.record_outcome(success=True)
+            return result
+
+    def _next_delay(
+        self, attempt: int, error: BaseException, deadline: Optional[float] = None
+    ) -> Optional[float]:
+        """Backoff before the next attempt, or None to give up and raise."""
+        reason = self.retry_reason(error)
+        if reason is None or attempt >= self.max_attempts:
+            self.stats.record_outcome(success=False)
+            return None
+        delay = self.backoff(attempt, error)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            # The retry couldn't start before the deadline.
+            self.stats.record_outcome(success=False)
+            return None
+        self.stats.record_retry(reason, delay)
+        return delay
@@ -0,0 +1,219 @@
+"""Request coalescing ("single-flight") for identical in-flight scrapes.
+
+When several threads or agent branches ask for the same page with the same
+parameters at the same moment, only the first actually calls Zenrows; the
+rest wait for it and share its result - or its error. Once the call
+finishes, the next identical request goes upstream again (pair this with a
+``cache`` to also reuse results after the fact).
+
+Give a tool a `SingleFlight` to enable it; one instance can be shared by
+several tools. Requests are matched on `request_fingerprint()`, the same
+key the response cache uses. Sync callers coalesce with sync callers, and
+async callers with async callers on the same event loop.
+
+Each caller can bound its own wait with a `CancelToken` and a deadline;
+one that gives up leaves the others waiting, and the call is cancelled
+once every caller waiting on it has given up.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from langchain_zenrows.zenrows_cancel import CancelToken, cancelled_by
+from langchain_zenrows.zenrows_deadline import DeadlineExceeded, remaining, within
+
+T = TypeVar("T")
+
+
+class _Call:
+    """A sync call in flight, how many callers are waiting on it, and how
+    to stop it once none are."""
+
+    __slots__ = ("future", "waiters", "abandon")
+
+    def __init__(self, abandon: Optional[Callable[[], None]]) -> None:
+        self.future: Future = Future()
+        self.waiters = 0
+        self.abandon = abandon
+
+
+class _AsyncCall:
+    """An async call in flight, and how many callers are waiting on it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls that share a key."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._acalls: Dict[Tuple[asyncio.AbstractEventLoop, str], _AsyncCall] = {}
+
+    def do(
+        self,
+        key: str,
+        fn: Callable[[], T],
+        cancel_token: Optional[CancelToken] = None,
+        deadline: Optional[float] = None,
+        abandon: Optional[Callable[[], None]] = None,
+    ) -> Tuple[T, bool]:
+        """Run ``fn`` unless a call with ``key`` is already in flight.
+
+        ``cancel_token`` and ``deadline`` (a `time.monotonic` time) bound
+        how long this caller waits, and only this caller: if it may give
+        up, ``fn`` runs on a thread of its own, which carries on for the
+        others. Once every caller has given up, the leader's ``abandon``
+        is called to stop ``fn``.
+
+        Returns:
+            ``(result, shared)`` - ``shared`` is True if the result came
+            from another caller's in-flight call. Errors are shared too.
+
+        Raises:
+            RequestCancelled: If ``cancel_token`` is cancelled while waiting.
+            DeadlineExceeded: If ``deadline`` passes while waiting.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = _Call(abandon)
+                self._calls[key] = call
+            call.waiters += 1
+
+        if leader and cancel_token is None and deadline is None:
+            # This caller waits it out anyway, so it may as well run it.
+            self._run(key, call, fn)
+            return call.future.result(), False
+        if leader:
+            context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run, args=(self._run, key, call, fn), daemon=True
+            ).start()
+
+        try:
+            return self._follow(call.future, cancel_token, deadline), not leader
+        except BaseException:
+            with self._lock:
+                call.waiters -= 1
+                abandoned = call.waiters == 0 and not call.future.done()
+                if abandoned and self._calls.get(key) is call:
+                    # Later callers start a fresh call rather than join one
+                    # that's being stopped.
+                    del self._calls[key]
+            if abandoned and call.abandon is not None:
+                call.abandon()
+            raise
+
+    def _run(self, key: str, call: _Call, fn: Callable[[], Any]) -> None:
+        try:
+            result = fn()
+        except BaseException as e:
+            self._forget(key, call)
+            call.future.set_exception(e)
+            return
+        self._forget(key, call)
+        call.future.set_result(result)
+
+    @staticmethod
+    def _follow(
+        future: "Future[T]",
+        cancel_token: Optional[CancelToken],
+        deadline: Optional[float],
+    ) -> T:
+        """Wait for another caller's call, until ``cancel_token`` is
+        cancelled or ``deadline`` passes."""
+        if cancel_token is None and deadline is None:
+            return future.result()
+        done = threading.Event()
+        future.add_done_callback(lambda _: done.set())
+        if cancel_token is None:
+            done.wait(remaining(deadline))
+        else:
+            with cancel_token.on_cancel(done.set):
+                done.wait(remaining(deadline))
+        if future.done():
+            return future.result()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        raise DeadlineExceeded("the call's deadline was exceeded")
+
+    async def ado(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        cancel_token: Optional[CancelToken] = None,
+        deadline: Optional[float] = None,
+    ) -> Tuple[T, bool]:
+        """Async counterpart of `do`.
+
+        The upstream call runs as its own task, so one caller being
+        cancelled - or giving up per its ``cancel_token`` or ``deadline`` -
+        doesn't cancel it for the others still waiting. Once all of them
+        have, it's cancelled too, freeing its connection and limiter slot.
+        """
+        loop = asyncio.get_running_loop()
+        loop_key = (loop, key)
+        with self._lock:
+            call = self._acalls.get(loop_key)
+            leader = call is None
+            if call is None:
+                call = _AsyncCall(asyncio.ensure_future(fn()))
+                self._acalls[loop_key] = call
+                call.task.add_done_callback(lambda t: self._aforget(loop_key, t))
+            call.waiters += 1
+
+        def wait() -> Awaitable[Any]:
+            return asyncio.shield(call.task)
+
+        try:
+            if cancel_token is not None:
+                result = await within(
+                    deadline, lambda: cancelled_by(cancel_token, wait)
+                )
+            else:
+                result = await within(deadline, wait)
+            return result, not leader
+        except BaseException:
+            with self._lock:
+                call.waiters -= 1
+                if call.waiters == 0 and not call.task.done():
+                    # Nobody wants the result any more; later callers start
+                    # a fresh call rather than join a cancelled one.
+                    if self._acalls.get(loop_key) is call:
+                        del self._acalls[loop_key]
+                    call.task.cancel()
+            raise
+
+    def _forget(self, key: str, call: _Call) -> None:
+        with self._lock:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+
+    def _aforget(
+        self,
+        loop_key: Tuple[asyncio.AbstractEventLoop, str],
+        task: "asyncio.Future[Any]",
+    ) -> None:
+        with self._lock:
+            call = self._acalls.get(loop_key)
+            if call is not None and call.task is task:
+                del self._acalls[loop_key]
+        # Mark the error as retrieved even if every waiter was cancelled,
+        # so asyncio doesn't log "exception was never retrieved".
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Number of distinct calls currently in flight."""
+        with self._lock:
+            return len(self._calls) + len(self._acalls)
@@ -0,0 +1,272 @@
+"""Per-domain learning for Adaptive Stealth Mode.
+
+With ``mode="auto"`` Zenrows starts every request at the cheapest setup and
+escalates (JS rendering, premium proxies) until one works - so a hard domain
+pays the escalation latency on every request. A `StealthLearner` watches
+what each ``mode="auto"`` request was billed (``X-Request-Cost`` reveals the
+configuration that succeeded) and, once a domain has consistently needed
+``js_render`` and/or ``premium_proxy``, sends later ``mode="auto"`` requests
+for it with those set directly instead.
+
+- Observations decay with a ``half_life``, so a domain whose protection
+  changes is re-learned.
+- A small ``explore_rate`` of requests still go out with ``mode="auto"``, so
+  a domain that became easier is noticed.
+- A pre-selected request that fails because its config wasn't enough (the
+  target blocked it, or Zenrows couldn't get the content) makes the domain
+  start over with ``mode="auto"``. Rate limits, server errors, timeouts and
+  cancellations say nothing about the config and are ignored.
+- With a ``path``, what was learned is kept in a JSON file across restarts.
+- Costs are matched to the nearest tier of ``cost_configs``, within
+  ``cost_tolerance``; any other cost is counted in ``unknown_costs`` - a
+  growing count means the pricing table needs updating.
+"""
+
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Mapping, Optional, Tuple
+
+from langchain_zenrows.zenrows_capabilities import domain_of
+from langchain_zenrows.zenrows_http import error_code
+
+# Config billed at each `X-Request-Cost`, as (js_render, premium_proxy) -
+# the default for `StealthLearner(cost_configs=...)`.
+COST_CONFIGS: Dict[float, Tuple[bool, bool]] = {
+    1.0: (False, False),
+    5.0: (True, False),
+    10.0: (False, True),
+    25.0: (True, True),
+}
+
+# Failures of a pre-selected request that mean its config was wrong for the
+# domain: the target blocked it, or Zenrows couldn't get the content with it.
+WRONG_CONFIG_STATUSES: FrozenSet[int] = frozenset({403})
+WRONG_CONFIG_ERROR_CODES: FrozenSet[str] = frozenset({"RESP001", "REQS002"})
+
+_CONFIG_NAMES = {
+    (False, False): "basic",
+    (True, False): "js_render",
+    (False, True): "premium_proxy",
+    (True, True): "js_render+premium_proxy",
+}
+_NAME_CONFIGS = {name: config for config, name in _CONFIG_NAMES.items()}
+
+_STORE_VERSION = 1
+
+# Slack for `min_weight`: weights decay a little between observing and
+# predicting, so N fresh observations sum to just under N.
+_WEIGHT_TOLERANCE = 1e-3
+
+
+@dataclass
+class _DomainStats:
+    # Decayed count of successes per config name, as of `updated_at`.
+    weights: Dict[str, float] = field(default_factory=dict)
+    updated_at: float = 0.0
+
+    def decay(self, now: float, half_life: Optional[float]) -> None:
+        if half_life is not None and now > self.updated_at:
+            factor = 0.5 ** ((now - self.updated_at) / half_life)
+            self.weights = {k: w * factor for k, w in self.weights.items()}
+        self.updated_at = now
+
+
+class StealthLearner:
+    """Learns which stealth configuration each domain needs.
+
+    Args:
+        path: JSON file to load from and save to. None keeps it in memory.
+        min_weight: Decayed successes a config needs before it's
+            pre-selected for a domain.
+        half_life: Seconds for an observation's weight to halve. None never
+            decays.
+        explore_rate: Fraction of requests for learned domains still sent
+            with ``mode="auto"``, to notice a domain getting easier.
+        max_domains: Domains remembered; the least recently updated go first.
+        autosave_interval: With a ``path``, save at most this often (seconds)
+            as observations come in. Call `save` to flush on exit.
+        cost_configs: Config billed at each cost, as
+            ``{credits: (js_render, premium_proxy)}``. Defaults to
+            `COST_CONFIGS`; pass your plan's table if its prices differ.
+        cost_tolerance: Relative distance from the nearest tier a cost may
+            be and still count as that tier's config.
+
+    Attributes:
+        unknown_costs: Costs observed that matched no tier, and were ignored.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        *,
+        min_weight: float = 2.0,
+        half_life: Optional[float] = 7 * 86400.0,
+        explore_rate: float = 0.05,
+        max_domains: int = 100_000,
+        autosave_interval: float = 30.0,
+        cost_configs: Optional[Mapping[float, Tuple[bool, bool]]] = None,
+        cost_tolerance: float = 0.1,
+    ):
+        if not 0 <= explore_rate <= 1:
+            raise ValueError("explore_rate must be between 0 and 1")
+        self.path = path
+        self.min_weight = min_weight
+        self.half_life = half_life
+        self.explore_rate = explore_rate
+        self.max_domains = max_domains
+        self.autosave_interval = autosave_interval
+        self.cost_configs = dict(COST_CONFIGS if cost_configs is None else cost_configs)
+        self.cost_tolerance = cost_tolerance
+        self.unknown_costs = 0
+        self._domains: "OrderedDict[str, _DomainStats]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_save = time.monotonic()
+        self._dirty = False
+        if path is not None and os.path.exists(path):
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._domains)
+
+    # -- learning -----------------------------------------------------------
+
+    def observe(self, url: Optional[str], credits: Optional[float]) -> None:
+        """Record a successful ``mode="auto"`` (or pre-selected) request for
+        ``url`` billed ``credits``. Unknown costs are counted and ignored."""
+        domain = domain_of(url)
+        if domain is None or credits is None:
+            return
+        config = self._config_for(credits)
+        with self._lock:
+            if config is None:
+                self.unknown_costs += 1
+                return
+            stats = self._domains.pop(domain, None) or _DomainStats()
+            stats.decay(time.time(), self.half_life)
+            name = _CONFIG_NAMES[config]
+            stats.weights[name] = stats.weights.get(name, 0.0) + 1.0
+            self._domains[domain] = stats
+            while len(self._domains) > self.max_domains:
+                self._domains.popitem(last=False)
+            self._dirty = True
+        self._maybe_save()
+
+    def _config_for(self, credits: float) -> Optional[Tuple[bool, bool]]:
+        """The config of the tier nearest ``credits``, if within tolerance."""
+        if not self.cost_configs:
+            return None
+        tier = min(self.cost_configs, key=lambda cost: abs(cost - credits))
+        if abs(tier - credits) > self.cost_tolerance * tier:
+            return None
+        return self.cost_configs[tier]
+
+    def record_failure(self, url: Optional[str]) -> None:
+        """A pre-selected request for ``url`` failed with the wrong config
+        (see `wrong_config`): forget the domain so it goes back to
+        ``mode="auto"``."""
+        domain = domain_of(url)
+        with self._lock:
+            if self._domains.pop(domain, None) is not None:
+                self._dirty = True
+        self._maybe_save()
+
+    def predict(self, url: Optional[str]) -> Optional[Tuple[bool, bool]]:
+        """``(js_render, premium_proxy)`` to pre-select for ``url``, or None
+        to leave it to ``mode="auto"`` (unknown domain, not enough evidence,
+        or basic requests suffice)."""
+        domain = domain_of(url)
+        with self._lock:
+            stats = self._domains.get(domain) if domain is not None else None
+            if stats is None or not stats.weights:
+                return None
+            stats.decay(time.time(), self.half_life)
+            name, weight = max(stats.weights.items(), key=lambda item: item[1])
+        if weight < self.min_weight - _WEIGHT_TOLERANCE or name == "basic":
+            return None
+        return _NAME_CONFIGS[name]
+
+    def apply(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a ``mode="auto"`` request into a direct one for a learned
+        domain. Returns ``params`` unchanged, or an updated copy."""
+        if params.get("mode") != "auto":
+            return params
+        config = self.predict(params.get("url"))
+        if config is None:
+            return params
+        if self.explore_rate and random.random() < self.explore_rate:
+            return params
+        js_render, premium_proxy = config
+        params = dict(params)
+        del params["mode"]
+        if js_render:
+            params["js_render"] = True
+        if premium_proxy:
+            params["premium_proxy"] = True
+        return params
+
+    # -- persistence --------------------------------------------------------
+
+    def _load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != _STORE_VERSION:
+            return
+        domains = sorted(
+            data.get("domains", {}).items(), key=lambda item: item[1]["updated_at"]
+        )
+        for domain, entry in domains[-self.max_domains :]:
+            weights = {
+                name: float(weight)
+                for name, weight in entry["weights"].items()
+                if name in _NAME_CONFIGS
+            }
+            self._domains[domain] = _DomainStats(weights, float(entry["updated_at"]))
+
+    def save(self, path: Optional[str] = None) -> None:
+        """Write what was learned to ``path`` (default: the learner's own),
+        atomically."""
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path to save the stealth learner to")
+        with self._lock:
+            data = {
+                "version": _STORE_VERSION,
+                "domains": {
+                    domain: {"weights": stats.weights, "updated_at": stats.updated_at}
+                    for domain, stats in self._domains.items()
+                },
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def _maybe_save(self) -> None:
+        if (
+            self.path is not None
+            and self._dirty
+            and time.monotonic() - self._last_save >= self.autosave_interval
+        ):
+            self.save()
+
+
+def wrong_config(error: BaseException) -> bool:
+    """Whether ``error`` - an HTTP error from a pre-selected request - means
+    the config was wrong for the domain, rather than a transient failure."""
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) in WRONG_CONFIG_STATUSES:
+        return True
+    return error_code(getattr(response, "text", None)) in WRONG_CONFIG_ERROR_CODES
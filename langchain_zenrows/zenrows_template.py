@@ -0,0 +1,153 @@
+"""Pre-validated request templates for high-QPS Fetch callers.
+
+Every `ZenrowsFetch` call validates its input against `ZenrowsFetchInput`
+and then prepares the Zenrows query (auto-enabling ``js_render`` /
+``premium_proxy``, rewriting ``custom_headers``, dropping Nones). When the
+same parameter profile is sent for thousands of URLs, that work is the same
+every time. A `FetchTemplate`, from `ZenrowsFetch.template`, does it once and
+binds only the URL per call::
+
+    rendered = scraper.template(js_render=True, response_type="markdown")
+    for url in urls:
+        markdown = rendered.fetch(url)
+
+The constant part of the query string (API key, ``js_instructions``,
+``css_extractor``, ...) is URL-encoded once too, with JSON parameters
+compacted, so per call only the target URL is encoded and appended.
+
+Calls go straight to the tool's send path (cache, coalescing, retries,
+limiter and instrumentation all apply) but skip LangChain's ``invoke``
+machinery - there are no callbacks or run tracing per call.
+"""
+
+import json
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, Optional, Tuple
+from urllib.parse import quote_plus, urlencode
+
+if TYPE_CHECKING:
+    from langchain_zenrows.zenrows_fetch import ZenrowsFetch
+    from langchain_zenrows.zenrows_result import ZenrowsResult
+
+# Stands in for the URL while the profile is validated and prepared; it's
+# dropped again before any URL is bound.
+_PLACEHOLDER_URL = "https://template.invalid/"
+
+# Request lines longer than this are commonly rejected (414) by servers
+# and proxies, so a template refuses to build or send one.
+MAX_REQUEST_URL_LENGTH = 8192
+
+# String parameters holding JSON, sent with insignificant whitespace removed.
+_JSON_PARAMS = ("js_instructions", "css_extractor")
+
+
+class PreparedRequest(NamedTuple):
+    """A request ready to send: the params, the custom headers to forward,
+    and - from a template - the full request URL with the params encoded."""
+
+    params: Dict[str, Any]
+    request_headers: Optional[Dict[str, str]]
+    request_url: Optional[str] = None
+
+
+def _encode_value(key: str, value: Any) -> str:
+    """A param's query-string form: lowercase booleans (as the Zenrows docs
+    use) and compact JSON."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if key in _JSON_PARAMS and isinstance(value, str):
+        try:
+            return json.dumps(json.loads(value), separators=(",", ":"))
+        except ValueError:
+            return value
+    return str(value)
+
+
+def encode_query(params: Dict[str, Any]) -> str:
+    """URL-encode prepared Zenrows params into a query string."""
+    return urlencode([(k, _encode_value(k, v)) for k, v in params.items()])
+
+
+class FetchTemplate:
+    """A `ZenrowsFetch` parameter profile, validated and prepared once.
+
+    Build one with `ZenrowsFetch.template`. The tool's API key is captured
+    when the template is created. With a ``stealth_learner`` and
+    ``mode="auto"``, the parameters depend on each URL's domain, so only
+    validation is skipped per call and the query is encoded per call.
+
+    Args:
+        tool: The tool that sends the requests.
+        defaults: Tool-input fields for every call, except ``url``.
+
+    Raises:
+        ValueError: If ``defaults`` contains ``url``, fails validation, or
+            makes the request URL longer than `MAX_REQUEST_URL_LENGTH`.
+    """
+
+    def __init__(self, tool: "ZenrowsFetch", defaults: Dict[str, Any]):
+        if "url" in defaults:
+            raise ValueError("A template's url is bound per call, not in defaults")
+        kwargs = tool._validate_input({**defaults, "url": _PLACEHOLDER_URL})
+        del kwargs["url"]
+        self.tool = tool
+        self.defaults = kwargs
+
+        self._prepared: Optional[PreparedRequest] = None
+        if tool.stealth_learner is None or kwargs.get("mode") != "auto":
+            params, request_headers = tool._prepare_request_params(
+                {**kwargs, "url": _PLACEHOLDER_URL}
+            )
+            del params["url"]
+            url_prefix = f"{tool.base_url}?{encode_query(params)}&url="
+            self._check_length(len(url_prefix))
+            self._prepared = PreparedRequest(params, request_headers, url_prefix)
+
+    def __repr__(self) -> str:
+        return f"FetchTemplate({self.defaults!r})"
+
+    @staticmethod
+    def _check_length(length: int) -> None:
+        if length > MAX_REQUEST_URL_LENGTH:
+            raise ValueError(
+                f"Request URL would be {length} characters, over the "
+                f"{MAX_REQUEST_URL_LENGTH} limit - shorten js_instructions or "
+                "css_extractor"
+            )
+
+    def _bind(self, url: str) -> Tuple[Dict[str, Any], PreparedRequest]:
+        """The call's tool kwargs and prepared request for ``url``."""
+        if not isinstance(url, str) or not url:
+            raise ValueError("url must be a non-empty string")
+        kwargs = {**self.defaults, "url": url}
+        if self._prepared is None:
+            params, request_headers = self.tool._prepare_request_params(kwargs)
+            request_url = f"{self.tool.base_url}?{encode_query(params)}"
+        else:
+            params, request_headers, url_prefix = self._prepared
+            params = {**params, "url": url}
+            request_url = url_prefix + quote_plus(url)
+        self._check_length(len(request_url))
+        return kwargs, PreparedRequest(params, request_headers, request_url)
+
+    def prepare(self, url: str) -> PreparedRequest:
+        """The request that would be sent for ``url``."""
+        return self._bind(url)[1]
+
+    def fetch_result(self, url: str) -> "ZenrowsResult":
+        """Fetch ``url`` with this profile; see `ZenrowsFetch.fetch_result`."""
+        kwargs, prepared = self._bind(url)
+        return self.tool._run_result(kwargs, prepared)
+
+    async def afetch_result(self, url: str) -> "ZenrowsResult":
+        """Async counterpart of `fetch_result`."""
+        kwargs, prepared = self._bind(url)
+        return await self.tool._arun_result(kwargs, prepared)
+
+    def fetch(self, url: str) -> Any:
+        """Fetch ``url`` with this profile, returning the same output as the
+        tool's `_run`."""
+        return self.tool._to_tool_output(self.fetch_result(url))
+
+    async def afetch(self, url: str) -> Any:
+        """Async counterpart of `fetch`."""
+        return self.tool._to_tool_output(await self.afetch_result(url))
@@ -1,7 +1,10 @@
 """Pytest configuration and shared fixtures for langchain-zenrows tests."""
 
 import os
+
+import httpx
 import pytest
+import requests
 
 
 def pytest_configure(config):
@@ -52,6 +55,50 @@ def mock_response():
     return response
 
 
+@pytest.fixture
+def make_response():
+    """Factory for a `requests.Response` as Zenrows would send it:
+    ``make_response(status_code=200, text="<html></html>", headers=None)``.
+    Pass ``content=`` bytes instead of ``text`` for a binary body. A
+    non-2xx one raises `HTTPError` from ``raise_for_status()``."""
+
+    def make(status_code=200, text="<html></html>", headers=None, content=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = text.encode() if content is None else content
+        response._content_consumed = True
+        response.encoding = "utf-8" if content is None else "latin-1"
+        response.headers.update(headers or {})
+        response.url = "https://api.zenrows.com/v1/"
+        return response
+
+    return make
+
+
+@pytest.fixture
+def make_http_error(make_response):
+    """Factory for the `HTTPError` a non-2xx Zenrows response raises:
+    ``make_http_error(status_code, text="", headers=None)``."""
+
+    def make(status_code, text="", headers=None):
+        return requests.exceptions.HTTPError(
+            response=make_response(status_code, text, headers)
+        )
+
+    return make
+
+
+@pytest.fixture
+def mock_async_client():
+    """Factory for an `httpx.AsyncClient` whose requests ``handler``
+    answers in-process instead of going over the network."""
+
+    def make(handler):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return make
+
+
 @pytest.fixture
 def sample_html():
     """Provide sample HTML content for testing."""
@@ -0,0 +1,130 @@
+"""Unit tests for the batch runner and ZenrowsFetch's batch API."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from langchain_zenrows import ZenrowsFetch, ZenrowsFetchInput
+from langchain_zenrows.zenrows_batch import aiter_batch, iter_batch
+
+
+class TestIterBatch:
+    """Generic bounded-concurrency runner."""
+
+    def test_ordered_results_follow_input_order(self):
+        def slow_first(n):
+            time.sleep(0.05 if n == 0 else 0)
+            return n * 10
+
+        results = list(iter_batch(slow_first, range(6), concurrency=3, ordered=True))
+        assert [r.index for r in results] == list(range(6))
+        assert [r.output for r in results] == [0, 10, 20, 30, 40, 50]
+
+    def test_unordered_streams_completions_first(self):
+        def slow_first(n):
+            time.sleep(0.1 if n == 0 else 0)
+            return n
+
+        results = list(iter_batch(slow_first, range(3), concurrency=3))
+        assert results[-1].index == 0
+
+    def test_errors_are_per_item(self):
+        def flaky(n):
+            if n == 1:
+                raise ValueError("boom")
+            return n
+
+        results = list(iter_batch(flaky, range(3), concurrency=2, ordered=True))
+        assert [r.ok for r in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert results[1].output is None
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        def track(_):
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            time.sleep(0.01)
+            with lock:
+                state["now"] -= 1
+
+        list(iter_batch(track, range(20), concurrency=4))
+        assert state["peak"] <= 4
+
+    def test_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            list(iter_batch(lambda x: x, [1], concurrency=0))
+
+    @pytest.mark.asyncio
+    async def test_async_ordered_and_bounded(self):
+        state = {"now": 0, "peak": 0}
+
+        async def track(n):
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+            await asyncio.sleep(0.01 * (5 - n))
+            state["now"] -= 1
+            if n == 2:
+                raise ValueError("boom")
+            return n
+
+        results = [
+            r async for r in aiter_batch(track, range(5), concurrency=2, ordered=True)
+        ]
+        assert [r.index for r in results] == list(range(5))
+        assert state["peak"] <= 2
+        assert not results[2].ok
+
+
+class TestZenrowsFetchBatch:
+    """`batch_fetch` accepts URLs, dicts, and input models."""
+
+    def test_batch_fetch_mixed_inputs(self):
+        with patch.object(ZenrowsFetch, "_run", side_effect=lambda **kw: kw["url"]):
+            scraper = ZenrowsFetch(zenrows_api_key="test-key")
+            results = scraper.batch_fetch(
+                [
+                    "https://a.example",
+                    {"url": "https://b.example", "js_render": True},
+                    ZenrowsFetchInput(url="https://c.example"),
+                ],
+                concurrency=2,
+            )
+
+        assert [r.output for r in results] == [
+            "https://a.example",
+            "https://b.example",
+            "https://c.example",
+        ]
+
+    def test_batch_fetch_invalid_input_does_not_abort(self):
+        with patch.object(ZenrowsFetch, "_run", return_value="ok"):
+            scraper = ZenrowsFetch(zenrows_api_key="test-key")
+            results = scraper.batch_fetch(
+                [{"url": "https://a.example", "proxy_country": "usa"}, "https://b.example"]
+            )
+
+        assert not results[0].ok
+        assert results[1].output == "ok"
+
+    @pytest.mark.asyncio
+    async def test_abatch_fetch(self):
+        async def fake_arun(**kwargs):
+            if "bad" in kwargs["url"]:
+                raise ValueError("Rate limit exceeded")
+            return kwargs["url"]
+
+        with patch.object(ZenrowsFetch, "_arun", side_effect=fake_arun):
+            scraper = ZenrowsFetch(zenrows_api_key="test-key")
+            results = await scraper.abatch_fetch(
+                ["https://a.example", "https://bad.example", "https://c.example"]
+            )
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[2].output == "https://c.example"
@@ -0,0 +1,138 @@
+"""Unit tests for BinaryContent and ZenrowsFetch's binary output mode."""
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from langchain_zenrows import BinaryContent, InMemoryCache, ZenrowsFetch
+from langchain_zenrows.zenrows_binary import guess_mime_type
+
+PNG = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+PDF = b"%PDF-1.7\n\xe2\xe3\xcf\xd3 binary"
+
+
+class TestBinaryContent:
+    def test_data_is_a_view_over_the_original_bytes(self):
+        content = BinaryContent(PNG, "image/png")
+        view = content.data
+
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view.obj is PNG
+        assert bytes(content) is PNG
+        assert len(content) == content.nbytes == len(PNG)
+
+    def test_base64_is_computed_once(self):
+        content = BinaryContent(PNG, "image/png")
+
+        assert content.to_base64() is content.to_base64()
+        assert content.to_data_uri().startswith("data:image/png;base64,iVBOR")
+
+    def test_save_to(self, tmp_path):
+        target = tmp_path / "shot.png"
+
+        path = BinaryContent(PNG, "image/png").save_to(target)
+
+        assert path == str(target)
+        assert target.read_bytes() == PNG
+
+    def test_repr_is_short(self):
+        content = BinaryContent(PNG * 1000, "image/png")
+
+        assert str(content) == f"<BinaryContent image/png, {len(PNG) * 1000} bytes>"
+
+    def test_equality(self):
+        assert BinaryContent(PNG, "image/png") == BinaryContent(PNG, "image/png")
+        assert BinaryContent(PNG, "image/png") != BinaryContent(PNG, "image/jpeg")
+        assert BinaryContent(PNG, "image/png") == PNG
+
+
+class TestGuessMimeType:
+    @pytest.mark.parametrize(
+        "params, content_type, expected",
+        [
+            ({}, "image/jpeg", "image/jpeg"),
+            ({}, "application/pdf; charset=binary", "application/pdf"),
+            ({"response_type": "pdf"}, None, "application/pdf"),
+            ({"screenshot": "true", "screenshot_format": "jpeg"}, None, "image/jpeg"),
+            ({"screenshot": "true"}, "", "image/png"),
+        ],
+    )
+    def test_guess(self, params, content_type, expected):
+        assert guess_mime_type(params, content_type) == expected
+
+
+@patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+class TestFetchBinaryOutput:
+    def test_screenshot_returns_binary_content(self, mock_get, make_response):
+        mock_get.return_value = make_response(
+            content=PNG, headers={"Content-Type": "image/png"}
+        )
+        scraper = ZenrowsFetch(zenrows_api_key="k", binary_output=True)
+
+        result = scraper._run(url="https://example.com", screenshot_fullpage="true")
+
+        assert isinstance(result, BinaryContent)
+        assert result.mime_type == "image/png"
+        assert bytes(result) is mock_get.return_value.content
+
+    def test_pdf_is_not_decoded(self, mock_get, make_response):
+        mock_get.return_value = make_response(
+            content=PDF, headers={"Content-Type": "application/pdf"}
+        )
+        scraper = ZenrowsFetch(zenrows_api_key="k", binary_output=True)
+
+        result = scraper._run(url="https://example.com", response_type="pdf")
+
+        assert isinstance(result, BinaryContent)
+        assert result == PDF
+        assert result.mime_type == "application/pdf"
+
+    def test_text_responses_unchanged(self, mock_get, make_response):
+        mock_get.return_value = make_response(
+            text="<html></html>", headers={"Content-Type": "text/html"}
+        )
+        scraper = ZenrowsFetch(zenrows_api_key="k", binary_output=True)
+
+        assert scraper._run(url="https://example.com") == "<html></html>"
+
+    def test_off_by_default(self, mock_get, make_response):
+        mock_get.return_value = make_response(
+            content=PNG, headers={"Content-Type": "image/png"}
+        )
+        scraper = ZenrowsFetch(zenrows_api_key="k")
+
+        assert scraper._run(url="https://example.com", screenshot="true") == PNG
+
+    def test_cache_stores_bytes_and_rewraps_on_hit(self, mock_get, make_response):
+        mock_get.return_value = make_response(
+            content=PNG, headers={"Content-Type": "image/jpeg"}
+        )
+        cache = InMemoryCache()
+        scraper = ZenrowsFetch(zenrows_api_key="k", binary_output=True, cache=cache)
+        request = {"url": "https://example.com", "screenshot": "true", "screenshot_format": "jpeg"}
+
+        first = scraper._run(**request)
+        second = scraper._run(**request)
+
+        assert mock_get.call_count == 1
+        assert isinstance(second, BinaryContent)
+        assert second == first
+        assert second.mime_type == "image/jpeg"
+
+
+@pytest.mark.asyncio
+async def test_arun_returns_binary_content(mock_async_client):
+    client = mock_async_client(
+        lambda request: httpx.Response(
+            200, content=PDF, headers={"Content-Type": "application/pdf"}
+        )
+    )
+    scraper = ZenrowsFetch(zenrows_api_key="k", binary_output=True, async_client=client)
+
+    result = await scraper._arun(url="https://example.com", response_type="pdf")
+
+    assert isinstance(result, BinaryContent)
+    assert result == PDF
+    assert result.mime_type == "application/pdf"
@@ -0,0 +1,193 @@
+"""Unit tests for the response cache."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langchain_zenrows import (
+    InMemoryCache,
+    RedisCache,
+    SQLiteCache,
+    ZenrowsCache,
+    ZenrowsExtract,
+    ZenrowsFetch,
+)
+from langchain_zenrows.zenrows_cache import request_fingerprint
+
+
+class FakeRedis:
+    """Just enough of the redis-py client for `RedisCache`."""
+
+    def __init__(self):
+        self.data = {}
+        self.expiries = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        self.expiries[key] = ex
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def scan_iter(self, match):
+        prefix = match.rstrip("*")
+        return [k for k in list(self.data) if k.startswith(prefix)]
+
+
+class TestRequestFingerprint:
+    """Cache keys are canonical and never include the API key."""
+
+    def test_order_insensitive(self):
+        a = request_fingerprint({"url": "https://x", "js_render": True})
+        b = request_fingerprint({"js_render": True, "url": "https://x"})
+        assert a == b
+
+    def test_apikey_excluded(self):
+        a = request_fingerprint({"url": "https://x", "apikey": "one"})
+        b = request_fingerprint({"url": "https://x", "apikey": "two"})
+        assert a == b
+
+    def test_params_and_headers_matter(self):
+        base = request_fingerprint({"url": "https://x"})
+        assert request_fingerprint({"url": "https://x", "wait": 1}) != base
+        assert request_fingerprint({"url": "https://x"}, {"Referer": "r"}) != base
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryCache(ttl=60)
+    if request.param == "sqlite":
+        return SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+    return RedisCache(FakeRedis(), ttl=60)
+
+
+class TestBackends:
+    """Behavior shared by every backend."""
+
+    def test_round_trips_text_and_bytes(self, cache):
+        cache.set("text", "<html>é</html>")
+        cache.set("binary", b"\x89PNG\x00")
+        assert cache.lookup("text") == "<html>é</html>"
+        assert cache.lookup("binary") == b"\x89PNG\x00"
+        assert cache.lookup("missing") is None
+
+    def test_ttl_expiry(self, cache):
+        cache.set("k", "v")
+        with patch("langchain_zenrows.zenrows_cache.time.time", return_value=time.time() + 61):
+            assert cache.lookup("k") is None
+
+    def test_max_age(self, cache):
+        cache.set("k", "v")
+        with patch("langchain_zenrows.zenrows_cache.time.time", return_value=time.time() + 30):
+            assert cache.lookup("k", max_age=10) is None
+            assert cache.lookup("k", max_age=60) == "v"
+
+    def test_delete_and_clear(self, cache):
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.delete("a")
+        assert cache.lookup("a") is None
+        cache.clear()
+        assert cache.lookup("b") is None
+
+    @pytest.mark.asyncio
+    async def test_async_round_trip(self, cache):
+        await cache.aset("k", "v")
+        assert await cache.alookup("k") == "v"
+
+
+class TestBaseClass:
+    def test_backend_must_implement_every_method(self):
+        class GetOnly(ZenrowsCache):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError, match="abstract"):
+            GetOnly()
+
+
+class TestInMemoryCache:
+    def test_lru_eviction(self):
+        cache = InMemoryCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.lookup("a")  # a is now most recently used
+        cache.set("c", "3")
+        assert cache.lookup("b") is None
+        assert cache.lookup("a") == "1"
+        assert len(cache) == 2
+
+
+class TestSQLiteCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        SQLiteCache(path).set("k", "v")
+        assert SQLiteCache(path).lookup("k") == "v"
+
+    def test_purge_expired(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), ttl=60)
+        cache.set("k", "v")
+        with patch("langchain_zenrows.zenrows_cache.time.time", return_value=time.time() + 61):
+            assert cache.purge_expired() == 1
+
+
+class TestRedisCache:
+    def test_delegates_expiry_to_server(self):
+        client = FakeRedis()
+        RedisCache(client, ttl=0.5, prefix="t:").set("k", "v")
+        assert client.expiries == {"t:k": 1}
+
+
+class TestToolIntegration:
+    """Tools consult the cache before calling Zenrows."""
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_fetch_served_from_cache(self, mock_get):
+        mock_get.return_value = Mock(text="<html>fresh</html>")
+        scraper = ZenrowsFetch(zenrows_api_key="k", cache=InMemoryCache())
+
+        assert scraper._run(url="https://example.com") == "<html>fresh</html>"
+        assert scraper._run(url="https://example.com") == "<html>fresh</html>"
+        assert mock_get.call_count == 1
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_cache_bypass_refreshes(self, mock_get):
+        mock_get.side_effect = [Mock(text="old"), Mock(text="new")]
+        scraper = ZenrowsFetch(zenrows_api_key="k", cache=InMemoryCache())
+
+        scraper._run(url="https://example.com")
+        assert scraper._run(url="https://example.com", cache_bypass=True) == "new"
+        assert scraper._run(url="https://example.com") == "new"
+        assert "cache_bypass" not in mock_get.call_args[1]["params"]
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_cache_max_age(self, mock_get):
+        mock_get.side_effect = [Mock(text="old"), Mock(text="new")]
+        scraper = ZenrowsFetch(zenrows_api_key="k", cache=InMemoryCache())
+
+        scraper._run(url="https://example.com")
+        with patch("langchain_zenrows.zenrows_cache.time.time", return_value=time.time() + 30):
+            assert scraper._run(url="https://example.com", cache_max_age=10) == "new"
+        assert "cache_max_age" not in mock_get.call_args[1]["params"]
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_different_params_not_shared(self, mock_get):
+        mock_get.side_effect = [Mock(text="plain"), Mock(text="markdown")]
+        scraper = ZenrowsFetch(zenrows_api_key="k", cache=InMemoryCache())
+
+        scraper._run(url="https://example.com")
+        assert scraper._run(url="https://example.com", response_type="markdown") == "markdown"
+
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_extract_caches_final_result(self, mock_get):
+        mock_get.return_value = Mock(text='{"parsed": {}, "html": null}')
+        tool = ZenrowsExtract(zenrows_api_key="k", cache=InMemoryCache())
+
+        tool._run(url="https://example.com")
+        tool._run(url="https://example.com")
+        assert mock_get.call_count == 1
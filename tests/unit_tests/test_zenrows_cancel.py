@@ -0,0 +1,301 @@
+"""Unit tests for cooperative cancellation."""
+
+import asyncio
+import http.server
+import io
+import threading
+import time
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import (
+    CancelToken,
+    RequestCancelled,
+    RetryPolicy,
+    ZenrowsFetch,
+    ZenrowsRateLimiter,
+)
+from langchain_zenrows.zenrows_http import create_session
+
+URL = "https://example.com/page"
+
+
+def _cancel_after(token, seconds):
+    timer = threading.Timer(seconds, token.cancel)
+    timer.start()
+    return timer
+
+
+def _config(token):
+    return {"configurable": {"zenrows_cancel": token}}
+
+
+class StatusSession(requests.Session):
+    """Answers every GET with ``status``, counting them."""
+
+    def __init__(self, status=200):
+        super().__init__()
+        self.status = status
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        response = requests.Response()
+        response.status_code = self.status
+        response._content = b"page"
+        response.encoding = "utf-8"
+        response.url = URL
+        return response
+
+
+@pytest.fixture
+def hanging_server():
+    """A local server that accepts requests and never answers them."""
+    arrived, release = threading.Event(), threading.Event()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            arrived.set()
+            release.wait(10)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/", arrived
+    release.set()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def stalling_server():
+    """A local server that sends the first KiB of a body, then stalls."""
+    release = threading.Event()
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "1000000")
+            self.end_headers()
+            self.wfile.write(b"x" * 1024)
+            self.wfile.flush()
+            release.wait(10)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    release.set()
+    server.shutdown()
+    server.server_close()
+
+
+class TestCancelToken:
+    def test_callbacks_run_once(self):
+        token, calls = CancelToken(), []
+        with token.on_cancel(lambda: calls.append(1)):
+            token.cancel()
+            token.cancel()
+        assert token.cancelled and calls == [1]
+
+    def test_callback_runs_at_once_if_already_cancelled(self):
+        token, calls = CancelToken(), []
+        token.cancel()
+        with token.on_cancel(lambda: calls.append(1)):
+            pass
+        assert calls == [1]
+
+    def test_sleep_wakes_on_cancel(self):
+        token = CancelToken()
+        _cancel_after(token, 0.05)
+        started = time.monotonic()
+        with pytest.raises(RequestCancelled):
+            token.sleep(5)
+        assert time.monotonic() - started < 1
+
+    def test_config_value_must_be_a_token(self):
+        tool = ZenrowsFetch(zenrows_api_key="k", session=StatusSession())
+        with pytest.raises(ValueError, match="must be a CancelToken"):
+            tool.invoke({"url": URL}, config=_config("stop"))
+
+
+class TestSync:
+    """A `CancelToken` from the run config, cancelled from another thread."""
+
+    def test_already_cancelled_sends_nothing(self):
+        session, token = StatusSession(), CancelToken()
+        token.cancel()
+        tool = ZenrowsFetch(zenrows_api_key="k", session=session)
+        with pytest.raises(ValueError, match="Request cancelled"):
+            tool.invoke({"url": URL}, config=_config(token))
+        assert session.calls == 0
+
+    def test_wakes_limiter_wait(self):
+        limiter, token = ZenrowsRateLimiter(max_concurrency=1), CancelToken()
+        tool = ZenrowsFetch(
+            zenrows_api_key="k", session=StatusSession(), limiter=limiter
+        )
+        limiter.acquire()
+        _cancel_after(token, 0.05)
+        try:
+            with pytest.raises(ValueError, match="Request cancelled"):
+                tool.invoke({"url": URL}, config=_config(token))
+            assert limiter.in_flight == 1
+        finally:
+            limiter.release()
+
+    def test_cuts_backoff_short(self):
+        session, token = StatusSession(503), CancelToken()
+        policy = RetryPolicy(max_attempts=3, backoff_base=5, jitter=False)
+        tool = ZenrowsFetch(
+            zenrows_api_key="k",
+            session=session,
+            limiter=ZenrowsRateLimiter(),
+            retry_policy=policy,
+        )
+        _cancel_after(token, 0.05)
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request cancelled"):
+            tool.invoke({"url": URL}, config=_config(token))
+        assert session.calls == 1
+        assert time.monotonic() - started < 1
+
+    def test_aborts_request_in_flight(self, hanging_server):
+        base_url, arrived = hanging_server
+        limiter, token = ZenrowsRateLimiter(), CancelToken()
+        tool = ZenrowsFetch(
+            zenrows_api_key="k",
+            base_url=base_url,
+            session=create_session(),
+            limiter=limiter,
+        )
+        threading.Thread(
+            target=lambda: arrived.wait(5) and token.cancel(), daemon=True
+        ).start()
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request cancelled"):
+            tool.invoke({"url": URL}, config=_config(token))
+        assert time.monotonic() - started < 2
+        assert limiter.in_flight == 0
+
+
+class TestStreams:
+    """A token passed to the streaming methods, cancelled mid-stream."""
+
+    def test_aborts_body_mid_read(self, stalling_server):
+        limiter, token = ZenrowsRateLimiter(), CancelToken()
+        tool = ZenrowsFetch(
+            zenrows_api_key="k",
+            base_url=stalling_server,
+            session=create_session(),
+            limiter=limiter,
+        )
+        chunks = []
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request cancelled"):
+            for chunk in tool.iter_content(URL, chunk_size=1024, cancel_token=token):
+                chunks.append(chunk)
+                _cancel_after(token, 0.05)
+        assert chunks == [b"x" * 1024]
+        assert time.monotonic() - started < 2
+        assert limiter.in_flight == 0
+
+    def test_wakes_limiter_wait(self):
+        limiter, token = ZenrowsRateLimiter(max_concurrency=1), CancelToken()
+        tool = ZenrowsFetch(
+            zenrows_api_key="k", session=StatusSession(), limiter=limiter
+        )
+        limiter.acquire()
+        _cancel_after(token, 0.05)
+        try:
+            with pytest.raises(ValueError, match="Request cancelled"):
+                tool.fetch_to(URL, io.BytesIO(), cancel_token=token)
+        finally:
+            limiter.release()
+
+    @pytest.mark.asyncio
+    async def test_async_body_mid_read(self):
+        async def body():
+            yield b"x" * 1024
+            await asyncio.sleep(5)
+            yield b"never"
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, content=body())
+            )
+        )
+        limiter, token = ZenrowsRateLimiter(), CancelToken()
+        tool = ZenrowsFetch(zenrows_api_key="k", async_client=client, limiter=limiter)
+        chunks = []
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request cancelled"):
+            async for chunk in tool.aiter_content(
+                URL, chunk_size=1024, cancel_token=token
+            ):
+                chunks.append(chunk)
+                _cancel_after(token, 0.05)
+        await client.aclose()
+        assert chunks == [b"x" * 1024]
+        assert time.monotonic() - started < 1
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_limiter_wait(self):
+        limiter, token = ZenrowsRateLimiter(max_concurrency=1), CancelToken()
+        tool = ZenrowsFetch(zenrows_api_key="k", limiter=limiter)
+        await limiter.aacquire()
+        _cancel_after(token, 0.05)
+        try:
+            with pytest.raises(ValueError, match="Request cancelled"):
+                await tool.afetch_to(URL, io.BytesIO(), cancel_token=token)
+            assert limiter.in_flight == 1
+        finally:
+            limiter.release()
+
+
+class TestAsync:
+    """Cancelling the task, or the token, on the async path."""
+
+    @staticmethod
+    def _tool(limiter):
+        async def handler(request):
+            await asyncio.sleep(5)
+            return httpx.Response(200, text="page")
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        tool = ZenrowsFetch(zenrows_api_key="k", async_client=client, limiter=limiter)
+        return tool, client
+
+    @pytest.mark.asyncio
+    async def test_task_cancel_releases_slot(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=1)
+        tool, client = self._tool(limiter)
+        task = asyncio.ensure_future(tool._arun(url=URL))
+        await asyncio.sleep(0.05)
+        assert limiter.in_flight == 1
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await client.aclose()
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_token_cancel(self):
+        limiter, token = ZenrowsRateLimiter(), CancelToken()
+        tool, client = self._tool(limiter)
+        _cancel_after(token, 0.05)
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request cancelled"):
+            await tool.ainvoke({"url": URL}, config=_config(token))
+        await client.aclose()
+        assert time.monotonic() - started < 1
+        assert limiter.in_flight == 0
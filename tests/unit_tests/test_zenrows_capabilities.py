@@ -0,0 +1,176 @@
+"""Unit tests for AUTH010 domain memory and batch Extract routing."""
+
+import json
+import threading
+import time
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import DomainCapabilityCache, ZenrowsExtract
+
+BLOCKED = "blocked.example.com"
+
+
+class FakeSession(requests.Session):
+    """Fake Zenrows: AUTH010 for Extract on BLOCKED, Autoparse JSON otherwise."""
+
+    def __init__(self, make_response):
+        super().__init__()
+        self.make_response = make_response
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        with self._lock:
+            self.calls.append(dict(params))
+        if "extract" in params and BLOCKED in params["url"]:
+            return self.make_response(402, '{"code": "AUTH010"}')
+        return self.make_response(text=json.dumps({"title": "Widget"}))
+
+    def extract_calls(self, host):
+        return [c for c in self.calls if "extract" in c and host in c["url"]]
+
+
+@pytest.fixture
+def session(make_response):
+    return FakeSession(make_response)
+
+
+class TestDomainCapabilityCache:
+    """The domain set itself."""
+
+    def test_marks_by_host(self):
+        cache = DomainCapabilityCache()
+        cache.mark_unsupported("https://Blocked.Example.com/a?b=1")
+        assert cache.is_unsupported("https://blocked.example.com/other")
+        assert not cache.is_unsupported("https://example.com/")
+        assert not cache.is_unsupported(None)
+
+    def test_entries_expire(self):
+        cache = DomainCapabilityCache(ttl=0.01)
+        cache.mark_unsupported("https://blocked.example.com")
+        time.sleep(0.02)
+        assert not cache.is_unsupported("https://blocked.example.com")
+        assert len(cache) == 0
+
+    def test_forget_accepts_bare_host(self):
+        cache = DomainCapabilityCache()
+        cache.mark_unsupported("https://blocked.example.com")
+        cache.forget("blocked.example.com")
+        assert not cache.is_unsupported("https://blocked.example.com")
+
+
+class TestExtractRouting:
+    """`ZenrowsExtract` with a `domain_capabilities` cache."""
+
+    def _tool(self, session, **kwargs):
+        return ZenrowsExtract(zenrows_api_key="k", session=session, **kwargs)
+
+    def test_second_call_skips_extract_request(self, session):
+        tool = self._tool(session, domain_capabilities=DomainCapabilityCache())
+
+        first = json.loads(tool._run(url=f"https://{BLOCKED}/1"))
+        second = tool.extract_result(f"https://{BLOCKED}/2")
+
+        assert first["extract_fallback"] == "autoparse"
+        assert json.loads(second.content)["extract_fallback"] == "autoparse"
+        assert second.autoparse_fallback and second.attempts == 1
+        assert len(session.extract_calls(BLOCKED)) == 1
+        assert len(session.calls) == 3
+
+    def test_without_cache_every_call_probes(self, session):
+        tool = self._tool(session)
+        tool._run(url=f"https://{BLOCKED}/1")
+        tool._run(url=f"https://{BLOCKED}/2")
+        assert len(session.extract_calls(BLOCKED)) == 2
+
+    def test_fallback_disabled_still_sends_extract(self, session):
+        capabilities = DomainCapabilityCache()
+        capabilities.mark_unsupported(f"https://{BLOCKED}")
+        tool = self._tool(session, domain_capabilities=capabilities)
+        with pytest.raises(ValueError, match="402"):
+            tool._run(url=f"https://{BLOCKED}/1", fallback_to_autoparse=False)
+        assert len(session.extract_calls(BLOCKED)) == 1
+
+    def test_non_auto_mode_is_never_rerouted(self, session):
+        capabilities = DomainCapabilityCache()
+        capabilities.mark_unsupported(f"https://{BLOCKED}")
+        tool = self._tool(session, domain_capabilities=capabilities)
+        with pytest.raises(ValueError, match="402"):
+            tool._run(url=f"https://{BLOCKED}/1", extract="native")
+        assert len(session.extract_calls(BLOCKED)) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_path_routes(self, mock_async_client):
+        capabilities = DomainCapabilityCache()
+        capabilities.mark_unsupported(f"https://{BLOCKED}")
+        requested = []
+
+        def handler(request):
+            requested.append(dict(request.url.params))
+            return httpx.Response(200, json={"title": "Widget"})
+
+        client = mock_async_client(handler)
+        tool = ZenrowsExtract(
+            zenrows_api_key="k", async_client=client, domain_capabilities=capabilities
+        )
+        data = json.loads(await tool._arun(url=f"https://{BLOCKED}/1"))
+        await client.aclose()
+
+        assert data["extract_fallback"] == "autoparse"
+        assert len(requested) == 1 and "extract" not in requested[0]
+
+
+class TestBatchExtract:
+    """Concurrent batch Extract."""
+
+    def test_batch_learns_within_the_batch(self, session):
+        tool = ZenrowsExtract(zenrows_api_key="k", session=session)
+        inputs = [f"https://{BLOCKED}/{i}" for i in range(5)] + ["https://example.com"]
+
+        results = tool.batch_extract(inputs, concurrency=1)
+
+        assert [r.index for r in results] == list(range(6))
+        assert all(r.ok for r in results)
+        assert len(session.extract_calls(BLOCKED)) == 1
+        assert "extract_fallback" not in json.loads(results[5].output)
+        assert tool.domain_capabilities is None  # the batch used its own
+
+    def test_batch_uses_tool_cache_when_set(self, session):
+        capabilities = DomainCapabilityCache()
+        tool = ZenrowsExtract(
+            zenrows_api_key="k", session=session, domain_capabilities=capabilities
+        )
+        tool.batch_extract([f"https://{BLOCKED}/1"])
+        assert capabilities.is_unsupported(f"https://{BLOCKED}/")
+
+    def test_errors_are_per_item(self, session):
+        tool = ZenrowsExtract(zenrows_api_key="k", session=session)
+        results = tool.batch_extract(["https://example.com", {"js_render": True}])
+        assert results[0].ok
+        assert not results[1].ok
+
+    @pytest.mark.asyncio
+    async def test_abatch_extract(self, mock_async_client):
+        def handler(request):
+            params = dict(request.url.params)
+            if "extract" in params and BLOCKED in params["url"]:
+                return httpx.Response(402, json={"code": "AUTH010"})
+            return httpx.Response(200, json={"title": "Widget"})
+
+        requested = []
+
+        def recording(request):
+            requested.append(dict(request.url.params))
+            return handler(request)
+
+        client = mock_async_client(recording)
+        tool = ZenrowsExtract(zenrows_api_key="k", async_client=client)
+        inputs = [f"https://{BLOCKED}/{i}" for i in range(4)]
+        results = await tool.abatch_extract(inputs, concurrency=1)
+        await client.aclose()
+
+        assert all(r.ok for r in results)
+        extract_calls = [p for p in requested if "extract" in p]
+        assert len(extract_calls) == 1
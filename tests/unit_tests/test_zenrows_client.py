@@ -0,0 +1,290 @@
+"""Unit tests for the shared transport engine."""
+
+import io
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import (
+    InMemoryCache,
+    RetryPolicy,
+    SingleFlight,
+    ZenrowsCache,
+    ZenrowsClient,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsKeyPool,
+    ZenrowsRateLimiter,
+)
+from langchain_zenrows.zenrows_client import mapped_errors
+from langchain_zenrows.zenrows_result import RequestTrace, ZenrowsResult
+
+
+class ScriptedSession(requests.Session):
+    """Answers GETs from a list of responses, recording the params."""
+
+    def __init__(self, *responses):
+        super().__init__()
+        self.responses = list(responses)
+        self.sent = []
+
+    def get(self, url, params=None, **kwargs):
+        self.sent.append(params)
+        return self.responses.pop(0)
+
+
+def _client(session, **kwargs):
+    kwargs.setdefault("limiter", ZenrowsRateLimiter())
+    return ZenrowsClient("https://zenrows.test/", session=session, **kwargs)
+
+
+class TestSend:
+    """The retry -> key pool -> limiter -> HTTP stack."""
+
+    def test_plain_send(self, make_response):
+        session = ScriptedSession(make_response(text="page"))
+        trace = RequestTrace()
+        response = _client(session).send({"url": "u", "apikey": "k"}, None, trace)
+        assert response.text == "page"
+        assert trace.attempts == 1
+
+    def test_retries_per_policy(self, make_response):
+        session = ScriptedSession(make_response(503), make_response(text="page"))
+        policy = RetryPolicy(backoff_base=0, jitter=False)
+        trace = RequestTrace()
+        client = _client(session, retry_policy=policy)
+        assert client.send({"url": "u"}, None, trace).text == "page"
+        assert trace.attempts == 2
+
+    def test_raises_http_errors_unmapped(self, make_response):
+        session = ScriptedSession(make_response(404))
+        with pytest.raises(requests.exceptions.HTTPError):
+            _client(session).send({"url": "u"}, None, RequestTrace())
+
+    def test_key_pool_sets_key(self, make_response):
+        session = ScriptedSession(make_response())
+        client = _client(session, key_pool=ZenrowsKeyPool(["pool-key"]))
+        client.send({"url": "u"}, None, RequestTrace())
+        assert session.sent[0]["apikey"] == "pool-key"
+
+    @pytest.mark.asyncio
+    async def test_asend(self, mock_async_client):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, text="page")
+
+        async_client = mock_async_client(handler)
+        client = ZenrowsClient(
+            "https://zenrows.test/",
+            async_client=async_client,
+            limiter=ZenrowsRateLimiter(),
+        )
+        response = await client.asend({"url": "u"}, None, RequestTrace())
+        await async_client.aclose()
+        assert response.text == "page"
+        assert seen[0].url.params["url"] == "u"
+
+
+def _streamed(body=b"chunk" * 10, status=200):
+    response = requests.Response()
+    response.status_code = status
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class TestStream:
+    """Streamed requests share the key pool, limiter and timeouts."""
+
+    def test_holds_key_and_slot_while_streaming(self):
+        session = ScriptedSession(_streamed())
+        limiter = ZenrowsRateLimiter()
+        pool = ZenrowsKeyPool(["pool-key"], limiter_factory=lambda: limiter)
+        client = _client(session, key_pool=pool)
+        trace = RequestTrace()
+        with client.stream({"url": "u"}, None, trace) as response:
+            assert limiter.in_flight == 1
+            assert b"".join(response.iter_content(8)) == b"chunk" * 10
+        assert limiter.in_flight == 0
+        assert session.sent[0]["apikey"] == "pool-key"
+        assert trace.attempts == 1
+
+    def test_http_error_before_the_body(self):
+        limiter = ZenrowsRateLimiter()
+        client = _client(ScriptedSession(_streamed(status=500)), limiter=limiter)
+        with pytest.raises(requests.exceptions.HTTPError):
+            with client.stream({"url": "u"}, None, RequestTrace()):
+                pytest.fail("the block shouldn't run")
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_astream(self, mock_async_client):
+        def handler(request):
+            return httpx.Response(200, content=b"chunk" * 10)
+
+        async_client = mock_async_client(handler)
+        limiter = ZenrowsRateLimiter()
+        client = ZenrowsClient(
+            "https://zenrows.test/", async_client=async_client, limiter=limiter
+        )
+        async with client.astream({"url": "u"}, None, RequestTrace()) as response:
+            assert limiter.in_flight == 1
+            body = b"".join([chunk async for chunk in response.aiter_bytes(8)])
+        await async_client.aclose()
+        assert body == b"chunk" * 10
+        assert limiter.in_flight == 0
+
+
+class BrokenCache(ZenrowsCache):
+    """A backend that's down: every read and write fails."""
+
+    def get(self, key):
+        raise ConnectionError("cache down")
+
+    def set(self, key, value):
+        raise ConnectionError("cache down")
+
+    def delete(self, key):
+        raise ConnectionError("cache down")
+
+    def clear(self):
+        raise ConnectionError("cache down")
+
+
+class TestServe:
+    """Cache and coalescing around a call."""
+
+    def test_cache_hit_skips_compute(self):
+        cache = InMemoryCache()
+        client = ZenrowsClient(cache=cache)
+        compute = Mock(return_value=ZenrowsResult(content="fresh", url="u"))
+
+        first = client.serve({"url": "u"}, None, RequestTrace(), compute)
+        second = client.serve({"url": "u"}, None, RequestTrace(), compute)
+        assert (first.content, first.cache_hit) == ("fresh", False)
+        assert (second.content, second.cache_hit) == ("fresh", True)
+        assert compute.call_count == 1
+
+    def test_cache_bypass_still_stores(self):
+        cache = InMemoryCache()
+        client = ZenrowsClient(cache=cache)
+        compute = Mock(return_value=ZenrowsResult(content="fresh", url="u"))
+        client.serve({"url": "u"}, None, RequestTrace(), compute)
+        client.serve({"url": "u"}, None, RequestTrace(), compute, cache_bypass=True)
+        assert compute.call_count == 2
+
+    def test_cache_conversions(self):
+        client = ZenrowsClient(cache=InMemoryCache())
+        compute = Mock(return_value=ZenrowsResult(content="fresh", url="u"))
+        for _ in range(2):
+            result = client.serve(
+                {"url": "u"},
+                None,
+                RequestTrace(),
+                compute,
+                to_cache=str.upper,
+                from_cache=lambda cached: f"cached:{cached}",
+            )
+        assert result.content == "cached:FRESH"
+
+    def test_single_flight_marks_result(self):
+        client = ZenrowsClient(single_flight=SingleFlight())
+        compute = Mock(return_value=ZenrowsResult(content="fresh", url="u"))
+        result = client.serve({"url": "u"}, None, RequestTrace(), compute)
+        assert result.content == "fresh" and result.coalesced is False
+
+    def test_cache_outage_is_a_miss(self, caplog):
+        client = ZenrowsClient(cache=BrokenCache())
+        compute = Mock(return_value=ZenrowsResult(content="fresh", url="u"))
+        result = client.serve({"url": "u"}, None, RequestTrace(), compute)
+        assert result.content == "fresh" and not result.cache_hit
+        assert [r.message for r in caplog.records] == [
+            "Zenrows cache lookup failed",
+            "Zenrows cache store failed",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_async_cache_outage_is_a_miss(self, caplog):
+        client = ZenrowsClient(cache=BrokenCache())
+
+        async def compute(trace):
+            return ZenrowsResult(content="fresh", url="u")
+
+        result = await client.aserve({"url": "u"}, None, RequestTrace(), compute)
+        assert result.content == "fresh" and not result.cache_hit
+        assert len(caplog.records) == 2
+
+    @pytest.mark.asyncio
+    async def test_aserve(self):
+        client = ZenrowsClient(cache=InMemoryCache())
+        calls = []
+
+        async def compute(trace):
+            calls.append(1)
+            return ZenrowsResult(content="fresh", url="u")
+
+        await client.aserve({"url": "u"}, None, RequestTrace(), compute)
+        result = await client.aserve({"url": "u"}, None, RequestTrace(), compute)
+        assert result.cache_hit and len(calls) == 1
+
+
+class TestMappedErrors:
+    """Exceptions -> the tools' `ValueError`s."""
+
+    @pytest.mark.parametrize(
+        "error,message",
+        [
+            (requests.exceptions.Timeout(), "timed out"),
+            (httpx.ConnectError("refused"), "Request failed"),
+            (RuntimeError("boom"), "Unexpected error: boom"),
+        ],
+    )
+    def test_maps(self, error, message):
+        with pytest.raises(ValueError, match=message):
+            with mapped_errors():
+                raise error
+
+    def test_maps_http_errors(self, make_http_error):
+        with pytest.raises(ValueError, match="Invalid"):
+            with mapped_errors():
+                raise make_http_error(401)
+
+    def test_custom_http_handler(self, make_http_error):
+        def on_http_error(e):
+            raise ValueError(f"custom {e.response.status_code}")
+
+        with pytest.raises(ValueError, match="custom 404"):
+            with mapped_errors(on_http_error):
+                raise make_http_error(404)
+
+
+class TestToolsDelegate:
+    """Both tools send through a `ZenrowsClient` built from their fields."""
+
+    def test_fetch(self, make_response):
+        response = make_response()
+        with patch.object(ZenrowsClient, "send", return_value=response) as send:
+            ZenrowsFetch(zenrows_api_key="k")._run(url="https://example.com")
+        params = send.call_args.args[0]
+        assert params["url"] == "https://example.com" and params["apikey"] == "k"
+
+    def test_extract(self, make_response):
+        response = make_response(text='{"parsed": {}, "html": null}')
+        with patch.object(ZenrowsClient, "send", return_value=response) as send:
+            ZenrowsExtract(zenrows_api_key="k")._run(url="https://example.com")
+        assert send.call_args.args[0]["extract"] == "auto"
+
+    def test_client_mirrors_tool_fields(self):
+        policy, cache = RetryPolicy(), InMemoryCache()
+        tool = ZenrowsFetch(
+            zenrows_api_key="k",
+            base_url="https://zenrows.test/",
+            retry_policy=policy,
+            cache=cache,
+        )
+        client = tool._get_client()
+        assert client.base_url == "https://zenrows.test/"
+        assert client.retry_policy is policy and client.cache is cache
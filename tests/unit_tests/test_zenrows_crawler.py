@@ -0,0 +1,353 @@
+"""Unit tests for the crawler: canonicalization, dedup, frontier and crawl."""
+
+import asyncio
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from langchain_zenrows import BloomFilter, ZenrowsCrawler, ZenrowsFetch, ZenrowsResult
+from langchain_zenrows.zenrows_crawler import _Entry, _Frontier, canonicalize_url
+
+SITE = {
+    "https://example.com/": ["/a", "/b", "https://other.com/x"],
+    "https://example.com/a": ["/a/1", "b", "mailto:me@example.com"],
+    "https://example.com/b": ["/?utm_source=feed", "https://blog.example.com/"],
+    "https://example.com/a/1": ["/a/2"],
+    "https://blog.example.com/": [],
+}
+
+
+def _fake_fetch(site=SITE, calls=None, delay=0.0):
+    def fetch_result(self, tool_input):
+        if calls is not None:
+            calls.append(tool_input)
+        if delay:
+            time.sleep(delay)
+        url = tool_input["url"]
+        if url not in site:
+            raise ValueError("HTTP 404 error")
+        return ZenrowsResult(content=json.dumps({"links": site[url]}), url=url)
+
+    return fetch_result
+
+
+class TestCanonicalize:
+    """URL normalization."""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("HTTPS://Example.COM", "https://example.com/"),
+            ("https://example.com:443/a#frag", "https://example.com/a"),
+            ("http://example.com:8080/", "http://example.com:8080/"),
+            ("https://example.com/a/./b/../c", "https://example.com/a/c"),
+            ("https://example.com/a/b/..", "https://example.com/a/"),
+            ("https://example.com/?b=2&a=1&utm_source=x", "https://example.com/?a=1&b=2"),
+            ("https://example.com/%7euser/%2f", "https://example.com/~user/%2F"),
+            ("https://user:pw@example.com/", "https://example.com/"),
+        ],
+    )
+    def test_equivalent_spellings(self, url, expected):
+        assert canonicalize_url(url) == expected
+
+    @pytest.mark.parametrize(
+        "url", ["mailto:me@example.com", "/relative", "ftp://example.com/", "http://:80/"]
+    )
+    def test_rejects_non_http(self, url):
+        assert canonicalize_url(url) is None
+
+
+class TestBloomFilter:
+    """Probabilistic seen-set."""
+
+    def test_no_false_negatives(self):
+        bloom = BloomFilter(capacity=1000)
+        urls = [f"https://example.com/{i}" for i in range(1000)]
+        assert all(bloom.add(url) for url in urls[:10])
+        for url in urls:
+            bloom.add(url)
+        assert all(url in bloom for url in urls)
+        assert not bloom.add(urls[0])
+
+    def test_false_positive_rate_near_target(self):
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"https://example.com/{i}")
+        false_positives = sum(f"https://other.com/{i}" in bloom for i in range(5000))
+        assert false_positives / 5000 < 0.03
+
+    def test_rejects_bad_config(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+
+def _entry(seq, host, priority=0.0):
+    return _Entry(priority, seq, f"https://{host}/{seq}", host, 0, None)
+
+
+class TestFrontier:
+    """Priority order, per-host caps and pacing."""
+
+    def test_pops_in_priority_order(self):
+        frontier = _Frontier(max_per_host=None, host_delay=0.0)
+        for seq, priority in enumerate([3.0, 1.0, 2.0]):
+            frontier.push(_entry(seq, f"h{seq}", priority), 0.0)
+        assert [frontier.pop(0.0).seq for _ in range(3)] == [1, 2, 0]
+        assert frontier.pop(0.0) is None
+
+    def test_busy_host_is_skipped_until_released(self):
+        frontier = _Frontier(max_per_host=1, host_delay=0.0)
+        frontier.push(_entry(1, "a"), 0.0)
+        frontier.push(_entry(2, "a"), 0.0)
+        frontier.push(_entry(3, "b", priority=5.0), 0.0)
+        assert frontier.pop(0.0).seq == 1
+        assert frontier.pop(0.0).seq == 3  # "a" is busy
+        assert frontier.pop(0.0) is None
+        frontier.release("a", 0.0)
+        assert frontier.pop(0.0).seq == 2
+
+    def test_host_delay_paces_starts(self):
+        frontier = _Frontier(max_per_host=None, host_delay=1.0)
+        frontier.push(_entry(1, "a"), 0.0)
+        frontier.push(_entry(2, "a"), 0.0)
+        assert frontier.pop(0.0).seq == 1
+        assert frontier.pop(0.5) is None
+        assert frontier.next_wake(0.5) == pytest.approx(0.5)
+        assert frontier.pop(1.0).seq == 2
+
+
+class TestCrawl:
+    """End-to-end crawling over a fake site."""
+
+    def _crawler(self, **kwargs):
+        return ZenrowsCrawler(ZenrowsFetch(zenrows_api_key="k"), **kwargs)
+
+    def test_follows_links_within_domain(self):
+        calls = []
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch(calls=calls)):
+            pages = list(self._crawler().crawl(["https://example.com"]))
+
+        assert {p.url for p in pages} == {
+            "https://example.com/",
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/a/1",
+            "https://blog.example.com/",
+        }
+        assert all(call["outputs"] == "links" for call in calls)
+        assert len(calls) == 5  # "/?utm_source" and "b" deduplicated
+
+    def test_depth_and_page_limits(self):
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch()):
+            shallow = list(self._crawler(max_depth=0).crawl(["https://example.com"]))
+            capped = list(self._crawler(max_pages=2).crawl(["https://example.com"]))
+        assert [p.url for p in shallow] == ["https://example.com/"]
+        assert len(capped) == 2
+
+    def test_depth_parent_and_breadth_first_order(self):
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch()):
+            pages = list(self._crawler(concurrency=1).crawl(["https://example.com"]))
+        depths = [p.depth for p in pages]
+        assert depths == sorted(depths)
+        leaf = next(p for p in pages if p.url == "https://example.com/a/1")
+        assert (leaf.depth, leaf.parent) == (2, "https://example.com/a")
+
+    def test_follow_external_and_allowed_domains(self):
+        site = {**SITE, "https://other.com/x": []}
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch(site)):
+            external = list(
+                self._crawler(follow_external=True).crawl(["https://example.com"])
+            )
+            exact = list(
+                self._crawler(allowed_domains=["example.com"], max_depth=1).crawl(
+                    ["https://example.com"]
+                )
+            )
+        assert "https://other.com/x" in {p.url for p in external}
+        assert "https://other.com/x" not in {p.url for p in exact}
+
+    def test_errors_are_per_page(self):
+        site = {"https://example.com/": ["/missing", "/a"], "https://example.com/a": []}
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch(site)):
+            pages = {p.url: p for p in self._crawler().crawl(["https://example.com"])}
+        assert not pages["https://example.com/missing"].ok
+        assert isinstance(pages["https://example.com/missing"].error, ValueError)
+        assert pages["https://example.com/a"].ok
+
+    def test_non_json_body_is_a_page_error(self):
+        def fetch_result(self, tool_input):
+            return ZenrowsResult(content="<html></html>", url=tool_input["url"])
+
+        with patch.object(ZenrowsFetch, "fetch_result", fetch_result):
+            (page,) = self._crawler().crawl(["https://example.com"])
+        assert "Expected JSON" in str(page.error)
+
+    def test_keeps_requested_outputs(self):
+        calls = []
+        crawler = self._crawler(
+            max_depth=0, fetch_params={"outputs": "headings", "js_render": True}
+        )
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch(calls=calls)):
+            list(crawler.crawl(["https://example.com"]))
+        assert calls[0]["outputs"] == "headings,links"
+        assert calls[0]["js_render"] is True
+
+    def test_max_per_host_caps_concurrency(self):
+        site = {"https://example.com/": [f"/{i}" for i in range(8)]}
+        site.update({f"https://example.com/{i}": [] for i in range(8)})
+        lock, state = threading.Lock(), {"now": 0, "peak": 0}
+        inner = _fake_fetch(site)
+
+        def fetch_result(self, tool_input):
+            with lock:
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+            try:
+                time.sleep(0.01)
+                return inner(self, tool_input)
+            finally:
+                with lock:
+                    state["now"] -= 1
+
+        crawler = self._crawler(concurrency=8, max_per_host=2)
+        with patch.object(ZenrowsFetch, "fetch_result", fetch_result):
+            pages = list(crawler.crawl(["https://example.com"]))
+        assert len(pages) == 9
+        assert state["peak"] == 2
+
+    def test_stopping_early_resumes_later(self):
+        calls = []
+        fetch_result = _fake_fetch(calls=calls, delay=0.01)
+        with patch.object(ZenrowsFetch, "fetch_result", fetch_result):
+            crawler = self._crawler(concurrency=2)
+            iterator = crawler.crawl(["https://example.com"])
+            first = [next(iterator), next(iterator)]
+            iterator.close()
+            rest = list(crawler.crawl())
+        urls = [p.url for p in first + rest]
+        assert sorted(urls) == sorted(set(urls)) and len(urls) == 5
+        assert len(calls) == 5  # pages in flight at the stop weren't refetched
+
+    def test_bloom_filter_seen_set(self):
+        crawler = self._crawler(seen=BloomFilter(capacity=100))
+        with patch.object(ZenrowsFetch, "fetch_result", _fake_fetch()):
+            assert len(list(crawler.crawl(["https://example.com"]))) == 5
+
+    def test_rejects_bad_seed(self):
+        with pytest.raises(ValueError):
+            list(self._crawler().crawl(["not a url"]))
+
+    @pytest.mark.asyncio
+    async def test_astopping_early_resumes_later(self):
+        calls = []
+
+        async def afetch_result(self, tool_input):
+            await asyncio.sleep(0.01)
+            return _fake_fetch(calls=calls)(self, tool_input)
+
+        with patch.object(ZenrowsFetch, "afetch_result", afetch_result):
+            crawler = self._crawler(concurrency=2)
+            iterator = crawler.acrawl(["https://example.com"])
+            first = [await iterator.__anext__(), await iterator.__anext__()]
+            await iterator.aclose()
+            rest = [p async for p in crawler.acrawl()]
+        urls = [p.url for p in first + rest]
+        assert sorted(urls) == sorted(set(urls)) and len(urls) == 5
+        assert len(calls) == 5
+
+    def test_resumes_on_another_event_loop(self):
+        calls = []
+
+        async def afetch_result(self, tool_input):
+            await asyncio.sleep(0.01)
+            return _fake_fetch(calls=calls)(self, tool_input)
+
+        async def take(crawler, seeds=(), limit=None):
+            iterator, pages = crawler.acrawl(seeds), []
+            async for page in iterator:
+                pages.append(page)
+                if len(pages) == limit:
+                    break
+            await iterator.aclose()
+            return pages
+
+        with patch.object(ZenrowsFetch, "afetch_result", afetch_result):
+            crawler = self._crawler(concurrency=3)
+            first = asyncio.run(take(crawler, ["https://example.com"], limit=2))
+            rest = asyncio.run(take(crawler))
+        urls = [p.url for p in first + rest]
+        assert sorted(urls) == sorted(set(urls)) and len(urls) == 5
+
+    def test_crawl_resumed_by_acrawl(self):
+        calls = []
+        fetch_result = _fake_fetch(calls=calls, delay=0.05)
+
+        async def afetch_result(self, tool_input):
+            return fetch_result(self, tool_input)
+
+        async def rest(crawler):
+            return [p async for p in crawler.acrawl()]
+
+        with patch.object(ZenrowsFetch, "fetch_result", fetch_result), patch.object(
+            ZenrowsFetch, "afetch_result", afetch_result
+        ):
+            crawler = self._crawler(concurrency=2)
+            iterator = crawler.crawl(["https://example.com"])
+            first = [next(iterator), next(iterator)]
+            iterator.close()
+            assert crawler._carried
+            pages = first + asyncio.run(rest(crawler))
+        urls = [p.url for p in pages]
+        assert sorted(urls) == sorted(set(urls)) and len(urls) == 5
+        assert len(calls) == 5
+        assert crawler._frontier._in_flight == {}
+
+    def test_acrawl_resumed_by_crawl(self):
+        calls = []
+        fetch_result = _fake_fetch(calls=calls)
+
+        async def afetch_result(self, tool_input):
+            await asyncio.sleep(0.05)
+            return fetch_result(self, tool_input)
+
+        async def take(crawler, limit):
+            iterator = crawler.acrawl(["https://example.com"])
+            pages = [await iterator.__anext__() for _ in range(limit)]
+            await iterator.aclose()
+            return pages
+
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            with patch.object(ZenrowsFetch, "fetch_result", fetch_result), patch.object(
+                ZenrowsFetch, "afetch_result", afetch_result
+            ):
+                crawler = self._crawler(concurrency=2)
+                first = asyncio.run_coroutine_threadsafe(
+                    take(crawler, 2), loop
+                ).result(5)
+                assert crawler._acarried
+                pages = first + list(crawler.crawl())
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+        urls = [p.url for p in pages]
+        assert sorted(urls) == sorted(set(urls)) and len(urls) == 5
+        assert len(calls) == 5
+        assert crawler._frontier._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_acrawl(self):
+        async def afetch_result(self, tool_input):
+            return _fake_fetch()(self, tool_input)
+
+        with patch.object(ZenrowsFetch, "afetch_result", afetch_result):
+            pages = [p async for p in self._crawler().acrawl(["https://example.com"])]
+        assert len(pages) == 5
@@ -0,0 +1,199 @@
+"""Unit tests for timeouts and per-call deadline budgets."""
+
+import asyncio
+import io
+import json
+import time
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import (
+    DeadlineExceeded,
+    RetryPolicy,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsRateLimiter,
+    ZenrowsTimeouts,
+)
+from langchain_zenrows.zenrows_client import mapped_errors
+from langchain_zenrows.zenrows_deadline import (
+    call_deadline,
+    httpx_timeout,
+    remaining,
+    requests_timeout,
+)
+
+URL = "https://example.com/page"
+
+
+class RecordingSession(requests.Session):
+    """Answers GETs from a list of statuses, recording the ``timeout=``."""
+
+    def __init__(self, make_response, *statuses):
+        super().__init__()
+        self.make_response = make_response
+        self.statuses = list(statuses) or [200]
+        self.timeouts = []
+
+    def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        self.timeouts.append(timeout)
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return self.make_response(status, "page")
+
+
+def _fetch(session, **kwargs):
+    kwargs.setdefault("limiter", ZenrowsRateLimiter())
+    return ZenrowsFetch(zenrows_api_key="k", session=session, **kwargs)
+
+
+class TestTimeouts:
+    """`ZenrowsTimeouts` and the per-attempt ``timeout=``."""
+
+    def test_validation(self):
+        with pytest.raises(ValueError, match="read timeout must be positive"):
+            ZenrowsTimeouts(read=0)
+
+    def test_no_timeouts_by_default(self, make_response):
+        session = RecordingSession(make_response)
+        _fetch(session)._run(url=URL)
+        assert session.timeouts == [None]
+
+    def test_connect_and_read_passed(self, make_response):
+        session = RecordingSession(make_response)
+        _fetch(session, timeouts=ZenrowsTimeouts(connect=3, read=30))._run(url=URL)
+        assert session.timeouts == [(3, 30)]
+
+    def test_capped_at_what_is_left(self):
+        deadline = time.monotonic() + 5
+        connect, read = requests_timeout(ZenrowsTimeouts(connect=3, read=30), deadline)
+        assert connect == 3 and 4 < read <= 5
+
+    def test_httpx_timeout(self):
+        assert httpx_timeout(None, None) is httpx.USE_CLIENT_DEFAULT
+        timeout = httpx_timeout(ZenrowsTimeouts(connect=2, read=10), None)
+        assert (timeout.connect, timeout.read, timeout.write) == (2, 10, None)
+
+    def test_spent_deadline_raises(self):
+        with pytest.raises(DeadlineExceeded):
+            remaining(time.monotonic() - 1)
+
+
+class TestDeadline:
+    """The ``total`` budget and its sources."""
+
+    def test_none_without_budget(self):
+        assert call_deadline(None) is None
+        assert call_deadline(ZenrowsTimeouts(read=5)) is None
+
+    def test_total_sets_deadline(self):
+        deadline = call_deadline(ZenrowsTimeouts(total=10))
+        assert 9 < deadline - time.monotonic() <= 10
+
+    def test_run_config_budget(self, make_response):
+        session = RecordingSession(make_response)
+        tool = _fetch(session, timeouts=ZenrowsTimeouts(read=30))
+        tool.invoke({"url": URL}, config={"configurable": {"zenrows_timeout": 2}})
+        _, read = session.timeouts[0]
+        assert 1 < read <= 2
+
+    def test_run_config_wall_deadline(self, make_response):
+        session = RecordingSession(make_response)
+        config = {"configurable": {"zenrows_deadline": time.time() + 2}}
+        _fetch(session).invoke({"url": URL}, config=config)
+        connect, read = session.timeouts[0]
+        assert 1 < connect <= 2 and 1 < read <= 2
+
+    def test_spent_budget_fails_before_sending(self, make_response):
+        session = RecordingSession(make_response)
+        config = {"configurable": {"zenrows_deadline": time.time() - 1}}
+        with pytest.raises(ValueError, match="Request timed out"):
+            _fetch(session).invoke({"url": URL}, config=config)
+        assert session.timeouts == []
+
+    def test_stops_retries(self, make_response):
+        session = RecordingSession(make_response, 503)
+        policy = RetryPolicy(max_attempts=5, backoff_base=1, jitter=False)
+        tool = _fetch(
+            session, retry_policy=policy, timeouts=ZenrowsTimeouts(total=0.5)
+        )
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="503"):
+            tool._run(url=URL)
+        assert len(session.timeouts) == 1
+        assert time.monotonic() - started < 0.5
+
+    def test_bounds_limiter_wait(self, make_response):
+        session, limiter = RecordingSession(make_response), ZenrowsRateLimiter(1)
+        tool = _fetch(session, limiter=limiter, timeouts=ZenrowsTimeouts(total=0.2))
+        limiter.acquire()
+        started = time.monotonic()
+        try:
+            with pytest.raises(ValueError, match="Request timed out"):
+                tool._run(url=URL)
+            with pytest.raises(ValueError, match="Request timed out"):
+                tool.fetch_to(URL, io.BytesIO())
+        finally:
+            limiter.release()
+        assert session.timeouts == []
+        assert time.monotonic() - started < 1
+        assert limiter.in_flight == 0
+
+    def test_deadline_exceeded_is_mapped(self):
+        with pytest.raises(ValueError, match="Request timed out: .*deadline"):
+            with mapped_errors():
+                raise DeadlineExceeded("the call's deadline was exceeded")
+
+    def test_deadline_exceeded_not_retried(self):
+        error = DeadlineExceeded("the call's deadline was exceeded")
+        assert RetryPolicy().retry_reason(error) is None
+
+
+class TestAsync:
+    """The deadline cancels async requests wherever they are."""
+
+    @pytest.mark.asyncio
+    async def test_cancels_slow_request(self, mock_async_client):
+        async def handler(request):
+            await asyncio.sleep(5)
+            return httpx.Response(200, text="page")
+
+        client = mock_async_client(handler)
+        tool = ZenrowsFetch(
+            zenrows_api_key="k",
+            async_client=client,
+            limiter=ZenrowsRateLimiter(),
+            timeouts=ZenrowsTimeouts(total=0.1),
+        )
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request timed out"):
+            await tool._arun(url=URL)
+        await client.aclose()
+        assert time.monotonic() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_extract_fallback_shares_deadline(self, mock_async_client):
+        seen = []
+
+        async def handler(request):
+            seen.append(request.url.params.get("extract"))
+            if "extract" in request.url.params:
+                await asyncio.sleep(0.15)
+                return httpx.Response(402, json={"code": "AUTH010"})
+            await asyncio.sleep(5)
+            return httpx.Response(200, json={"title": "Widget"})
+
+        client = mock_async_client(handler)
+        tool = ZenrowsExtract(
+            zenrows_api_key="k",
+            async_client=client,
+            limiter=ZenrowsRateLimiter(),
+            timeouts=ZenrowsTimeouts(total=0.3),
+        )
+        started = time.monotonic()
+        with pytest.raises(ValueError, match="Request timed out"):
+            json.loads(await tool._arun(url=URL))
+        await client.aclose()
+        assert seen == ["auto", None]
+        assert time.monotonic() - started < 1
@@ -4,22 +4,13 @@ import json
 import os
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
-import requests
 from pydantic import ValidationError
 
 from langchain_zenrows import ZenrowsExtract, ZenrowsExtractInput
 
 
-def _http_error(status_code: int, body: str) -> requests.exceptions.HTTPError:
-    """Build an HTTPError carrying a fake response, matching what
-    `Response.raise_for_status()` raises."""
-    response = Mock()
-    response.status_code = status_code
-    response.text = body
-    return requests.exceptions.HTTPError(response=response)
-
-
 class TestZenrowsExtractInput:
     """Test the Pydantic input schema."""
 
@@ -76,7 +67,7 @@ class TestZenrowsExtract:
         tool = ZenrowsExtract(zenrows_api_key="test-key")
         assert tool.args_schema == ZenrowsExtractInput
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
     def test_run_defaults_extract_to_auto(self, mock_get):
         mock_response = Mock()
         mock_response.text = '{"parsed": {"name": "Widget"}, "html": "<html></html>"}'
@@ -91,7 +82,7 @@ class TestZenrowsExtract:
         assert params["extract"] == "auto"
         assert params["apikey"] == "test-key"
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
     def test_run_with_explicit_mode(self, mock_get):
         mock_response = Mock()
         mock_response.text = "{}"
@@ -103,7 +94,7 @@ class TestZenrowsExtract:
         params = mock_get.call_args[1]["params"]
         assert params["extract"] == "standard"
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
     def test_proxy_country_auto_enables_premium_proxy(self, mock_get):
         mock_response = Mock()
         mock_response.text = "{}"
@@ -128,10 +119,10 @@ class TestExtractAutoparseFallback:
     """AUTH010 (domain not enabled for Extract beta) -> retry with Autoparse,
     same behavior as the CLI's extract adapter."""
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
-    def test_falls_back_to_autoparse_on_auth010(self, mock_get):
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_falls_back_to_autoparse_on_auth010(self, mock_get, make_http_error):
         first_response = Mock()
-        first_response.raise_for_status.side_effect = _http_error(
+        first_response.raise_for_status.side_effect = make_http_error(
             402, '{"code": "AUTH010", "title": "Domain not enabled for Extract"}'
         )
 
@@ -155,10 +146,10 @@ class TestExtractAutoparseFallback:
         assert fallback_params.get("autoparse") is True
         assert "extract" not in fallback_params
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
-    def test_fallback_disabled_raises_instead(self, mock_get):
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_fallback_disabled_raises_instead(self, mock_get, make_http_error):
         response = Mock()
-        response.raise_for_status.side_effect = _http_error(
+        response.raise_for_status.side_effect = make_http_error(
             402, '{"code": "AUTH010"}'
         )
         mock_get.return_value = response
@@ -170,12 +161,12 @@ class TestExtractAutoparseFallback:
         # No fallback attempt made.
         assert mock_get.call_count == 1
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
-    def test_402_without_auth010_does_not_fall_back(self, mock_get):
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_402_without_auth010_does_not_fall_back(self, mock_get, make_http_error):
         """A real credits-exhausted 402 (e.g. AUTH004) must raise normally,
         not be mistaken for the domain-gating error."""
         response = Mock()
-        response.raise_for_status.side_effect = _http_error(
+        response.raise_for_status.side_effect = make_http_error(
             402, '{"code": "AUTH004", "title": "No credit available"}'
         )
         mock_get.return_value = response
@@ -190,7 +181,7 @@ class TestExtractAdaptiveStealth:
     default, so targets needing js_render/premium_proxy (e.g. Zoopla)
     escalate automatically instead of failing with REQS002."""
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
     def test_sends_adaptive_stealth_by_default(self, mock_get):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -203,7 +194,7 @@ class TestExtractAdaptiveStealth:
         params = mock_get.call_args[1]["params"]
         assert params["mode"] == "auto"
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
     def test_omits_wire_mode_when_disabled(self, mock_get):
         response = Mock()
         response.raise_for_status.return_value = None
@@ -216,10 +207,14 @@ class TestExtractAdaptiveStealth:
         params = mock_get.call_args[1]["params"]
         assert "mode" not in params
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
-    def test_fallback_request_also_carries_adaptive_stealth(self, mock_get):
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_fallback_request_also_carries_adaptive_stealth(
+        self, mock_get, make_http_error
+    ):
         first_response = Mock()
-        first_response.raise_for_status.side_effect = _http_error(402, '{"code": "AUTH010"}')
+        first_response.raise_for_status.side_effect = make_http_error(
+            402, '{"code": "AUTH010"}'
+        )
 
         second_response = Mock()
         second_response.raise_for_status.return_value = None
@@ -234,12 +229,12 @@ class TestExtractAdaptiveStealth:
         fallback_params = mock_get.call_args_list[1][1]["params"]
         assert fallback_params["mode"] == "auto"
 
-    @patch("langchain_zenrows.zenrows_extract.requests.get")
-    def test_no_fallback_for_non_auto_mode(self, mock_get):
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_no_fallback_for_non_auto_mode(self, mock_get, make_http_error):
         """AUTH010 shouldn't apply to native/standard modes - only auto is
         the domain-gated beta path."""
         response = Mock()
-        response.raise_for_status.side_effect = _http_error(
+        response.raise_for_status.side_effect = make_http_error(
             402, '{"code": "AUTH010"}'
         )
         mock_get.return_value = response
@@ -249,3 +244,62 @@ class TestExtractAdaptiveStealth:
             tool._run(url="https://example.com", extract="native")
 
         assert mock_get.call_count == 1
+
+
+class TestZenrowsExtractAsync:
+    """`_arun` mirrors `_run` on the async client, fallback included."""
+
+    @pytest.mark.asyncio
+    async def test_arun_returns_extract_response(self, mock_async_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, text='{"parsed": {}, "html": null}')
+
+        tool = ZenrowsExtract(zenrows_api_key="test-key")
+        with patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            result = await tool._arun(url="https://example.com")
+
+        assert result == '{"parsed": {}, "html": null}'
+        assert seen[0].url.params["extract"] == "auto"
+        assert seen[0].url.params["mode"] == "auto"
+
+    @pytest.mark.asyncio
+    async def test_arun_falls_back_to_autoparse_on_auth010(self, mock_async_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            if "extract" in request.url.params:
+                return httpx.Response(402, text='{"code": "AUTH010"}')
+            return httpx.Response(200, json={"title": "Widget"})
+
+        tool = ZenrowsExtract(zenrows_api_key="test-key")
+        with patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            result = await tool._arun(url="https://example.com")
+
+        data = json.loads(result)
+        assert data["extract_fallback"] == "autoparse"
+        assert data["parsed"] == {"title": "Widget"}
+        assert len(seen) == 2
+        assert seen[1].url.params["autoparse"] == "true"
+
+    @pytest.mark.asyncio
+    async def test_arun_402_without_auth010_raises(self, mock_async_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(402, text='{"code": "AUTH004"}')
+
+        tool = ZenrowsExtract(zenrows_api_key="test-key")
+        with patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            with pytest.raises(ValueError, match="HTTP error occurred: 402"):
+                await tool._arun(url="https://example.com")
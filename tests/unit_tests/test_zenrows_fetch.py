@@ -5,6 +5,7 @@ import os
 import warnings
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 from pydantic import ValidationError
 
@@ -71,7 +72,7 @@ class TestZenrowsFetch:
             warnings.simplefilter("error", DeprecationWarning)
             ZenrowsFetch(zenrows_api_key="test-key")
 
-    @patch("langchain_zenrows.zenrows_fetch.requests.get")
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
     def test_run_success_html_response(self, mock_get):
         mock_response = Mock()
         mock_response.text = "<html><body>Test content</body></html>"
@@ -86,7 +87,7 @@ class TestZenrowsFetch:
         assert call_args[1]["params"]["url"] == "https://example.com"
         assert call_args[1]["params"]["apikey"] == "test-key"
 
-    @patch("langchain_zenrows.zenrows_fetch.requests.get")
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
     def test_run_with_all_parameters(self, mock_get):
         mock_response = Mock()
         mock_response.text = "Test content"
@@ -121,7 +122,7 @@ class TestZenrowsFetch:
             mock_run.assert_called_once()
 
 
-@patch("langchain_zenrows.zenrows_fetch.requests.get")
+@patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
 class TestAdaptiveStealthMode:
     """Adaptive Stealth Mode (mode="auto") - Zenrows manages js_render/premium_proxy
     itself, so the client-side auto-enable heuristics must stay out of its way."""
@@ -167,3 +168,71 @@ class TestAdaptiveStealthMode:
         assert params["mode"] == "auto"
         assert params["screenshot_fullpage"] == "true"
         assert params["screenshot"] == "true"
+
+
+class TestZenrowsFetchAsync:
+    """`_arun` goes through the pooled async client, not the blocking `_run`."""
+
+    @pytest.mark.asyncio
+    async def test_arun_does_not_call_blocking_run(self, mock_async_client):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, text="<html>async</html>")
+
+        scraper = ZenrowsFetch(zenrows_api_key="test-key")
+        with patch.object(ZenrowsFetch, "_run") as mock_run, patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            result = await scraper._arun(url="https://example.com", wait_for=".x")
+
+        assert result == "<html>async</html>"
+        mock_run.assert_not_called()
+        params = seen[0].url.params
+        assert params["url"] == "https://example.com"
+        assert params["apikey"] == "test-key"
+        assert params["js_render"] == "true"
+
+    @pytest.mark.asyncio
+    async def test_arun_screenshot_returns_bytes(self, mock_async_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=b"\x89PNG...")
+
+        scraper = ZenrowsFetch(zenrows_api_key="test-key")
+        with patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            result = await scraper._arun(
+                url="https://example.com", screenshot_fullpage="true"
+            )
+
+        assert result == b"\x89PNG..."
+
+    @pytest.mark.asyncio
+    async def test_arun_maps_rate_limit_error(self, mock_async_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(429, text="too many")
+
+        scraper = ZenrowsFetch(zenrows_api_key="test-key")
+        with patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            with pytest.raises(ValueError, match="Rate limit exceeded"):
+                await scraper._arun(url="https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_arun_maps_timeout(self, mock_async_client):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("slow", request=request)
+
+        scraper = ZenrowsFetch(zenrows_api_key="test-key")
+        with patch(
+            "langchain_zenrows.zenrows_client.get_default_async_client",
+            return_value=mock_async_client(handler),
+        ):
+            with pytest.raises(ValueError, match="Request timed out"):
+                await scraper._arun(url="https://example.com")
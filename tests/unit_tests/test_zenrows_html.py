@@ -0,0 +1,174 @@
+"""Unit tests for local HTML post-processing."""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from langchain_zenrows import (
+    BinaryContent,
+    HtmlDocument,
+    InMemoryCache,
+    ZenrowsFetch,
+    ZenrowsResult,
+)
+
+PAGE = """<!doctype html>
+<html><head><title>Shop &amp; Co</title><style>p { color: red }</style></head>
+<body>
+  <h1>Widgets</h1>
+  <p>Our <b>best</b> widgets - see <a href="/w/1" title="a,b">the first</a>.<br>In stock
+  <p>Second <img src="img/w.png" alt="widget">
+  <ul><li>one<li>two<ul><li>nested</ul></ul>
+  <table>
+    <tr><th>Name<th>Price
+    <tr><td>Widget<td>9.99
+  </table>
+  <pre>  x = 1
+  y = 2</pre>
+  <div class="card featured" id="c1"><span data-sku="A1">Alpha</span></div>
+  <div class="card"><span data-sku="B2">Beta</span></div>
+  <a href="https://other.example.org/">elsewhere</a>
+  <a href="#top">top</a><a href="javascript:void(0)">js</a><a href="/w/1">again</a>
+  <script>document.write("hidden")</script>
+</body></html>"""
+
+BASE = "https://example.com/shop/"
+
+
+@pytest.fixture
+def page():
+    return HtmlDocument(PAGE, BASE)
+
+
+class TestViews:
+    def test_title(self, page):
+        assert page.title == "Shop & Co"
+
+    def test_markdown(self, page):
+        markdown = page.markdown
+        assert markdown.startswith("# Widgets\n\n")
+        assert "Our **best** widgets - see [the first](https://example.com/w/1)." in (
+            markdown
+        )
+        assert "![widget](https://example.com/shop/img/w.png)" in markdown
+        assert "- one\n- two\n  - nested" in markdown
+        assert "| Name | Price |\n| --- | --- |\n| Widget | 9.99 |" in markdown
+        assert "```\n  x = 1\n  y = 2\n```" in markdown
+        assert "hidden" not in markdown and "color" not in markdown
+
+    def test_text(self, page):
+        lines = page.text.split("\n")
+        assert lines[:3] == ["Widgets", "Our best widgets - see the first.", "In stock"]
+        assert "Name Price" in lines and "  x = 1" in lines
+        assert "hidden" not in page.text
+
+    def test_links(self, page):
+        assert page.links == [
+            "https://example.com/w/1",
+            "https://other.example.org/",
+        ]
+
+    def test_base_href(self):
+        page = HtmlDocument('<base href="/docs/"><a href="a">a</a>', BASE)
+        assert page.links == ["https://example.com/docs/a"]
+
+    def test_tables(self, page):
+        assert page.tables == [[["Name", "Price"], ["Widget", "9.99"]]]
+
+    def test_views_are_computed_once(self, page):
+        assert page.markdown is page.markdown
+        assert page.links is page.links
+        assert page.select("span") is page.select("span")
+
+    @pytest.mark.parametrize(
+        "html",
+        ["<span>x" * 1500, "<ul><li><a href='/a'>x" * 1000, "<pre><b>x" * 1500],
+        ids=["inline", "lists", "pre"],
+    )
+    def test_deep_nesting(self, html):
+        page = HtmlDocument(html, BASE)
+        assert page.text and page.markdown and page.links is not None
+        deepest = page.select("*")[-1]
+        depth = 0
+        while deepest.parent is not None:
+            deepest, depth = deepest.parent, depth + 1
+        assert depth <= 256
+
+
+class TestSelect:
+    @pytest.mark.parametrize(
+        "selector,expected",
+        [
+            ("span", ["Alpha", "Beta"]),
+            ("div.card.featured > span", ["Alpha"]),
+            ("#c1 span", ["Alpha"]),
+            ("[data-sku^=B]", ["Beta"]),
+            ('span[data-sku="A1"], h1', ["Widgets", "Alpha"]),
+            ("div + div span", ["Beta"]),
+            ("h1 ~ ul > li", ["one", "two nested"]),
+            ('a[title="a,b"], h1', ["Widgets", "the first"]),
+        ],
+    )
+    def test_selectors(self, page, selector, expected):
+        assert [el.text for el in page.select(selector)] == expected
+
+    @pytest.mark.parametrize("selector", ["li:first-child", "", "a,,b", "> a"])
+    def test_unsupported(self, page, selector):
+        with pytest.raises(ValueError, match="Unsupported CSS selector"):
+            page.select(selector)
+
+    def test_extract(self, page):
+        extracted = page.extract(
+            '{"title": "h1", "names": ".card span", "skus": "span @data-sku",'
+            ' "image": "img @src", "videos": "video"}'
+        )
+        assert extracted == {
+            "title": "Widgets",
+            "names": ["Alpha", "Beta"],
+            "skus": ["A1", "B2"],
+            "image": "https://example.com/shop/img/w.png",
+            "videos": [],
+        }
+
+    def test_extract_at_sign_in_attribute_value(self):
+        page = HtmlDocument('<a href="mailto:a@b.com">mail</a>', BASE)
+        assert page.extract({"m": 'a[href^="mailto:a@b"]'}) == {"m": "mail"}
+        assert page.extract({"m": 'a[href$="@b.com"] @href'}) == {
+            "m": "mailto:a@b.com"
+        }
+
+
+class TestResult:
+    def test_document_is_cached_on_the_result(self):
+        result = ZenrowsResult(content=PAGE, url=BASE, content_type="text/html")
+        assert result.document() is result.document()
+        assert "_document" not in result.metadata()
+
+    @pytest.mark.parametrize(
+        "content,content_type",
+        [
+            (BinaryContent(b"%PDF", "application/pdf"), None),
+            ('{"title": "Widgets"}', "application/json"),
+        ],
+    )
+    def test_rejects_non_html(self, content, content_type):
+        result = ZenrowsResult(content=content, content_type=content_type)
+        with pytest.raises(ValueError, match="isn't HTML"):
+            result.document()
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_one_fetch_many_views(self, mock_get):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = PAGE.encode()
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        mock_get.return_value = response
+
+        tool = ZenrowsFetch(zenrows_api_key="k", cache=InMemoryCache())
+        page = tool.fetch_result(BASE).document()
+        assert page.links and page.tables and page.markdown
+        # A later call for the same page is a cache hit, parsed locally again.
+        assert tool.fetch_result(BASE).document().title == "Shop & Co"
+        assert mock_get.call_count == 1
@@ -0,0 +1,123 @@
+"""Unit tests for the shared Zenrows HTTP transport."""
+
+import asyncio
+import urllib.request
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from langchain_zenrows import ZenrowsExtract, ZenrowsFetch
+from langchain_zenrows.zenrows_http import (
+    create_session,
+    get_default_async_client,
+    get_default_session,
+    error_code,
+    get_encoded,
+    header_float,
+    parse_retry_after,
+)
+
+
+class TestSession:
+    """The sync pool: one keep-alive session shared across tool instances."""
+
+    def test_default_session_is_shared(self):
+        assert get_default_session() is get_default_session()
+        for tool in (ZenrowsFetch, ZenrowsExtract):
+            client = tool(zenrows_api_key="k")._get_client()
+            assert client.get_session() is get_default_session()
+
+    def test_create_session_configures_adapter(self):
+        session = create_session(pool_maxsize=42, max_retries=5)
+        adapter = session.get_adapter("https://api.zenrows.com/v1/")
+        assert adapter._pool_maxsize == 42
+        assert adapter.max_retries.total == 5
+
+    def test_session_rejects_cookies(self):
+        """Shared across threads/tools, so it must not accumulate state."""
+        session = create_session()
+        cookie = requests.cookies.create_cookie("sid", "abc", domain="api.zenrows.com")
+        request = urllib.request.Request("https://api.zenrows.com/v1/")
+        assert not session.cookies._policy.set_ok(cookie, request)
+
+    def test_injected_session_is_used(self):
+        session = Mock(spec=requests.Session)
+        session.get.return_value = Mock(text="pooled")
+        scraper = ZenrowsFetch(zenrows_api_key="k", session=session)
+
+        assert scraper._run(url="https://example.com") == "pooled"
+        session.get.assert_called_once()
+
+
+class TestGetEncoded:
+    """Sending an already-encoded URL without requests re-quoting it."""
+
+    def test_url_sent_as_is_with_session_and_custom_headers(self):
+        session = create_session()
+        session.headers["X-Session"] = "1"
+        sent = []
+        session.send = lambda prepared, **kwargs: sent.append((prepared, kwargs))
+
+        url = "https://api.zenrows.com/v1/?apikey=k&url=https%3A%2F%2Fa.com%2F%7Ex"
+        get_encoded(session, url, {"Referer": "https://b.com"})
+
+        [(prepared, kwargs)] = sent
+        assert prepared.url == url
+        assert prepared.method == "GET"
+        assert prepared.headers["X-Session"] == "1"
+        assert prepared.headers["Referer"] == "https://b.com"
+        assert kwargs["allow_redirects"] is True
+
+
+class TestDefaultAsyncClient:
+    """The async pool is shared per event loop."""
+
+    @pytest.mark.asyncio
+    async def test_reused_within_a_loop(self):
+        assert get_default_async_client() is get_default_async_client()
+
+    def test_not_reused_across_loops(self):
+        async def grab():
+            return get_default_async_client()
+
+        first = asyncio.run(grab())
+        second = asyncio.run(grab())
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        client = get_default_async_client()
+        await client.aclose()
+        assert get_default_async_client() is not client
+
+    def test_outside_a_loop_raises(self):
+        with pytest.raises(RuntimeError):
+            get_default_async_client()
+
+
+class TestResponseHelpers:
+    """Reading Zenrows error envelopes and headers."""
+
+    @pytest.mark.parametrize(
+        "body,code",
+        [
+            ('{"code": "auth010"}', "AUTH010"),
+            ("<html>", None),
+            ("[1]", None),
+            (None, None),
+        ],
+    )
+    def test_error_code(self, body, code):
+        assert error_code(body) == code
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after(" 2.5 ") == 2.5
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+
+    def test_header_float(self):
+        headers = {"X-Request-Cost": "10", "X-Bad": "n/a"}
+        assert header_float(headers, "X-Request-Cost") == 10.0
+        assert header_float(headers, "X-Bad") is None
+        assert header_float(headers, "X-Missing") is None
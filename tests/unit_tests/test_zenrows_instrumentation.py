@@ -0,0 +1,301 @@
+"""Unit tests for the tools' instrumentation hooks."""
+
+import io
+import json
+from typing import Any, List, Tuple
+from unittest.mock import patch
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import (
+    RetryPolicy,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsInstrumentation,
+)
+from langchain_zenrows.zenrows_instrumentation import MultiInstrumentation
+
+
+class RecordingInstrumentation(ZenrowsInstrumentation):
+    def __init__(self):
+        self.events: List[Tuple[str, Any]] = []
+
+    def on_call_start(self, tool, url):
+        self.events.append(("start", (tool, url)))
+        return "token"
+
+    def on_prepared(self, token, params, seconds):
+        self.events.append(("prepared", params))
+
+    def on_attempt(self, token, event):
+        assert token == "token"
+        self.events.append(("attempt", event))
+
+    def on_autoparse_fallback(self, token):
+        self.events.append(("fallback", None))
+
+    def on_call_end(self, token, result, error):
+        self.events.append(("end", (result, error)))
+
+    def of(self, kind):
+        return [payload for k, payload in self.events if k == kind]
+
+
+@patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+class TestFetchHooks:
+    def test_successful_call(self, mock_get, make_response):
+        mock_get.return_value = make_response()
+        hooks = RecordingInstrumentation()
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=hooks)
+
+        scraper.invoke({"url": "https://example.com"})
+
+        assert [k for k, _ in hooks.events] == ["start", "prepared", "attempt", "end"]
+        assert hooks.of("start") == [("zenrows_fetch", "https://example.com")]
+        assert "apikey" not in hooks.of("prepared")[0]
+        (attempt,) = hooks.of("attempt")
+        assert attempt.status_code == 200
+        assert attempt.retry is False
+        assert attempt.bytes_received == len(b"<html></html>")
+        ((result, error),) = hooks.of("end")
+        assert error is None and result.content == "<html></html>"
+
+    def test_retries_and_429s_are_reported(self, mock_get, make_response):
+        mock_get.side_effect = [make_response(429), make_response()]
+        hooks = RecordingInstrumentation()
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k",
+            instrumentation=hooks,
+            retry_policy=RetryPolicy(backoff_base=0, jitter=False, respect_retry_after=False),
+        )
+
+        scraper.invoke({"url": "https://example.com"})
+
+        attempts = hooks.of("attempt")
+        assert [a.status_code for a in attempts] == [429, 200]
+        assert [a.retry for a in attempts] == [False, True]
+
+    def test_mapped_error_is_reported(self, mock_get):
+        mock_get.side_effect = requests.exceptions.Timeout()
+        hooks = RecordingInstrumentation()
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=hooks)
+
+        with pytest.raises(ValueError, match="timed out"):
+            scraper.invoke({"url": "https://example.com"})
+
+        (attempt,) = hooks.of("attempt")
+        assert attempt.status_code is None
+        assert isinstance(attempt.error, requests.exceptions.Timeout)
+        ((result, error),) = hooks.of("end")
+        assert result is None
+        assert isinstance(error, ValueError)
+        assert isinstance(error.__context__, requests.exceptions.Timeout)
+
+    def test_streamed_call(self, mock_get, make_response):
+        mock_get.return_value = make_response(content=b"x" * 3000)
+        hooks = RecordingInstrumentation()
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=hooks)
+
+        scraper.fetch_to("https://example.com", io.BytesIO(), chunk_size=1024)
+
+        assert [k for k, _ in hooks.events] == ["start", "attempt", "end"]
+        (attempt,) = hooks.of("attempt")
+        assert attempt.status_code == 200 and attempt.error is None
+        ((result, error),) = hooks.of("end")
+        assert error is None and result.bytes_received == 3000
+
+    def test_streamed_error_is_reported(self, mock_get, make_response):
+        mock_get.return_value = make_response(500)
+        hooks = RecordingInstrumentation()
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=hooks)
+
+        with pytest.raises(ValueError):
+            scraper.fetch_to("https://example.com", io.BytesIO())
+
+        ((result, error),) = hooks.of("end")
+        assert result is None and isinstance(error, ValueError)
+
+    def test_stream_closed_early_still_ends(self, mock_get, make_response):
+        mock_get.return_value = make_response(content=b"x" * 3000)
+        hooks = RecordingInstrumentation()
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=hooks)
+
+        chunks = scraper.iter_content("https://example.com", chunk_size=1024)
+        next(chunks)
+        chunks.close()
+
+        ((result, error),) = hooks.of("end")
+        assert error is None and result.bytes_received == 1024
+
+    def test_multi_instrumentation_fans_out(self, mock_get, make_response):
+        mock_get.return_value = make_response()
+        first, second = RecordingInstrumentation(), RecordingInstrumentation()
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k", instrumentation=MultiInstrumentation([first, second])
+        )
+
+        scraper.invoke({"url": "https://example.com"})
+
+        assert first.events and [k for k, _ in first.events] == [
+            k for k, _ in second.events
+        ]
+
+
+@patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+def test_extract_fallback_is_reported(mock_get, make_response):
+    mock_get.side_effect = [
+        make_response(402, json.dumps({"code": "AUTH010"})),
+        make_response(text=json.dumps({"title": "x"})),
+    ]
+    hooks = RecordingInstrumentation()
+    tool = ZenrowsExtract(zenrows_api_key="k", instrumentation=hooks)
+
+    tool.invoke({"url": "https://example.com"})
+
+    assert [k for k, _ in hooks.events] == [
+        "start",
+        "prepared",
+        "attempt",
+        "fallback",
+        "attempt",
+        "end",
+    ]
+    attempts = hooks.of("attempt")
+    assert [a.status_code for a in attempts] == [402, 200]
+    assert [a.retry for a in attempts] == [False, False]
+
+
+@pytest.mark.asyncio
+async def test_async_hooks(mock_async_client):
+    client = mock_async_client(lambda request: httpx.Response(200, text="ok"))
+    hooks = RecordingInstrumentation()
+    scraper = ZenrowsFetch(zenrows_api_key="k", async_client=client, instrumentation=hooks)
+
+    await scraper.ainvoke({"url": "https://example.com"})
+
+    assert [k for k, _ in hooks.events] == ["start", "prepared", "attempt", "end"]
+    assert hooks.of("attempt")[0].status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_hooks(mock_async_client):
+    client = mock_async_client(
+        lambda request: httpx.Response(200, content=b"x" * 3000)
+    )
+    hooks = RecordingInstrumentation()
+    scraper = ZenrowsFetch(
+        zenrows_api_key="k", async_client=client, instrumentation=hooks
+    )
+
+    await scraper.afetch_to("https://example.com", io.BytesIO(), chunk_size=1024)
+
+    assert [k for k, _ in hooks.events] == ["start", "attempt", "end"]
+    ((result, error),) = hooks.of("end")
+    assert error is None and result.bytes_received == 3000
+
+    chunks = scraper.aiter_content("https://example.com", chunk_size=1024)
+    await chunks.__anext__()
+    await chunks.aclose()
+    await client.aclose()
+    ((result, error),) = hooks.of("end")[1:]
+    assert error is None and result.bytes_received == 1024
+
+
+class TestOpenTelemetry:
+    @pytest.fixture
+    def otel(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+            InMemorySpanExporter,
+        )
+
+        from langchain_zenrows import OpenTelemetryInstrumentation
+
+        exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        instrumentation = OpenTelemetryInstrumentation(
+            tracer_provider=tracer_provider, meter_provider=meter_provider
+        )
+        return instrumentation, exporter, reader
+
+    @staticmethod
+    def _metrics(reader):
+        data = reader.get_metrics_data()
+        return {
+            metric.name: metric
+            for resource in data.resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_span_and_metrics(self, mock_get, otel, make_response):
+        instrumentation, exporter, reader = otel
+        mock_get.side_effect = [make_response(429), make_response()]
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k",
+            instrumentation=instrumentation,
+            retry_policy=RetryPolicy(backoff_base=0, jitter=False, respect_retry_after=False),
+        )
+
+        scraper.invoke({"url": "https://example.com"})
+
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "zenrows.zenrows_fetch"
+        assert span.attributes["zenrows.attempts"] == 2
+        assert span.attributes["http.response.status_code"] == 200
+        assert [e.name for e in span.events] == ["zenrows.attempt"] * 2
+
+        metrics = self._metrics(reader)
+        assert {
+            "zenrows.client.duration",
+            "zenrows.client.attempt.duration",
+            "zenrows.client.response.size",
+            "zenrows.client.retries",
+            "zenrows.client.rate_limited",
+        } <= set(metrics)
+        assert metrics["zenrows.client.rate_limited"].data.data_points[0].value == 1
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_span_is_current_during_the_call(self, mock_get, otel, make_response):
+        from opentelemetry import trace
+
+        instrumentation, exporter, _ = otel
+        current = []
+
+        def get(*args, **kwargs):
+            current.append(trace.get_current_span().get_span_context())
+            return make_response()
+
+        mock_get.side_effect = get
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=instrumentation)
+        scraper.invoke({"url": "https://example.com"})
+
+        (span,) = exporter.get_finished_spans()
+        assert current == [span.get_span_context()]
+        assert not trace.get_current_span().get_span_context().is_valid
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_error_sets_span_status(self, mock_get, otel, make_response):
+        from opentelemetry.trace import StatusCode
+
+        instrumentation, exporter, reader = otel
+        mock_get.return_value = make_response(401)
+        scraper = ZenrowsFetch(zenrows_api_key="k", instrumentation=instrumentation)
+
+        with pytest.raises(ValueError):
+            scraper.invoke({"url": "https://example.com"})
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code == StatusCode.ERROR
+        errors = self._metrics(reader)["zenrows.client.errors"]
+        assert errors.data.data_points[0].attributes["error.type"] == "HTTPError"
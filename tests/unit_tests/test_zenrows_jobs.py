@@ -0,0 +1,188 @@
+"""Unit tests for journaled, resumable batch jobs."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langchain_zenrows import (
+    JSONLJournal,
+    JournalRecord,
+    SQLiteJournal,
+    ZenrowsFetch,
+    ZenrowsJob,
+    ZenrowsJournal,
+)
+from langchain_zenrows.zenrows_jobs import job_item_key
+
+URLS = [f"https://example.com/{i}" for i in range(6)]
+
+
+class FakeTool:
+    """Stands in for a Zenrows tool; fails for URLs listed in ``failing``."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+
+    def invoke(self, tool_input):
+        self.calls.append(tool_input["url"])
+        if tool_input["url"] in self.failing:
+            raise ValueError("HTTP 503 error")
+        return f"<html>{tool_input['url']}</html>"
+
+    async def ainvoke(self, tool_input):
+        return self.invoke(tool_input)
+
+
+@pytest.fixture(params=["jsonl", "sqlite"])
+def make_journal(request, tmp_path):
+    def make():
+        if request.param == "jsonl":
+            return JSONLJournal(str(tmp_path / "journal.jsonl"))
+        return SQLiteJournal(str(tmp_path / "journal.sqlite3"))
+
+    return make
+
+
+class TestJob:
+    """Running, skipping and resuming."""
+
+    def test_journals_outputs_and_errors(self, make_journal):
+        with make_journal() as journal:
+            summary = ZenrowsJob(FakeTool(failing={URLS[2]}), journal).run(URLS)
+            records = list(journal.iter_records(include_failed=True))
+
+        assert (summary.total, summary.succeeded, summary.failed) == (6, 5, 1)
+        assert [r.index for r in records] == list(range(6))
+        assert records[0].output == f"<html>{URLS[0]}</html>"
+        assert records[2].error == "ValueError: HTTP 503 error"
+
+    def test_rerun_skips_finished_and_retries_failed(self, make_journal):
+        with make_journal() as journal:
+            ZenrowsJob(FakeTool(failing={URLS[2]}), journal).run(URLS)
+
+        tool = FakeTool()
+        with make_journal() as journal:
+            summary = ZenrowsJob(tool, journal).run(URLS)
+            statuses = journal.statuses()
+
+        assert tool.calls == [URLS[2]]
+        assert (summary.skipped, summary.succeeded) == (5, 1)
+        assert set(statuses.values()) == {"ok"}
+
+    def test_retry_failed_off_leaves_failures(self, make_journal):
+        with make_journal() as journal:
+            ZenrowsJob(FakeTool(failing={URLS[2]}), journal).run(URLS)
+            tool = FakeTool()
+            ZenrowsJob(tool, journal, retry_failed=False).run(URLS)
+        assert tool.calls == []
+
+    def test_resume_after_interruption(self, make_journal):
+        with make_journal() as journal:
+            iterator = ZenrowsJob(FakeTool(), journal, concurrency=1).iter_run(URLS)
+            first = [next(iterator), next(iterator)]
+            iterator.close()
+
+        tool = FakeTool()
+        with make_journal() as journal:
+            ZenrowsJob(tool, journal).run(URLS)
+            assert len(journal.statuses()) == 6
+        assert not {r.input["url"] for r in first} & set(tool.calls)
+
+    def test_same_input_in_any_form_runs_once(self, make_journal):
+        tool = FakeTool()
+        inputs = [URLS[0], {"url": URLS[0]}, URLS[1]]
+        with make_journal() as journal:
+            summary = ZenrowsJob(tool, journal).run(inputs)
+        assert tool.calls == URLS[:2]
+        assert summary.skipped == 1
+        assert job_item_key(URLS[0]) == job_item_key({"url": URLS[0]})
+
+    def test_results_keep_original_index(self, make_journal):
+        with make_journal() as journal:
+            ZenrowsJob(FakeTool(), journal).run(URLS[:3])
+            results = list(ZenrowsJob(FakeTool(), journal).iter_run(URLS))
+        assert sorted(r.index for r in results) == [3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_arun(self, make_journal):
+        with make_journal() as journal:
+            summary = await ZenrowsJob(FakeTool(), journal).arun(URLS)
+            assert summary.succeeded == 6
+            assert len(journal.statuses()) == 6
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_with_fetch_tool(self, mock_get, make_journal):
+        mock_get.return_value = Mock(text="<html>ok</html>", status_code=200, headers={})
+        with make_journal() as journal:
+            job = ZenrowsJob(ZenrowsFetch(zenrows_api_key="k"), journal)
+            assert job.run(URLS[:2]).succeeded == 2
+            assert [r.output for r in journal.iter_records()] == ["<html>ok</html>"] * 2
+
+
+class TestJournal:
+    """Storage details."""
+
+    def test_bytes_and_json_outputs_round_trip(self, make_journal):
+        with make_journal() as journal:
+            journal.append(JournalRecord("a", 0, {"url": "u"}, "ok", output=b"\x89PNG"))
+            journal.append(JournalRecord("b", 1, {"url": "v"}, "ok", output={"x": 1}))
+            outputs = [r.output for r in journal.iter_records()]
+        assert outputs == [b"\x89PNG", {"x": 1}]
+
+    def test_later_record_supersedes(self, make_journal):
+        with make_journal() as journal:
+            journal.append(JournalRecord("a", 0, {"url": "u"}, "error", error="boom"))
+            journal.append(JournalRecord("a", 0, {"url": "u"}, "ok", output="fine"))
+            records = list(journal.iter_records(include_failed=True))
+        assert [(r.status, r.output) for r in records] == [("ok", "fine")]
+
+    def test_journal_must_implement_every_method(self):
+        class AppendOnly(ZenrowsJournal):
+            def append(self, record):
+                pass
+
+        with pytest.raises(TypeError, match="abstract"):
+            AppendOnly()
+
+    def test_jsonl_ignores_torn_line(self, tmp_path):
+        path = tmp_path / "journal.jsonl"
+        with JSONLJournal(str(path)) as journal:
+            journal.append(JournalRecord("a", 0, {"url": "u"}, "ok", output="x"))
+        with open(path, "a") as f:
+            f.write('{"key": "b", "index": 1, "inp')  # crash mid-write
+        with JSONLJournal(str(path)) as journal:
+            journal.append(JournalRecord("c", 2, {"url": "w"}, "ok", output="z"))
+            assert journal.statuses() == {"a": "ok", "c": "ok"}
+
+
+class TestCompact:
+    """Shard output."""
+
+    def test_jsonl_shards(self, make_journal, tmp_path):
+        with make_journal() as journal:
+            ZenrowsJob(FakeTool(failing={URLS[1]}), journal).run(URLS)
+            paths = journal.compact(str(tmp_path / "out"), shard_size=2)
+
+        assert [p.rsplit("/", 1)[1] for p in paths] == [
+            "part-00000.jsonl",
+            "part-00001.jsonl",
+            "part-00002.jsonl",
+        ]
+        rows = [json.loads(line) for p in paths for line in open(p)]
+        assert [row["index"] for row in rows] == [0, 2, 3, 4, 5]
+
+    def test_parquet_shards(self, make_journal, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        with make_journal() as journal:
+            journal.append(JournalRecord("a", 0, {"url": "u"}, "ok", output="text"))
+            journal.append(JournalRecord("b", 1, {"url": "v"}, "ok", output=b"\x00"))
+            (path,) = journal.compact(str(tmp_path / "out"), format="parquet")
+        table = pq.read_table(path).to_pydict()
+        assert table["output"] == ["text", None]
+        assert table["output_bytes"] == [None, b"\x00"]
+
+    def test_rejects_unknown_format(self, make_journal, tmp_path):
+        with make_journal() as journal, pytest.raises(ValueError):
+            journal.compact(str(tmp_path), format="csv")
@@ -0,0 +1,234 @@
+"""Unit tests for spreading requests over several API keys."""
+
+import json
+from collections import Counter
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import ZenrowsExtract, ZenrowsFetch, ZenrowsKeyPool
+
+
+def _learn_limit(pool, key, limit):
+    lease = pool._acquire()
+    while lease.key != key:
+        pool._release(lease, None)
+        lease = pool._acquire()
+    lease.limiter.observe(200, {"Concurrency-Limit": str(limit)})
+    pool._release(lease, None)
+
+
+class TestSelection:
+    """Which key a request gets."""
+
+    def test_equal_keys_round_robin(self, make_response):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        keys = []
+        for _ in range(4):
+            lease = pool._acquire()
+            keys.append(lease.key)
+            pool._release(lease, make_response())
+        assert Counter(keys) == {"key-a": 2, "key-b": 2}
+
+    def test_in_flight_spread_by_weight(self):
+        pool = ZenrowsKeyPool({"key-a": 2, "key-b": 1})
+        held = [pool._acquire().key for _ in range(6)]
+        assert Counter(held) == {"key-a": 4, "key-b": 2}
+
+    def test_in_flight_spread_by_learned_limits(self):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        _learn_limit(pool, "key-a", 10)
+        _learn_limit(pool, "key-b", 5)
+        held = [pool._acquire().key for _ in range(15)]
+        assert Counter(held) == {"key-a": 10, "key-b": 5}
+
+    def test_evicted_key_skipped_until_cooldown_ends(self):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        pool.evict("key-a", seconds=60)
+        assert {pool._acquire().key for _ in range(3)} == {"key-b"}
+        pool.restore("key-a")
+        assert "key-a" in {pool._acquire().key for _ in range(3)}
+
+    def test_all_evicted_uses_first_back(self):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        pool.evict("key-a", seconds=60)
+        pool.evict("key-b", seconds=10)
+        assert pool._acquire().key == "key-b"
+
+    def test_validates_keys(self):
+        with pytest.raises(ValueError):
+            ZenrowsKeyPool([])
+        with pytest.raises(ValueError):
+            ZenrowsKeyPool({"key-a": 0})
+        assert len(ZenrowsKeyPool("single-key")) == 1
+
+
+class TestEviction:
+    """Which responses take a key out of rotation."""
+
+    @pytest.mark.parametrize(
+        "status,body,evicted",
+        [
+            (401, "", True),
+            (402, '{"code": "AUTH002"}', True),
+            (402, '{"code": "AUTH010"}', False),
+            (429, "", True),
+            (404, "", False),
+            (503, "", False),
+        ],
+    )
+    def test_statuses(self, status, body, evicted, make_response):
+        pool = ZenrowsKeyPool(["key-a"])
+        lease = pool._acquire()
+        assert pool._release(lease, make_response(status, body)) is evicted
+        assert (pool.snapshot()[0]["cooling_down_seconds"] > 0) is evicted
+
+    def test_429_honors_retry_after(self, make_response):
+        pool = ZenrowsKeyPool(["key-a"], rate_limit_cooldown=1)
+        response = make_response(429, headers={"Retry-After": "120"})
+        pool._release(pool._acquire(), response)
+        assert pool.snapshot()[0]["cooling_down_seconds"] > 100
+
+    def test_usage_tracked(self, make_response):
+        pool = ZenrowsKeyPool(["abcdefgh-1234"])
+        pool._release(pool._acquire(), make_response(headers={"X-Request-Cost": "5"}))
+        pool._release(pool._acquire(), make_response(404))
+        pool._release(pool._acquire(), None)
+        (stats,) = pool.snapshot()
+        assert stats["key"] == "...1234"
+        assert stats["requests"] == 3
+        assert stats["successes"] == 1 and stats["failures"] == 2
+        assert stats["credits"] == 5.0
+        assert stats["status_codes"] == {"404": 1}
+        assert stats["in_flight"] == 0
+
+
+class TestCall:
+    """Failover across keys."""
+
+    def test_fails_over_to_next_key(self, make_response, make_http_error):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        used = []
+
+        def attempt(lease):
+            used.append(lease.key)
+            if len(used) == 1:
+                raise make_http_error(429)
+            return make_response()
+
+        assert pool.call(attempt).status_code == 200
+        assert len(set(used)) == 2
+
+    def test_raises_once_every_key_tried(self, make_http_error):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        used = []
+
+        def attempt(lease):
+            used.append(lease.key)
+            raise make_http_error(401)
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            pool.call(attempt)
+        assert sorted(used) == ["key-a", "key-b"]
+
+    def test_non_evicting_errors_are_not_failed_over(self, make_http_error):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        used = []
+
+        def attempt(lease):
+            used.append(lease.key)
+            raise make_http_error(402, '{"code": "AUTH010"}')
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            pool.call(attempt)
+        assert len(used) == 1
+
+    @pytest.mark.asyncio
+    async def test_acall(self, make_response, make_http_error):
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        used = []
+
+        async def attempt(lease):
+            used.append(lease.key)
+            if len(used) == 1:
+                raise make_http_error(402, '{"code": "AUTH002"}')
+            return make_response()
+
+        await pool.acall(attempt)
+        assert len(set(used)) == 2
+
+
+def _query(url):
+    return dict(parse_qsl(urlsplit(url).query))
+
+
+class TestTools:
+    """Tools driven by a key pool."""
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_fetch_fails_over(self, mock_get, monkeypatch, make_response):
+        monkeypatch.delenv("ZENROWS_API_KEY", raising=False)
+        mock_get.side_effect = lambda url, params, **kw: (
+            make_response(401)
+            if params["apikey"] == "revoked"
+            else make_response(text="page")
+        )
+        pool = ZenrowsKeyPool(["revoked", "good-key"])
+        tool = ZenrowsFetch(key_pool=pool)
+
+        assert [tool._run(url="https://example.com") for _ in range(3)] == ["page"] * 3
+        keys = [c.kwargs["params"]["apikey"] for c in mock_get.call_args_list]
+        assert keys.count("revoked") == 1
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.send")
+    def test_template_adds_pool_key(self, mock_send, make_response):
+        mock_send.return_value = make_response()
+        tool = ZenrowsFetch(key_pool=ZenrowsKeyPool(["pool-key"]))
+        tool.template(js_render=True).fetch("https://example.com")
+        sent = _query(mock_send.call_args.args[0].url)
+        assert sent["apikey"] == "pool-key" and sent["js_render"] == "true"
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_streaming_uses_pool_key(self, mock_get, make_response):
+        response = make_response(content=b"ab")
+        mock_get.return_value = response
+        pool = ZenrowsKeyPool(["pool-key"])
+        tool = ZenrowsFetch(key_pool=pool)
+
+        assert b"".join(tool.iter_content("https://example.com")) == b"ab"
+        assert mock_get.call_args.kwargs["params"]["apikey"] == "pool-key"
+        assert pool.snapshot()[0]["successes"] == 1
+
+    def test_extract_auth010_keeps_key(self, make_response):
+        class FakeSession(requests.Session):
+            def get(self, url, params=None, **kwargs):
+                if "extract" in params:
+                    return make_response(402, json.dumps({"code": "AUTH010"}))
+                body = {"parsed": {"title": "Widget"}, "html": "<html></html>"}
+                return make_response(text=json.dumps(body))
+
+        pool = ZenrowsKeyPool(["key-a", "key-b"])
+        tool = ZenrowsExtract(key_pool=pool, session=FakeSession())
+        output = json.loads(tool._run(url="https://example.com"))
+        assert output["extract_fallback"] == "autoparse"
+        assert all(s["evictions"] == 0 for s in pool.snapshot())
+
+    @pytest.mark.asyncio
+    async def test_async_fetch_fails_over(self, mock_async_client):
+        def handler(request):
+            if request.url.params["apikey"] == "exhausted":
+                return httpx.Response(402, json={"code": "AUTH002"})
+            return httpx.Response(200, text="page")
+
+        client = mock_async_client(handler)
+        pool = ZenrowsKeyPool(["exhausted", "good-key"])
+        tool = ZenrowsFetch(key_pool=pool, async_client=client)
+        results = [await tool._arun(url="https://example.com") for _ in range(3)]
+        await client.aclose()
+
+        assert results == ["page"] * 3
+        by_key = {s["key"]: s for s in pool.snapshot()}
+        assert by_key["...sted"]["evictions"] == 1
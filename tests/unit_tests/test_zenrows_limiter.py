@@ -0,0 +1,185 @@
+"""Unit tests for the client-side concurrency / rate limiter."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from langchain_zenrows import (
+    DeadlineExceeded,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsRateLimiter,
+)
+from langchain_zenrows.zenrows_limiter import get_default_limiter
+
+
+class TestConcurrency:
+    """The semaphore side of the limiter."""
+
+    def test_blocks_at_limit_until_release(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=1)
+        limiter.acquire()
+        acquired = threading.Event()
+
+        def second():
+            limiter.acquire()
+            acquired.set()
+
+        thread = threading.Thread(target=second)
+        thread.start()
+        assert not acquired.wait(0.05)
+        limiter.release()
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_unbounded_by_default(self):
+        limiter = ZenrowsRateLimiter()
+        for _ in range(50):
+            limiter.acquire()
+        assert limiter.in_flight == 50
+
+    def test_slot_binds_wait_time(self):
+        limiter = ZenrowsRateLimiter()
+        with limiter.slot() as waited:
+            assert waited >= 0
+            assert limiter.in_flight == 1
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_respect_limit(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=2)
+        state = {"now": 0, "peak": 0}
+
+        async def job():
+            async with limiter.aslot():
+                state["now"] += 1
+                state["peak"] = max(state["peak"], state["now"])
+                await asyncio.sleep(0.01)
+                state["now"] -= 1
+
+        await asyncio.gather(*(job() for _ in range(10)))
+        assert state["peak"] == 2
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=1)
+        await limiter.aacquire()
+        waiter = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+        assert limiter.in_flight == 0
+
+
+    def test_timeout_bounds_wait(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=1)
+        limiter.acquire()
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire(timeout=0.05)
+        assert 0.04 < time.monotonic() - started < 1
+        assert limiter.in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_async_timeout_bounds_wait(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=1)
+        await limiter.aacquire()
+        with pytest.raises(DeadlineExceeded):
+            await limiter.aacquire(timeout=0.05)
+        limiter.release()
+        assert limiter.in_flight == 0
+        await limiter.aacquire(timeout=0.05)
+
+class TestAdaptation:
+    """Learning the plan's concurrency from response headers."""
+
+    def test_adopts_concurrency_limit_header(self):
+        limiter = ZenrowsRateLimiter()
+        limiter.observe(200, {"Concurrency-Limit": "25"})
+        assert limiter.concurrency_limit == 25
+
+    def test_remaining_accounts_for_other_consumers(self):
+        limiter = ZenrowsRateLimiter()
+        for _ in range(4):
+            limiter.acquire()
+        # 25-slot plan, 6 free, 4 of the 19 used are ours -> our share is 10.
+        limiter.observe(200, {"Concurrency-Limit": "25", "Concurrency-Remaining": "6"})
+        assert limiter.concurrency_limit == 10
+
+    def test_never_exceeds_max_concurrency(self):
+        limiter = ZenrowsRateLimiter(max_concurrency=5)
+        limiter.observe(200, {"Concurrency-Limit": "100"})
+        assert limiter.concurrency_limit == 5
+
+    def test_429_halves_limit(self):
+        limiter = ZenrowsRateLimiter()
+        limiter.observe(200, {"Concurrency-Limit": "20"})
+        limiter.observe(429, {})
+        assert limiter.concurrency_limit == 10
+
+    def test_non_adaptive_ignores_headers(self):
+        limiter = ZenrowsRateLimiter(adaptive=False)
+        limiter.observe(200, {"Concurrency-Limit": "3"})
+        limiter.observe(429, {})
+        assert limiter.concurrency_limit is None
+
+    def test_malformed_headers_ignored(self):
+        limiter = ZenrowsRateLimiter()
+        limiter.observe(200, {"Concurrency-Limit": "lots"})
+        limiter.observe(200, Mock())
+        assert limiter.concurrency_limit is None
+
+
+class TestTokenBucket:
+    """The requests-per-second side of the limiter."""
+
+    def test_burst_then_paced(self):
+        limiter = ZenrowsRateLimiter(requests_per_second=20, burst=2)
+        started = time.monotonic()
+        for _ in range(4):
+            limiter.acquire()
+            limiter.release()
+        # 2 free from the burst, then 2 more at 20/s -> ~0.1s.
+        assert time.monotonic() - started >= 0.09
+
+    def test_delay_past_timeout_fails_at_once(self):
+        limiter = ZenrowsRateLimiter(requests_per_second=1, burst=1)
+        limiter.acquire()
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            limiter.acquire(timeout=0.5)
+        assert time.monotonic() - started < 0.1
+
+    def test_rejects_bad_config(self):
+        with pytest.raises(ValueError):
+            ZenrowsRateLimiter(requests_per_second=0)
+        with pytest.raises(ValueError):
+            ZenrowsRateLimiter(max_concurrency=0)
+
+
+class TestToolIntegration:
+    """Tools route every request through the limiter."""
+
+    def test_default_limiter_is_shared(self):
+        for tool in (ZenrowsFetch, ZenrowsExtract):
+            client = tool(zenrows_api_key="k")._get_client()
+            assert client.get_limiter() is get_default_limiter()
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_fetch_observes_headers_and_releases(self, mock_get):
+        mock_get.return_value = Mock(
+            text="ok", status_code=200, headers={"Concurrency-Limit": "7"}
+        )
+        limiter = ZenrowsRateLimiter()
+        scraper = ZenrowsFetch(zenrows_api_key="k", limiter=limiter)
+
+        scraper._run(url="https://example.com")
+
+        assert limiter.concurrency_limit == 7
+        assert limiter.in_flight == 0
@@ -0,0 +1,96 @@
+"""Unit tests for the ZenrowsLoader document loader."""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from langchain_zenrows import ZenrowsFetch, ZenrowsLoader, ZenrowsResult
+
+
+def _fetch_result(calls=None, failing=(), delays=None):
+    def fetch_result(self, tool_input):
+        if calls is not None:
+            calls.append(tool_input)
+        url = tool_input["url"]
+        time.sleep((delays or {}).get(url, 0))
+        if url in failing:
+            raise ValueError("HTTP 404 error")
+        return ZenrowsResult(
+            content=f"# {url}",
+            url=url,
+            status_code=200,
+            content_type="text/markdown",
+            total_seconds=0.5,
+        )
+
+    return fetch_result
+
+
+class TestZenrowsLoader:
+    """Streaming Documents from Zenrows."""
+
+    def _loader(self, urls, **kwargs):
+        return ZenrowsLoader(urls, fetch=ZenrowsFetch(zenrows_api_key="k"), **kwargs)
+
+    def test_defaults_to_markdown_with_metadata(self):
+        calls = []
+        with patch.object(ZenrowsFetch, "fetch_result", _fetch_result(calls)):
+            (doc,) = self._loader("https://example.com").load()
+
+        assert calls == [{"response_type": "markdown", "url": "https://example.com"}]
+        assert doc.page_content == "# https://example.com"
+        assert doc.metadata["source"] == "https://example.com"
+        assert doc.metadata["status_code"] == 200
+        assert doc.metadata["total_seconds"] == 0.5
+        assert "final_url" not in doc.metadata  # None values are dropped
+
+    def test_per_page_params_override_defaults(self):
+        calls = []
+        loader = self._loader(
+            [{"url": "https://a.com", "response_type": "plaintext"}, "https://b.com"],
+            params={"response_type": "markdown", "js_render": True},
+        )
+        with patch.object(ZenrowsFetch, "fetch_result", _fetch_result(calls)):
+            loader.load()
+        by_url = {c["url"]: c for c in calls}
+        assert by_url["https://a.com"]["response_type"] == "plaintext"
+        assert by_url["https://b.com"]["js_render"] is True
+
+    def test_lazy_load_streams_in_completion_order(self):
+        urls = ["https://slow.com", "https://fast.com"]
+        delays = {"https://slow.com": 0.1}
+        with patch.object(ZenrowsFetch, "fetch_result", _fetch_result(delays=delays)):
+            sources = [d.metadata["source"] for d in self._loader(urls).lazy_load()]
+        assert sources == ["https://fast.com", "https://slow.com"]
+
+    def test_failures_skipped_and_recorded(self):
+        urls = ["https://a.com", "https://gone.com"]
+        loader = self._loader(urls)
+        failing = {"https://gone.com"}
+        with patch.object(ZenrowsFetch, "fetch_result", _fetch_result(failing=failing)):
+            docs = loader.load()
+        assert [d.metadata["source"] for d in docs] == ["https://a.com"]
+        assert [f.input for f in loader.failures] == ["https://gone.com"]
+
+    def test_raises_when_not_continuing(self):
+        loader = self._loader(["https://gone.com"], continue_on_failure=False)
+        failing = {"https://gone.com"}
+        with patch.object(ZenrowsFetch, "fetch_result", _fetch_result(failing=failing)):
+            with pytest.raises(ValueError, match="404"):
+                loader.load()
+
+    def test_requires_api_key_without_tool(self, monkeypatch):
+        monkeypatch.delenv("ZENROWS_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="API key"):
+            ZenrowsLoader("https://example.com")
+
+    @pytest.mark.asyncio
+    async def test_alazy_load(self):
+        async def afetch_result(self, tool_input):
+            return _fetch_result()(self, tool_input)
+
+        loader = self._loader(["https://a.com", "https://b.com"])
+        with patch.object(ZenrowsFetch, "afetch_result", afetch_result):
+            docs = [doc async for doc in loader.alazy_load()]
+        assert {d.metadata["source"] for d in docs} == {"https://a.com", "https://b.com"}
@@ -0,0 +1,232 @@
+"""Unit tests for request / response middleware."""
+
+import json
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import (
+    InMemoryCache,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsMiddleware,
+)
+
+URL = "https://example.com/page"
+
+
+class RecordingSession(requests.Session):
+    """Answers every GET with 200, recording what was sent."""
+
+    def __init__(self, make_response):
+        super().__init__()
+        self.make_response = make_response
+        self.sent = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.sent.append({"params": params, "headers": headers})
+        return self.make_response(text="page")
+
+
+class TenantHeader(ZenrowsMiddleware):
+    def on_request(self, request):
+        request.headers["X-Tenant"] = "acme"
+
+
+class BlockDomains(ZenrowsMiddleware):
+    def on_request(self, request):
+        if urlsplit(request.url).hostname == "blocked.example.com":
+            return request.respond(403, "blocked by policy")
+
+
+class Upper(ZenrowsMiddleware):
+    def on_response(self, request, response):
+        return request.respond(200, response.text.upper())
+
+
+class Recorder(ZenrowsMiddleware):
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def on_request(self, request):
+        self.log.append(f"{self.name}:request")
+
+    def on_response(self, request, response):
+        self.log.append(f"{self.name}:response")
+        return response
+
+
+def _fetch(session, middleware, **kwargs):
+    return ZenrowsFetch(
+        zenrows_api_key="k", session=session, middleware=middleware, **kwargs
+    )
+
+
+class TestSync:
+    """The chain on the sync path."""
+
+    def test_injects_headers(self, make_response):
+        session = RecordingSession(make_response)
+        _fetch(session, [TenantHeader()])._run(url=URL)
+        assert session.sent[0]["headers"] == {"X-Tenant": "acme"}
+
+    def test_runs_in_order(self, make_response):
+        log = []
+        middleware = [Recorder("outer", log), Recorder("inner", log)]
+        _fetch(RecordingSession(make_response), middleware)._run(url=URL)
+        assert log == [
+            "outer:request",
+            "inner:request",
+            "inner:response",
+            "outer:response",
+        ]
+
+    def test_short_circuit_error(self, make_response):
+        session = RecordingSession(make_response)
+        tool = _fetch(session, [BlockDomains()])
+        with pytest.raises(ValueError, match="403 - blocked by policy"):
+            tool._run(url="https://blocked.example.com/")
+        assert session.sent == []
+
+    def test_short_circuit_response(self, make_response):
+        class Canned(ZenrowsMiddleware):
+            def on_request(self, request):
+                return request.respond(200, "canned")
+
+        result = _fetch(RecordingSession(make_response), [Canned()]).fetch_result(URL)
+        assert result.content == "canned"
+        assert result.status_code == 200
+
+    def test_rewrites_response(self, make_response):
+        session = RecordingSession(make_response)
+        assert _fetch(session, [Upper()])._run(url=URL) == "PAGE"
+
+    def test_wrapping_handler(self, make_response):
+        class Audit(ZenrowsMiddleware):
+            def __init__(self):
+                self.seen = []
+
+            def handle(self, request, call_next):
+                response = call_next(request)
+                self.seen.append((request.url, response.status_code))
+                return response
+
+        audit = Audit()
+        _fetch(RecordingSession(make_response), [audit])._run(url=URL)
+        assert audit.seen == [(URL, 200)]
+
+    def test_params_edits_are_sent(self, make_response):
+        class Country(ZenrowsMiddleware):
+            def on_request(self, request):
+                request.params["proxy_country"] = "de"
+
+        session = RecordingSession(make_response)
+        _fetch(session, [Country()])._run(url=URL)
+        assert session.sent[0]["params"]["proxy_country"] == "de"
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.send")
+    def test_template_params_edit_drops_encoded_url(self, mock_send, make_response):
+        class Country(ZenrowsMiddleware):
+            def on_request(self, request):
+                request.params["proxy_country"] = "de"
+
+        mock_send.return_value = make_response(text="page")
+        tool = ZenrowsFetch(zenrows_api_key="k", middleware=[Country()])
+        tool.template(premium_proxy=True).fetch(URL)
+        query = dict(parse_qsl(urlsplit(mock_send.call_args.args[0].url).query))
+        assert query["proxy_country"] == "de" and query["url"] == URL
+
+    def test_cache_hits_skip_the_chain(self, make_response):
+        log = []
+        session = RecordingSession(make_response)
+        tool = _fetch(session, [Recorder("m", log)], cache=InMemoryCache())
+        tool._run(url=URL)
+        tool._run(url=URL)
+        assert log == ["m:request", "m:response"]
+
+    def test_empty_chain_is_skipped(self, make_response):
+        with patch("langchain_zenrows.zenrows_client.run_middleware") as chain:
+            _fetch(RecordingSession(make_response), [])._run(url=URL)
+        chain.assert_not_called()
+
+
+class TestStreams:
+    """Streams run each middleware's `on_request`, and nothing else."""
+
+    def test_on_request_edits_apply(self, make_response):
+        session = RecordingSession(make_response)
+        log = []
+        tool = _fetch(session, [TenantHeader(), Recorder("m", log)])
+        assert b"".join(tool.iter_content(URL)) == b"page"
+        assert session.sent[0]["headers"] == {"X-Tenant": "acme"}
+        assert log == ["m:request"]
+
+    def test_short_circuit(self, make_response):
+        session = RecordingSession(make_response)
+        tool = _fetch(session, [BlockDomains()])
+        with pytest.raises(ValueError, match="403 - blocked by policy"):
+            list(tool.iter_content("https://blocked.example.com/"))
+        assert session.sent == []
+
+    @pytest.mark.asyncio
+    async def test_async_short_circuit(self):
+        class Canned(ZenrowsMiddleware):
+            def on_request(self, request):
+                return request.respond(200, "canned")
+
+        tool = ZenrowsFetch(zenrows_api_key="k", middleware=[Canned()])
+        chunks = [chunk async for chunk in tool.aiter_content(URL)]
+        assert b"".join(chunks) == b"canned"
+
+
+class TestAsync:
+    """The chain on the async path."""
+
+    @pytest.mark.asyncio
+    async def test_headers_and_short_circuit(self, mock_async_client):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, text="page")
+
+        client = mock_async_client(handler)
+        tool = ZenrowsFetch(
+            zenrows_api_key="k",
+            async_client=client,
+            middleware=[TenantHeader(), BlockDomains(), Upper()],
+        )
+        assert await tool._arun(url=URL) == "PAGE"
+        with pytest.raises(ValueError, match="403"):
+            await tool._arun(url="https://blocked.example.com/")
+        await client.aclose()
+
+        assert len(seen) == 1
+        assert seen[0].headers["X-Tenant"] == "acme"
+
+    @pytest.mark.asyncio
+    async def test_extract_fallback_passes_through(self, mock_async_client):
+        seen = []
+
+        def handler(request):
+            if "extract" in request.url.params:
+                return httpx.Response(402, json={"code": "AUTH010"})
+            return httpx.Response(200, json={"title": "Widget"})
+
+        class Audit(ZenrowsMiddleware):
+            def on_request(self, request):
+                seen.append(request.params.get("extract"))
+
+        client = mock_async_client(handler)
+        tool = ZenrowsExtract(
+            zenrows_api_key="k", async_client=client, middleware=[Audit()]
+        )
+        output = json.loads(await tool._arun(url=URL))
+        await client.aclose()
+
+        assert output["extract_fallback"] == "autoparse"
+        assert seen == ["auto", None]
@@ -0,0 +1,188 @@
+"""Unit tests for ZenrowsResult and the tools' structured-result mode."""
+
+import asyncio
+import datetime
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+from langchain_core.messages import ToolMessage
+
+from langchain_zenrows import (
+    InMemoryCache,
+    RetryPolicy,
+    SingleFlight,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsRateLimiter,
+    ZenrowsResult,
+)
+from langchain_zenrows.zenrows_result import RequestTrace
+
+
+class TestRequestTrace:
+    def test_result_reads_zenrows_headers(self, make_response):
+        trace = RequestTrace()
+        with trace.attempt(0.25):
+            trace.response = make_response(
+                headers={
+                    "X-Request-Cost": "5",
+                    "X-Request-Id": "abc",
+                    "Zr-Final-Url": "https://example.com/final",
+                    "Content-Type": "text/html",
+                }
+            )
+            trace.response.elapsed = datetime.timedelta(seconds=1.5)
+
+        result = trace.result("<html></html>", {"url": "https://example.com", "mode": "auto"})
+
+        assert result.credits == 5.0
+        assert result.stealth_escalated is True
+        assert result.request_id == "abc"
+        assert result.final_url == "https://example.com/final"
+        assert result.content_type == "text/html"
+        assert result.bytes_received == len(b"<html></html>")
+        assert result.attempts == 1
+        assert result.queue_seconds == 0.25
+        assert result.server_seconds == 1.5
+
+    def test_escalation_only_reported_in_adaptive_mode(self, make_response):
+        trace = RequestTrace()
+        trace.response = make_response(headers={"X-Request-Cost": "1"})
+
+        assert trace.result("", {"url": "u", "mode": "auto"}).stealth_escalated is False
+        assert trace.result("", {"url": "u"}).stealth_escalated is None
+
+    @pytest.mark.asyncio
+    async def test_httpx_hook_times_new_connections(self):
+        trace = RequestTrace()
+
+        await trace.on_httpx_event("connection.connect_tcp.started", {})
+        await trace.on_httpx_event("connection.connect_tcp.complete", {})
+        await trace.on_httpx_event("http11.send_request_headers.started", {})
+
+        assert trace.connect_seconds is not None and trace.connect_seconds >= 0
+
+    def test_text_summarizes_binary_content(self):
+        assert ZenrowsResult(content=b"\x00" * 10).text == "<10 bytes>"
+        assert ZenrowsResult(content="hello").text == "hello"
+
+
+@patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+class TestFetchResult:
+    def test_fetch_result(self, mock_get, make_response):
+        mock_get.return_value = make_response(headers={"X-Request-Cost": "1"})
+        scraper = ZenrowsFetch(zenrows_api_key="k", limiter=ZenrowsRateLimiter())
+
+        result = scraper.fetch_result("https://example.com")
+
+        assert isinstance(result, ZenrowsResult)
+        assert result.content == "<html></html>"
+        assert result.url == "https://example.com"
+        assert result.status_code == 200
+        assert result.credits == 1.0
+        assert result.cache_hit is False and result.coalesced is False
+        assert result.total_seconds >= 0
+
+    def test_plain_run_still_returns_content(self, mock_get, make_response):
+        mock_get.return_value = make_response()
+        scraper = ZenrowsFetch(zenrows_api_key="k")
+
+        assert scraper.invoke({"url": "https://example.com"}) == "<html></html>"
+
+    def test_content_and_artifact(self, mock_get, make_response):
+        mock_get.return_value = make_response(headers={"X-Request-Cost": "10"})
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k", response_format="content_and_artifact"
+        )
+
+        message = scraper.invoke(
+            {
+                "type": "tool_call",
+                "id": "call-1",
+                "name": scraper.name,
+                "args": {"url": "https://example.com", "mode": "auto"},
+            }
+        )
+
+        assert isinstance(message, ToolMessage)
+        assert message.content == "<html></html>"
+        assert isinstance(message.artifact, ZenrowsResult)
+        assert message.artifact.stealth_escalated is True
+
+    def test_cache_hit_is_flagged(self, mock_get, make_response):
+        mock_get.return_value = make_response()
+        scraper = ZenrowsFetch(zenrows_api_key="k", cache=InMemoryCache())
+
+        scraper.fetch_result("https://example.com")
+        result = scraper.fetch_result("https://example.com")
+
+        assert result.cache_hit is True
+        assert result.attempts == 0
+        assert result.content == "<html></html>"
+
+    def test_retries_counted_in_attempts(self, mock_get, make_response):
+        mock_get.side_effect = [make_response(503), make_response()]
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k", retry_policy=RetryPolicy(backoff_base=0, jitter=False)
+        )
+
+        assert scraper.fetch_result("https://example.com").attempts == 2
+
+    def test_errors_are_mapped(self, mock_get, make_response):
+        mock_get.return_value = make_response(401)
+        scraper = ZenrowsFetch(zenrows_api_key="k")
+
+        with pytest.raises(ValueError, match="Invalid Zenrows API key"):
+            scraper.fetch_result("https://example.com")
+
+
+@pytest.mark.asyncio
+async def test_afetch_result_coalesced_flag(mock_async_client):
+    client = mock_async_client(
+        lambda request: httpx.Response(
+            200, text="<html></html>", headers={"X-Request-Cost": "1"}
+        )
+    )
+    scraper = ZenrowsFetch(
+        zenrows_api_key="k", async_client=client, single_flight=SingleFlight()
+    )
+
+    first, second = await asyncio.gather(
+        scraper.afetch_result("https://example.com"),
+        scraper.afetch_result("https://example.com"),
+    )
+
+    assert first.content == second.content == "<html></html>"
+    assert sorted([first.coalesced, second.coalesced]) == [False, True]
+    assert first.credits == 1.0
+
+
+@patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+class TestExtractResult:
+    def test_extract_result(self, mock_get, make_response):
+        body = json.dumps({"parsed": {"title": "x"}, "html": "<html></html>"})
+        mock_get.return_value = make_response(
+            text=body, headers={"X-Request-Cost": "25"}
+        )
+        tool = ZenrowsExtract(zenrows_api_key="k")
+
+        result = tool.extract_result("https://example.com")
+
+        assert json.loads(result.content)["parsed"] == {"title": "x"}
+        assert result.autoparse_fallback is False
+        assert result.stealth_escalated is True
+
+    def test_autoparse_fallback_is_flagged(self, mock_get, make_response):
+        mock_get.side_effect = [
+            make_response(402, json.dumps({"code": "AUTH010"})),
+            make_response(text=json.dumps({"title": "x"})),
+        ]
+        tool = ZenrowsExtract(zenrows_api_key="k")
+
+        result = tool.extract_result("https://example.com")
+
+        assert result.autoparse_fallback is True
+        assert result.attempts == 2
+        assert json.loads(result.content)["extract_fallback"] == "autoparse"
@@ -0,0 +1,167 @@
+"""Unit tests for the retry policy."""
+
+import email.utils
+import json
+import time
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import RetryPolicy, ZenrowsExtract, ZenrowsFetch
+
+
+class TestRetryReason:
+    """What counts as transient."""
+
+    def setup_method(self):
+        self.policy = RetryPolicy()
+
+    @pytest.mark.parametrize("status", [429, 500, 502, 503, 504])
+    def test_retryable_statuses(self, status, make_http_error):
+        assert self.policy.retry_reason(make_http_error(status)) == str(status)
+
+    @pytest.mark.parametrize("status", [400, 401, 402, 404, 413])
+    def test_non_retryable_statuses(self, status, make_http_error):
+        assert self.policy.retry_reason(make_http_error(status)) is None
+
+    def test_auth010_never_retried(self, make_http_error):
+        policy = RetryPolicy(retryable_statuses=frozenset({402}))
+        assert policy.retry_reason(make_http_error(402, '{"code": "AUTH010"}')) is None
+        assert policy.retry_reason(make_http_error(402, '{"code": "AUTH004"}')) == "402"
+
+    def test_timeouts_and_connection_errors(self):
+        assert self.policy.retry_reason(requests.exceptions.ReadTimeout()) == "timeout"
+        assert self.policy.retry_reason(httpx.ReadTimeout("slow")) == "timeout"
+        assert self.policy.retry_reason(requests.exceptions.ConnectionError()) == "connection"
+        assert self.policy.retry_reason(httpx.ConnectError("refused")) == "connection"
+        assert RetryPolicy(retry_on_timeout=False).retry_reason(
+            requests.exceptions.ReadTimeout()
+        ) is None
+
+    def test_other_errors_not_retried(self):
+        assert self.policy.retry_reason(ValueError("bad input")) is None
+
+
+class TestBackoff:
+    """Exponential backoff, jitter and Retry-After."""
+
+    def test_exponential_without_jitter(self, make_http_error):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5, jitter=False)
+        error = make_http_error(503)
+        assert [policy.backoff(n, error) for n in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+    def test_full_jitter_stays_within_bounds(self, make_http_error):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=5)
+        delays = [policy.backoff(3, make_http_error(503)) for _ in range(50)]
+        assert all(0 <= d <= 4 for d in delays)
+
+    def test_retry_after_seconds(self, make_http_error):
+        policy = RetryPolicy()
+        error = make_http_error(429, headers={"Retry-After": "7"})
+        assert policy.backoff(1, error) == 7
+
+    def test_retry_after_http_date_and_cap(self, make_http_error):
+        policy = RetryPolicy(max_retry_after=10)
+        when = email.utils.formatdate(time.time() + 3600, usegmt=True)
+        error = make_http_error(503, headers={"Retry-After": when})
+        assert policy.backoff(1, error) == 10
+
+    def test_retry_after_ignored_when_disabled(self, make_http_error):
+        policy = RetryPolicy(respect_retry_after=False, backoff_base=1, jitter=False)
+        error = make_http_error(429, headers={"Retry-After": "30"})
+        assert policy.backoff(1, error) == 1
+
+    def test_rejects_zero_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestCall:
+    """The retry loop and its statistics."""
+
+    def test_retries_until_success(self, make_http_error):
+        policy = RetryPolicy(backoff_base=0)
+        fn = Mock(side_effect=[make_http_error(503), make_http_error(429), "done"])
+
+        assert policy.call(fn) == "done"
+        stats = policy.stats.snapshot()
+        assert stats["attempts"] == 3
+        assert stats["retries"] == 2
+        assert stats["retries_by_reason"] == {"503": 1, "429": 1}
+        assert stats["successes"] == 1
+
+    def test_gives_up_after_max_attempts(self, make_http_error):
+        policy = RetryPolicy(max_attempts=2, backoff_base=0)
+        fn = Mock(side_effect=make_http_error(503))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            policy.call(fn)
+        assert fn.call_count == 2
+        assert policy.stats.failures == 1
+
+    def test_non_retryable_raises_immediately(self, make_http_error):
+        policy = RetryPolicy(backoff_base=0)
+        fn = Mock(side_effect=make_http_error(401))
+
+        with pytest.raises(requests.exceptions.HTTPError):
+            policy.call(fn)
+        assert fn.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_acall_retries(self):
+        policy = RetryPolicy(backoff_base=0)
+        attempts = []
+
+        async def fn():
+            attempts.append(1)
+            if len(attempts) < 2:
+                raise httpx.ConnectError("refused")
+            return "done"
+
+        assert await policy.acall(fn) == "done"
+        assert policy.stats.retries_by_reason == {"connection": 1}
+
+
+class TestToolIntegration:
+    """Tools retry each request per their `retry_policy`."""
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_fetch_retries_transient_errors(self, mock_get, make_response):
+        mock_get.side_effect = [
+            make_response(503),
+            make_response(text="<html>ok</html>"),
+        ]
+        policy = RetryPolicy(backoff_base=0)
+        scraper = ZenrowsFetch(zenrows_api_key="k", retry_policy=policy)
+
+        assert scraper._run(url="https://example.com") == "<html>ok</html>"
+        assert mock_get.call_count == 2
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_fetch_without_policy_raises_immediately(self, mock_get, make_response):
+        mock_get.return_value = make_response(503)
+        scraper = ZenrowsFetch(zenrows_api_key="k")
+
+        with pytest.raises(ValueError, match="HTTP error occurred: 503"):
+            scraper._run(url="https://example.com")
+        assert mock_get.call_count == 1
+
+    @patch("langchain_zenrows.zenrows_extract.requests.Session.get")
+    def test_extract_fallback_retried_independently(self, mock_get, make_response):
+        mock_get.side_effect = [
+            make_response(402, '{"code": "AUTH010"}'),
+            make_response(502),
+            make_response(text='{"title": "Widget"}'),
+        ]
+        policy = RetryPolicy(backoff_base=0)
+        tool = ZenrowsExtract(zenrows_api_key="k", retry_policy=policy)
+
+        data = json.loads(tool._run(url="https://example.com"))
+
+        assert data["extract_fallback"] == "autoparse"
+        assert mock_get.call_count == 3
+        stats = policy.stats.snapshot()
+        assert stats["autoparse_fallbacks"] == 1
+        assert stats["retries_by_reason"] == {"502": 1}
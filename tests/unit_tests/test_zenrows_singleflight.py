@@ -0,0 +1,361 @@
+"""Unit tests for request coalescing."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+
+from langchain_zenrows import (
+    CancelToken,
+    DeadlineExceeded,
+    RequestCancelled,
+    SingleFlight,
+    ZenrowsExtract,
+    ZenrowsFetch,
+    ZenrowsInstrumentation,
+)
+
+URL = "https://example.com"
+
+
+class CallRecorder(ZenrowsInstrumentation):
+    """Records each hook as ``(kind, call number)``."""
+
+    def __init__(self):
+        self.events = []
+        self._lock = threading.Lock()
+
+    def _record(self, kind, token):
+        with self._lock:
+            self.events.append((kind, token))
+
+    def on_call_start(self, tool, url):
+        with self._lock:
+            token = sum(kind == "start" for kind, _ in self.events)
+            self.events.append(("start", token))
+        return token
+
+    def on_attempt(self, token, event):
+        self._record("attempt", token)
+
+    def on_call_end(self, token, result, error):
+        self._record("end", token)
+
+    def late_events(self):
+        ended = set()
+        late = []
+        for kind, token in list(self.events):
+            if token in ended:
+                late.append((kind, token))
+            if kind == "end":
+                ended.add(token)
+        return late
+
+
+class TestSingleFlight:
+    """Concurrent calls with one key share one execution."""
+
+    def test_concurrent_calls_share_result(self):
+        flight = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def slow():
+            calls.append(1)
+            release.wait(1)
+            return "page"
+
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(flight.do, "k", slow) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert [r[0] for r in results] == ["page"] * 4
+        assert sorted(r[1] for r in results) == [False, True, True, True]
+        assert flight.in_flight() == 0
+
+    def test_errors_are_shared(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def failing():
+            release.wait(1)
+            raise ValueError("boom")
+
+        with ThreadPoolExecutor(2) as pool:
+            futures = [pool.submit(flight.do, "k", failing) for _ in range(2)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result()
+
+    def test_follower_wait_bounded_by_its_token_and_deadline(self):
+        flight, release = SingleFlight(), threading.Event()
+        token = CancelToken()
+
+        def slow():
+            release.wait(5)
+            return "page"
+
+        with ThreadPoolExecutor(3) as pool:
+            leader = pool.submit(flight.do, "k", slow)
+            time.sleep(0.05)
+            cancelled = pool.submit(flight.do, "k", slow, token)
+            timed_out = pool.submit(
+                flight.do, "k", slow, None, time.monotonic() + 0.1
+            )
+            threading.Timer(0.05, token.cancel).start()
+            started = time.monotonic()
+            with pytest.raises(RequestCancelled):
+                cancelled.result()
+            with pytest.raises(DeadlineExceeded):
+                timed_out.result()
+            assert time.monotonic() - started < 1
+            release.set()
+            assert leader.result() == ("page", False)
+
+    def test_abandoned_once_every_caller_gives_up(self):
+        flight, release = SingleFlight(), threading.Event()
+        tokens = [CancelToken(), CancelToken()]
+
+        def slow():
+            release.wait(5)
+            return "page"
+
+        with ThreadPoolExecutor(2) as pool:
+            futures = [
+                pool.submit(flight.do, "k", slow, token, None, release.set)
+                for token in tokens
+            ]
+            time.sleep(0.05)
+            tokens[0].cancel()
+            with pytest.raises(RequestCancelled):
+                futures[0].result()
+            assert not release.is_set()
+            tokens[1].cancel()
+            with pytest.raises(RequestCancelled):
+                futures[1].result()
+        assert release.is_set()
+        assert flight.in_flight() == 0
+
+    def test_sequential_calls_not_coalesced(self):
+        flight = SingleFlight()
+        fn = Mock(return_value="page")
+        flight.do("k", fn)
+        flight.do("k", fn)
+        assert fn.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_calls_share_result(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "page"
+
+        results = await asyncio.gather(*(flight.ado("k", slow) for _ in range(5)))
+        assert len(calls) == 1
+        assert [r[0] for r in results] == ["page"] * 5
+        assert flight.in_flight() == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "page"
+
+        leader = asyncio.ensure_future(flight.ado("k", slow))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.ado("k", slow))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == ("page", True)
+
+    @pytest.mark.asyncio
+    async def test_async_follower_wait_bounded(self):
+        flight, token = SingleFlight(), CancelToken()
+
+        async def slow():
+            await asyncio.sleep(0.2)
+            return "page"
+
+        leader = asyncio.ensure_future(flight.ado("k", slow))
+        await asyncio.sleep(0)
+        token.cancel()
+        with pytest.raises(RequestCancelled):
+            await flight.ado("k", slow, token)
+        with pytest.raises(DeadlineExceeded):
+            await flight.ado("k", slow, None, time.monotonic() + 0.05)
+        assert await leader == ("page", False)
+
+    @pytest.mark.asyncio
+    async def test_call_cancelled_once_every_caller_is(self):
+        flight = SingleFlight()
+        upstream = []
+
+        async def slow():
+            upstream.append(asyncio.current_task())
+            await asyncio.sleep(5)
+            return "page"
+
+        callers = [asyncio.ensure_future(flight.ado("k", slow)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert upstream[0].cancelled()
+        assert flight.in_flight() == 0
+
+
+class TestToolIntegration:
+    """Tools coalesce identical concurrent calls when given a SingleFlight."""
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_fetch_coalesces_identical_requests(self, mock_get):
+        def slow_get(*args, **kwargs):
+            time.sleep(0.05)
+            return Mock(text="<html>shared</html>")
+
+        mock_get.side_effect = slow_get
+        scraper = ZenrowsFetch(zenrows_api_key="k", single_flight=SingleFlight())
+
+        with ThreadPoolExecutor(3) as pool:
+            results = list(pool.map(lambda _: scraper._run(url="https://example.com"), range(3)))
+
+        assert results == ["<html>shared</html>"] * 3
+        assert mock_get.call_count == 1
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_leader_cancel_leaves_followers(self, mock_get, make_response):
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return make_response(text="<html>shared</html>")
+
+        mock_get.side_effect = slow_get
+        scraper = ZenrowsFetch(zenrows_api_key="k", single_flight=SingleFlight())
+        token = CancelToken()
+        config = {"configurable": {"zenrows_cancel": token}}
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(scraper.invoke, {"url": URL}, config)
+            time.sleep(0.05)
+            follower = pool.submit(scraper.invoke, {"url": URL})
+            time.sleep(0.05)
+            token.cancel()
+            with pytest.raises(ValueError, match="Request cancelled"):
+                leader.result(1)
+            release.set()
+            assert follower.result() == "<html>shared</html>"
+        assert mock_get.call_count == 1
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_no_events_after_a_caller_gives_up(self, mock_get, make_response):
+        release = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            release.wait(5)
+            return make_response(text="<html>shared</html>")
+
+        mock_get.side_effect = slow_get
+        recorder = CallRecorder()
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k", single_flight=SingleFlight(), instrumentation=recorder
+        )
+        config = {"configurable": {"zenrows_timeout": 0.2}}
+
+        with ThreadPoolExecutor(2) as pool:
+            leader = pool.submit(scraper.invoke, {"url": URL}, config)
+            time.sleep(0.05)
+            follower = pool.submit(scraper.invoke, {"url": URL})
+            with pytest.raises(ValueError, match="timed out"):
+                leader.result(1)
+            release.set()
+            assert follower.result() == "<html>shared</html>"
+        assert recorder.late_events() == []
+        assert [kind for kind, _ in recorder.events].count("end") == 2
+
+    @pytest.mark.asyncio
+    async def test_async_no_events_after_a_caller_gives_up(self, mock_async_client):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, text="<html>shared</html>")
+
+        client = mock_async_client(handler)
+        recorder = CallRecorder()
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k",
+            async_client=client,
+            single_flight=SingleFlight(),
+            instrumentation=recorder,
+        )
+        config = {"configurable": {"zenrows_timeout": 0.05}}
+        leader = asyncio.ensure_future(scraper.ainvoke({"url": URL}, config))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(scraper.ainvoke({"url": URL}))
+
+        with pytest.raises(ValueError, match="timed out"):
+            await leader
+        assert await follower == "<html>shared</html>"
+        await client.aclose()
+        assert recorder.late_events() == []
+
+    @pytest.mark.asyncio
+    async def test_async_leader_cancel_leaves_followers(self, mock_async_client):
+        seen = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, text="<html>shared</html>")
+
+        client = mock_async_client(handler)
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k", async_client=client, single_flight=SingleFlight()
+        )
+        token = CancelToken()
+        config = {"configurable": {"zenrows_cancel": token}}
+        leader = asyncio.ensure_future(scraper.ainvoke({"url": URL}, config))
+        await asyncio.sleep(0.02)
+        follower = asyncio.ensure_future(scraper.ainvoke({"url": URL}))
+        await asyncio.sleep(0.02)
+        token.cancel()
+
+        with pytest.raises(ValueError, match="Request cancelled"):
+            await leader
+        assert await follower == "<html>shared</html>"
+        await client.aclose()
+        assert len(seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_extract_coalesces_async_requests(self, mock_async_client):
+        seen = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            await asyncio.sleep(0.02)
+            return httpx.Response(200, text='{"parsed": {}, "html": null}')
+
+        client = mock_async_client(handler)
+        tool = ZenrowsExtract(
+            zenrows_api_key="k", async_client=client, single_flight=SingleFlight()
+        )
+        results = await asyncio.gather(
+            *(tool._arun(url="https://example.com") for _ in range(3))
+        )
+
+        assert len(set(results)) == 1
+        assert len(seen) == 1
@@ -0,0 +1,211 @@
+"""Unit tests for per-domain Adaptive Stealth learning."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from langchain_zenrows import StealthLearner, ZenrowsFetch
+
+URL = "https://hard.example.com/page"
+
+
+def _learner(**kwargs):
+    kwargs.setdefault("explore_rate", 0.0)
+    return StealthLearner(**kwargs)
+
+
+class TestStealthLearner:
+    """Learning, decay and persistence."""
+
+    def test_needs_min_weight_before_preselecting(self):
+        learner = _learner()
+        learner.observe(URL, 25.0)
+        assert learner.predict(URL) is None
+        learner.observe("https://hard.example.com/other", 25.0)
+        assert learner.predict(URL) == (True, True)
+
+    def test_basic_domains_stay_on_auto(self):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 1.0)
+        assert learner.predict(URL) is None
+
+    def test_most_frequent_config_wins(self):
+        learner = _learner(min_weight=1)
+        for cost in (5.0, 10.0, 10.0):
+            learner.observe(URL, cost)
+        assert learner.predict(URL) == (False, True)
+
+    def test_unknown_costs_ignored(self):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 3.0)
+        learner.observe(URL, None)
+        assert len(learner) == 0
+        assert learner.unknown_costs == 1
+
+    def test_costs_match_nearest_tier(self):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 4.9999999)
+        learner.observe(URL, 5.2)
+        assert learner.predict(URL) == (True, False)
+        assert learner.unknown_costs == 0
+
+    def test_custom_cost_table(self):
+        learner = _learner(min_weight=1, cost_configs={2.0: (False, True)})
+        learner.observe(URL, 10.0)
+        assert learner.unknown_costs == 1
+        learner.observe(URL, 2.0)
+        assert learner.predict(URL) == (False, True)
+
+    def test_observations_decay(self):
+        learner = _learner(min_weight=2, half_life=10.0)
+        with patch("langchain_zenrows.zenrows_stealth.time.time", return_value=0.0):
+            learner.observe(URL, 5.0)
+            learner.observe(URL, 5.0)
+            assert learner.predict(URL) == (True, False)
+        with patch("langchain_zenrows.zenrows_stealth.time.time", return_value=10.0):
+            assert learner.predict(URL) is None  # weight halved to 1.0
+
+    def test_failure_forgets_domain(self):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 25.0)
+        learner.record_failure(URL)
+        assert learner.predict(URL) is None
+
+    def test_apply_rewrites_auto_requests(self):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 25.0)
+        params = {"url": URL, "mode": "auto"}
+        applied = learner.apply(params)
+        assert applied == {"url": URL, "js_render": True, "premium_proxy": True}
+        assert params["mode"] == "auto"  # not mutated
+        assert learner.apply({"url": URL}) == {"url": URL}
+
+    def test_explore_rate_keeps_some_requests_on_auto(self):
+        learner = _learner(min_weight=1, explore_rate=1.0)
+        learner.observe(URL, 25.0)
+        assert learner.apply({"url": URL, "mode": "auto"})["mode"] == "auto"
+
+    def test_lru_bound(self):
+        learner = _learner(max_domains=2)
+        for host in ("a.com", "b.com", "c.com"):
+            learner.observe(f"https://{host}/", 5.0)
+        assert len(learner) == 2
+
+    def test_save_and_reload(self, tmp_path):
+        path = str(tmp_path / "stealth.json")
+        learner = _learner(path=path, min_weight=1)
+        learner.observe(URL, 5.0)
+        learner.save()
+
+        assert json.load(open(path))["domains"]["hard.example.com"]["weights"] == {
+            "js_render": pytest.approx(1.0)
+        }
+        assert _learner(path=path, min_weight=1).predict(URL) == (True, False)
+
+    def test_autosaves(self, tmp_path):
+        path = tmp_path / "stealth.json"
+        learner = _learner(path=str(path), autosave_interval=0)
+        learner.observe(URL, 5.0)
+        assert path.exists()
+
+    def test_save_without_path_raises(self):
+        with pytest.raises(ValueError):
+            _learner().save()
+
+
+class TestFetchIntegration:
+    """`ZenrowsFetch` with a `stealth_learner`."""
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_learned_domain_skips_auto(self, mock_get, make_response):
+        mock_get.return_value = make_response(headers={"X-Request-Cost": "25"})
+        tool = ZenrowsFetch(zenrows_api_key="k", stealth_learner=_learner())
+
+        for _ in range(3):
+            tool._run(url=URL, mode="auto")
+
+        sent = [c.kwargs["params"] for c in mock_get.call_args_list]
+        assert [p.get("mode") for p in sent] == ["auto", "auto", None]
+        assert sent[2]["js_render"] is True and sent[2]["premium_proxy"] is True
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_non_auto_calls_are_not_learned(self, mock_get, make_response):
+        mock_get.return_value = make_response(headers={"X-Request-Cost": "25"})
+        learner = _learner(min_weight=1)
+        tool = ZenrowsFetch(zenrows_api_key="k", stealth_learner=learner)
+        tool._run(url=URL, js_render=True, premium_proxy=True)
+        assert len(learner) == 0
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_failed_preselection_falls_back_to_auto(self, mock_get, make_response):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 5.0)
+        mock_get.side_effect = [
+            make_response(403, "blocked"),
+            make_response(headers={"X-Request-Cost": "25"}),
+        ]
+        tool = ZenrowsFetch(zenrows_api_key="k", stealth_learner=learner)
+
+        with pytest.raises(ValueError):
+            tool._run(url=URL, mode="auto")
+        tool._run(url=URL, mode="auto")
+
+        sent = [c.kwargs["params"] for c in mock_get.call_args_list]
+        assert sent[0].get("mode") is None and sent[0]["js_render"] is True
+        assert sent[1]["mode"] == "auto"
+
+    @pytest.mark.parametrize(
+        "status,body,forgotten",
+        [
+            (403, "blocked", True),
+            (422, '{"code": "RESP001"}', True),
+            (429, "slow down", False),
+            (503, "unavailable", False),
+        ],
+    )
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_only_wrong_config_failures_forget(
+        self, mock_get, status, body, forgotten, make_response
+    ):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 5.0)
+        mock_get.return_value = make_response(status, body)
+        tool = ZenrowsFetch(zenrows_api_key="k", stealth_learner=learner)
+
+        with pytest.raises(ValueError):
+            tool._run(url=URL, mode="auto")
+        assert (learner.predict(URL) is None) is forgotten
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+    def test_timeouts_keep_domain(self, mock_get):
+        learner = _learner(min_weight=1)
+        learner.observe(URL, 5.0)
+        mock_get.side_effect = requests.exceptions.Timeout("slow")
+        tool = ZenrowsFetch(zenrows_api_key="k", stealth_learner=learner)
+
+        with pytest.raises(ValueError):
+            tool._run(url=URL, mode="auto")
+        assert learner.predict(URL) == (True, False)
+
+    @pytest.mark.asyncio
+    async def test_async_path_learns(self, mock_async_client):
+        import httpx
+
+        requested = []
+
+        def handler(request):
+            requested.append(dict(request.url.params))
+            return httpx.Response(200, text="ok", headers={"X-Request-Cost": "10"})
+
+        client = mock_async_client(handler)
+        tool = ZenrowsFetch(
+            zenrows_api_key="k", async_client=client, stealth_learner=_learner()
+        )
+        for _ in range(3):
+            await tool._arun(url=URL, mode="auto")
+        await client.aclose()
+
+        assert requested[2].get("mode") is None
+        assert requested[2]["premium_proxy"] == "true"
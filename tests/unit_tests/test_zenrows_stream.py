@@ -0,0 +1,117 @@
+"""Unit tests for ZenrowsFetch's streaming mode."""
+
+import io
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+import requests
+
+from langchain_zenrows import ZenrowsFetch
+
+PAYLOAD = b"\x89PNG" + bytes(range(256)) * 100
+
+
+def _streaming_response(body: bytes = PAYLOAD, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.status_code = status_code
+    response.headers = {}
+    response.iter_content.side_effect = lambda chunk_size: (
+        body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+    )
+    if status_code >= 400:
+        response.text = "error body"
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+            response=response
+        )
+    return response
+
+
+def _answer(body: bytes = PAYLOAD, status_code: int = 200):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(status_code, content=body)
+
+    return handler
+
+
+@patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
+class TestSyncStreaming:
+    def test_iter_content_yields_chunks(self, mock_get):
+        mock_get.return_value = _streaming_response()
+        scraper = ZenrowsFetch(zenrows_api_key="k")
+
+        chunks = list(
+            scraper.iter_content(
+                {"url": "https://example.com", "screenshot_fullpage": "true"},
+                chunk_size=1024,
+            )
+        )
+
+        assert b"".join(chunks) == PAYLOAD
+        assert max(len(c) for c in chunks) == 1024
+        assert mock_get.call_args[1]["stream"] is True
+        assert mock_get.call_args[1]["params"]["screenshot"] == "true"
+
+    def test_fetch_to_path(self, mock_get, tmp_path):
+        mock_get.return_value = _streaming_response()
+        target = tmp_path / "page.png"
+
+        written = ZenrowsFetch(zenrows_api_key="k").fetch_to("https://example.com", target)
+
+        assert written == len(PAYLOAD)
+        assert target.read_bytes() == PAYLOAD
+        assert not (tmp_path / "page.png.part").exists()
+
+    def test_fetch_to_file_object(self, mock_get):
+        mock_get.return_value = _streaming_response()
+        buffer = io.BytesIO()
+
+        ZenrowsFetch(zenrows_api_key="k").fetch_to("https://example.com", buffer)
+
+        assert buffer.getvalue() == PAYLOAD
+
+    def test_http_error_mapped_and_no_partial_file(self, mock_get, tmp_path):
+        mock_get.return_value = _streaming_response(status_code=413)
+        target = tmp_path / "page.png"
+
+        with pytest.raises(ValueError, match="Response size too large"):
+            ZenrowsFetch(zenrows_api_key="k").fetch_to("https://example.com", target)
+        assert not target.exists()
+        assert not (tmp_path / "page.png.part").exists()
+
+
+class TestAsyncStreaming:
+    @pytest.mark.asyncio
+    async def test_aiter_content_yields_chunks(self, mock_async_client):
+        client = mock_async_client(_answer())
+        scraper = ZenrowsFetch(zenrows_api_key="k", async_client=client)
+
+        chunks = [c async for c in scraper.aiter_content("https://example.com", chunk_size=512)]
+
+        assert b"".join(chunks) == PAYLOAD
+        assert max(len(c) for c in chunks) <= 512
+
+    @pytest.mark.asyncio
+    async def test_afetch_to_path(self, tmp_path, mock_async_client):
+        client = mock_async_client(_answer())
+        scraper = ZenrowsFetch(zenrows_api_key="k", async_client=client)
+        target = tmp_path / "doc.pdf"
+
+        written = await scraper.afetch_to(
+            {"url": "https://example.com", "response_type": "pdf"}, target
+        )
+
+        assert written == len(PAYLOAD)
+        assert target.read_bytes() == PAYLOAD
+
+    @pytest.mark.asyncio
+    async def test_error_body_included(self, mock_async_client):
+        scraper = ZenrowsFetch(
+            zenrows_api_key="k",
+            async_client=mock_async_client(_answer(b"bad selector", 400)),
+        )
+
+        with pytest.raises(ValueError, match="400 - bad selector"):
+            async for _ in scraper.aiter_content("https://example.com"):
+                pass
@@ -0,0 +1,155 @@
+"""Unit tests for pre-validated Fetch request templates."""
+
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
+
+import httpx
+import pytest
+
+from langchain_zenrows import (
+    FetchTemplate,
+    InMemoryCache,
+    StealthLearner,
+    ZenrowsFetch,
+)
+from langchain_zenrows.zenrows_template import MAX_REQUEST_URL_LENGTH
+
+
+def _tool(**kwargs):
+    return ZenrowsFetch(zenrows_api_key="k", **kwargs)
+
+
+def _query(request_url):
+    return dict(parse_qsl(urlsplit(request_url).query))
+
+
+def _wire(params):
+    """``params`` as a template encodes them."""
+    return {
+        k: str(v).lower() if isinstance(v, bool) else str(v) for k, v in params.items()
+    }
+
+
+class TestFetchTemplate:
+    """Preparing once and binding URLs."""
+
+    PROFILES = [
+        {},
+        {"wait_for": ".content", "response_type": "markdown"},
+        {"proxy_country": "us", "custom_headers": {"Referer": "https://a.com"}},
+        {"screenshot_fullpage": "true", "mode": "auto"},
+        {"css_extractor": '{"t":"h1"}', "cache_bypass": True, "js_render": None},
+    ]
+
+    @pytest.mark.parametrize("defaults", PROFILES)
+    def test_prepares_same_request_as_tool(self, defaults):
+        tool = _tool()
+        url = "https://example.com/a"
+        params, request_headers = tool._prepare_request_params(
+            tool._validate_input({**defaults, "url": url})
+        )
+        prepared = tool.template(**defaults).prepare(url)
+        assert (prepared.params, prepared.request_headers) == (params, request_headers)
+        assert prepared.request_url.startswith(tool.base_url + "?")
+        assert _query(prepared.request_url) == _wire(params)
+
+    def test_bound_params_are_independent(self):
+        template = _tool().template(js_render=True)
+        first = template.prepare("https://a.com").params
+        first["extra"] = 1
+        second = template.prepare("https://b.com").params
+        assert second == {"js_render": True, "apikey": "k", "url": "https://b.com"}
+
+    def test_url_is_encoded_per_call(self):
+        url = "https://example.com/search?q=a b&lang=en#top"
+        prepared = _tool().template(js_render=True).prepare(url)
+        assert _query(prepared.request_url)["url"] == url
+
+    def test_json_params_are_compacted(self):
+        instructions = '[\n  {"click": ".button"},\n  {"wait": 500}\n]'
+        template = _tool().template(js_instructions=instructions)
+        prepared = template.prepare("https://a.com")
+        assert prepared.params["js_instructions"] == instructions
+        sent = _query(prepared.request_url)["js_instructions"]
+        assert sent == '[{"click":".button"},{"wait":500}]'
+
+    def test_url_length_limit(self):
+        instructions = '[{"evaluate": "%s"}]' % ("x" * MAX_REQUEST_URL_LENGTH)
+        with pytest.raises(ValueError, match="over the"):
+            _tool().template(js_instructions=instructions)
+
+        template = _tool().template()
+        with pytest.raises(ValueError, match="over the"):
+            template.prepare("https://a.com/" + "x" * MAX_REQUEST_URL_LENGTH)
+
+    def test_rejects_url_in_defaults(self):
+        with pytest.raises(ValueError, match="bound per call"):
+            _tool().template(url="https://example.com")
+
+    def test_validates_defaults_once(self):
+        with pytest.raises(ValueError, match="two-letter"):
+            _tool().template(proxy_country="usa")
+
+    def test_rejects_bad_url(self):
+        template = _tool().template()
+        with pytest.raises(ValueError, match="url"):
+            template.prepare(None)
+
+    def test_repr(self):
+        assert isinstance(_tool().template(), FetchTemplate)
+        assert "js_render" in repr(_tool().template(js_render=True))
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.send")
+    def test_fetch_skips_validation_and_preparation(self, mock_send, make_response):
+        mock_send.return_value = make_response(text="page")
+        tool = _tool()
+        template = tool.template(response_type="markdown")
+
+        with patch.object(
+            ZenrowsFetch, "_prepare_request_params", side_effect=AssertionError
+        ), patch.object(ZenrowsFetch, "_validate_input", side_effect=AssertionError):
+            assert template.fetch("https://example.com") == "page"
+
+        assert _query(mock_send.call_args.args[0].url) == {
+            "response_type": "markdown",
+            "apikey": "k",
+            "url": "https://example.com",
+        }
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.send")
+    def test_fetch_uses_the_cache(self, mock_send, make_response):
+        mock_send.return_value = make_response()
+        template = _tool(cache=InMemoryCache()).template(js_render=True)
+        template.fetch_result("https://example.com")
+        assert template.fetch_result("https://example.com").cache_hit
+        assert mock_send.call_count == 1
+
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.send")
+    def test_stealth_learner_applies_per_url(self, mock_send, make_response):
+        mock_send.return_value = make_response()
+        learner = StealthLearner(min_weight=1, explore_rate=0)
+        learner.observe("https://hard.com/", 25.0)
+        template = _tool(stealth_learner=learner).template(mode="auto")
+
+        template.fetch("https://hard.com/x")
+        template.fetch("https://easy.com/x")
+
+        hard, easy = [_query(c.args[0].url) for c in mock_send.call_args_list]
+        assert "mode" not in hard and hard["premium_proxy"] == "true"
+        assert easy["mode"] == "auto"
+
+    @pytest.mark.asyncio
+    async def test_afetch(self, mock_async_client):
+        requested = []
+
+        def handler(request):
+            requested.append(dict(request.url.params))
+            return httpx.Response(200, text="ok")
+
+        client = mock_async_client(handler)
+        template = _tool(async_client=client).template(wait_for=".x")
+        assert await template.afetch("https://example.com") == "ok"
+        await client.aclose()
+
+        assert requested[0]["js_render"] == "true"
+        assert requested[0]["url"] == "https://example.com"
@@ -133,7 +133,7 @@ class TestZenRowsUniversalScraper:
         assert "javascript" in description.lower()
         assert "anti-bot" in description.lower()
 
-    @patch("langchain_zenrows.zenrows_fetch.requests.get")
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
     def test_run_success_html_response(self, mock_get):
         """Test successful _run method with HTML response."""
         # Setup mock response
@@ -154,7 +154,7 @@ class TestZenRowsUniversalScraper:
         assert call_args[1]["params"]["url"] == "https://example.com"
         assert call_args[1]["params"]["apikey"] == "test-key"
 
-    @patch("langchain_zenrows.zenrows_fetch.requests.get")
+    @patch("langchain_zenrows.zenrows_fetch.requests.Session.get")
     def test_run_with_all_parameters(self, mock_get):
         """Test _run method with all parameters."""
         # Setup mock response